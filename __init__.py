@@ -48,6 +48,7 @@ try:
     from .resilience import (
         EnhancedCircuitBreaker,
         ModelFallbackChain,
+        AdaptiveModelRouter,
         SecurityValidator,
         CircuitState
     )
@@ -89,6 +90,7 @@ except ImportError:
     from resilience import (
         EnhancedCircuitBreaker,
         ModelFallbackChain,
+        AdaptiveModelRouter,
         SecurityValidator,
         CircuitState
     )
@@ -112,6 +114,7 @@ __all__ = [
     # Phase B - Priority 1: Resilience
     'EnhancedCircuitBreaker',
     'ModelFallbackChain',
+    'AdaptiveModelRouter',
     'SecurityValidator',
     'CircuitState',
     'ResilientBaseAgent',
@@ -5,6 +5,7 @@ Provides base classes and utilities for building robust AI agent systems
 with cost tracking, error handling, and retry logic.
 """
 
+import copy
 import os
 import time
 import random
@@ -31,6 +32,9 @@ except ImportError:
 # Import centralized model selection
 from core.models import ModelSelector
 from core.constants import Models, Limits
+from utils.single_flight import SingleFlight, get_default_single_flight, request_key
+from utils.response_cache import ResponseCache
+from utils.prompt_cache import system_blocks, user_content, cache_token_usage
 
 # Configure logging
 logging.basicConfig(
@@ -84,21 +88,33 @@ class ModelPricing:
         'gpt-3.5-turbo': (0.50, 1.50),
     }
 
+    # Prompt-cache pricing relative to the input rate
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
+
     @classmethod
-    def calculate_cost(cls, model: str, input_tokens: int, output_tokens: int) -> float:
+    def calculate_cost(cls, model: str, input_tokens: int, output_tokens: int,
+                       cache_read_tokens: int = 0, cache_write_tokens: int = 0) -> float:
         """
         Calculate cost for token usage.
 
         Args:
             model: Model name
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Cost in USD
         """
         pricing = cls.PRICING.get(model, (0, 0))
-        input_cost = (input_tokens / 1_000_000) * pricing[0]
+        billed_input = (
+            input_tokens
+            + cache_write_tokens * cls.CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * cls.CACHE_READ_MULTIPLIER
+        )
+        input_cost = (billed_input / 1_000_000) * pricing[0]
         output_cost = (output_tokens / 1_000_000) * pricing[1]
         return round(input_cost + output_cost, 6)
 
@@ -474,7 +490,12 @@ class BaseAgent:
                  max_retries: int = Limits.MAX_RETRIES,
                  use_circuit_breaker: bool = True,
                  cost_tracker: Optional[CostTracker] = None,
-                 system_prompt: Optional[str] = None):
+                 system_prompt: Optional[str] = None,
+                 coalesce_requests: bool = False,
+                 single_flight: Optional[SingleFlight] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 cache_namespace: Optional[str] = None,
+                 prompt_caching: bool = False):
         """
         Initialize base agent.
 
@@ -488,6 +509,12 @@ class BaseAgent:
             use_circuit_breaker: Enable circuit breaker
             cost_tracker: Optional shared cost tracker
             system_prompt: Optional custom system prompt
+            coalesce_requests: Share one upstream call among identical in-flight requests
+            single_flight: Optional coalescing group (defaults to the process-wide group)
+            response_cache: Optional persistent response cache (opt-in)
+            cache_namespace: Cache namespace (defaults to role)
+            prompt_caching: Mark the system prompt and stable prompt prefixes
+                for provider-side prompt caching
         """
         self.role = role
         self.model = model
@@ -495,6 +522,7 @@ class BaseAgent:
         self.max_tokens = max_tokens
         self.max_retries = max_retries
         self.system_prompt = system_prompt
+        self.prompt_caching = prompt_caching
 
         # Initialize client
         if ANTHROPIC_AVAILABLE:
@@ -518,6 +546,13 @@ class BaseAgent:
             jitter=True
         )
 
+        # Request coalescing (single-flight)
+        self.single_flight = (single_flight or get_default_single_flight()) if coalesce_requests else None
+
+        # Persistent response cache
+        self.response_cache = response_cache
+        self.cache_namespace = cache_namespace or role
+
         # Initialize tracking
         self.cost_tracker = cost_tracker or CostTracker()
         self.agent_id = f"{role}_{model}_{id(self)}"
@@ -529,15 +564,18 @@ class BaseAgent:
              prompt: str,
              context: Optional[Dict[str, Any]] = None,
              temperature: Optional[float] = None,
-             max_tokens: Optional[int] = None) -> Dict[str, Any]:
+             max_tokens: Optional[int] = None,
+             cache_prefix: Optional[str] = None) -> Dict[str, Any]:
         """
         Make API call with full resilience and tracking.
 
         Args:
-            prompt: User prompt
+            prompt: User prompt (sent after cache_prefix)
             context: Additional context
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            cache_prefix: Static leading part of the prompt, identical across
+                calls; marked for prompt caching when enabled
 
         Returns:
             Dictionary with output, tokens, cost, and metadata
@@ -554,6 +592,41 @@ class BaseAgent:
         temperature = temperature or self.temperature
         max_tokens = max_tokens or self.max_tokens
 
+        key = None
+        if self.single_flight or self.response_cache:
+            key = request_key(
+                model=self.model, system=system, prompt=(cache_prefix or "") + prompt,
+                temperature=temperature, max_tokens=max_tokens
+            )
+
+        # Serve repeated requests from the response cache
+        if self.response_cache:
+            cached = self.response_cache.get(self.cache_namespace, key)
+            if cached is not None:
+                logger.info(f"Response cache hit: {self.agent_id}")
+                # Copy so callers cannot mutate the entry in the memory tier
+                return {**copy.deepcopy(cached), 'cost': 0.0, 'cached': True}
+
+        # Coalesce identical in-flight requests into one upstream call
+        if self.single_flight:
+            result, shared = self.single_flight.do(
+                key, lambda: self._call_with_retries(prompt, system, temperature, max_tokens, cache_prefix)
+            )
+            if shared:
+                logger.info(f"Coalesced identical in-flight request: {self.agent_id}")
+                return {**result, 'coalesced': True}
+        else:
+            result = self._call_with_retries(prompt, system, temperature, max_tokens, cache_prefix)
+
+        if self.response_cache and result.get('success'):
+            self.response_cache.set(self.cache_namespace, key, copy.deepcopy(result))
+
+        return result
+
+    def _call_with_retries(self, prompt: str, system: str,
+                           temperature: float, max_tokens: int,
+                           cache_prefix: Optional[str] = None) -> Dict[str, Any]:
+        """Run the API call with circuit breaker, retries and tracking."""
         # Retry loop with backoff
         for attempt in range(self.max_retries):
             start_time = time.time()
@@ -563,19 +636,22 @@ class BaseAgent:
                 if self.circuit_breaker:
                     response = self.circuit_breaker.call(
                         self._make_api_call,
-                        prompt, system, temperature, max_tokens
+                        prompt, system, temperature, max_tokens, cache_prefix
                     )
                 else:
                     response = self._make_api_call(
-                        prompt, system, temperature, max_tokens
+                        prompt, system, temperature, max_tokens, cache_prefix
                     )
 
                 # Calculate metrics
                 latency = time.time() - start_time
+                cache_read, cache_write = cache_token_usage(response.usage)
                 cost = ModelPricing.calculate_cost(
                     self.model,
                     response.usage.input_tokens,
-                    response.usage.output_tokens
+                    response.usage.output_tokens,
+                    cache_read_tokens=cache_read,
+                    cache_write_tokens=cache_write
                 )
 
                 # Track success
@@ -605,6 +681,8 @@ class BaseAgent:
                     'tokens_in': response.usage.input_tokens,
                     'tokens_out': response.usage.output_tokens,
                     'total_tokens': response.usage.input_tokens + response.usage.output_tokens,
+                    'cache_read_tokens': cache_read,
+                    'cache_write_tokens': cache_write,
                     'cost': cost,
                     'model': self.model,
                     'attempt': attempt + 1,
@@ -664,14 +742,18 @@ class BaseAgent:
         return system
 
     def _make_api_call(self, prompt: str, system: str,
-                      temperature: float, max_tokens: int):
+                      temperature: float, max_tokens: int,
+                      cache_prefix: Optional[str] = None):
         """Make the actual API call."""
         return self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system,
-            messages=[{"role": "user", "content": prompt}]
+            system=system_blocks(system, cache=self.prompt_caching),
+            messages=[{
+                "role": "user",
+                "content": user_content(prompt, cache_prefix, cache=self.prompt_caching)
+            }]
         )
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -683,7 +765,9 @@ class BaseAgent:
             'role': self.role,
             'model': self.model,
             'metrics': self.local_metrics.get_summary(),
-            'circuit_breaker': circuit_status
+            'circuit_breaker': circuit_status,
+            'coalescing': self.single_flight.get_stats() if self.single_flight else None,
+            'response_cache': self.response_cache.get_stats() if self.response_cache else None
         }
 
     def reset(self):
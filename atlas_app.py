@@ -1620,16 +1620,17 @@ Focus on:
 
 Return ONLY the numbered questions, one per line."""
 
-                    result = optimizer.call(
-                        prompt=follow_up_prompt,
-                        context={}
-                    )
-                    if not result.success:
-                        raise Exception(result.error or "Optimizer call failed")
-                    response = result.output
+                    # Render questions as tokens arrive instead of after the full response
+                    st.info("💡 **Consider these clarifications:**")
+                    stream_placeholder = st.empty()
+                    response = ""
+                    for chunk in optimizer.stream_text(follow_up_prompt, context={}):
+                        response += chunk
+                        stream_placeholder.markdown(response + "▌")
+                    stream_placeholder.empty()
+
                     st.session_state.generator_follow_ups = response.strip().split('\n')
 
-                    st.info("💡 **Consider these clarifications:**")
                     for question in st.session_state.generator_follow_ups:
                         if question.strip():
                             st.markdown(f"- {question.strip()}")
@@ -0,0 +1,359 @@
+"""
+Cluster Worker Processes - Multi-Process Backend for ClusterNode
+
+Runs each ClusterNode's work packages in its own OS process so CPU-bound
+packages (parsing, consensus scoring, local validation) use more than one
+core. This module only depends on the standard library, so spawned workers
+start without importing the agent stack.
+
+Protocol (one duplex pipe per worker, pickled tuples):
+    parent -> worker: ("run", request_id, payload)
+                      ("cancel", request_id)
+                      None to stop
+    worker -> parent: ("result", request_id, ok, output_or_error)
+                      ("heartbeat", timestamp)
+
+Cancelling a submission drops the package if it is still queued in the
+worker; a package whose handler has already started runs to completion
+(threads cannot be interrupted) and its result is discarded.
+
+Payloads are compact tuples built by package_payload(), not WorkPackage
+dataclasses, so only the fields a handler needs cross the pipe.
+
+Usage:
+    worker = ProcessNodeWorker("node_000", handler=simulated_work_package)
+    worker.start()
+    output = await worker.submit(package_payload(package, dependencies_data))
+    worker.stop()
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import pickle
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = "heartbeat"
+RESULT = "result"
+RUN = "run"
+CANCEL = "cancel"
+
+# (package_id, name, type, inputs, compute_estimate, dependencies_data)
+PackagePayload = Tuple[str, str, str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]
+PackageHandler = Callable[[PackagePayload], Dict[str, Any]]
+
+
+class WorkerDiedError(RuntimeError):
+    """Raised for packages in flight when a worker process exits."""
+
+
+def package_payload(package, dependencies_data: Dict[str, Any]) -> PackagePayload:
+    """Compact, picklable form of a WorkPackage for a worker."""
+    return (package.id, package.name, package.type, package.inputs,
+            package.compute_estimate, dependencies_data)
+
+
+def execute_work_package(payload: PackagePayload) -> Dict[str, Any]:
+    """
+    Default package computation (the mock result the cluster produces).
+
+    Returns:
+        Dict with "result" and "confidence"
+    """
+    _, name, package_type, _, _, _ = payload
+
+    if package_type == "analysis":
+        result = {
+            "analysis": f"Analysis of {name}",
+            "findings": ["Finding 1", "Finding 2"],
+            "confidence": 0.92
+        }
+    elif package_type == "generation":
+        result = {
+            "generated": f"Generated content for {name}",
+            "tokens": 500
+        }
+    else:
+        result = {"computed": f"Result for {name}"}
+
+    return {"result": result, "confidence": 0.85 + random.random() * 0.15}  # 0.85-1.0
+
+
+def simulated_work_package(payload: PackagePayload) -> Dict[str, Any]:
+    """Default worker handler: block for the package's simulated runtime, then compute."""
+    time.sleep(0.1 * payload[4].get("runtime_seconds", 1))
+    return execute_work_package(payload)
+
+
+def _send(conn, lock: threading.Lock, message: Tuple) -> None:
+    data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    with lock:
+        conn.send_bytes(data)
+
+
+def _worker_main(conn, handler: PackageHandler, max_parallel: int, heartbeat_interval: float) -> None:
+    """Worker process entry point: run packages on a thread pool, send heartbeats."""
+    lock = threading.Lock()
+    stopping = threading.Event()
+    queued: Dict[int, Any] = {}  # request_id -> pool future
+    queued_lock = threading.Lock()
+
+    def heartbeat():
+        while not stopping.wait(heartbeat_interval):
+            try:
+                _send(conn, lock, (HEARTBEAT, time.time()))
+            except (OSError, EOFError):
+                return
+
+    def run(request_id: int, payload: PackagePayload):
+        with queued_lock:
+            queued.pop(request_id, None)
+        try:
+            message = (RESULT, request_id, True, handler(payload))
+        except Exception as e:
+            message = (RESULT, request_id, False, f"{type(e).__name__}: {e}")
+        try:
+            _send(conn, lock, message)
+        except (OSError, EOFError):
+            pass
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    with ThreadPoolExecutor(max_workers=max(max_parallel, 1)) as pool:
+        while True:
+            try:
+                message = pickle.loads(conn.recv_bytes())
+            except (EOFError, OSError):
+                break
+            if message is None:
+                break
+            if message[0] == RUN:
+                _, request_id, payload = message
+                with queued_lock:
+                    queued[request_id] = pool.submit(run, request_id, payload)
+            elif message[0] == CANCEL:
+                with queued_lock:
+                    future = queued.pop(message[1], None)
+                if future is not None:
+                    future.cancel()  # no-op once the handler has started
+
+    stopping.set()
+
+
+class ProcessNodeWorker:
+    """
+    Parent-side handle for one worker process.
+
+    A reader thread receives results and heartbeats. A heartbeat missing for
+    heartbeat_timeout seconds reports on_heartbeat(False); the next one
+    reports on_heartbeat(True). When the process exits unexpectedly,
+    on_death() is called and in-flight submissions fail with WorkerDiedError.
+
+    Callbacks run on the event loop of the latest submit() (or the loop
+    running when start() was called), not on the reader thread, so they
+    may touch state owned by that loop. With no open loop they run inline.
+    """
+
+    def __init__(self,
+                 node_id: str,
+                 handler: PackageHandler = simulated_work_package,
+                 max_parallel: int = 3,
+                 heartbeat_interval: float = 1.0,
+                 heartbeat_timeout: float = 5.0,
+                 on_heartbeat: Optional[Callable[[bool], None]] = None,
+                 on_death: Optional[Callable[[], None]] = None):
+        """
+        Initialize worker handle (call start() to spawn the process).
+
+        Args:
+            node_id: Owning node id (used for the process name)
+            handler: Module-level (picklable) function run for each payload
+            max_parallel: Packages run concurrently inside the worker
+            heartbeat_interval: Seconds between worker heartbeats
+            heartbeat_timeout: Seconds without a message before a miss is reported
+            on_heartbeat: Called with False on a missed heartbeat, True on recovery
+            on_death: Called once if the process exits without stop()
+        """
+        self.node_id = node_id
+        self.handler = handler
+        self.max_parallel = max_parallel
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.on_heartbeat = on_heartbeat
+        self.on_death = on_death
+
+        self.process = None
+        self.last_heartbeat: Optional[float] = None
+        self.missed_heartbeats = 0
+
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._pending: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._reader: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+        self._dead = False
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running and accepting packages."""
+        return self.process is not None and self.process.is_alive() and not self._dead
+
+    def start(self) -> None:
+        """Spawn the worker process and its reader thread."""
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.handler, self.max_parallel, self.heartbeat_interval),
+            name=f"cluster-worker-{self.node_id}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+        self.last_heartbeat = time.time()
+        self._reader = threading.Thread(target=self._read, name=f"cluster-reader-{self.node_id}", daemon=True)
+        self._reader.start()
+
+    async def submit(self, payload: PackagePayload) -> Dict[str, Any]:
+        """
+        Run a payload in the worker process.
+
+        Cancelling the awaiting task tells the worker to drop the package if
+        it has not started yet.
+
+        Returns:
+            Handler output
+
+        Raises:
+            WorkerDiedError: If the worker is not running or exits mid-package
+            RuntimeError: If the handler raised (message carries the error)
+        """
+        if not self.alive:
+            raise WorkerDiedError(f"Worker for {self.node_id} is not running")
+
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        future = loop.create_future()
+        request_id = next(self._request_ids)
+        with self._pending_lock:
+            self._pending[request_id] = (loop, future)
+
+        try:
+            _send(self._conn, self._send_lock, (RUN, request_id, payload))
+        except (OSError, EOFError) as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise WorkerDiedError(f"Worker for {self.node_id} is not running: {e}")
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            try:
+                _send(self._conn, self._send_lock, (CANCEL, request_id))
+            except (OSError, EOFError):
+                pass
+            raise
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker process (terminating it if it does not exit in time)."""
+        if self.process is None:
+            return
+        self._stopping = True
+        try:
+            _send(self._conn, self._send_lock, None)
+        except (OSError, EOFError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self._conn.close()
+        if self._reader is not None:
+            self._reader.join(timeout)
+
+    def _read(self) -> None:
+        """Reader thread: resolve results, track heartbeats, detect death."""
+        while True:
+            try:
+                if not self._conn.poll(self.heartbeat_timeout):
+                    if not self.process.is_alive():
+                        break
+                    self.missed_heartbeats += 1
+                    if self.on_heartbeat is not None:
+                        self._notify(self.on_heartbeat, False)
+                    continue
+                message = pickle.loads(self._conn.recv_bytes())
+            except (EOFError, OSError):
+                break
+
+            if message[0] == HEARTBEAT:
+                if self.missed_heartbeats and self.on_heartbeat is not None:
+                    self._notify(self.on_heartbeat, True)
+                self.missed_heartbeats = 0
+                self.last_heartbeat = message[1]
+            else:
+                _, request_id, ok, output = message
+                self._resolve(request_id, output if ok else RuntimeError(output))
+
+        self._dead = True
+        # Report death before failing submissions, so callers awaiting them
+        # already see the node's updated state
+        if not self._stopping:
+            logger.warning(f"Worker process for {self.node_id} died")
+            if self.on_death is not None:
+                self._notify(self.on_death)
+
+        with self._pending_lock:
+            pending = list(self._pending)
+        for request_id in pending:
+            self._resolve(request_id, WorkerDiedError(f"Worker for {self.node_id} exited"))
+
+    def _notify(self, callback: Callable, *args: Any) -> None:
+        """Run a callback on the owning event loop (inline if there is none)."""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(callback, *args)
+                return
+            except RuntimeError:
+                pass  # loop closed meanwhile
+        callback(*args)
+
+    def _resolve(self, request_id: int, outcome: Any) -> None:
+        with self._pending_lock:
+            entry = self._pending.get(request_id)
+        if entry is None:
+            return
+        loop, future = entry
+
+        def settle():
+            if future.done():
+                return
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+        try:
+            loop.call_soon_threadsafe(settle)
+        except RuntimeError:
+            pass  # loop already closed
@@ -12,27 +12,32 @@ import json
 import yaml
 import asyncio
 import psutil
-import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator, Callable
+from dataclasses import dataclass, field, fields, asdict
 from collections import deque, defaultdict
 from enum import Enum
 import numpy as np
 import logging
-import hashlib
 import pickle
+import uuid
 
 # Import base components
 try:
     from .agent_system import BaseAgent
     from .expert_agents import ExpertAgent, AgentRole
     from .learning_system import AdaptiveLearner
+    from .episodic_memory import EpisodeStore
+    from .workspace_probe import TTLCache, WorkspaceProbe
+    from .task_scheduler import TaskScheduler
 except ImportError:
     from agent_system import BaseAgent
     from expert_agents import ExpertAgent, AgentRole
     from learning_system import AdaptiveLearner
+    from episodic_memory import EpisodeStore
+    from workspace_probe import TTLCache, WorkspaceProbe
+    from task_scheduler import TaskScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -644,9 +649,13 @@ class CognitiveState:
 class PerceptionLayer:
     """
     Perception layer - awareness of environment and context.
+
+    Environment and project data are gathered concurrently in worker
+    threads and cached: environment data for `ttl` seconds, project data
+    through an incremental WorkspaceProbe.
     """
 
-    def __init__(self):
+    def __init__(self, project_root: Path = Path("."), ttl: float = 5.0):
         self.environment_monitor = BaseAgent(
             role="Environment Monitor",
             model="claude-3-5-sonnet-20241022",
@@ -657,37 +666,50 @@ class PerceptionLayer:
             model="claude-3-5-sonnet-20241022",
             temperature=0.2
         )
+        self.environment_cache = TTLCache(ttl)
+        self.workspace = WorkspaceProbe(project_root, ttl=ttl)
+
+        # Start the CPU sample window so later non-blocking reads are meaningful
+        psutil.cpu_percent(interval=None)
 
     async def perceive(self) -> Tuple[EnvironmentalContext, ProjectContext]:
         """Perceive current environment and project state."""
 
-        # Gather environmental data
-        env_data = self._gather_environment_data()
-        env_context = await self._analyze_environment(env_data)
+        # Gather off the event loop: both do blocking filesystem/process probing
+        env_data, proj_data = await asyncio.gather(
+            asyncio.to_thread(self._gather_environment_data),
+            asyncio.to_thread(self._gather_project_data)
+        )
 
-        # Gather project data
-        proj_data = self._gather_project_data()
-        proj_context = await self._analyze_project(proj_data)
+        env_context, proj_context = await asyncio.gather(
+            self._analyze_environment(env_data),
+            self._analyze_project(proj_data)
+        )
 
         return env_context, proj_context
 
     def _gather_environment_data(self) -> Dict[str, Any]:
-        """Gather raw environmental data."""
-        # CPU and Memory
-        cpu_percent = psutil.cpu_percent(interval=1)
+        """Gather raw environmental data (cached for the TTL)."""
+        cached = self.environment_cache.get("environment")
+        if cached is not None:
+            return cached
+
+        # CPU (usage since the previous call, without blocking) and Memory
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
 
         # Processes
-        python_procs = []
-        node_procs = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-            if 'python' in proc.info['name'].lower():
-                python_procs.append(proc.info)
-            elif 'node' in proc.info['name'].lower():
-                node_procs.append(proc.info)
-
-        return {
+        python_procs = 0
+        node_procs = 0
+        for proc in psutil.process_iter(['name']):
+            name = (proc.info['name'] or "").lower()
+            if 'python' in name:
+                python_procs += 1
+            elif 'node' in name:
+                node_procs += 1
+
+        data = {
             "cpu_percent": cpu_percent,
             "memory_used_gb": memory.used / (1024**3),
             "memory_total_gb": memory.total / (1024**3),
@@ -695,53 +717,27 @@ class PerceptionLayer:
             "disk_used_gb": disk.used / (1024**3),
             "disk_total_gb": disk.total / (1024**3),
             "disk_percent": disk.percent,
-            "python_processes": len(python_procs),
-            "node_processes": len(node_procs),
+            "python_processes": python_procs,
+            "node_processes": node_procs,
             "network_status": "connected",  # Simplified
             "claude_api_status": "up",
             "github_api_status": "up",
             "api_response_times": {"claude": 200, "github": 150}
         }
+        self.environment_cache.put("environment", data)
+        return data
 
     def _gather_project_data(self) -> Dict[str, Any]:
-        """Gather raw project data."""
-        try:
-            # Git status
-            git_status = subprocess.run(
-                ['git', 'status', '--short'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            ).stdout
-
-            # Recent commits
-            recent_commits = subprocess.run(
-                ['git', 'log', '--oneline', '-5'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            ).stdout
-
-            # Find TODO/FIXME comments
-            todos = subprocess.run(
-                ['grep', '-r', '-E', 'TODO|FIXME', '--include=*.py', '.'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            ).stdout[:500]  # Limit output
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            git_status = ""
-            recent_commits = ""
-            todos = ""
+        """Gather raw project data (incremental git and TODO scans)."""
+        workspace = self.workspace.snapshot()
 
         return {
-            "git_status": git_status,
-            "recent_commits": recent_commits,
+            "git_status": workspace["git_status"],
+            "recent_commits": workspace["recent_commits"],
             "open_files": [],  # Would track in real implementation
             "recent_edits": [],
             "test_results": {"passing": 10, "failing": 2},
-            "todo_comments": todos,
+            "todo_comments": workspace["todo_comments"],
             "open_issues": []
         }
 
@@ -823,9 +819,13 @@ class PerceptionLayer:
 class ReasoningLayer:
     """
     Reasoning layer - planning and execution.
+
+    Milestone tasks run through a TaskScheduler: each starts once its
+    dependencies succeed and a slot and its agent are free, so a milestone
+    takes its critical-path time.
     """
 
-    def __init__(self):
+    def __init__(self, max_parallel_tasks: int = 3):
         self.strategic_planner = BaseAgent(
             role="Strategic Planner",
             model="claude-3-5-sonnet-20241022",
@@ -838,6 +838,7 @@ class ReasoningLayer:
         )
         self.current_plan = None
         self.execution_history = []
+        self.max_parallel_tasks = max_parallel_tasks
 
     async def plan(self,
                    env_context: EnvironmentalContext,
@@ -892,44 +893,125 @@ class ReasoningLayer:
 
     async def execute_milestone(self,
                                milestone: Dict[str, Any],
-                               resources: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tactical milestone."""
-
-        # Break down into tasks
-        tasks = self._decompose_milestone(milestone)
-
-        # Execute tasks
+                               resources: Dict[str, Any],
+                               on_task_result: Optional[Callable[[Dict[str, Any]], None]] = None
+                               ) -> Dict[str, Any]:
+        """
+        Execute a tactical milestone.
+
+        Args:
+            milestone: Milestone from the plan
+            resources: May hold "available_agents" (each runs one task at a
+                time; tasks needing other agents fail), "capacity" (amounts
+                of other resources tasks name in their "resources") and
+                "max_parallel_tasks"
+            on_task_result: Called with each task result as it finishes
+        """
         results = []
-        for task in tasks:
-            result = await self._execute_task(task, resources)
+        async for result in self.stream_milestone(milestone, resources):
             results.append(result)
+            if on_task_result is not None:
+                on_task_result(result)
+
+        tasks = self._decompose_milestone(milestone)
 
         # Compile execution report
         execution_report = {
             "milestone_id": milestone["id"],
             "status": "completed" if all(r["success"] for r in results) else "partial",
             "tasks_completed": sum(1 for r in results if r["success"]),
-            "time_taken": sum(r["time"] for r in results),
+            "tasks_failed": sum(1 for r in results if not r["success"]),
+            "time_taken": self._critical_path_time(tasks, results),
             "output": {"task_results": results}
         }
 
         self.execution_history.append(execution_report)
         return execution_report
 
+    async def stream_milestone(self,
+                               milestone: Dict[str, Any],
+                               resources: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Execute a milestone's tasks concurrently, yielding results as they finish."""
+        tasks = self._decompose_milestone(milestone)
+        scheduler = TaskScheduler(
+            max_concurrency=resources.get("max_parallel_tasks", self.max_parallel_tasks),
+            capacity=self._resource_capacity(tasks, resources)
+        )
+
+        async def execute(task: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._execute_task(task, resources)
+
+        async for result in scheduler.run(tasks, execute, demand=self._task_demand):
+            yield result
+
     def _decompose_milestone(self, milestone: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Break milestone into atomic tasks."""
+        """Break milestone into atomic tasks with dependency edges."""
         # Simplified task decomposition
+        agents = milestone.get("resources_required", {}).get("agents", [])
         if milestone["name"] == "Fix failing tests":
             return [
-                {"id": "T1", "name": "Identify failing tests", "time": 5},
-                {"id": "T2", "name": "Debug test failures", "time": 15},
-                {"id": "T3", "name": "Fix code issues", "time": 10}
+                {"id": "T1", "name": "Identify failing tests", "time": 5,
+                 "dependencies": [], "agent": "test-specialist"},
+                {"id": "T2", "name": "Debug test failures", "time": 15,
+                 "dependencies": ["T1"], "agent": "test-specialist"},
+                {"id": "T3", "name": "Fix code issues", "time": 10,
+                 "dependencies": ["T2"], "agent": "test-specialist"}
+            ]
+        elif len(agents) > 1:
+            # One workstream per specialist between shared design and integration
+            return [
+                {"id": "T1", "name": f"Design {milestone['name'].lower()}", "time": 10, "dependencies": []},
+                *[
+                    {"id": f"T{i}", "name": f"{agent} work", "time": 30,
+                     "dependencies": ["T1"], "agent": agent}
+                    for i, agent in enumerate(agents, start=2)
+                ],
+                {"id": f"T{len(agents) + 2}", "name": "Integrate workstreams", "time": 10,
+                 "dependencies": [f"T{i}" for i in range(2, len(agents) + 2)]}
             ]
         else:
             return [
-                {"id": "T1", "name": "Generic task", "time": 10}
+                {"id": "T1", "name": "Generic task", "time": 10, "dependencies": [],
+                 **({"agent": agents[0]} if agents else {})}
             ]
 
+    @staticmethod
+    def _task_demand(task: Dict[str, Any]) -> Dict[str, float]:
+        """Resources a task holds while running: its agent plus declared resources."""
+        demand = dict(task.get("resources", {}))
+        if task.get("agent"):
+            demand[task["agent"]] = demand.get(task["agent"], 0) + 1
+        return demand
+
+    @staticmethod
+    def _resource_capacity(tasks: List[Dict[str, Any]], resources: Dict[str, Any]) -> Dict[str, float]:
+        """Scheduler capacity from the resources dict (unlisted resources are unlimited)."""
+        capacity = dict(resources.get("capacity", {}))
+        if "available_agents" in resources:
+            available = set(resources["available_agents"])
+            for task in tasks:
+                if task.get("agent"):
+                    capacity[task["agent"]] = 1 if task["agent"] in available else 0
+        return capacity
+
+    @staticmethod
+    def _critical_path_time(tasks: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> float:
+        """Longest dependency chain of task times (tasks that did not run take 0)."""
+        times = {r["task_id"]: r["time"] for r in results}
+        finish: Dict[str, float] = {}
+        remaining = [task for task in tasks if task["id"] in times]
+        while remaining:
+            progressed = False
+            for task in list(remaining):
+                deps = [dep for dep in task.get("dependencies", []) if dep in times]
+                if all(dep in finish for dep in deps):
+                    finish[task["id"]] = max((finish[dep] for dep in deps), default=0) + times[task["id"]]
+                    remaining.remove(task)
+                    progressed = True
+            if not progressed:  # cycle; those tasks never ran
+                break
+        return max(finish.values(), default=0)
+
     async def _execute_task(self, task: Dict[str, Any], resources: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single task."""
         # Simulate task execution
@@ -946,15 +1028,23 @@ class ReasoningLayer:
 class MemorySystems:
     """
     Memory systems - episodic and semantic memory.
+
+    Episodes are appended to an EpisodeStore log (episodes.jsonl, read
+    lazily) and retrieved through its TF-IDF tag index over every recorded
+    episode. episodic_memory holds the episodes recorded by this instance.
     """
 
-    def __init__(self, memory_path: str = "/home/jevenson/.claude/cognitive_memory"):
+    def __init__(self,
+                 memory_path: str = "/home/jevenson/.claude/cognitive_memory",
+                 max_episodes: Optional[int] = None):
         self.memory_path = Path(memory_path)
         self.memory_path.mkdir(parents=True, exist_ok=True)
 
+        self.episodes = EpisodeStore(self.memory_path / "episodes.jsonl", max_episodes=max_episodes)
         self.episodic_memory = deque(maxlen=1000)
         self.semantic_memory = {}
-        self.episode_index = {}
+        self.episode_index = self.episodes.index
+        self._semantic_dirty = False
 
         self._load_memories()
 
@@ -1009,28 +1099,21 @@ class MemorySystems:
                 concept.confidence = min(1.0, concept.confidence + 0.1)
                 concept.usage_count += 1
                 concept.last_accessed = datetime.now()
+            self._semantic_dirty = True
 
         # Add relationships
         for from_concept, rel_type, to_concept, strength in relationships:
             if from_concept in self.semantic_memory:
                 concept = self.semantic_memory[from_concept]
                 concept.relationships[rel_type].append((to_concept, strength))
+                self._semantic_dirty = True
 
     def retrieve_relevant_episodes(self, context: Dict[str, Any], limit: int = 5) -> List[Episode]:
-        """Retrieve episodes relevant to current context."""
-        # Simple retrieval based on tags
-        current_tags = set(context.get("tags", []))
-
-        scored_episodes = []
-        for episode in self.episodic_memory:
-            episode_tags = set(episode.tags)
-            overlap = len(current_tags & episode_tags)
-            if overlap > 0:
-                scored_episodes.append((overlap, episode))
-
-        # Sort by relevance and return top matches
-        scored_episodes.sort(key=lambda x: x[0], reverse=True)
-        return [ep for _, ep in scored_episodes[:limit]]
+        """Retrieve episodes relevant to current context (TF-IDF tag match over all episodes)."""
+        return [
+            self._episode_from_record(record)
+            for record, _ in self.episodes.search(context.get("tags", []), limit)
+        ]
 
     def get_concept_knowledge(self, concept_name: str) -> Optional[Concept]:
         """Retrieve knowledge about a concept."""
@@ -1038,7 +1121,7 @@ class MemorySystems:
 
     def _generate_episode_id(self) -> str:
         """Generate unique episode ID."""
-        return hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
+        return uuid.uuid4().hex[:16]
 
     def _extract_successes(self, results: Dict[str, Any]) -> List[str]:
         """Extract successes from results."""
@@ -1062,24 +1145,27 @@ class MemorySystems:
         return list(set(tags))
 
     def _find_similar_episodes(self, goals: List[str], actions: List[str]) -> List[Tuple[str, float]]:
-        """Find similar past episodes."""
-        similar = []
-        current_tags = set(self._generate_tags(goals, actions))
-
-        for episode in list(self.episodic_memory)[-20:]:  # Check last 20
-            episode_tags = set(episode.tags)
-            similarity = len(current_tags & episode_tags) / max(len(current_tags), 1)
-            if similarity > 0.3:
-                similar.append((episode.id, similarity))
-
-        return similar[:3]
+        """Find the most similar past episodes (IDF-weighted share of current tags)."""
+        current_tags = self._generate_tags(goals, actions)
+        return self.episodes.search_ids(current_tags, limit=3, min_score=0.3)
 
     def _index_episode(self, episode: Episode):
-        """Index episode for fast retrieval."""
-        for tag in episode.tags:
-            if tag not in self.episode_index:
-                self.episode_index[tag] = []
-            self.episode_index[tag].append(episode.id)
+        """Append episode to the log and tag index."""
+        self.episodes.append(self._episode_record(episode))
+
+    @staticmethod
+    def _episode_record(episode: Episode) -> Dict[str, Any]:
+        record = {f.name: getattr(episode, f.name) for f in fields(Episode)}  # shallow; asdict deep-copies
+        record["timestamp"] = episode.timestamp.isoformat()
+        return record
+
+    @staticmethod
+    def _episode_from_record(record: Dict[str, Any]) -> Episode:
+        return Episode(**{
+            **record,
+            "timestamp": datetime.fromisoformat(record["timestamp"]),
+            "similar_episodes": [tuple(similar) for similar in record["similar_episodes"]]
+        })
 
     def _classify_concept(self, concept_name: str) -> str:
         """Classify concept type."""
@@ -1093,25 +1179,31 @@ class MemorySystems:
             return "technique"
 
     def _load_memories(self):
-        """Load memories from disk."""
+        """Load memories from disk (episodes are read lazily by the EpisodeStore)."""
         episodic_path = self.memory_path / "episodic.pkl"
         semantic_path = self.memory_path / "semantic.pkl"
 
-        if episodic_path.exists():
+        # One-time migration of the old pickled episode deque into the log
+        if episodic_path.exists() and not self.episodes.path.exists():
             with open(episodic_path, 'rb') as f:
-                self.episodic_memory = pickle.load(f)
+                legacy = pickle.load(f)
+            for episode in legacy:
+                self._index_episode(episode)
+            self.episodes.flush()
+            logger.info(f"Migrated {len(legacy)} episodes to {self.episodes.path}")
 
         if semantic_path.exists():
             with open(semantic_path, 'rb') as f:
                 self.semantic_memory = pickle.load(f)
 
     def save_memories(self):
-        """Save memories to disk."""
-        with open(self.memory_path / "episodic.pkl", 'wb') as f:
-            pickle.dump(self.episodic_memory, f)
+        """Save memories to disk (episodes are already in the log; semantic memory only if changed)."""
+        self.episodes.flush()
 
-        with open(self.memory_path / "semantic.pkl", 'wb') as f:
-            pickle.dump(self.semantic_memory, f)
+        if self._semantic_dirty:
+            with open(self.memory_path / "semantic.pkl", 'wb') as f:
+                pickle.dump(self.semantic_memory, f)
+            self._semantic_dirty = False
 
 
 class Metacognition:
@@ -1132,6 +1224,7 @@ class Metacognition:
         )
 
         self.performance_history = deque(maxlen=100)
+        self.task_results = deque(maxlen=100)
         self.current_cognitive_state = CognitiveState(
             active_goals=[],
             current_strategy=self._default_strategy(),
@@ -1142,6 +1235,14 @@ class Metacognition:
             completion_rate=0.8
         )
 
+    def observe_task_result(self, result: Dict[str, Any]):
+        """Update the cognitive state from a task result as soon as it finishes."""
+        self.task_results.append(result)
+        failures = sum(1 for r in self.task_results if not r.get("success"))
+        self.current_cognitive_state.error_rate = failures / len(self.task_results)
+        if not result.get("success"):
+            logger.info(f"Task {result.get('task_id')} failed: {result.get('error', 'unknown error')}")
+
     def analyze_performance(self,
                            completed_tasks: int,
                            planned_tasks: int,
@@ -1340,9 +1441,14 @@ class CognitiveProcessor:
         # Execute first milestone (simplified for demo)
         if plan["milestones"]:
             milestone = plan["milestones"][0]
+            strategy = self.metacognition.current_cognitive_state.current_strategy
             execution_result = await self.reasoning.execute_milestone(
                 milestone,
-                {"available_agents": ["test-specialist"]}
+                {
+                    "available_agents": ["test-specialist"],
+                    "max_parallel_tasks": strategy["max_parallel_tasks"]
+                },
+                on_task_result=self.metacognition.observe_task_result
             )
         else:
             execution_result = {"status": "no_milestones"}
@@ -1369,7 +1475,7 @@ class CognitiveProcessor:
             planned_tasks=len(plan.get("milestones", [])),
             time_taken=duration,
             time_estimated=plan.get("total_estimated_time", 60),
-            errors=0
+            errors=execution_result.get("tasks_failed", 0)
         )
 
         strategy_update = self.metacognition.adjust_strategy(performance)
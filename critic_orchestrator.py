@@ -23,21 +23,35 @@ Usage:
 
     # Get aggregated report
     report = orchestrator.generate_report(results)
+
+    # Critics run concurrently (bounded by max_concurrency, each with a timeout)
+    orchestrator = CriticOrchestrator(max_concurrency=3, critic_timeout=120)
+    results = await orchestrator.areview_code(code_snippet)
+
+    # Watch the aggregated report fill in as critics finish
+    for report in orchestrator.stream_report(code_snippet, file_path="app/users.py"):
+        print(report.success_count, report.overall_score)
+
+    # Incremental review: only changed functions/classes are sent to critics
+    orchestrator = CriticOrchestrator(review_cache=ReviewCache())
 """
 
+import asyncio
 import json
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Iterator
+from dataclasses import dataclass, field, replace
 
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from agent_system import BaseAgent
+from utils.review_cache import ReviewCache, severity_stats
 
 # Observability
 try:
@@ -139,14 +153,34 @@ class CriticOrchestrator:
     # Opus model - MANDATORY, no fallback
     OPUS_MODEL = "claude-opus-4-20250514"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Static review instructions, built once and sent verbatim with every review
+    REVIEW_INSTRUCTIONS = (
+        "\n# Instructions\n\n"
+        "Analyze the code above according to your specialized domain. "
+        "Output your findings in the JSON schema format specified in your definition. "
+        "Focus ONLY on your domain - do not comment on other domains. "
+        "Every finding must include specific location, severity, impact, and concrete recommendation."
+    )
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 max_concurrency: int = 5,
+                 critic_timeout: Optional[float] = None,
+                 review_cache: Optional[ReviewCache] = None):
         """
         Initialize CriticOrchestrator.
 
         Args:
             api_key: Anthropic API key (uses env var ANTHROPIC_API_KEY if not provided)
+            max_concurrency: Maximum critics running at once (1 = sequential)
+            critic_timeout: Per-critic timeout in seconds (None = no timeout)
+            review_cache: Optional per-unit review cache; when set, only changed
+                functions/classes are sent to critics and cached findings are reused
         """
         self.api_key = api_key
+        self.max_concurrency = max(1, max_concurrency)
+        self.critic_timeout = critic_timeout
+        self.review_cache = review_cache
         self._critic_agents: Dict[str, BaseAgent] = {}
 
         # Initialize observability
@@ -178,34 +212,21 @@ class CriticOrchestrator:
                 system_prompt=critic_definition,
                 temperature=0.3,  # Low temperature for consistent analysis
                 max_tokens=4096,
-                use_circuit_breaker=True  # Resilience enabled (no fallback needed separately)
+                use_circuit_breaker=True,  # Resilience enabled (no fallback needed separately)
+                prompt_caching=True  # Critic definition is a large, static system prompt
             )
             self._critic_agents[critic_id] = agent
 
         print(f"Loaded {len(self._critic_agents)}/{len(self.CRITICS)} critics")
 
-    def review_code(
+    def _prepare_review(
         self,
         code_snippet: str,
-        file_path: Optional[str] = None,
-        critics: Optional[List[str]] = None,
-        language: Optional[str] = None
-    ) -> Dict[str, CriticResult]:
-        """
-        Review code with specified critics (or all critics).
-
-        FRESH CONTEXT ENFORCEMENT: Critics receive ONLY the code snippet,
-        with no history or context about creation.
-
-        Args:
-            code_snippet: Code to review
-            file_path: Optional file path for context in findings
-            critics: List of critic IDs to run (None = all critics)
-            language: Programming language hint (auto-detected if None)
-
-        Returns:
-            Dictionary mapping critic_id to CriticResult
-        """
+        file_path: Optional[str],
+        critics: Optional[List[str]],
+        language: Optional[str]
+    ) -> Tuple[List[str], str]:
+        """Validate critic IDs, build the prompt and emit the review-started event."""
         # Determine which critics to run
         critics_to_run = critics or list(self.CRITICS.keys())
 
@@ -232,73 +253,252 @@ class CriticOrchestrator:
                 data={"critics": critics_to_run, "file": file_path}
             )
 
-        # Run critics
-        results = {}
+        loaded = []
         for critic_id in critics_to_run:
             if critic_id not in self._critic_agents:
                 print(f"Skipping {critic_id}: not loaded")
                 continue
+            loaded.append(critic_id)
 
-            # Emit critic invoked event
-            if self.emitter:
-                self.emitter.start_span(critic_id)
-                self.emitter.emit(
-                    event_type=EventType.CRITIC_STARTED,
-                    component=critic_id,
-                    message=f"Invoking {critic_id}",
-                    severity=EventSeverity.INFO,
-                    agent=critic_id,
-                    model=self.OPUS_MODEL
-                )
+        return loaded, prompt
 
-            result = self._run_critic(critic_id, prompt)
-            results[critic_id] = result
-
-            # Emit critic completed/failed event
-            if self.emitter:
-                if result.success:
-                    self.emitter.emit(
-                        event_type=EventType.CRITIC_COMPLETED,
-                        component=critic_id,
-                        message=f"{critic_id} completed with score {result.overall_score}",
-                        severity=EventSeverity.INFO,
-                        agent=critic_id,
-                        duration_ms=result.execution_time_seconds * 1000,
-                        cost_usd=result.cost_usd,
-                        quality_score=float(result.overall_score)
-                    )
-                    # Emit quality measured
-                    self.emitter.emit(
-                        event_type=EventType.QUALITY_MEASURED,
-                        component=critic_id,
-                        message=f"Quality score: {result.overall_score} ({result.grade})",
-                        severity=EventSeverity.INFO,
-                        quality_score=float(result.overall_score),
-                        data={"grade": result.grade, "findings_count": len(result.findings)}
+    def iter_review(
+        self,
+        code_snippet: str,
+        file_path: Optional[str] = None,
+        critics: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Iterator[CriticResult]:
+        """
+        Run critics concurrently, yielding each CriticResult as it completes.
+
+        Critics run on a thread pool bounded by max_concurrency. A critic that
+        exceeds its timeout (measured from when it started, not when it was
+        queued) yields an error result; its thread is abandoned, not killed.
+
+        Events for each critic are emitted from the calling thread once that
+        critic finishes, so every critic's events sit contiguously in its own
+        span even though the critics overlap in time.
+
+        Args:
+            code_snippet: Code to review
+            file_path: Optional file path for context in findings
+            critics: List of critic IDs to run (None = all critics)
+            language: Programming language hint (auto-detected if None)
+            max_concurrency: Override the orchestrator's concurrency cap
+            timeout: Override the orchestrator's per-critic timeout
+
+        Yields:
+            CriticResult in completion order
+        """
+        critics_to_run, prompt = self._prepare_review(code_snippet, file_path, critics, language)
+        if not critics_to_run:
+            return
+
+        workers = min(max_concurrency or self.max_concurrency, len(critics_to_run))
+        timeout = timeout if timeout is not None else self.critic_timeout
+        started_at: Dict[str, float] = {}
+
+        def run(critic_id: str) -> CriticResult:
+            started_at[critic_id] = time.time()
+            if self.review_cache:
+                return self._run_critic_incremental(critic_id, code_snippet, file_path, language)
+            return self._run_critic(critic_id, prompt)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="critic")
+        try:
+            pending = {executor.submit(run, critic_id): critic_id for critic_id in critics_to_run}
+            while pending:
+                done, _ = wait(pending, timeout=0.1 if timeout else None, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    critic_id = pending.pop(future)
+                    result = future.result()
+                    self._emit_critic_events(critic_id, result)
+                    yield result
+
+                if timeout:
+                    now = time.time()
+                    for future, critic_id in list(pending.items()):
+                        started = started_at.get(critic_id)
+                        if started is not None and now - started > timeout and not future.done():
+                            del pending[future]
+                            result = self._error_result(
+                                critic_id, f"Critic timed out after {timeout:.0f}s", now - started
+                            )
+                            self._emit_critic_events(critic_id, result)
+                            yield result
+        finally:
+            # Don't block on timed-out critics; drop any that never started
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def review_code(
+        self,
+        code_snippet: str,
+        file_path: Optional[str] = None,
+        critics: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, CriticResult]:
+        """
+        Review code with specified critics (or all critics).
+
+        FRESH CONTEXT ENFORCEMENT: Critics receive ONLY the code snippet,
+        with no history or context about creation.
+
+        Critics run concurrently (see iter_review).
+
+        Args:
+            code_snippet: Code to review
+            file_path: Optional file path for context in findings
+            critics: List of critic IDs to run (None = all critics)
+            language: Programming language hint (auto-detected if None)
+            max_concurrency: Override the orchestrator's concurrency cap
+            timeout: Override the orchestrator's per-critic timeout
+
+        Returns:
+            Dictionary mapping critic_id to CriticResult (in requested critic order)
+        """
+        completed = {
+            result.critic_type: result
+            for result in self.iter_review(
+                code_snippet, file_path, critics, language, max_concurrency, timeout
+            )
+        }
+        order = critics or list(self.CRITICS.keys())
+        return {critic_id: completed[critic_id] for critic_id in order if critic_id in completed}
+
+    async def areview_code(
+        self,
+        code_snippet: str,
+        file_path: Optional[str] = None,
+        critics: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, CriticResult]:
+        """
+        Async variant of review_code.
+
+        Critics run on a private thread pool, bounded by an asyncio.Semaphore,
+        each wrapped in asyncio.wait_for for its timeout. The pool is shut
+        down without waiting, so a timed-out critic never holds up the loop.
+
+        Returns:
+            Dictionary mapping critic_id to CriticResult (in requested critic order)
+        """
+        critics_to_run, prompt = self._prepare_review(code_snippet, file_path, critics, language)
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        timeout = timeout if timeout is not None else self.critic_timeout
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(critics_to_run)), thread_name_prefix="critic"
+        )
+
+        def call(critic_id: str) -> CriticResult:
+            if self.review_cache:
+                return self._run_critic_incremental(critic_id, code_snippet, file_path, language)
+            return self._run_critic(critic_id, prompt)
+
+        async def run(critic_id: str) -> CriticResult:
+            async with semaphore:
+                start = time.time()
+                try:
+                    result = await asyncio.wait_for(
+                        loop.run_in_executor(executor, call, critic_id),
+                        timeout
                     )
-                else:
-                    self.emitter.emit(
-                        event_type=EventType.CRITIC_FAILED,
-                        component=critic_id,
-                        message=f"{critic_id} failed: {result.error}",
-                        severity=EventSeverity.ERROR,
-                        error=result.error
+                except asyncio.TimeoutError:
+                    result = self._error_result(
+                        critic_id, f"Critic timed out after {timeout:.0f}s", time.time() - start
                     )
+            # Runs on the loop thread between awaits, so spans never interleave
+            self._emit_critic_events(critic_id, result)
+            return result
 
-                # Emit cost event
-                if result.cost_usd and result.cost_usd > 0:
-                    self.emitter.emit(
-                        event_type=EventType.COST_INCURRED,
-                        component=critic_id,
-                        message=f"Cost incurred: ${result.cost_usd:.4f}",
-                        severity=EventSeverity.INFO,
-                        cost_usd=result.cost_usd,
-                        data={"model": self.OPUS_MODEL}
-                    )
+        try:
+            results = await asyncio.gather(*(run(critic_id) for critic_id in critics_to_run))
+        finally:
+            executor.shutdown(wait=False)
+        return dict(zip(critics_to_run, results))
+
+    def stream_report(
+        self,
+        code_snippet: str,
+        file_path: Optional[str] = None,
+        critics: Optional[List[str]] = None,
+        language: Optional[str] = None
+    ) -> Iterator[AggregatedReport]:
+        """
+        Yield an updated AggregatedReport each time a critic finishes.
+
+        The last report yielded covers every critic that ran.
+        """
+        results: Dict[str, CriticResult] = {}
+        for result in self.iter_review(code_snippet, file_path, critics, language):
+            results[result.critic_type] = result
+            yield self.generate_report(results, code_snippet, file_path)
+
+    def _emit_critic_events(self, critic_id: str, result: CriticResult):
+        """Emit one critic's events inside its own span."""
+        if not self.emitter:
+            return
+
+        self.emitter.start_span(critic_id)
+        self.emitter.emit(
+            event_type=EventType.CRITIC_STARTED,
+            component=critic_id,
+            message=f"Invoking {critic_id}",
+            severity=EventSeverity.INFO,
+            agent=critic_id,
+            model=self.OPUS_MODEL
+        )
 
-                self.emitter.end_span()
+        # Emit critic completed/failed event
+        if result.success:
+            self.emitter.emit(
+                event_type=EventType.CRITIC_COMPLETED,
+                component=critic_id,
+                message=f"{critic_id} completed with score {result.overall_score}",
+                severity=EventSeverity.INFO,
+                agent=critic_id,
+                duration_ms=result.execution_time_seconds * 1000,
+                cost_usd=result.cost_usd,
+                quality_score=float(result.overall_score)
+            )
+            # Emit quality measured
+            self.emitter.emit(
+                event_type=EventType.QUALITY_MEASURED,
+                component=critic_id,
+                message=f"Quality score: {result.overall_score} ({result.grade})",
+                severity=EventSeverity.INFO,
+                quality_score=float(result.overall_score),
+                data={"grade": result.grade, "findings_count": len(result.findings)}
+            )
+        else:
+            self.emitter.emit(
+                event_type=EventType.CRITIC_FAILED,
+                component=critic_id,
+                message=f"{critic_id} failed: {result.error}",
+                severity=EventSeverity.ERROR,
+                error=result.error
+            )
+
+        # Emit cost event
+        if result.cost_usd and result.cost_usd > 0:
+            self.emitter.emit(
+                event_type=EventType.COST_INCURRED,
+                component=critic_id,
+                message=f"Cost incurred: ${result.cost_usd:.4f}",
+                severity=EventSeverity.INFO,
+                cost_usd=result.cost_usd,
+                data={"model": self.OPUS_MODEL}
+            )
 
-        return results
+        self.emitter.end_span()
 
     def _build_fresh_context_prompt(
         self,
@@ -340,13 +540,7 @@ class CriticOrchestrator:
         prompt_parts.append("```")
 
         # Instructions
-        prompt_parts.append("\n# Instructions\n")
-        prompt_parts.append(
-            "Analyze the code above according to your specialized domain. "
-            "Output your findings in the JSON schema format specified in your definition. "
-            "Focus ONLY on your domain - do not comment on other domains. "
-            "Every finding must include specific location, severity, impact, and concrete recommendation."
-        )
+        prompt_parts.append(self.REVIEW_INSTRUCTIONS)
 
         return "\n".join(prompt_parts)
 
@@ -399,22 +593,77 @@ class CriticOrchestrator:
             execution_time = (datetime.now() - start_time).total_seconds()
 
             # Return error result
-            return CriticResult(
+            return self._error_result(critic_id, str(e), execution_time)
+
+    def _error_result(self, critic_id: str, error: str, execution_time: float) -> CriticResult:
+        """Build a failed CriticResult."""
+        return CriticResult(
+            critic_type=critic_id,
+            model_used=self.OPUS_MODEL,
+            analysis_timestamp=datetime.now().isoformat(),
+            overall_score=0,
+            grade="ERROR",
+            summary=f"Critic failed: {error}",
+            findings=[],
+            statistics={},
+            metrics={},
+            execution_time_seconds=execution_time,
+            cost_usd=self._critic_agents[critic_id].cost_tracker.total_cost,
+            success=False,
+            error=error
+        )
+
+    def _run_critic_incremental(
+        self,
+        critic_id: str,
+        code_snippet: str,
+        file_path: Optional[str],
+        language: Optional[str]
+    ) -> CriticResult:
+        """
+        Run a critic on changed code units only, merging cached findings.
+
+        Findings are reported in the original snippet's line numbers. Failed
+        reviews are not cached.
+        """
+        plan = self.review_cache.plan(code_snippet, critic_id)
+        start_time = datetime.now()
+
+        if plan.changed:
+            # Language hint still comes from file_path; only the snippet shrinks
+            prompt = self._build_fresh_context_prompt(plan.snippet, file_path, language)
+            result = self._run_critic(critic_id, prompt)
+            if not result.success:
+                return result
+            self.review_cache.record(plan, result.findings, result.overall_score, result.grade)
+        else:
+            result = CriticResult(
                 critic_type=critic_id,
                 model_used=self.OPUS_MODEL,
                 analysis_timestamp=datetime.now().isoformat(),
                 overall_score=0,
-                grade="ERROR",
-                summary=f"Critic failed: {str(e)}",
+                grade="UNKNOWN",
+                summary="No changes since last review; findings reused from cache",
                 findings=[],
                 statistics={},
                 metrics={},
-                execution_time_seconds=execution_time,
-                cost_usd=agent.cost_tracker.total_cost,
-                success=False,
-                error=str(e)
+                execution_time_seconds=(datetime.now() - start_time).total_seconds(),
+                cost_usd=0.0,
+                success=True
             )
 
+        merged = self.review_cache.merge(plan)
+        grade_priority = {"CRITICAL": 0, "POOR": 1, "FAIR": 2, "GOOD": 3, "EXCELLENT": 4}
+        known_grades = [g for g in merged.labels if g in grade_priority]
+        return replace(
+            result,
+            overall_score=round(merged.score),
+            grade=min(known_grades, key=grade_priority.get) if known_grades else result.grade,
+            findings=merged.findings,
+            statistics=severity_stats(merged.findings),
+            metrics={**result.metrics, "incremental": merged.stats}
+        )
+
     def _extract_json(self, response: str) -> Dict[str, Any]:
         """
         Extract JSON from critic response.
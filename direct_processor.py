@@ -8,13 +8,13 @@ This module processes tasks directly in the Atlas UI thread, providing:
 - Actual document processing using orchestrated AI agents
 """
 
+import asyncio
 import json
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 import subprocess
-import tempfile
 import sys
 
 # Add lib directory to path for imports
@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from document_orchestrator import DocumentProcessingOrchestrator
 from agent_system import CostTracker
+from mcp_bridge import get_bridge
 
 
 class DirectProcessor:
@@ -360,11 +361,6 @@ Generate complete CSV with all tasks, dependencies, and timelines."""
             }
 
         try:
-            # Write prompt to temp file
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-                f.write(prompt)
-                prompt_file = f.name
-
             self.emit_event(
                 agent="Claude Code CLI",
                 action=f"Sending {len(prompt):,} character prompt to {model}...",
@@ -372,35 +368,37 @@ Generate complete CSV with all tasks, dependencies, and timelines."""
                 progress=50
             )
 
-            # Execute Claude Code
-            # Note: This is a simplified version - actual implementation would use the MCP bridge
-            result = subprocess.run(
-                [self.claude_cli, 'query', '--file', prompt_file],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            # Execute via the MCP bridge (pooled, pre-warmed CLI workers)
+            response = asyncio.run(get_bridge().call_model(
+                model=model,
+                messages=[{"role": "user", "content": prompt}]
+            ))
+
+            output = response.get("result", response.get("content", ""))
+            is_error = bool(response.get("is_error"))
 
             self.emit_event(
                 agent="Claude Code CLI",
-                action=f"Received {len(result.stdout):,} character response",
+                action=f"Received {len(output):,} character response",
                 model=model,
                 progress=80
             )
 
-            # Clean up
-            Path(prompt_file).unlink()
-
             return {
-                "output": result.stdout,
-                "error": result.stderr if result.returncode != 0 else None,
-                "return_code": result.returncode
+                "output": output,
+                "error": output if is_error else None,
+                "return_code": 1 if is_error else 0
             }
 
-        except subprocess.TimeoutExpired:
+        except RuntimeError as e:
+            if "timed out" in str(e):
+                return {
+                    "output": "[ERROR] Claude Code execution timed out after 5 minutes",
+                    "error": "TIMEOUT"
+                }
             return {
-                "output": "[ERROR] Claude Code execution timed out after 5 minutes",
-                "error": "TIMEOUT"
+                "output": f"[ERROR] Failed to execute Claude Code: {e}",
+                "error": str(e)
             }
         except Exception as e:
             return {
@@ -12,24 +12,39 @@ Implements a distributed computing system with:
 import asyncio
 import hashlib
 import json
+import math
+import re
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple, Set
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict, Counter, deque
 from enum import Enum
-import numpy as np
 from statistics import mean, median, stdev
 import logging
-import random
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # Import base components
 try:
     from .agent_system import BaseAgent
     from .message_bus import AgentMessageBus, Message, MessagePriority
+    from .cluster_worker import (
+        ProcessNodeWorker, PackageHandler, package_payload,
+        execute_work_package, simulated_work_package
+    )
 except ImportError:
     from agent_system import BaseAgent
     from message_bus import AgentMessageBus, Message, MessagePriority
+    from cluster_worker import (
+        ProcessNodeWorker, PackageHandler, package_payload,
+        execute_work_package, simulated_work_package
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -406,9 +421,24 @@ class ConsensusResult:
 class ClusterNode:
     """
     A single node in the distributed cluster.
+
+    Backends:
+    - "inline": packages run as coroutines in the caller's event loop
+    - "process": packages run in a dedicated worker process
+      (cluster_worker.ProcessNodeWorker); heartbeats feed reliability and
+      worker death takes the node offline so packages fail over
     """
 
-    def __init__(self, node_id: str, model: str = "claude-3-5-sonnet-20241022"):
+    BACKENDS = ("inline", "process")
+
+    def __init__(self,
+                 node_id: str,
+                 model: str = "claude-3-5-sonnet-20241022",
+                 backend: str = "inline",
+                 handler: Optional[PackageHandler] = None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}, got {backend!r}")
+
         self.node_id = node_id
         self.model = model
         self.agent = BaseAgent(
@@ -432,6 +462,18 @@ class ClusterNode:
         self.completed_packages: List[str] = []
         self.performance_history = deque(maxlen=100)
 
+        self.backend = backend
+        self.worker: Optional[ProcessNodeWorker] = None
+        if backend == "process":
+            self.worker = ProcessNodeWorker(
+                node_id,
+                handler=handler or simulated_work_package,
+                max_parallel=self.capabilities.max_parallel,
+                on_heartbeat=self._update_reliability,
+                on_death=self._on_worker_death
+            )
+            self.worker.start()
+
     def _determine_specializations(self, model: str) -> List[str]:
         """Determine node specializations based on model."""
         if "haiku" in model:
@@ -459,25 +501,17 @@ class ClusterNode:
         package.start_time = start_time
 
         try:
-            # Simulate execution with mock result
-            await asyncio.sleep(0.1 * package.compute_estimate.get("runtime_seconds", 1))
-
-            # Generate mock result based on package type
-            if package.type == "analysis":
-                result = {
-                    "analysis": f"Analysis of {package.name}",
-                    "findings": ["Finding 1", "Finding 2"],
-                    "confidence": 0.92
-                }
-            elif package.type == "generation":
-                result = {
-                    "generated": f"Generated content for {package.name}",
-                    "tokens": 500
-                }
+            payload = package_payload(package, dependencies_data)
+
+            if self.worker is not None:
+                output = await self.worker.submit(payload)
             else:
-                result = {"computed": f"Result for {package.name}"}
+                # Simulate execution with mock result
+                await asyncio.sleep(0.1 * package.compute_estimate.get("runtime_seconds", 1))
+                output = execute_work_package(payload)
 
-            confidence = 0.85 + random.random() * 0.15  # 0.85-1.0
+            result = output["result"]
+            confidence = output["confidence"]
 
             # Create node result
             node_result = NodeResult(
@@ -556,6 +590,18 @@ class ClusterNode:
         """Get current load (0.0-1.0)."""
         return len(self.active_packages) / max(self.capabilities.max_parallel, 1)
 
+    def _on_worker_death(self):
+        """Take the node offline when its worker process dies."""
+        logger.warning(f"Node {self.node_id} worker died; marking offline")
+        self.capabilities.status = "offline"
+        self._update_reliability(success=False)
+
+    def shutdown(self):
+        """Stop the node's worker process, if any."""
+        if self.worker is not None:
+            self.worker.stop()
+        self.capabilities.status = "offline"
+
 
 class TaskSplitter:
     """
@@ -751,72 +797,160 @@ class ConsensusBuilder:
         )
 
     def _group_similar_results(self, results: List[NodeResult]) -> List[List[NodeResult]]:
-        """Group similar results together."""
-        groups = []
-        assigned = set()
+        """
+        Group similar results together.
 
-        for i, result1 in enumerate(results):
-            if i in assigned:
-                continue
+        Identical results are collapsed first, the remaining distinct results
+        are compared with one TF-IDF similarity matrix, and every pair above
+        similarity_threshold is merged with union-find. Groups keep members in
+        input order and are sorted by size, then by first member, so the
+        output does not depend on comparison order.
+        """
+        # Collapse identical results (the common case for agreeing nodes)
+        unique: Dict[str, int] = {}
+        members: List[List[int]] = []
+        for i, result in enumerate(results):
+            key = self._canonical(result.result)
+            if key not in unique:
+                unique[key] = len(members)
+                members.append([])
+            members[unique[key]].append(i)
+
+        labels = self._cluster_distinct([results[m[0]].result for m in members])
+        clusters: Dict[int, List[int]] = defaultdict(list)
+        for u, indices in enumerate(members):
+            clusters[labels[u]].extend(indices)
+
+        # Sort groups by size (largest first), ties by first appearance
+        ordered = sorted((sorted(indices) for indices in clusters.values()),
+                         key=lambda indices: (-len(indices), indices[0]))
+        return [[results[i] for i in indices] for indices in ordered]
+
+    def _cluster_distinct(self, values: List[Any]) -> List[int]:
+        """
+        Cluster label for each distinct result value.
 
-            group = [result1]
-            assigned.add(i)
+        Every pair above similarity_threshold (one TF-IDF similarity matrix
+        over all values) is merged with union-find; a label is the lowest
+        index in its cluster.
+        """
+        parent = list(range(len(values)))
 
-            for j, result2 in enumerate(results[i+1:], start=i+1):
-                if j not in assigned:
-                    similarity = self._calculate_similarity(result1.result, result2.result)
-                    if similarity > self.similarity_threshold:
-                        group.append(result2)
-                        assigned.add(j)
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
 
-            groups.append(group)
+        if len(values) > 1:
+            for i, j in self._similar_pairs(self._similarity_matrix(values)):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
 
-        # Sort groups by size (largest first)
-        groups.sort(key=len, reverse=True)
-        return groups
+        return [find(i) for i in range(len(values))]
 
     def _calculate_similarity(self, result1: Any, result2: Any) -> float:
-        """Calculate similarity between two results."""
-        # Simplified similarity calculation
-        if result1 == result2:
+        """Calculate cosine similarity between two results' TF-IDF vectors."""
+        if self._canonical(result1) == self._canonical(result2):
             return 1.0
+        return float(self._similarity_matrix([result1, result2])[0][1])
+
+    def _similar_pairs(self, similarity) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) whose similarity exceeds the threshold."""
+        if NUMPY_AVAILABLE:
+            above = np.triu(similarity > self.similarity_threshold, k=1)
+            return [(int(i), int(j)) for i, j in np.argwhere(above)]
+
+        return [
+            (i, j)
+            for i, row in enumerate(similarity)
+            for j in range(i + 1, len(row))
+            if row[j] > self.similarity_threshold
+        ]
 
-        if isinstance(result1, dict) and isinstance(result2, dict):
-            # Compare dictionary keys and values
-            keys1, keys2 = set(result1.keys()), set(result2.keys())
-            key_similarity = len(keys1 & keys2) / max(len(keys1 | keys2), 1)
+    def _similarity_matrix(self, results: List[Any]):
+        """
+        Pairwise cosine similarity of TF-IDF vectors for results.
 
-            # Compare values for common keys
-            common_keys = keys1 & keys2
-            if common_keys:
-                value_matches = sum(1 for k in common_keys if result1[k] == result2[k])
-                value_similarity = value_matches / len(common_keys)
-            else:
-                value_similarity = 0
+        Uses a single matrix multiply when NumPy is available; otherwise a
+        sparse pure-Python computation with the same values.
 
-            return (key_similarity + value_similarity) / 2
+        Returns:
+            n x n NumPy array, or list of lists without NumPy
+        """
+        features = [self._result_features(result) for result in results]
+
+        document_frequency = Counter()
+        for counts in features:
+            document_frequency.update(counts.keys())
+        vocabulary = {term: i for i, term in enumerate(sorted(document_frequency))}
+
+        # Smoothed IDF keeps terms shared by every result non-zero
+        n = len(results)
+        idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        if NUMPY_AVAILABLE:
+            matrix = np.zeros((n, len(vocabulary)))
+            for row, counts in enumerate(features):
+                for term, count in counts.items():
+                    matrix[row, vocabulary[term]] = count * idf[term]
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+            return matrix @ matrix.T
+
+        vectors = []
+        for counts in features:
+            vector = {term: count * idf[term] for term, count in counts.items()}
+            norm = math.sqrt(sum(v * v for v in vector.values()))
+            vectors.append({term: v / norm for term, v in vector.items()} if norm else {})
+
+        similarity = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i, n):
+                a, b = vectors[i], vectors[j]
+                if len(a) > len(b):
+                    a, b = b, a
+                similarity[i][j] = similarity[j][i] = sum(v * b.get(term, 0.0) for term, v in a.items())
+        return similarity
+
+    @staticmethod
+    def _canonical(result: Any) -> str:
+        """Order-independent string form of a result (equal results, equal strings)."""
+        try:
+            return json.dumps(result, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return repr(result)
 
-        elif isinstance(result1, (list, tuple)) and isinstance(result2, (list, tuple)):
-            # Compare sequences
-            if len(result1) == len(result2):
-                matches = sum(1 for a, b in zip(result1, result2) if a == b)
-                return matches / max(len(result1), 1)
-            else:
-                return 0.5  # Different lengths
+    @classmethod
+    def _result_features(cls, result: Any, path: str = "") -> Counter:
+        """
+        Bag of path-qualified word tokens for a result.
 
-        else:
-            # Simple string comparison
-            str1, str2 = str(result1), str(result2)
-            if len(str1) == 0 or len(str2) == 0:
-                return 0.0
-            # Character-level similarity
-            matches = sum(1 for a, b in zip(str1, str2) if a == b)
-            return matches / max(len(str1), len(str2))
+        Dict keys become part of the path (so {"answer": "42"} and
+        {"score": "42"} differ), list items share their parent's path, and
+        scalars are split into lowercase word tokens.
+        """
+        features = Counter()
+        if isinstance(result, dict):
+            for key in sorted(result, key=str):
+                child = f"{path}{key}."
+                features[child] += 1
+                features.update(cls._result_features(result[key], child))
+        elif isinstance(result, (list, tuple, set, frozenset)):
+            items = sorted(result, key=str) if isinstance(result, (set, frozenset)) else result
+            for item in items:
+                features.update(cls._result_features(item, path))
+        elif result is not None:
+            for token in re.findall(r"\w+", str(result).lower()):
+                features[path + token] += 1
+        return features
 
     def _calculate_group_weights(self,
                                 result_groups: List[List[NodeResult]],
-                                node_reliability: Dict[str, float]) -> List[float]:
-        """Calculate weighted vote for each result group."""
+                                node_reliability: Dict[str, float],
+                                normalize: bool = True) -> List[float]:
+        """Calculate weighted vote for each result group (normalized to sum to 1.0 by default)."""
         group_weights = []
 
         total_weight = 0.0
@@ -835,11 +969,63 @@ class ConsensusBuilder:
             total_weight += group_weight
 
         # Normalize to sum to 1.0
-        if total_weight > 0:
+        if normalize and total_weight > 0:
             group_weights = [w / total_weight for w in group_weights]
 
         return group_weights
 
+    def quorum_reached(self,
+                       node_results: List[NodeResult],
+                       outstanding_weight: float,
+                       node_reliability: Dict[str, float]) -> bool:
+        """
+        Whether the outstanding results can no longer change the consensus.
+
+        Groups the results received so far and applies outcome_decided() to
+        their raw reliability-weighted votes.
+
+        Args:
+            node_results: Results received so far
+            outstanding_weight: Upper bound on the vote of packages not yet reported
+            node_reliability: Reliability score by node id
+
+        Returns:
+            True if consensus can be built without the outstanding results
+        """
+        if not node_results:
+            return False
+
+        return self.outcome_decided(
+            self._calculate_group_weights(self._group_similar_results(node_results),
+                                          node_reliability, normalize=False),
+            outstanding_weight
+        )
+
+    def outcome_decided(self, group_weights: List[float], outstanding_weight: float) -> bool:
+        """
+        Whether raw group votes already fix the leader and the consensus type.
+
+        The leader is decided once its vote exceeds the runner-up's even if
+        all of outstanding_weight went to the runner-up. Its final share then
+        lies between leader / (received + outstanding) (everything else goes
+        to other groups) and (leader + outstanding) / (received + outstanding);
+        the consensus type is decided when both ends fall in the same
+        _determine_consensus band.
+        """
+        if not group_weights:
+            return False
+
+        weights = sorted(group_weights, reverse=True)
+        leader = weights[0]
+        runner_up = weights[1] if len(weights) > 1 else 0.0
+        if leader <= runner_up + outstanding_weight:
+            return False
+
+        total = sum(weights) + outstanding_weight
+        worst, _ = self._determine_consensus([leader / total])
+        best, _ = self._determine_consensus([(leader + outstanding_weight) / total])
+        return worst == best
+
     def _determine_consensus(self, group_weights: List[float]) -> Tuple[str, float]:
         """Determine consensus type and level."""
         if not group_weights:
@@ -954,12 +1140,94 @@ class ConsensusBuilder:
         return stdev(times) / max(mean(times), 1)
 
 
+class QuorumTracker:
+    """
+    Running result groups for repeated early-quorum checks during one DAG run.
+
+    Each check folds in only the results added since the last one. A result
+    identical to one already seen just adds its vote to that value; the
+    distinct values are re-clustered (the same TF-IDF grouping as
+    ConsensusBuilder._group_similar_results) only when a new one arrives,
+    so agreeing nodes cost O(1) each instead of a full regroup of every
+    result on every completion. Votes are weighed with the node's
+    reliability when the result arrives.
+    """
+
+    def __init__(self, builder: ConsensusBuilder):
+        self.builder = builder
+        self.folded = 0
+        self._last: Optional[NodeResult] = None
+        self._distinct: Dict[str, int] = {}  # canonical result -> distinct index
+        self._values: List[Any] = []         # distinct result values
+        self._weights: List[float] = []      # vote per distinct value
+        self._labels: Optional[List[int]] = None  # cluster per distinct value; None when stale
+
+    def follows(self, node_results: List[NodeResult]) -> bool:
+        """Whether node_results extends the results folded so far."""
+        if self.folded == 0:
+            return True
+        return len(node_results) >= self.folded and node_results[self.folded - 1] is self._last
+
+    def reached(self,
+                node_results: List[NodeResult],
+                outstanding_weight: float,
+                node_reliability: Dict[str, float]) -> bool:
+        """ConsensusBuilder.quorum_reached over the incrementally folded results."""
+        for result in node_results[self.folded:]:
+            self._fold(result, node_reliability)
+        self.folded = len(node_results)
+        if node_results:
+            self._last = node_results[-1]
+
+        if self._labels is None:
+            self._labels = self.builder._cluster_distinct(self._values)
+        groups: Dict[int, float] = defaultdict(float)
+        for label, weight in zip(self._labels, self._weights):
+            groups[label] += weight
+        return self.builder.outcome_decided(list(groups.values()), outstanding_weight)
+
+    def _fold(self, result: NodeResult, node_reliability: Dict[str, float]):
+        vote = node_reliability.get(result.node_id, 0.5) * result.confidence
+        key = self.builder._canonical(result.result)
+        index = self._distinct.get(key)
+        if index is None:
+            index = self._distinct[key] = len(self._values)
+            self._values.append(result.result)
+            self._weights.append(0.0)
+            self._labels = None
+        self._weights[index] += vote
+
+
 class DistributedCluster:
     """
     Main distributed cluster orchestrator.
     """
 
-    def __init__(self, num_nodes: int = 5):
+    # Wait between dispatch attempts when every candidate node is saturated
+    DISPATCH_POLL_SECONDS = 0.05
+
+    # Packages a thief inspects from the tail of a victim's deque
+    STEAL_SCAN_DEPTH = 8
+
+    def __init__(self,
+                 num_nodes: int = 5,
+                 backend: str = "inline",
+                 handler: Optional[PackageHandler] = None,
+                 early_quorum: bool = False):
+        """
+        Initialize cluster.
+
+        Args:
+            num_nodes: Number of nodes to start
+            backend: ClusterNode backend ("inline" or "process")
+            handler: Module-level package handler for "process" nodes
+            early_quorum: Build consensus as soon as the outstanding packages
+                can no longer change the leading result group or the
+                consensus type, cancelling them
+        """
+        self.backend = backend
+        self.handler = handler
+        self.early_quorum = early_quorum
         self.nodes: Dict[str, ClusterNode] = {}
         self.task_splitter = TaskSplitter()
         self.consensus_builder = ConsensusBuilder()
@@ -967,6 +1235,8 @@ class DistributedCluster:
 
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
         self.completed_tasks: List[str] = []
+        self.steals = 0
+        self._quorum_tracker: Optional[QuorumTracker] = None
 
         # Initialize cluster nodes
         self._initialize_nodes(num_nodes)
@@ -983,7 +1253,7 @@ class DistributedCluster:
         for i in range(num_nodes):
             node_id = f"node_{i:03d}"
             model = models[i % len(models)]
-            node = ClusterNode(node_id, model)
+            node = ClusterNode(node_id, model, backend=self.backend, handler=self.handler)
             self.nodes[node_id] = node
             self.message_bus.register_agent(node_id)
 
@@ -1009,25 +1279,19 @@ class DistributedCluster:
 
         logger.info(f"Task split into {distribution_plan['total_work_packages']} packages")
 
-        # 2. Execute work packages in parallel batches
-        work_packages = [
-            WorkPackage(**wp) for wp in distribution_plan["work_packages"]
-        ]
+        # 2. Execute work packages as their dependencies finish
+        packages = {
+            wp["id"]: WorkPackage(**wp) for wp in distribution_plan["work_packages"]
+        }
 
-        all_results = []
-        for batch in distribution_plan["execution_order"]:
-            batch_results = await self._execute_batch(batch, work_packages)
-            all_results.extend(batch_results)
+        steals_before = self.steals
+        stop_when = self._quorum_reached if self.early_quorum else None
+        all_results = await self._execute_dag(packages, stop_when=stop_when)
 
         # 3. Build consensus from results
-        node_reliability = {
-            node_id: node.capabilities.reliability_score
-            for node_id, node in self.nodes.items()
-        }
-
         consensus = await self.consensus_builder.build_consensus(
             all_results,
-            node_reliability
+            self._node_reliability()
         )
 
         # 4. Compile final result
@@ -1041,7 +1305,10 @@ class DistributedCluster:
             "distribution": {
                 "total_packages": distribution_plan["total_work_packages"],
                 "parallel_speedup": distribution_plan["estimated_parallel_speedup"],
-                "nodes_used": len(set(r.node_id for r in all_results))
+                "nodes_used": len(set(r.node_id for r in all_results)),
+                "retries": sum(wp.retry_count for wp in packages.values()),
+                "steals": self.steals - steals_before,
+                "cancelled": sum(1 for wp in packages.values() if wp.status == "cancelled")
             },
             "performance": {
                 "total_duration_seconds": duration,
@@ -1063,56 +1330,277 @@ class DistributedCluster:
 
         return final_result
 
-    async def _execute_batch(self,
-                            batch: List[str],
-                            all_packages: List[WorkPackage]) -> List[NodeResult]:
-        """Execute a batch of work packages in parallel."""
-        tasks = []
-        results = []
-
-        for package_id in batch:
-            # Find package
-            package = next((wp for wp in all_packages if wp.id == package_id), None)
-            if not package:
-                continue
+    def _node_reliability(self) -> Dict[str, float]:
+        """Current reliability score of every node."""
+        return {
+            node_id: node.capabilities.reliability_score
+            for node_id, node in self.nodes.items()
+        }
 
-            # Find assigned node
-            node = self.nodes.get(package.assigned_node)
-            if not node:
-                # Try backup node
-                for backup_id in package.backup_nodes:
-                    node = self.nodes.get(backup_id)
-                    if node:
-                        package.assigned_node = backup_id
-                        break
-
-            if node:
-                # Get dependency data
-                dep_data = self._get_dependency_data(package, all_packages)
-
-                # Create execution task
-                task = asyncio.create_task(
-                    node.execute_package(package, dep_data)
-                )
-                tasks.append(task)
+    def _quorum_reached(self, results: List[NodeResult], outstanding: Set[str]) -> bool:
+        """
+        Early-quorum stop condition for _execute_dag.
 
-        # Wait for all tasks to complete
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        Each outstanding package can add at most one vote of the most
+        reliable online node at full confidence. Results are folded into a
+        QuorumTracker, which starts over when a new run's results arrive.
+        """
+        node_reliability = self._node_reliability()
+        best_vote = max(
+            (node_reliability[node_id] for node_id, node in self.nodes.items()
+             if node.capabilities.status == "online"),
+            default=0.0
+        )
+        tracker = self._quorum_tracker
+        if tracker is None or not tracker.follows(results):
+            tracker = self._quorum_tracker = QuorumTracker(self.consensus_builder)
+        return tracker.reached(results, len(outstanding) * best_vote, node_reliability)
+
+    async def _execute_dag(self,
+                           packages: Dict[str, WorkPackage],
+                           stop_when: Optional[Callable[[List[NodeResult], Set[str]], bool]] = None
+                           ) -> List[NodeResult]:
+        """
+        Execute work packages as soon as their own dependencies finish.
+
+        Ready packages go on the deque of their assigned node (or first
+        online backup), highest priority first. Whenever a node has spare
+        capacity (ClusterNode.get_load() < 1.0, counting packages dispatched
+        but not yet started) it takes the head of its own deque; an idle
+        node with an empty deque steals from the tail of the longest other
+        deque, preferring packages matching its own specializations and
+        leaving packages that match their owner's. A failed package is
+        retried on its next untried node while the rest of the graph keeps
+        running. Dependents are released once a package completes or runs
+        out of nodes. Dependencies outside the plan are ignored, and
+        packages left waiting on a cycle are run once nothing else can
+        progress.
+
+        If stop_when(results, outstanding_ids) returns True after a package
+        finishes, running packages are cancelled, every unfinished package
+        is marked "cancelled", and the results so far are returned.
+
+        Args:
+            packages: Work packages by id
+            stop_when: Optional early-stop condition checked as results arrive
+
+        Returns:
+            Final NodeResult of every executed package, in completion order
+        """
+        waiting_on: Dict[str, Set[str]] = {
+            package_id: {dep for dep in package.dependencies if dep in packages}
+            for package_id, package in packages.items()
+        }
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for package_id, deps in waiting_on.items():
+            for dep in deps:
+                dependents[dep].append(package_id)
+
+        # Assigned + backup nodes, fixed before stealing moves packages around
+        homes: Dict[str, List[str]] = {
+            package_id: [package.assigned_node] + package.backup_nodes
+            for package_id, package in packages.items()
+        }
+        queues: Dict[str, deque] = defaultdict(deque)
+        queued: Set[str] = set()
+        finished: Set[str] = set()
+        tried: Dict[str, Set[str]] = defaultdict(set)
+        running: Dict[asyncio.Task, str] = {}
+        results: List[NodeResult] = []
+
+        def enqueue(package_id: str):
+            candidates = self._candidate_nodes(homes[package_id], tried[package_id])
+            if not candidates:
+                logger.warning(f"No available node for {package_id}; skipping")
+                release(package_id)
+                return
+            queues[candidates[0].node_id].append(package_id)
+            queued.add(package_id)
+
+        def release(package_id: str):
+            queued.discard(package_id)
+            finished.add(package_id)
+            for child in dependents[package_id]:
+                waiting_on[child].discard(package_id)
+                if not waiting_on[child] and child not in queued and child not in finished:
+                    enqueue(child)
+
+        initial = [package_id for package_id, deps in waiting_on.items() if not deps]
+        for package_id in sorted(initial, key=lambda pid: -packages[pid].priority):
+            enqueue(package_id)
+
+        while len(finished) < len(packages):
+            # Round-robin: each node with spare capacity takes one package per pass
+            dispatched = True
+            while dispatched:
+                dispatched = False
+                for node in list(self.nodes.values()):
+                    if node.capabilities.status != "online":
+                        continue
+                    if self._dispatch_load(node, running.values(), packages) >= 1.0:
+                        continue
+
+                    package_id = self._next_package(node, queues, tried, packages)
+                    if package_id is None:
+                        continue
+
+                    package = packages[package_id]
+                    tried[package_id].add(node.node_id)
+                    package.assigned_node = node.node_id
+                    job = asyncio.create_task(
+                        node.execute_package(package, self._get_dependency_data(package, packages))
+                    )
+                    running[job] = package_id
+                    dispatched = True
+
+            if not running:
+                waiting = [package_id for queue in queues.values() for package_id in queue]
+                if waiting:
+                    stranded = [package_id for package_id in waiting
+                                if not any(node.capabilities.status == "online" and node_id not in tried[package_id]
+                                           for node_id, node in self.nodes.items())]
+                    for package_id in stranded:
+                        logger.warning(f"No online node left for {package_id}; skipping")
+                        for queue in queues.values():
+                            if package_id in queue:
+                                queue.remove(package_id)
+                        release(package_id)
+                    if len(stranded) < len(waiting):
+                        # Nodes saturated by other work; wait for capacity
+                        await asyncio.sleep(self.DISPATCH_POLL_SECONDS)
+                    continue
+
+                stuck = [package_id for package_id in packages
+                         if package_id not in finished and package_id not in queued]
+                logger.warning(f"Dependency cycle among {stuck}; running them anyway")
+                for package_id in stuck:
+                    waiting_on[package_id].clear()
+                    enqueue(package_id)
+                continue
 
-            # Filter out exceptions
-            results = [r for r in results if isinstance(r, NodeResult)]
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            for job in done:
+                package = packages[running.pop(job)]
+                try:
+                    result = job.result()
+                except Exception as e:
+                    logger.error(f"Package {package.id} raised on {package.assigned_node}: {e}")
+                    result = None
+
+                if result is not None and result.status == "success":
+                    results.append(result)
+                    release(package.id)
+                elif self._candidate_nodes(homes[package.id], tried[package.id]):
+                    package.retry_count += 1
+                    package.status = "pending"
+                    logger.info(f"Retrying {package.id} on a backup node (attempt {package.retry_count + 1})")
+                    queued.discard(package.id)
+                    enqueue(package.id)
+                else:
+                    if result is not None:
+                        results.append(result)
+                    release(package.id)
+
+            if stop_when is not None and len(finished) < len(packages):
+                outstanding = {package_id for package_id in packages if package_id not in finished}
+                if stop_when(results, outstanding):
+                    logger.info(f"Stopping early; cancelling {len(outstanding)} outstanding packages")
+                    for job in running:
+                        job.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    for package_id in outstanding:
+                        packages[package_id].status = "cancelled"
+                    break
 
         return results
 
+    def _next_package(self,
+                      node: ClusterNode,
+                      queues: Dict[str, deque],
+                      tried: Dict[str, Set[str]],
+                      packages: Dict[str, WorkPackage]) -> Optional[str]:
+        """
+        Next package for an idle node: own deque head, else steal.
+
+        Thieves scan up to STEAL_SCAN_DEPTH packages from the tail of the
+        longest other deque (further only if none of those can run on the
+        thief) and take the best affinity match: packages of a type the
+        thief specializes in first, then packages the owner does not
+        specialize in, then anything else.
+        """
+        own = queues.get(node.node_id)
+        if own:
+            return own.popleft()
+
+        victims = sorted(
+            ((node_id, queue) for node_id, queue in queues.items() if node_id != node.node_id and queue),
+            key=lambda item: len(item[1]),
+            reverse=True
+        )
+        for owner_id, queue in victims:
+            owner = self.nodes.get(owner_id)
+            best_index, best_affinity = None, None
+
+            for depth, index in enumerate(range(len(queue) - 1, -1, -1)):
+                if depth >= self.STEAL_SCAN_DEPTH and best_index is not None:
+                    break
+                package = packages[queue[index]]
+                if node.node_id in tried[package.id]:
+                    continue
+                affinity = (
+                    self._matches_specialization(node, package),
+                    owner is None or not self._matches_specialization(owner, package)
+                )
+                if best_affinity is None or affinity > best_affinity:
+                    best_index, best_affinity = index, affinity
+
+            if best_index is not None:
+                package_id = queue[best_index]
+                del queue[best_index]
+                self.steals += 1
+                return package_id
+
+        return None
+
+    @staticmethod
+    def _matches_specialization(node: ClusterNode, package: WorkPackage) -> bool:
+        """Whether the package type is one the node specializes in."""
+        specializations = node.capabilities.specializations
+        if package.type in specializations:
+            return True
+        return package.type == "compute" and any(s.endswith("computation") for s in specializations)
+
+    def _dispatch_load(self,
+                       node: ClusterNode,
+                       running: Iterable[str],
+                       packages: Dict[str, WorkPackage]) -> float:
+        """Node load, counting packages dispatched to it that have not started yet."""
+        not_started = {
+            package_id for package_id in running
+            if packages[package_id].assigned_node == node.node_id
+            and package_id not in node.active_packages
+        }
+        return node.get_load() + len(not_started) / max(node.capabilities.max_parallel, 1)
+
+    def _candidate_nodes(self, node_ids: List[str], tried: Set[str]) -> List[ClusterNode]:
+        """Online nodes from node_ids (assigned, then backups) not yet tried, in order."""
+        candidates = []
+        for node_id in node_ids:
+            node = self.nodes.get(node_id)
+            if (node is not None and node_id not in tried
+                    and node.capabilities.status == "online" and node not in candidates):
+                candidates.append(node)
+        return candidates
+
     def _get_dependency_data(self,
                             package: WorkPackage,
-                            all_packages: List[WorkPackage]) -> Dict[str, Any]:
+                            packages: Dict[str, WorkPackage]) -> Dict[str, Any]:
         """Get output data from package dependencies."""
         dep_data = {}
 
         for dep_id in package.dependencies:
-            dep_package = next((wp for wp in all_packages if wp.id == dep_id), None)
+            dep_package = packages.get(dep_id)
             if dep_package and dep_package.result:
                 dep_data[dep_id] = dep_package.result.result
 
@@ -1146,7 +1634,7 @@ class DistributedCluster:
             for i in range(current_size, target_size):
                 node_id = f"node_{i:03d}"
                 model = "claude-3-5-sonnet-20241022"  # Use cheap model for new nodes
-                node = ClusterNode(node_id, model)
+                node = ClusterNode(node_id, model, backend=self.backend, handler=self.handler)
                 self.nodes[node_id] = node
                 self.message_bus.register_agent(node_id)
 
@@ -1160,11 +1648,17 @@ class DistributedCluster:
                 # Wait for active packages to complete
                 while node.active_packages:
                     await asyncio.sleep(1)
+                node.shutdown()
                 del self.nodes[node_id]
                 self.message_bus.unregister_agent(node_id)
 
             logger.info(f"Scaled down cluster from {current_size} to {target_size} nodes")
 
+    def shutdown(self):
+        """Stop every node's worker process."""
+        for node in self.nodes.values():
+            node.shutdown()
+
 
 # ================== DEMONSTRATION ==================
 
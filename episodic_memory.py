@@ -0,0 +1,362 @@
+"""
+Episodic Memory Store - Append-Only Episode Log with a TF-IDF Tag Index
+
+Backs cognitive_processing.MemorySystems so episodic memory scales to
+100k+ episodes:
+
+    - Episodes are appended as JSON lines; recording one never rewrites
+      the store. Evicted episodes are appended as tombstones and the log
+      is compacted (rewritten with live records only) once tombstones
+      outnumber a fraction of the live episodes.
+    - The log is scanned lazily on first use; only ids, tags and file
+      offsets stay in memory. Episode bodies are read on demand through a
+      small LRU cache.
+    - An inverted tag index scores candidate episodes by the IDF-weighted
+      fraction of the query's tags they contain, over all episodes, and
+      returns the top k with a heap.
+
+This module only depends on the standard library; records are plain dicts
+with at least "id" and "tags".
+
+Usage:
+    store = EpisodeStore(Path("~/.claude/cognitive_memory/episodes.jsonl"))
+    store.append({"id": "ep1", "tags": ["deploy", "api"], ...})
+    for record, score in store.search(["deploy"], limit=5):
+        ...
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TagIndex:
+    """
+    Inverted index from tag to episode ids.
+
+    score(query, episode) = sum(idf(t) for t in query & episode) / sum(idf(t) for t in query)
+    with smoothed idf(t) = log((1 + N) / (1 + df(t))) + 1, so rare shared
+    tags count for more than common ones and scores stay in [0, 1].
+
+    Search walks posting lists from the rarest query tag to the most
+    common, newest episode first, and stops once the weight of the tags
+    left could not lift an unseen episode above min_score or past the
+    current k-th best (MaxScore pruning). Tags shared by most episodes
+    are rarely scanned, and repeats of a task stop after k exact matches.
+    """
+
+    def __init__(self):
+        # tag -> episode ids in insertion order (dict as an ordered set)
+        self.postings: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.tags: Dict[str, FrozenSet[str]] = {}
+        self.sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __contains__(self, episode_id: str) -> bool:
+        return episode_id in self.tags
+
+    def add(self, episode_id: str, tags: Iterable[str]):
+        """Index an episode (re-adding an id replaces its tags)."""
+        if episode_id in self.tags:
+            self.remove(episode_id)
+        unique = frozenset(tags)
+        self.tags[episode_id] = unique
+        self.sequence[episode_id] = self._next_sequence
+        self._next_sequence += 1
+        for tag in unique:
+            self.postings[tag][episode_id] = None
+
+    def remove(self, episode_id: str):
+        """Drop an episode from the index."""
+        for tag in self.tags.pop(episode_id, ()):
+            episodes = self.postings[tag]
+            episodes.pop(episode_id, None)
+            if not episodes:
+                del self.postings[tag]
+        self.sequence.pop(episode_id, None)
+
+    def idf(self, tag: str) -> float:
+        df = len(self.postings.get(tag, ()))
+        return math.log((1 + len(self.tags)) / (1 + df)) + 1
+
+    def search(self,
+               tags: Iterable[str],
+               limit: int,
+               min_score: float = 0.0,
+               exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """
+        Top episodes for a set of query tags.
+
+        Args:
+            tags: Query tags
+            limit: Maximum results
+            min_score: Only return episodes scoring above this
+            exclude: Episode ids to skip
+
+        Returns:
+            (episode_id, score) pairs, best first; ties go to newer episodes
+        """
+        query = {tag: self.idf(tag) for tag in set(tags)}
+        total = sum(query.values())
+        weights = {tag: weight for tag, weight in query.items() if tag in self.postings}
+        if not weights or limit <= 0:
+            return []
+
+        seen = set(exclude)
+        top: List[Tuple[float, int, str]] = []  # min-heap of the best `limit`
+        remaining = sum(weights.values())
+
+        for tag in sorted(weights, key=lambda t: (-weights[t], t)):
+            # Best score an episode without any of the tags scanned so far can reach
+            ceiling = remaining / total
+            if ceiling <= min_score or (len(top) == limit and ceiling < top[0][0]):
+                break
+
+            for episode_id in reversed(self.postings[tag]):
+                if len(top) == limit and top[0][:2] >= (ceiling, self.sequence[episode_id]):
+                    break  # this and older episodes cannot beat the k-th best
+                if episode_id in seen:
+                    continue
+                seen.add(episode_id)
+                episode_tags = self.tags[episode_id]
+                score = sum(w for t, w in weights.items() if t in episode_tags) / total
+                if score <= min_score:
+                    continue
+                entry = (score, self.sequence[episode_id], episode_id)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+
+            remaining -= weights[tag]
+
+        return [(episode_id, score) for score, _, episode_id in sorted(top, reverse=True)]
+
+
+class EpisodeStore:
+    """
+    Append-only JSON-lines episode log with a lazily built TagIndex.
+
+    Not safe for concurrent writers; one MemorySystems instance owns a log.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 max_episodes: Optional[int] = None,
+                 compact_ratio: float = 0.5,
+                 compact_min: int = 1000,
+                 cache_size: int = 256):
+        """
+        Initialize episode store (the log is read on first use).
+
+        Args:
+            path: Log file path (created on first append)
+            max_episodes: Oldest episodes beyond this are evicted; None keeps all
+            compact_ratio: Compact once tombstones exceed this fraction of live episodes
+            compact_min: ... and number at least this many
+            cache_size: Episode bodies kept in the LRU cache
+        """
+        self.path = Path(path)
+        self.max_episodes = max_episodes
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self.cache_size = cache_size
+
+        self.index = TagIndex()
+        self.offsets: "OrderedDict[str, int]" = OrderedDict()  # id -> byte offset, oldest first
+        self.dead_records = 0
+        self.compactions = 0
+
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loaded = False
+        self._writer = None
+        self._reader = None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self.offsets)
+
+    def __contains__(self, episode_id: str) -> bool:
+        self._ensure_loaded()
+        return episode_id in self.offsets
+
+    def ids(self) -> List[str]:
+        """Live episode ids, oldest first."""
+        self._ensure_loaded()
+        return list(self.offsets)
+
+    def append(self, record: Dict[str, Any]):
+        """Append an episode record (must have "id" and "tags") and index it."""
+        self._ensure_loaded()
+        episode_id = record["id"]
+        if episode_id in self.offsets:
+            self.dead_records += 1  # superseded line
+
+        self.offsets[episode_id] = self._write(record)
+        self.offsets.move_to_end(episode_id)
+        self.index.add(episode_id, record.get("tags", ()))
+        self._remember(episode_id, record)
+
+        if self.max_episodes is not None:
+            while len(self.offsets) > self.max_episodes:
+                self._evict(next(iter(self.offsets)))
+
+        self._maybe_compact()
+
+    def get(self, episode_id: str) -> Optional[Dict[str, Any]]:
+        """Episode record by id (read from disk on a cache miss)."""
+        self._ensure_loaded()
+        record = self._cache.get(episode_id)
+        if record is not None:
+            self._cache.move_to_end(episode_id)
+            return record
+
+        offset = self.offsets.get(episode_id)
+        if offset is None:
+            return None
+        self.flush()
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(offset)
+        record = json.loads(self._reader.readline())
+        self._remember(episode_id, record)
+        return record
+
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """The newest episode records, oldest first."""
+        self._ensure_loaded()
+        newest = list(itertools.islice(reversed(self.offsets), max(count, 0)))
+        return [self.get(episode_id) for episode_id in reversed(newest)]
+
+    def search(self,
+               tags: Iterable[str],
+               limit: int,
+               min_score: float = 0.0,
+               exclude: Iterable[str] = ()) -> List[Tuple[Dict[str, Any], float]]:
+        """Top (record, score) pairs for query tags (see TagIndex.search)."""
+        return [
+            (self.get(episode_id), score)
+            for episode_id, score in self.search_ids(tags, limit, min_score, exclude)
+        ]
+
+    def search_ids(self,
+                   tags: Iterable[str],
+                   limit: int,
+                   min_score: float = 0.0,
+                   exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """Top (episode_id, score) pairs without reading episode bodies."""
+        self._ensure_loaded()
+        return self.index.search(tags, limit, min_score, exclude)
+
+    def flush(self):
+        """Flush buffered appends to disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def compact(self):
+        """Rewrite the log with live records only (atomic replace)."""
+        self._ensure_loaded()
+        self.flush()
+        if not self.path.exists():
+            return
+
+        temp_path = self.path.with_name(self.path.name + ".compact")
+        offsets: "OrderedDict[str, int]" = OrderedDict()
+        with open(self.path, "rb") as source, open(temp_path, "wb") as target:
+            for episode_id, offset in self.offsets.items():
+                source.seek(offset)
+                offsets[episode_id] = target.tell()
+                target.write(source.readline())
+            target.flush()
+            os.fsync(target.fileno())
+
+        self.close()
+        os.replace(temp_path, self.path)
+        self.offsets = offsets
+        self.dead_records = 0
+        self.compactions += 1
+        logger.info(f"Compacted episode log to {len(offsets)} episodes")
+
+    def close(self):
+        """Close open file handles (reopened on demand)."""
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = self._reader = None
+
+    def _ensure_loaded(self):
+        """Scan the log once, rebuilding offsets and the tag index."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+
+        torn_at = None
+        with open(self.path, "rb") as log:
+            offset = 0
+            for line in log:
+                if not line.endswith(b"\n"):
+                    torn_at = offset  # partial write from a crash
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt episode log line at byte {offset}")
+                    self.dead_records += 1
+                    offset += len(line)
+                    continue
+
+                episode_id = record["id"]
+                if episode_id in self.offsets:
+                    self.dead_records += 1
+                    del self.offsets[episode_id]
+                if record.get("deleted"):
+                    self.dead_records += 1
+                    self.index.remove(episode_id)
+                else:
+                    self.offsets[episode_id] = offset
+                    self.index.add(episode_id, record.get("tags", ()))
+                offset += len(line)
+
+        if torn_at is not None:
+            logger.warning(f"Truncating partial episode log record at byte {torn_at}")
+            os.truncate(self.path, torn_at)
+
+    def _write(self, record: Dict[str, Any]) -> int:
+        """Append one line; returns its byte offset."""
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = open(self.path, "ab")
+        offset = self._writer.tell()
+        self._writer.write(json.dumps(record, default=str).encode("utf-8") + b"\n")
+        return offset
+
+    def _evict(self, episode_id: str):
+        """Drop an episode, recording a tombstone."""
+        del self.offsets[episode_id]
+        self.index.remove(episode_id)
+        self._cache.pop(episode_id, None)
+        self._write({"id": episode_id, "deleted": True})
+        self.dead_records += 2  # the record and its tombstone
+
+    def _maybe_compact(self):
+        if self.dead_records >= max(self.compact_min, len(self.offsets) * self.compact_ratio):
+            self.compact()
+
+    def _remember(self, episode_id: str, record: Dict[str, Any]):
+        self._cache[episode_id] = record
+        self._cache.move_to_end(episode_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
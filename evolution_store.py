@@ -0,0 +1,267 @@
+"""
+Evolution Store - Checkpoints and Shared Evaluations for Prompt Evolution
+
+Persists PromptEvolutionEngine runs so a crash or restart does not throw
+away paid-for fitness evaluations.
+
+Architecture (one SQLite file):
+    - prompts: prompt text stored once, keyed by SHA-256 content hash
+    - evaluations: one test result per (content hash, test case id), shared
+      by every run, so re-evaluating a known prompt costs nothing
+    - runs: base prompt, engine config and test cases per run_id
+    - generations: per-generation checkpoint (population records reference
+      prompts by content hash; dimension scores and fitness inline)
+
+Usage:
+    from evolution_store import EvolutionStore
+
+    store = EvolutionStore()  # ~/.claude/cache/prompt_evolution.db
+    engine = PromptEvolutionEngine(store=store)
+    best = await engine.evolve(base_prompt, test_cases)   # engine.run_id
+    best = await engine.resume(run_id)                    # after a restart
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of prompt text (the key prompts and evaluations are stored under)."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class EvolutionStore:
+    """
+    SQLite store for evolution checkpoints and evaluation results.
+
+    Values must be JSON-serialisable; non-serialisable values are stored
+    as strings.
+    """
+
+    DEFAULT_DB_PATH = Path.home() / ".claude" / "cache" / "prompt_evolution.db"
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize evolution store.
+
+        Args:
+            db_path: SQLite file path (":memory:" for a process-local store)
+        """
+        self.db_path = str(db_path or self.DEFAULT_DB_PATH)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+
+        # Metrics
+        self.evaluation_hits = 0
+        self.evaluation_misses = 0
+
+    def _create_tables(self):
+        """Create store tables."""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS prompts (
+                content_hash TEXT PRIMARY KEY,
+                content TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS evaluations (
+                content_hash TEXT NOT NULL,
+                test_case_id TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (content_hash, test_case_id)
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                base_prompt TEXT NOT NULL,
+                config TEXT NOT NULL,
+                test_cases TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS generations (
+                run_id TEXT NOT NULL,
+                number INTEGER NOT NULL,
+                population TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (run_id, number)
+            );
+        """)
+        self.conn.commit()
+
+    # Evaluations
+
+    def get_evaluation(self, content_hash: str, test_case_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored test result.
+
+        Returns:
+            Result dict, or None if this prompt was never run on the test case
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT result FROM evaluations WHERE content_hash = ? AND test_case_id = ?",
+                (content_hash, test_case_id)
+            ).fetchone()
+            if row is None:
+                self.evaluation_misses += 1
+                return None
+            self.evaluation_hits += 1
+            return json.loads(row[0])
+
+    def put_evaluation(self, content_hash: str, test_case_id: str, result: Dict[str, Any]):
+        """Store a test result for a prompt."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO evaluations (content_hash, test_case_id, result, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (content_hash, test_case_id, json.dumps(result, default=str), time.time())
+            )
+            self.conn.commit()
+
+    # Runs and checkpoints
+
+    def create_run(self,
+                   run_id: str,
+                   base_prompt: str,
+                   config: Dict[str, Any],
+                   test_cases: List[Dict[str, Any]]):
+        """Record a new run (status "running")."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO runs (run_id, base_prompt, config, test_cases, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, base_prompt, json.dumps(config, default=str),
+                 json.dumps(test_cases, default=str), "running", now, now)
+            )
+            self.conn.commit()
+
+    def save_generation(self,
+                        run_id: str,
+                        number: int,
+                        population: List[Dict[str, Any]],
+                        summary: Dict[str, Any]):
+        """
+        Checkpoint an evaluated generation.
+
+        Args:
+            run_id: Run the generation belongs to
+            number: Generation number
+            population: Variation records, each with a "content" field
+            summary: Generation statistics (best/average fitness, diversity)
+        """
+        records = []
+        prompts = []
+        for record in population:
+            record = dict(record)
+            content = record.pop("content")
+            record["content_hash"] = content_hash(content)
+            prompts.append((record["content_hash"], content))
+            records.append(record)
+
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO prompts (content_hash, content) VALUES (?, ?)", prompts
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO generations (run_id, number, population, summary, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, number, json.dumps(records, default=str), json.dumps(summary, default=str), now)
+            )
+            self.conn.execute("UPDATE runs SET updated_at = ? WHERE run_id = ?", (now, run_id))
+            self.conn.commit()
+
+    def finish_run(self, run_id: str, status: str = "completed"):
+        """Mark a run finished."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                (status, time.time(), run_id)
+            )
+            self.conn.commit()
+
+    def load_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a run and its checkpoints.
+
+        Returns:
+            Dict with base_prompt, config, test_cases, status and generations
+            (in order, each with number, population records including
+            "content", and summary), or None if the run is unknown
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT base_prompt, config, test_cases, status FROM runs WHERE run_id = ?",
+                (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            base_prompt, config, test_cases, status = row
+
+            generations = []
+            for number, population, summary in self.conn.execute(
+                "SELECT number, population, summary FROM generations WHERE run_id = ? ORDER BY number",
+                (run_id,)
+            ).fetchall():
+                records = json.loads(population)
+                hashes = sorted({record["content_hash"] for record in records})
+                contents = dict(self.conn.execute(
+                    f"SELECT content_hash, content FROM prompts WHERE content_hash IN ({','.join('?' * len(hashes))})",
+                    hashes
+                ).fetchall())
+                for record in records:
+                    record["content"] = contents[record["content_hash"]]
+                generations.append({"number": number, "population": records, "summary": json.loads(summary)})
+
+        return {
+            "run_id": run_id,
+            "base_prompt": base_prompt,
+            "config": json.loads(config),
+            "test_cases": json.loads(test_cases),
+            "status": status,
+            "generations": generations,
+        }
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """Summaries of stored runs, most recently updated first."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT r.run_id, r.status, r.updated_at, COUNT(g.number)
+                FROM runs r LEFT JOIN generations g ON g.run_id = r.run_id
+                GROUP BY r.run_id ORDER BY r.updated_at DESC
+            """).fetchall()
+        return [
+            {"run_id": run_id, "status": status, "updated_at": updated_at, "generations": count}
+            for run_id, status, updated_at, count in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store metrics."""
+        with self._lock:
+            counts = {
+                table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("prompts", "evaluations", "runs", "generations")
+            }
+        lookups = self.evaluation_hits + self.evaluation_misses
+        return {
+            **counts,
+            "evaluation_hits": self.evaluation_hits,
+            "evaluation_misses": self.evaluation_misses,
+            "hit_rate": round(self.evaluation_hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self.conn.close()
@@ -239,6 +239,17 @@ class LearningDatabase:
 
         return executions[:limit]
 
+    def get_executions(self, limit: int = 1000) -> List[TaskExecution]:
+        """Get the most recent task executions."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM task_executions
+            ORDER BY start_time DESC
+            LIMIT ?
+        """, (limit,))
+
+        return [self._row_to_execution(row) for row in cursor.fetchall()]
+
     def _row_to_execution(self, row) -> TaskExecution:
         """Convert database row to TaskExecution."""
         return TaskExecution(
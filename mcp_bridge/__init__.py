@@ -6,5 +6,6 @@ Enables Atlas to use Claude Code Max subscription instead of API keys.
 
 from .anthropic_adapter import Anthropic
 from .claude_code_bridge import ClaudeCodeBridge, get_bridge
+from .worker_pool import ClaudeWorkerPool
 
-__all__ = ['Anthropic', 'ClaudeCodeBridge', 'get_bridge']
+__all__ = ['Anthropic', 'ClaudeCodeBridge', 'get_bridge', 'ClaudeWorkerPool']
@@ -13,12 +13,20 @@ Usage:
         model="claude-3-5-sonnet-20241022",
         messages=[{"role": "user", "content": "Hello"}]
     )
+
+    # Incremental streaming (Anthropic SDK event shapes)
+    with client.messages.stream(model=..., messages=[...]) as stream:
+        for text in stream.text_stream:
+            print(text, end="", flush=True)
 """
 
 import asyncio
+import queue
+import threading
 from typing import Dict, Any, List, Optional, Iterator
 from dataclasses import dataclass
 from .claude_code_bridge import get_bridge
+from utils.prompt_cache import flatten_content
 
 import logging
 logger = logging.getLogger(__name__)
@@ -29,6 +37,8 @@ class Usage:
     """Token usage information."""
     input_tokens: int
     output_tokens: int
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
 
 
 @dataclass
@@ -43,6 +53,258 @@ class Message:
     stop_reason: Optional[str] = None
 
 
+def _flatten_request(messages: List[Dict[str, Any]], system: Any):
+    """
+    Collapse SDK content blocks to plain text for the CLI bridge.
+
+    Callers may send ``system`` and message content as block lists carrying
+    ``cache_control`` markers; the CLI takes strings and manages its own
+    prompt cache, so only the text is forwarded.
+    """
+    flat_messages = [{**msg, "content": flatten_content(msg.get("content"))} for msg in messages]
+    return flat_messages, (flatten_content(system) if system is not None else None)
+
+
+class StreamEvent(dict):
+    """
+    Stream event compatible with Anthropic SDK event objects.
+
+    A dict (so existing dict-based consumers keep working) that also supports
+    attribute access, e.g. ``event.type`` and ``event.delta.text``.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(name)
+        return StreamEvent(value) if isinstance(value, dict) else value
+
+
+class _StreamTranslator:
+    """
+    Translate Claude Code CLI stream-json lines into Anthropic SDK stream events.
+
+    With --include-partial-messages the CLI wraps raw API events as
+    ``{"type": "stream_event", "event": {...}}``; these pass straight through.
+    Without partial messages only whole ``assistant`` messages and a final
+    ``result`` arrive, so equivalent start/delta/stop events are synthesised.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.partial = False
+        self.started = False
+        self.stopped = False
+        self.block_index = 0
+        self.emitted_text = False
+
+    def _message_start(self) -> Dict[str, Any]:
+        self.started = True
+        return {
+            "type": "message_start",
+            "message": {
+                "id": "msg_stream",
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": self.model,
+                "stop_reason": None,
+                "usage": {"input_tokens": 0, "output_tokens": 0}
+            }
+        }
+
+    def _text_block(self, text: str) -> List[Dict[str, Any]]:
+        index = self.block_index
+        self.block_index += 1
+        self.emitted_text = True
+        return [
+            {"type": "content_block_start", "index": index,
+             "content_block": {"type": "text", "text": ""}},
+            {"type": "content_block_delta", "index": index,
+             "delta": {"type": "text_delta", "text": text}},
+            {"type": "content_block_stop", "index": index}
+        ]
+
+    def feed(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Translate one CLI event into zero or more SDK events."""
+        chunk_type = chunk.get("type")
+
+        if chunk_type == "stream_event":
+            self.partial = True
+            event = chunk.get("event", {})
+            if event.get("type") == "message_start":
+                self.started = True
+            elif event.get("type") == "message_stop":
+                self.stopped = True
+            elif event.get("type") == "content_block_delta":
+                self.emitted_text = True
+            return [event]
+
+        if self.partial or self.stopped:
+            return []
+
+        events = []
+        if chunk_type == "assistant":
+            if not self.started:
+                events.append(self._message_start())
+            for block in chunk.get("message", {}).get("content", []):
+                if block.get("type") == "text" and block.get("text"):
+                    events.extend(self._text_block(block["text"]))
+
+        elif chunk_type == "content_block_delta" and "delta" not in chunk:
+            # Plain text line from the bridge
+            if not self.started:
+                events.append(self._message_start())
+            events.extend(self._text_block(chunk.get("content", "")))
+
+        elif chunk_type == "result":
+            if not self.started:
+                events.append(self._message_start())
+            if not self.emitted_text and chunk.get("result"):
+                events.extend(self._text_block(chunk["result"]))
+            events.append({
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": chunk.get("usage", {}).get("output_tokens", 0)}
+            })
+            events.append({"type": "message_stop"})
+            self.stopped = True
+
+        return events
+
+
+class MessageStream:
+    """
+    Synchronous stream of SDK-compatible events.
+
+    Events are produced on a background thread with its own event loop and
+    handed over through a bounded queue: when the consumer falls behind, the
+    producer blocks, which in turn stops reading the CLI's stdout.
+    Iterating yields StreamEvent objects; ``text_stream`` yields text deltas.
+    """
+
+    _DONE = object()
+
+    def __init__(self, bridge, model: str, messages: List[Dict[str, str]],
+                 max_tokens: int, system: Optional[str], temperature: float,
+                 max_buffered_events: int = 64):
+        self.model = model
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_buffered_events)
+        self._closed = threading.Event()
+        self._text_parts: List[str] = []
+        self._usage = {"input_tokens": 0, "output_tokens": 0}
+        self._stop_reason: Optional[str] = None
+        self._finished = False
+
+        self._thread = threading.Thread(
+            target=self._produce,
+            args=(bridge, model, messages, max_tokens, system, temperature),
+            daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        """Blocking put that gives up once the consumer has closed the stream."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, bridge, model, messages, max_tokens, system, temperature):
+        async def pump():
+            translator = _StreamTranslator(model)
+            gen = bridge.stream_model(
+                model=model,
+                messages=messages,
+                system=system,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            try:
+                async for chunk in gen:
+                    for event in translator.feed(chunk):
+                        if not self._put(StreamEvent(event)):
+                            return
+            finally:
+                # Closing the generator kills the CLI if we stopped early
+                await gen.aclose()
+
+        try:
+            asyncio.run(pump())
+        except BaseException as e:
+            self._put(e)
+        finally:
+            self._put(self._DONE)
+
+    def __iter__(self) -> Iterator[StreamEvent]:
+        while not self._finished:
+            item = self._queue.get()
+            if item is self._DONE:
+                self._finished = True
+                return
+            if isinstance(item, BaseException):
+                self._finished = True
+                raise item
+            self._record(item)
+            yield item
+
+    def _record(self, event: StreamEvent):
+        """Accumulate state for get_final_message()."""
+        if event.get("type") == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                self._text_parts.append(delta.get("text", ""))
+        elif event.get("type") == "message_start":
+            usage = event.get("message", {}).get("usage", {})
+            self._usage["input_tokens"] = usage.get("input_tokens", 0)
+        elif event.get("type") == "message_delta":
+            self._usage["output_tokens"] = event.get("usage", {}).get("output_tokens", 0)
+            self._stop_reason = event.get("delta", {}).get("stop_reason")
+
+    @property
+    def text_stream(self) -> Iterator[str]:
+        """Iterate over text deltas only."""
+        for event in self:
+            if event.get("type") == "content_block_delta" and event["delta"].get("type") == "text_delta":
+                yield event["delta"]["text"]
+
+    def get_final_message(self) -> "Message":
+        """Drain the stream and return the assembled Message."""
+        for _ in self:
+            pass
+        content_text = "".join(self._text_parts)
+        return Message(
+            id=f"msg_{hash(content_text)}",
+            type="message",
+            role="assistant",
+            content=[{"type": "text", "text": content_text}],
+            model=self.model,
+            usage=Usage(**self._usage),
+            stop_reason=self._stop_reason or "end_turn"
+        )
+
+    def close(self):
+        """Stop consuming; the producer stops and the CLI process is killed."""
+        self._closed.set()
+        self._finished = True
+        # Unblock a producer waiting on a full queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "MessageStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class Messages:
     """
     Messages API compatible with Anthropic SDK.
@@ -70,22 +332,22 @@ class Messages:
             model: Model name
             messages: List of message dicts
             max_tokens: Maximum tokens
-            system: System prompt
+            system: System prompt (string or content blocks)
             temperature: Sampling temperature
             stream: Whether to stream response
 
         Returns:
             Message object or stream iterator
         """
-        # Run async call in event loop
-        loop = asyncio.get_event_loop()
-
+        messages, system = _flatten_request(messages, system)
         if stream:
             # Return streaming iterator
             return self._create_stream_sync(
                 model, messages, max_tokens, system, temperature
             )
         else:
+            # Run async call in event loop
+            loop = asyncio.get_event_loop()
             # Return complete message
             return loop.run_until_complete(
                 self._create_async(model, messages, max_tokens, system, temperature)
@@ -123,7 +385,9 @@ class Messages:
             model=model,
             usage=Usage(
                 input_tokens=response.get("usage", {}).get("input_tokens", 0),
-                output_tokens=response.get("usage", {}).get("output_tokens", 0)
+                output_tokens=response.get("usage", {}).get("output_tokens", 0),
+                cache_read_input_tokens=response.get("usage", {}).get("cache_read_input_tokens") or 0,
+                cache_creation_input_tokens=response.get("usage", {}).get("cache_creation_input_tokens") or 0
             ),
             stop_reason="end_turn"
         )
@@ -135,29 +399,28 @@ class Messages:
         max_tokens: int,
         system: Optional[str],
         temperature: float
-    ) -> Iterator:
-        """Create streaming response (synchronous iterator)."""
-        loop = asyncio.get_event_loop()
+    ) -> MessageStream:
+        """Create streaming response (synchronous iterator of SDK-style events)."""
+        return MessageStream(self.bridge, model, messages, max_tokens, system, temperature)
 
-        async def stream_generator():
-            async for chunk in self.bridge.stream_model(
-                model=model,
-                messages=messages,
-                system=system,
-                max_tokens=max_tokens,
-                temperature=temperature
-            ):
-                yield chunk
-
-        # Convert async generator to sync iterator
-        gen = stream_generator()
+    def stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 4096,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> MessageStream:
+        """
+        Stream a message (mirrors Anthropic SDK ``client.messages.stream``).
 
-        while True:
-            try:
-                chunk = loop.run_until_complete(gen.__anext__())
-                yield chunk
-            except StopAsyncIteration:
-                break
+        Returns:
+            MessageStream usable as a context manager, with ``text_stream``
+            and ``get_final_message()``
+        """
+        messages, system = _flatten_request(messages, system)
+        return self._create_stream_sync(model, messages, max_tokens, system, temperature)
 
 
 class Anthropic:
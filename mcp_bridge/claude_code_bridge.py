@@ -16,13 +16,18 @@ Version: 2.0.0 (Refactored)
 """
 
 import asyncio
+import atexit
+import copy
 import json
 import subprocess
 import logging
 import os
 import tempfile
 from typing import Dict, Any, Optional, List
-from pathlib import Path
+
+from utils.single_flight import SingleFlight, get_default_single_flight, request_key
+from utils.response_cache import ResponseCache
+from mcp_bridge.worker_pool import ClaudeWorkerPool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,10 +40,57 @@ class ClaudeCodeBridge:
     Uses `claude --print` mode which supports subscription auth.
     """
 
-    def __init__(self):
+    CACHE_NAMESPACE = "claude_code_bridge"
+
+    # Max bytes per stream-json line (a single assistant message can be large)
+    STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+    def __init__(self,
+                 coalesce_requests: bool = False,
+                 single_flight: Optional[SingleFlight] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 worker_pool_size: int = 4,
+                 warm_workers: int = 1,
+                 max_calls_per_worker: int = 1):
+        """
+        Initialize bridge.
+
+        Args:
+            coalesce_requests: Share one CLI call among identical in-flight requests
+            single_flight: Optional coalescing group (defaults to the process-wide group)
+            response_cache: Optional persistent response cache (opt-in)
+            worker_pool_size: Max concurrent pooled CLI workers (0 = spawn per request)
+            warm_workers: Pre-spawned idle workers kept per (model, system prompt)
+            max_calls_per_worker: Requests per worker before recycling
+        """
         self.claude_path = self._find_claude_code()
+        self.single_flight = (single_flight or get_default_single_flight()) if coalesce_requests else None
+        self.response_cache = response_cache
+
+        # Subscription environment, built once instead of per request
+        self.env = self._subscription_env()
+
+        self.worker_pool = ClaudeWorkerPool(
+            self.claude_path,
+            env=self.env,
+            max_workers=worker_pool_size,
+            warm_workers=warm_workers,
+            max_calls_per_worker=max_calls_per_worker
+        ) if worker_pool_size > 0 else None
+        if self.worker_pool:
+            # Pre-spawned workers would otherwise outlive the host process
+            atexit.register(self.worker_pool.shutdown)
+
         logger.info(f"✅ Claude Code CLI found at: {self.claude_path}")
 
+    def _subscription_env(self) -> Dict[str, str]:
+        """Copy of the environment without ANTHROPIC_API_KEY (forces subscription auth)."""
+        env = os.environ.copy()
+        if "ANTHROPIC_API_KEY" in env:
+            del env["ANTHROPIC_API_KEY"]
+            logger.debug("Removed ANTHROPIC_API_KEY to use subscription")
+        return env
+
     def _find_claude_code(self) -> str:
         """Find Claude Code CLI executable."""
         try:
@@ -90,6 +142,42 @@ class ClaudeCodeBridge:
         Returns:
             Response dict
         """
+        key = request_key(
+            model=model, messages=messages, system=system,
+            max_tokens=max_tokens, temperature=temperature
+        )
+
+        if self.response_cache:
+            cached = self.response_cache.get(self.CACHE_NAMESPACE, key)
+            if cached is not None:
+                logger.info("💾 Claude Code response served from cache")
+                return copy.deepcopy(cached)
+
+        if self.single_flight:
+            response, shared = await self.single_flight.ado(
+                key, lambda: self._call_cli(model, messages, system, max_tokens, temperature)
+            )
+            if shared:
+                logger.info("🔁 Coalesced identical in-flight Claude Code request")
+                return dict(response)
+        else:
+            response = await self._call_cli(model, messages, system, max_tokens, temperature)
+
+        # Error results (e.g. auth or API failures reported with is_error) are not cached
+        if self.response_cache and not response.get("is_error"):
+            self.response_cache.set(self.CACHE_NAMESPACE, key, copy.deepcopy(response))
+
+        return response
+
+    async def _call_cli(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Run one `claude --print` subprocess and parse its response."""
         # Build prompt from messages
         prompt_parts = []
 
@@ -104,6 +192,15 @@ class ClaudeCodeBridge:
         # Map model name to Claude Code alias
         model_alias = self._map_model_name(model)
 
+        if self.worker_pool:
+            logger.info(f"🤖 Calling Claude Code: {model_alias} (subscription mode, pooled worker)")
+            try:
+                response_data = await self.worker_pool.arequest(model_alias, system, full_prompt)
+            except RuntimeError as e:
+                self._raise_cli_error(str(e))
+            logger.info("✅ Claude Code response received (via subscription)")
+            return response_data
+
         # Build command
         cmd = [
             self.claude_path,
@@ -117,12 +214,6 @@ class ClaudeCodeBridge:
 
         cmd.append(full_prompt)
 
-        # CRITICAL: Remove ANTHROPIC_API_KEY to force subscription auth
-        env = os.environ.copy()
-        if "ANTHROPIC_API_KEY" in env:
-            del env["ANTHROPIC_API_KEY"]
-            logger.debug("Removed ANTHROPIC_API_KEY to use subscription")
-
         logger.info(f"🤖 Calling Claude Code: {model_alias} (subscription mode)")
 
         try:
@@ -130,24 +221,13 @@ class ClaudeCodeBridge:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env  # Use modified environment
+                env=self.env  # Environment without ANTHROPIC_API_KEY
             )
 
             stdout, stderr = await result.communicate()
 
             if result.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-
-                # Check for common auth issues
-                if "not logged in" in error_msg.lower() or "login" in error_msg.lower():
-                    raise RuntimeError(
-                        "❌ Not logged into Claude Code with Max subscription.\n"
-                        f"Run: {self.claude_path} login\n"
-                        "Authenticate with your Max account (NOT Console/API)"
-                    )
-
-                logger.error(f"Claude Code error: {error_msg}")
-                raise RuntimeError(f"Claude Code failed: {error_msg}")
+                self._raise_cli_error(stderr.decode() if stderr else "Unknown error")
 
             # Parse JSON response
             response_text = stdout.decode()
@@ -171,6 +251,23 @@ class ClaudeCodeBridge:
         except asyncio.TimeoutError:
             raise RuntimeError("Claude Code call timed out")
 
+    def _raise_cli_error(self, error_msg: str):
+        """Raise a RuntimeError for a failed CLI call, flagging auth problems."""
+        # Check for common auth issues
+        if "not logged in" in error_msg.lower() or "login" in error_msg.lower():
+            raise RuntimeError(
+                "❌ Not logged into Claude Code with Max subscription.\n"
+                f"Run: {self.claude_path} login\n"
+                "Authenticate with your Max account (NOT Console/API)"
+            )
+
+        logger.error(f"Claude Code error: {error_msg}")
+        raise RuntimeError(f"Claude Code failed: {error_msg}")
+
+    def get_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Get worker pool metrics (None when pooling is disabled)."""
+        return self.worker_pool.health_check() if self.worker_pool else None
+
     def _map_model_name(self, model: str) -> str:
         """
         Map API model names to Claude Code aliases.
@@ -216,6 +313,13 @@ class ClaudeCodeBridge:
         """
         Stream Claude model response.
 
+        Runs the CLI with `--output-format stream-json --include-partial-messages`
+        and yields each parsed line as soon as it is read, so token deltas
+        (`{"type": "stream_event", "event": {...}}`) reach the caller while the
+        model is still generating. Lines are only read when the consumer asks
+        for the next chunk, so a slow consumer applies backpressure all the
+        way to the CLI's stdout pipe.
+
         Args:
             model: Model name
             messages: Message list
@@ -224,7 +328,7 @@ class ClaudeCodeBridge:
             temperature: Temperature
 
         Yields:
-            Response chunks
+            Parsed CLI stream-json events
         """
         # Build prompt
         prompt_parts = []
@@ -241,6 +345,8 @@ class ClaudeCodeBridge:
             self.claude_path,
             "--print",
             "--output-format", "stream-json",
+            "--verbose",  # Required by the CLI for stream-json in --print mode
+            "--include-partial-messages",
             "--model", model_alias
         ]
 
@@ -249,32 +355,40 @@ class ClaudeCodeBridge:
 
         cmd.append(full_prompt)
 
-        # Remove API key for subscription auth
-        env = os.environ.copy()
-        if "ANTHROPIC_API_KEY" in env:
-            del env["ANTHROPIC_API_KEY"]
-
         logger.info(f"🤖 Streaming from Claude Code: {model_alias}")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env
-        )
+        # stderr goes to a temp file so it can never fill a pipe and stall stdout
+        with tempfile.TemporaryFile() as stderr_file:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr_file,
+                env=self.env,  # Environment without ANTHROPIC_API_KEY
+                limit=self.STREAM_LINE_LIMIT
+            )
 
-        # Stream line by line
-        async for line in process.stdout:
-            chunk_text = line.decode().strip()
-            if chunk_text:
-                try:
-                    chunk_data = json.loads(chunk_text)
-                    yield chunk_data
-                except json.JSONDecodeError:
-                    # Plain text chunk
-                    yield {"content": chunk_text, "type": "content_block_delta"}
-
-        await process.wait()
+            try:
+                # Stream line by line
+                async for line in process.stdout:
+                    chunk_text = line.decode().strip()
+                    if chunk_text:
+                        try:
+                            chunk_data = json.loads(chunk_text)
+                            yield chunk_data
+                        except json.JSONDecodeError:
+                            # Plain text chunk
+                            yield {"content": chunk_text, "type": "content_block_delta"}
+
+                await process.wait()
+
+                if process.returncode != 0:
+                    stderr_file.seek(0)
+                    self._raise_cli_error(stderr_file.read().decode().strip() or "Unknown error")
+            finally:
+                # Consumer stopped early (or errored): don't leave the CLI running
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
 
 
 # Singleton
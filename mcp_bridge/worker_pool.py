@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Persistent Claude Code CLI Worker Pool
+
+Spawning `claude --print` per request means every short call pays for Node
+start-up and subscription auth. This pool keeps CLI processes warm in
+stream-json session mode so a request only pays for the model turn.
+
+Architecture:
+    ClaudeCodeBridge → ClaudeWorkerPool → N × `claude --print
+        --input-format stream-json --output-format stream-json`
+
+    - Workers are keyed by (model alias, system prompt) since both are fixed
+      per CLI process
+    - After a worker is taken, a replacement is pre-spawned in the background
+      so the next identical request finds a warm process
+    - Concurrency is bounded by a semaphore (max_workers); many callers are
+      multiplexed over that fixed set of processes
+    - Dead workers, and idle workers unused for idle_timeout, are reaped
+      whenever a request acquires a worker and in health_check(); they are
+      closed outside the pool lock so slow exits never block other callers
+    - Workers are recycled after max_calls_per_worker requests. The default of
+      1 keeps every request isolated (a CLI session carries conversation
+      history between turns); raise it only for stateless prompts
+
+Workers use plain subprocess.Popen (not asyncio subprocesses) so one pool can
+serve callers running on different event loops, as well as sync callers.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WorkerKey = Tuple[str, Optional[str]]
+
+
+class ClaudeWorker:
+    """A single long-lived `claude` CLI process in stream-json mode."""
+
+    def __init__(self, cmd: List[str], env: Dict[str, str]):
+        """
+        Spawn worker process.
+
+        Args:
+            cmd: Full CLI command
+            env: Process environment
+        """
+        # stderr goes to a temp file so a chatty CLI can never fill a pipe and block
+        self._stderr = tempfile.TemporaryFile(mode="w+")
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            bufsize=1,
+            env=env
+        )
+        self.calls = 0
+        self.created_at = time.time()
+        self.last_used = self.created_at
+
+    def is_alive(self) -> bool:
+        """Check whether the process is still running."""
+        return self.process.poll() is None
+
+    def request(self, prompt: str, timeout: float, close_input: bool) -> Dict[str, Any]:
+        """
+        Send one user turn and block until its result message arrives.
+
+        Args:
+            prompt: User prompt text
+            timeout: Seconds before the worker is killed
+            close_input: Close stdin after writing (worker exits after this turn)
+
+        Returns:
+            The CLI's `{"type": "result", ...}` message
+
+        Raises:
+            RuntimeError: Worker died or timed out before producing a result,
+                or the result is an error (is_error, e.g. auth or API failure)
+        """
+        message = {
+            "type": "user",
+            "message": {"role": "user", "content": [{"type": "text", "text": prompt}]}
+        }
+
+        timer = threading.Timer(timeout, self.process.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            self.process.stdin.write(json.dumps(message) + "\n")
+            self.process.stdin.flush()
+            if close_input:
+                self.process.stdin.close()
+
+            self.calls += 1
+            self.last_used = time.time()
+
+            for line in self.process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("type") == "result":
+                    if event.get("is_error"):
+                        raise RuntimeError(str(event.get("result") or event.get("subtype") or "error result"))
+                    return event
+        except (BrokenPipeError, ValueError, OSError) as e:
+            raise RuntimeError(f"worker pipe closed: {e}")
+        finally:
+            timer.cancel()
+
+        self.process.wait()
+        if self.process.returncode is not None and self.process.returncode < 0:
+            raise RuntimeError(f"call timed out after {timeout:.0f}s")
+        raise RuntimeError(self.read_stderr() or "worker exited without a result")
+
+    def read_stderr(self) -> str:
+        """Read captured stderr."""
+        try:
+            self._stderr.seek(0)
+            return self._stderr.read().strip()
+        except (ValueError, OSError):
+            return ""
+
+    def close(self):
+        """Terminate the worker."""
+        if self.is_alive():
+            try:
+                self.process.stdin.close()
+            except (ValueError, OSError):
+                pass
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self._stderr.close()
+
+
+class ClaudeWorkerPool:
+    """
+    Pool of warm Claude Code CLI workers.
+
+    Example:
+        pool = ClaudeWorkerPool("/usr/local/bin/claude", env=env)
+        result = pool.request("sonnet", None, "Hello")
+        result = await pool.arequest("sonnet", None, "Hello")
+    """
+
+    def __init__(self,
+                 claude_path: str,
+                 env: Dict[str, str],
+                 max_workers: int = 4,
+                 warm_workers: int = 1,
+                 max_calls_per_worker: int = 1,
+                 request_timeout: float = 300.0,
+                 idle_timeout: float = 300.0):
+        """
+        Initialize worker pool.
+
+        Args:
+            claude_path: Path to the `claude` executable
+            env: Environment for workers (computed once by the caller)
+            max_workers: Maximum concurrent requests
+            warm_workers: Idle spares kept ready per (model, system) key
+            max_calls_per_worker: Requests served before a worker is recycled
+            request_timeout: Per-request timeout in seconds
+            idle_timeout: Idle workers older than this are reaped
+        """
+        self.claude_path = claude_path
+        self.env = env
+        self.max_workers = max_workers
+        self.warm_workers = warm_workers
+        self.max_calls_per_worker = max(1, max_calls_per_worker)
+        self.request_timeout = request_timeout
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_workers)
+        self._idle: Dict[WorkerKey, List[ClaudeWorker]] = {}
+        self._closed = False
+
+        # Metrics
+        self.requests = 0
+        self.warm_hits = 0
+        self.cold_starts = 0
+        self.recycled = 0
+        self.dead_workers = 0
+        self.failures = 0
+
+    def _build_cmd(self, model_alias: str, system: Optional[str]) -> List[str]:
+        """Build the stream-json session command."""
+        cmd = [
+            self.claude_path,
+            "--print",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+            "--model", model_alias
+        ]
+        if system:
+            cmd.extend(["--system-prompt", system])
+        return cmd
+
+    def _spawn(self, key: WorkerKey) -> ClaudeWorker:
+        return ClaudeWorker(self._build_cmd(*key), self.env)
+
+    def _acquire(self, key: WorkerKey) -> ClaudeWorker:
+        """Take a live idle worker for key, or spawn one (reaping stale workers first)."""
+        with self._lock:
+            stale = self._take_stale(time.time())
+            idle = self._idle.get(key, [])
+            worker = idle.pop() if idle else None
+        self._close_in_background(stale)
+
+        if worker is not None:
+            self.warm_hits += 1
+            return worker
+        self.cold_starts += 1
+        return self._spawn(key)
+
+    def _take_stale(self, now: float) -> List[ClaudeWorker]:
+        """Remove dead and long-idle workers from the idle set (caller holds the lock)."""
+        stale = []
+        for key, workers in self._idle.items():
+            keep = []
+            for worker in workers:
+                if not worker.is_alive():
+                    self.dead_workers += 1
+                    stale.append(worker)
+                elif now - worker.last_used > self.idle_timeout:
+                    stale.append(worker)
+                else:
+                    keep.append(worker)
+            self._idle[key] = keep
+        return stale
+
+    @staticmethod
+    def _close_in_background(workers: List[ClaudeWorker]):
+        """Close workers off the caller's path (close() may wait for the CLI to exit)."""
+        if workers:
+            threading.Thread(
+                target=lambda: [worker.close() for worker in workers], daemon=True
+            ).start()
+
+    def _replenish(self, key: WorkerKey):
+        """Pre-spawn spares for key in the background."""
+        if self.warm_workers <= 0 or self._closed:
+            return
+
+        def fill():
+            with self._lock:
+                missing = self.warm_workers - len(self._idle.get(key, []))
+            for _ in range(missing):
+                try:
+                    worker = self._spawn(key)
+                except OSError as e:
+                    logger.warning(f"Failed to pre-spawn Claude Code worker: {e}")
+                    return
+                self._park(key, worker)
+
+        threading.Thread(target=fill, daemon=True).start()
+
+    def _park(self, key: WorkerKey, worker: ClaudeWorker):
+        """Return a reusable worker to the idle set (or close it)."""
+        evicted = None
+        with self._lock:
+            if self._closed:
+                evicted = worker
+            else:
+                self._idle.setdefault(key, []).append(worker)
+
+                # Bound total idle processes across keys: drop the stalest
+                total_idle = sum(len(workers) for workers in self._idle.values())
+                if total_idle > self.max_workers:
+                    stale_key = min(
+                        (k for k in self._idle if self._idle[k]),
+                        key=lambda k: self._idle[k][0].last_used
+                    )
+                    evicted = self._idle[stale_key].pop(0)
+
+        if evicted is not None:
+            evicted.close()
+
+    def _release(self, key: WorkerKey, worker: ClaudeWorker):
+        """Recycle or park a worker after a request."""
+        if worker.calls >= self.max_calls_per_worker or not worker.is_alive():
+            self.recycled += 1
+            # Reap off the request path; the CLI exits on its own once stdin is closed
+            threading.Thread(target=worker.close, daemon=True).start()
+        else:
+            self._park(key, worker)
+
+    def request(self, model_alias: str, system: Optional[str], prompt: str) -> Dict[str, Any]:
+        """
+        Run one prompt on a pooled worker (blocking).
+
+        Args:
+            model_alias: Claude Code model alias (e.g. "sonnet")
+            system: Optional system prompt
+            prompt: User prompt
+
+        Returns:
+            CLI result message ({"type": "result", "result": ..., "usage": ...})
+        """
+        if self._closed:
+            raise RuntimeError("Claude Code worker pool is shut down")
+
+        key: WorkerKey = (model_alias, system)
+        with self._semaphore:
+            self.requests += 1
+            worker = self._acquire(key)
+            self._replenish(key)
+
+            # Last call for this worker: close stdin so the CLI exits cleanly
+            last_call = worker.calls + 1 >= self.max_calls_per_worker
+            try:
+                result = worker.request(prompt, self.request_timeout, close_input=last_call)
+            except Exception:
+                self.failures += 1
+                worker.close()
+                raise
+
+            self._release(key, worker)
+            return result
+
+    async def arequest(self, model_alias: str, system: Optional[str], prompt: str) -> Dict[str, Any]:
+        """Async wrapper around request() (runs in the default executor)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.request, model_alias, system, prompt)
+        )
+
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Drop dead and long-idle workers.
+
+        Returns:
+            Pool statistics after pruning
+        """
+        with self._lock:
+            stale = self._take_stale(time.time())
+        for worker in stale:
+            worker.close()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool metrics."""
+        with self._lock:
+            idle = sum(len(workers) for workers in self._idle.values())
+        return {
+            "max_workers": self.max_workers,
+            "idle_workers": idle,
+            "requests": self.requests,
+            "warm_hits": self.warm_hits,
+            "cold_starts": self.cold_starts,
+            "recycled": self.recycled,
+            "dead_workers": self.dead_workers,
+            "failures": self.failures
+        }
+
+    def shutdown(self):
+        """Terminate all idle workers and refuse new requests."""
+        with self._lock:
+            self._closed = True
+            workers = [w for ws in self._idle.values() for w in ws]
+            self._idle.clear()
+        for worker in workers:
+            worker.close()
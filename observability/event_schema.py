@@ -65,6 +65,7 @@ class EventType(str, Enum):
     VALIDATION_PASSED = "validation.passed"
     VALIDATION_FAILED = "validation.failed"
     VALIDATION_SKIPPED = "validation.skipped"
+    VALIDATION_PROGRESS = "validation.progress"
 
     # ========== CRITIC EVENTS ==========
     CRITIC_STARTED = "critic.started"
@@ -10,9 +10,23 @@ Strategy:
 - Tier 4: GPT-4 ($30/1M input) - Last resort for highest quality
 
 Cost Savings: 60-80% on simple tasks vs always using Sonnet/Opus
+
+Racing mode (racing=True):
+- Start the cheapest eligible tier, then start the next tier concurrently
+  after race_delay seconds (or immediately when the running tiers fail)
+- First result meeting quality_target wins; the other tiers are cancelled
+  and charged their worst-case cost (their provider requests still finish)
+- spend_cap_usd bounds committed + worst-case in-flight spend
+- Per-task-type tier success rates learned from recorded workflows decide
+  whether racing is worth it and how soon the next tier starts
+
+Tier prediction (tier_predictor=TierPredictor(...)):
+- Tiers a learned model predicts will miss the target on similar tasks are
+  skipped, so the workflow starts at the predicted tier directly
 """
 
 import asyncio
+import re
 import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -36,12 +50,14 @@ try:
     from .workflow_metrics import WorkflowMetricsTracker
     from .specialized_roles_orchestrator import WorkflowResult, PhaseResult, WorkflowPhase
     from .role_definitions import DEVELOPER_ROLE
+    from .tier_predictor import TierPredictor
 except ImportError:
     from resilient_agent import ResilientBaseAgent
     from validation_orchestrator import ValidationOrchestrator
     from workflow_metrics import WorkflowMetricsTracker
     from specialized_roles_orchestrator import WorkflowResult, PhaseResult, WorkflowPhase
     from role_definitions import DEVELOPER_ROLE
+    from tier_predictor import TierPredictor
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +86,15 @@ class ProgressiveEnhancementOrchestrator:
     - Average savings: 60-70% across typical task distribution
     """
 
+    # Output token limit per tier call (also the worst case for spend estimates)
+    TIER_MAX_TOKENS = 4096
+
+    # Task types hinted by context["complexity"] that race without waiting
+    HARD_TASK_TYPES = ("complex", "critical")
+
+    # Recorded attempts needed before a tier's learned success rate is trusted
+    MIN_TIER_SAMPLES = 3
+
     # Model tier definitions (extracted from specialized_roles escalation logic)
     MODEL_TIERS = [
         ModelTier(
@@ -109,7 +134,14 @@ class ProgressiveEnhancementOrchestrator:
     def __init__(self,
                  project_root: str = "/mnt/d/Dev",
                  quality_target: int = 90,
-                 max_escalations: int = 3):
+                 max_escalations: int = 3,
+                 racing: bool = False,
+                 race_delay: float = 20.0,
+                 race_skip_rate: float = 0.8,
+                 spend_cap_usd: Optional[float] = None,
+                 metrics_tracker: Optional[WorkflowMetricsTracker] = None,
+                 tier_predictor: Optional[TierPredictor] = None,
+                 learning_db=None):
         """
         Initialize progressive enhancement orchestrator.
 
@@ -117,14 +149,37 @@ class ProgressiveEnhancementOrchestrator:
             project_root: Root directory for validation
             quality_target: Target quality score (0-100)
             max_escalations: Maximum number of escalation attempts
+            racing: Start higher tiers concurrently instead of strictly in turn
+            race_delay: Seconds to wait before starting the next tier in a race
+            race_skip_rate: Learned cheapest-tier success rate at or above which
+                the workflow escalates sequentially instead of racing
+            spend_cap_usd: Optional cap on workflow spend; a tier is only started
+                if spent + worst-case in-flight cost stays within it (the first
+                tier always runs)
+            metrics_tracker: Optional shared WorkflowMetricsTracker
+            tier_predictor: Optional TierPredictor used to skip tiers predicted
+                to miss the target; trained on metrics history at startup
+            learning_db: Optional LearningDatabase with extra training history
         """
+        if race_delay < 0:
+            raise ValueError(f"race_delay must be >= 0, got {race_delay}")
+
         self.validator = ValidationOrchestrator(project_root=project_root)
-        self.metrics = WorkflowMetricsTracker()
+        self.metrics = metrics_tracker or WorkflowMetricsTracker()
 
         self.quality_target = quality_target
         self.max_escalations = max_escalations
         self.project_root = project_root
 
+        self.racing = racing
+        self.race_delay = race_delay
+        self.race_skip_rate = race_skip_rate
+        self.spend_cap_usd = spend_cap_usd
+
+        self.tier_predictor = tier_predictor
+        if tier_predictor is not None:
+            tier_predictor.fit_history(self.metrics, learning_db)
+
         # Initialize observability
         if EventEmitter is not None:
             self.emitter = EventEmitter(enable_console=False)
@@ -154,8 +209,19 @@ class ProgressiveEnhancementOrchestrator:
         if context is None:
             context = {}
 
+        task_type = self._task_type(task, context)
+        tiers = self._eligible_tiers()
+        predicted_skips = self._predicted_skips(task, context, tiers)
+        tiers = [tier for tier in tiers if tier.name not in predicted_skips]
+        race_delay = self._plan_race(task_type, tiers) if self.racing else None
+        race_info = None
+
         logger.info(f"Starting progressive workflow {workflow_id}: {task}")
         logger.info(f"Quality target: {self.quality_target}/100")
+        if predicted_skips:
+            logger.info(f"Skipping tiers predicted to miss target: {', '.join(predicted_skips)}")
+        if race_delay is not None:
+            logger.info(f"Racing tiers for task type '{task_type}' (delay {race_delay:.1f}s)")
 
         # Start workflow trace
         if self.emitter:
@@ -164,7 +230,8 @@ class ProgressiveEnhancementOrchestrator:
                 context={
                     "workflow_id": workflow_id,
                     "quality_target": self.quality_target,
-                    "max_escalations": self.max_escalations
+                    "max_escalations": self.max_escalations,
+                    "racing": race_delay is not None
                 }
             )
 
@@ -174,133 +241,180 @@ class ProgressiveEnhancementOrchestrator:
         best_quality = 0
         total_cost = 0.0
         total_tokens = 0
+        spend_capped = False
 
-        # Try each tier progressively
-        for tier_index, tier in enumerate(self.MODEL_TIERS):
-            if tier_index >= self.max_escalations + 1:
-                logger.info(f"Reached max escalations ({self.max_escalations})")
-                break
+        if race_delay is not None:
+            race_results, race_info = await self._race_tiers(task, context, tiers, race_delay)
+            spend_capped = race_info["spend_capped"]
 
-            # Skip tier if its max quality can't meet target
-            if tier.max_quality < self.quality_target:
-                logger.info(f"Skipping {tier.name} (max quality {tier.max_quality} < target {self.quality_target})")
-                continue
+            for tier, tier_result in race_results:
+                attempts.append({
+                    "tier": tier.name,
+                    "model": tier.model,
+                    "quality": tier_result["quality"],
+                    "cost": tier_result["cost"],
+                    "tokens": tier_result["tokens"],
+                    "success": tier_result["success"],
+                    "cancelled": tier_result.get("cancelled", False)
+                })
 
-            logger.info(f"🔄 Attempting with {tier.name} (max quality: {tier.max_quality})")
+                total_cost += tier_result["cost"]
+                total_tokens += tier_result["tokens"]
 
-            # Emit agent invoked event
-            if self.emitter:
-                self.emitter.start_span(f"tier_{tier.name}")
+                if tier_result["quality"] > best_quality:
+                    best_quality = tier_result["quality"]
+                    best_result = tier_result
+
+            if race_info["winner"] and self.emitter:
                 self.emitter.emit(
-                    event_type=EventType.AGENT_INVOKED,
+                    event_type=EventType.QUALITY_THRESHOLD_PASSED,
                     component="progressive-orchestrator",
-                    message=f"Attempting tier {tier.name} (tier {tier_index + 1}/{len(self.MODEL_TIERS)})",
+                    message=f"Quality target met at tier {race_info['winner']} (race)",
                     severity=EventSeverity.INFO,
-                    workflow="progressive_enhancement",
-                    model=tier.model,
+                    quality_score=float(best_quality),
                     data={
-                        "tier": tier.name,
-                        "tier_index": tier_index,
-                        "max_quality": tier.max_quality
+                        "target": self.quality_target,
+                        "actual": best_quality,
+                        "stopped_at_tier": race_info["winner"],
+                        "cancelled_tiers": race_info["cancelled_tiers"]
                     }
                 )
+        else:
+            # Try each tier progressively
+            for tier_index, tier in enumerate(self.MODEL_TIERS):
+                if tier_index >= self.max_escalations + 1:
+                    logger.info(f"Reached max escalations ({self.max_escalations})")
+                    break
 
-            # Execute with current tier
-            tier_result = await self._execute_with_tier(task, context, tier)
+                # Skip tier if its max quality can't meet target
+                if tier.max_quality < self.quality_target:
+                    logger.info(f"Skipping {tier.name} (max quality {tier.max_quality} < target {self.quality_target})")
+                    continue
 
-            # Emit agent completed event
-            if self.emitter:
-                self.emitter.emit(
-                    event_type=EventType.AGENT_COMPLETED,
-                    component="progressive-orchestrator",
-                    message=f"Tier {tier.name} completed: quality {tier_result['quality']}/100",
-                    severity=EventSeverity.INFO,
-                    workflow="progressive_enhancement",
-                    duration_ms=tier_result["duration_ms"],
-                    cost_usd=tier_result["cost"],
-                    model=tier.model,
-                    data={
-                        "tier": tier.name,
-                        "quality": tier_result["quality"],
-                        "success": tier_result["success"]
-                    }
-                )
+                if tier.name in predicted_skips:
+                    continue
 
-                # Emit quality measured event
-                self.emitter.emit(
-                    event_type=EventType.QUALITY_MEASURED,
-                    component=f"tier_{tier.name}",
-                    message=f"Tier {tier.name} quality: {tier_result['quality']}/100",
-                    severity=EventSeverity.INFO,
-                    quality_score=float(tier_result["quality"]),
-                    data={"tier": tier.name}
-                )
+                # Stop escalating once the next tier could push spend past the cap
+                if attempts and not self._within_spend_cap(total_cost, tier, task, context):
+                    logger.info(f"Spend cap ${self.spend_cap_usd:.4f} reached; not escalating to {tier.name}")
+                    spend_capped = True
+                    break
 
-                self.emitter.end_span()
+                logger.info(f"🔄 Attempting with {tier.name} (max quality: {tier.max_quality})")
 
-            attempts.append({
-                "tier": tier.name,
-                "model": tier.model,
-                "quality": tier_result["quality"],
-                "cost": tier_result["cost"],
-                "tokens": tier_result["tokens"],
-                "success": tier_result["success"]
-            })
-
-            total_cost += tier_result["cost"]
-            total_tokens += tier_result["tokens"]
-
-            # Check if this is our best result so far
-            if tier_result["quality"] > best_quality:
-                best_quality = tier_result["quality"]
-                best_result = tier_result
-
-            # Success criteria: quality meets or exceeds target
-            if tier_result["quality"] >= self.quality_target:
-                logger.info(f"✅ Quality target met: {tier_result['quality']}/100 >= {self.quality_target}/100")
-                logger.info(f"   Stopped at {tier.name} (saved cost by not escalating further)")
-
-                # Emit quality threshold passed
+                # Emit agent invoked event
                 if self.emitter:
+                    self.emitter.start_span(f"tier_{tier.name}")
                     self.emitter.emit(
-                        event_type=EventType.QUALITY_THRESHOLD_PASSED,
+                        event_type=EventType.AGENT_INVOKED,
                         component="progressive-orchestrator",
-                        message=f"Quality target met at tier {tier.name}",
+                        message=f"Attempting tier {tier.name} (tier {tier_index + 1}/{len(self.MODEL_TIERS)})",
                         severity=EventSeverity.INFO,
-                        quality_score=float(tier_result["quality"]),
+                        workflow="progressive_enhancement",
+                        model=tier.model,
                         data={
-                            "target": self.quality_target,
-                            "actual": tier_result["quality"],
-                            "stopped_at_tier": tier.name
+                            "tier": tier.name,
+                            "tier_index": tier_index,
+                            "max_quality": tier.max_quality
                         }
                     )
 
-                break
-
-            # If we tried the last tier, stop
-            if tier_index == len(self.MODEL_TIERS) - 1:
-                logger.info(f"⚠️ Tried all tiers. Best quality: {best_quality}/100")
-                break
+                # Execute with current tier
+                tier_result = await self._execute_with_tier(task, context, tier)
 
-            logger.info(f"   Quality {tier_result['quality']}/100 < target {self.quality_target}/100. Escalating...")
-
-            # Emit escalation event
-            if self.emitter:
-                next_tier = self.MODEL_TIERS[tier_index + 1] if tier_index + 1 < len(self.MODEL_TIERS) else None
-                if next_tier:
+                # Emit agent completed event
+                if self.emitter:
                     self.emitter.emit(
-                        event_type=EventType.MODEL_FALLBACK,
+                        event_type=EventType.AGENT_COMPLETED,
                         component="progressive-orchestrator",
-                        message=f"Escalating from {tier.name} to {next_tier.name}",
-                        severity=EventSeverity.WARNING,
+                        message=f"Tier {tier.name} completed: quality {tier_result['quality']}/100",
+                        severity=EventSeverity.INFO,
                         workflow="progressive_enhancement",
+                        duration_ms=tier_result["duration_ms"],
+                        cost_usd=tier_result["cost"],
+                        model=tier.model,
                         data={
-                            "from_tier": tier.name,
-                            "to_tier": next_tier.name,
-                            "reason": f"quality {tier_result['quality']} < target {self.quality_target}"
+                            "tier": tier.name,
+                            "quality": tier_result["quality"],
+                            "success": tier_result["success"]
                         }
                     )
 
+                    # Emit quality measured event
+                    self.emitter.emit(
+                        event_type=EventType.QUALITY_MEASURED,
+                        component=f"tier_{tier.name}",
+                        message=f"Tier {tier.name} quality: {tier_result['quality']}/100",
+                        severity=EventSeverity.INFO,
+                        quality_score=float(tier_result["quality"]),
+                        data={"tier": tier.name}
+                    )
+
+                    self.emitter.end_span()
+
+                attempts.append({
+                    "tier": tier.name,
+                    "model": tier.model,
+                    "quality": tier_result["quality"],
+                    "cost": tier_result["cost"],
+                    "tokens": tier_result["tokens"],
+                    "success": tier_result["success"]
+                })
+
+                total_cost += tier_result["cost"]
+                total_tokens += tier_result["tokens"]
+
+                # Check if this is our best result so far
+                if tier_result["quality"] > best_quality:
+                    best_quality = tier_result["quality"]
+                    best_result = tier_result
+
+                # Success criteria: quality meets or exceeds target
+                if tier_result["quality"] >= self.quality_target:
+                    logger.info(f"✅ Quality target met: {tier_result['quality']}/100 >= {self.quality_target}/100")
+                    logger.info(f"   Stopped at {tier.name} (saved cost by not escalating further)")
+
+                    # Emit quality threshold passed
+                    if self.emitter:
+                        self.emitter.emit(
+                            event_type=EventType.QUALITY_THRESHOLD_PASSED,
+                            component="progressive-orchestrator",
+                            message=f"Quality target met at tier {tier.name}",
+                            severity=EventSeverity.INFO,
+                            quality_score=float(tier_result["quality"]),
+                            data={
+                                "target": self.quality_target,
+                                "actual": tier_result["quality"],
+                                "stopped_at_tier": tier.name
+                            }
+                        )
+
+                    break
+
+                # If we tried the last tier, stop
+                if tier_index == len(self.MODEL_TIERS) - 1:
+                    logger.info(f"⚠️ Tried all tiers. Best quality: {best_quality}/100")
+                    break
+
+                logger.info(f"   Quality {tier_result['quality']}/100 < target {self.quality_target}/100. Escalating...")
+
+                # Emit escalation event
+                if self.emitter:
+                    next_tier = self.MODEL_TIERS[tier_index + 1] if tier_index + 1 < len(self.MODEL_TIERS) else None
+                    if next_tier:
+                        self.emitter.emit(
+                            event_type=EventType.MODEL_FALLBACK,
+                            component="progressive-orchestrator",
+                            message=f"Escalating from {tier.name} to {next_tier.name}",
+                            severity=EventSeverity.WARNING,
+                            workflow="progressive_enhancement",
+                            data={
+                                "from_tier": tier.name,
+                                "to_tier": next_tier.name,
+                                "reason": f"quality {tier_result['quality']} < target {self.quality_target}"
+                            }
+                        )
+
         # Calculate final metrics
         end_time = datetime.now()
         total_duration_ms = (end_time - start_time).total_seconds() * 1000
@@ -312,6 +426,11 @@ class ProgressiveEnhancementOrchestrator:
         cost_savings = baseline_cost - total_cost
         cost_savings_percent = (cost_savings / baseline_cost * 100) if baseline_cost > 0 else 0
 
+        if race_info and race_info["winner"]:
+            final_tier = race_info["winner"]
+        else:
+            final_tier = attempts[-1]["tier"] if attempts else "none"
+
         # Create PhaseResult from best attempt
         if best_result:
             phase_result = PhaseResult(
@@ -320,8 +439,8 @@ class ProgressiveEnhancementOrchestrator:
                 output=best_result["output"],
                 success=best_result["success"],
                 execution_time_ms=best_result["duration_ms"],
-                tokens_used=0,
-                cost_usd=0.0,
+                tokens_used=best_result["tokens"],
+                cost_usd=best_result["cost"],
                 model_used=best_result["model"],
                 validation_result=best_result.get("validation"),
                 quality_score=best_result["quality"],
@@ -341,11 +460,15 @@ class ProgressiveEnhancementOrchestrator:
                 "quality_target": self.quality_target,
                 "attempts": attempts,
                 "tiers_tried": len(attempts),
-                "final_tier": attempts[-1]["tier"] if attempts else "none",
+                "final_tier": final_tier,
                 "cost_savings_usd": cost_savings,
                 "cost_savings_percent": cost_savings_percent,
                 "baseline_cost_usd": baseline_cost,
-                "escalated": len(attempts) > 1
+                "escalated": len(attempts) > 1,
+                "task_type": task_type,
+                "spend_capped": spend_capped,
+                "predicted_skips": predicted_skips,
+                "race": race_info
             }
         }
 
@@ -366,6 +489,12 @@ class ProgressiveEnhancementOrchestrator:
         # Record metrics
         self.metrics.record_workflow(workflow_result)
 
+        if self.tier_predictor is not None:
+            for attempt in attempts:
+                if not attempt.get("cancelled"):
+                    self.tier_predictor.add_example(task, context, attempt["tier"],
+                                                    attempt["quality"] >= self.quality_target)
+
         logger.info(f"Progressive workflow completed: quality={best_quality}/100, "
                    f"cost=${total_cost:.4f}, tiers={len(attempts)}, "
                    f"savings={cost_savings_percent:.1f}%")
@@ -378,7 +507,7 @@ class ProgressiveEnhancementOrchestrator:
                     "quality": best_quality,
                     "cost": total_cost,
                     "tiers_tried": len(attempts),
-                    "final_tier": attempts[-1]["tier"] if attempts else "none",
+                    "final_tier": final_tier,
                     "escalated": len(attempts) > 1,
                     "cost_savings_percent": cost_savings_percent
                 }
@@ -427,12 +556,12 @@ class ProgressiveEnhancementOrchestrator:
                 role=f"Developer ({tier.name})",
                 model=tier.model,
                 temperature=0.3,
-                max_tokens=4096,
+                max_tokens=self.TIER_MAX_TOKENS,
                 system_prompt=self._create_system_prompt(task, context)
             )
 
-            # Execute task
-            result = agent.call(task)
+            # Execute task off the event loop so raced tiers overlap
+            result = await asyncio.to_thread(agent.call, task)
 
             execution_time_ms = (time.time() - start_time) * 1000
 
@@ -442,27 +571,29 @@ class ProgressiveEnhancementOrchestrator:
                     "model": tier.model,
                     "output": "",
                     "quality": 0,
-                    "cost": 0.0,
-                    "tokens": 0,
+                    "cost": result.cost,
+                    "tokens": result.total_tokens,
                     "duration_ms": execution_time_ms,
                     "success": False,
                     "error": result.error
                 }
 
+            output = result.output or ""
+
             # Validate result if it looks like code
             validation_result = None
-            if self._is_code_result(result.content):
-                validation_result = await self._validate_result(result.content, context)
+            if self._is_code_result(output):
+                validation_result = await self._validate_result(output, context)
 
             # Estimate quality score
-            quality = self._estimate_quality(result.content, validation_result, tier)
+            quality = self._estimate_quality(output, validation_result, tier)
 
             return {
                 "model": tier.model,
-                "output": result.content,
+                "output": output,
                 "quality": quality,
-                "cost": 0.0,
-                "tokens": 0,
+                "cost": result.cost,
+                "tokens": result.total_tokens,
                 "duration_ms": execution_time_ms,
                 "success": True,
                 "validation": validation_result
@@ -481,6 +612,266 @@ class ProgressiveEnhancementOrchestrator:
                 "error": str(e)
             }
 
+    async def _race_tiers(self,
+                          task: str,
+                          context: Dict[str, Any],
+                          tiers: List[ModelTier],
+                          delay: float) -> Tuple[List[Tuple[ModelTier, Dict[str, Any]]], Dict[str, Any]]:
+        """
+        Race eligible tiers with staggered starts.
+
+        The cheapest tier starts at once; each further tier starts when
+        `delay` seconds pass without a winner, or immediately when nothing
+        is left running. A tier only starts if spend so far plus the
+        worst-case cost of every running tier stays within the spend cap.
+        The first result meeting quality_target wins and the remaining tiers
+        are cancelled (a provider request already in flight completes in its
+        worker thread, but its result is discarded). Its spend cannot be
+        observed, so each cancelled tier is charged its worst-case
+        _estimate_tier_cost.
+
+        Args:
+            task: Development task description
+            context: Task context
+            tiers: Tiers to race, cheapest first
+            delay: Seconds between tier starts
+
+        Returns:
+            Tuple of ([(tier, tier_result)] in completion order, race info);
+            cancelled tiers are appended last with cancelled=True and their
+            estimated cost
+        """
+        loop = asyncio.get_running_loop()
+
+        running: Dict[asyncio.Task, Tuple[ModelTier, float, float]] = {}
+        results: List[Tuple[ModelTier, Dict[str, Any]]] = []
+        started: List[str] = []
+        spent = 0.0
+        next_index = 0
+        last_start = loop.time()
+        winner: Optional[Tuple[ModelTier, Dict[str, Any]]] = None
+        spend_capped = False
+
+        def start_next() -> None:
+            nonlocal next_index, last_start, spend_capped
+            tier = tiers[next_index]
+            estimate = self._estimate_tier_cost(tier, task, context)
+            in_flight = sum(entry[1] for entry in running.values())
+
+            if started and not self._within_spend_cap(spent + in_flight, tier, task, context):
+                logger.info(f"Spend cap ${self.spend_cap_usd:.4f} reached; not starting {tier.name}")
+                spend_capped = True
+                return
+
+            job = asyncio.create_task(self._execute_with_tier(task, context, tier))
+            running[job] = (tier, estimate, loop.time())
+            started.append(tier.name)
+            next_index += 1
+            last_start = loop.time()
+
+            if self.emitter:
+                self.emitter.emit(
+                    event_type=EventType.AGENT_INVOKED,
+                    component="progressive-orchestrator",
+                    message=f"Racing tier {tier.name} ({len(started)}/{len(tiers)})",
+                    severity=EventSeverity.INFO,
+                    workflow="progressive_enhancement",
+                    model=tier.model,
+                    data={"tier": tier.name, "racing": True, "estimated_cost": estimate}
+                )
+
+        if tiers:
+            start_next()
+
+        try:
+            while running:
+                can_start = next_index < len(tiers) and not spend_capped
+                timeout = max(0.0, last_start + delay - loop.time()) if can_start else None
+
+                done, _ = await asyncio.wait(running, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+
+                for job in done:
+                    tier, _, _ = running.pop(job)
+                    tier_result = job.result()
+                    results.append((tier, tier_result))
+                    spent += tier_result["cost"]
+
+                    if self.emitter:
+                        self.emitter.emit(
+                            event_type=EventType.AGENT_COMPLETED,
+                            component="progressive-orchestrator",
+                            message=f"Tier {tier.name} completed: quality {tier_result['quality']}/100",
+                            severity=EventSeverity.INFO,
+                            workflow="progressive_enhancement",
+                            duration_ms=tier_result["duration_ms"],
+                            cost_usd=tier_result["cost"],
+                            model=tier.model,
+                            data={"tier": tier.name, "quality": tier_result["quality"], "racing": True}
+                        )
+
+                    if tier_result["quality"] >= self.quality_target and (
+                            winner is None or tier_result["quality"] > winner[1]["quality"]):
+                        winner = (tier, tier_result)
+
+                if winner:
+                    break
+
+                if can_start and (not running or loop.time() - last_start >= delay):
+                    start_next()
+        finally:
+            for job in running:
+                job.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        cancelled = []
+        for tier, estimate, started_at in running.values():
+            cancelled.append(tier.name)
+            spent += estimate
+            results.append((tier, {
+                "model": tier.model,
+                "output": "",
+                "quality": 0,
+                "cost": estimate,
+                "cost_estimated": True,
+                "tokens": 0,
+                "duration_ms": (loop.time() - started_at) * 1000,
+                "success": False,
+                "cancelled": True,
+                "error": "cancelled: race won by another tier"
+            }))
+
+        if winner:
+            logger.info(f"✅ Race won by {winner[0].name}: {winner[1]['quality']}/100 "
+                        f"(cancelled: {', '.join(cancelled) or 'none'})")
+
+        race_info = {
+            "delay_seconds": delay,
+            "tiers_started": started,
+            "winner": winner[0].name if winner else None,
+            "cancelled_tiers": cancelled,
+            "spend_capped": spend_capped,
+            "spent_usd": spent
+        }
+        return results, race_info
+
+    def _eligible_tiers(self) -> List[ModelTier]:
+        """Tiers within max_escalations that can reach the quality target."""
+        tiers = []
+        for tier_index, tier in enumerate(self.MODEL_TIERS):
+            if tier_index >= self.max_escalations + 1:
+                break
+            if tier.max_quality >= self.quality_target:
+                tiers.append(tier)
+        return tiers
+
+    def _predicted_skips(self,
+                         task: str,
+                         context: Dict[str, Any],
+                         tiers: List[ModelTier]) -> List[str]:
+        """Names of eligible tiers the tier predictor expects to miss the target."""
+        if self.tier_predictor is None or not tiers:
+            return []
+
+        names = [tier.name for tier in tiers]
+        start = self.tier_predictor.recommend_start(task, context, names)
+        return names[:names.index(start)]
+
+    def _task_type(self, task: str, context: Dict[str, Any]) -> str:
+        """
+        Task type used to key learned tier success rates.
+
+        Uses context["task_type"] or context["complexity"] when given, else
+        the first tier `suitable_for` label mentioned in the task.
+        """
+        explicit = context.get("task_type") or context.get("complexity")
+        if explicit:
+            return str(explicit).lower()
+
+        words = set(re.findall(r"[a-z_]+", task.lower()))
+        for tier in self.MODEL_TIERS:
+            for label in tier.suitable_for:
+                if label in words:
+                    return label
+        return "general"
+
+    def tier_success_rates(self, task_type: str) -> Dict[str, Dict[str, float]]:
+        """
+        Learned per-tier success rates for a task type.
+
+        Counts the attempts of previously recorded progressive workflows of
+        the same task type; an attempt succeeded if it met that workflow's
+        quality target. Rates are Laplace-smoothed: (successes + 1) / (attempts + 2).
+
+        Args:
+            task_type: Task type (see _task_type)
+
+        Returns:
+            Dict of tier name -> {"attempts", "successes", "rate"}
+        """
+        counts: Dict[str, List[int]] = {}
+        for workflow in self.metrics.workflows:
+            metadata = (workflow.context or {}).get("workflow_metadata") or {}
+            if metadata.get("workflow_type") != "progressive_enhancement":
+                continue
+            if metadata.get("task_type") != task_type:
+                continue
+
+            target = metadata.get("quality_target", self.quality_target)
+            for attempt in metadata.get("attempts", []):
+                if attempt.get("cancelled"):
+                    continue
+                tier_counts = counts.setdefault(attempt["tier"], [0, 0])
+                tier_counts[0] += 1
+                tier_counts[1] += int(attempt.get("quality", 0) >= target)
+
+        return {
+            tier: {"attempts": n, "successes": s, "rate": (s + 1) / (n + 2)}
+            for tier, (n, s) in counts.items()
+        }
+
+    def _plan_race(self, task_type: str, tiers: List[ModelTier]) -> Optional[float]:
+        """
+        Decide whether racing is worth it for this task type.
+
+        With enough history for the cheapest tier, skip racing when it
+        usually succeeds (rate >= race_skip_rate), otherwise start the next
+        tier after race_delay scaled by that rate. Without history, hard
+        task types race immediately and others wait the full race_delay.
+
+        Returns:
+            Seconds between tier starts, or None to escalate sequentially
+        """
+        if len(tiers) < 2:
+            return None
+
+        stats = self.tier_success_rates(task_type).get(tiers[0].name)
+        if stats and stats["attempts"] >= self.MIN_TIER_SAMPLES:
+            if stats["rate"] >= self.race_skip_rate:
+                return None
+            return self.race_delay * stats["rate"]
+
+        if task_type in self.HARD_TASK_TYPES:
+            return 0.0
+        return self.race_delay
+
+    def _estimate_tier_cost(self, tier: ModelTier, task: str, context: Dict[str, Any]) -> float:
+        """Worst-case cost of one tier call (full TIER_MAX_TOKENS output)."""
+        input_tokens = (len(self._create_system_prompt(task, context)) + len(task)) // 4
+        return (input_tokens * tier.cost_per_1m_input +
+                self.TIER_MAX_TOKENS * tier.cost_per_1m_output) / 1_000_000
+
+    def _within_spend_cap(self,
+                          committed: float,
+                          tier: ModelTier,
+                          task: str,
+                          context: Dict[str, Any]) -> bool:
+        """Whether starting tier keeps committed + its worst-case cost within the cap."""
+        if self.spend_cap_usd is None:
+            return True
+        return committed + self._estimate_tier_cost(tier, task, context) <= self.spend_cap_usd
+
     def _create_system_prompt(self, task: str, context: Dict[str, Any]) -> str:
         """Create system prompt for development task."""
         language = context.get("language", "python")
@@ -10,17 +10,27 @@ import json
 import random
 import asyncio
 import hashlib
+import uuid
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 import re
 import statistics
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 try:
     from .agent_system import BaseAgent
+    from .evolution_store import EvolutionStore, content_hash
 except ImportError:
     from agent_system import BaseAgent
+    from evolution_store import EvolutionStore, content_hash
 
 
 class MutationType(Enum):
@@ -335,10 +345,45 @@ class PromptMutator:
 
 
 class FitnessEvaluator:
-    """Evaluates prompt fitness across multiple dimensions."""
+    """
+    Evaluates prompt fitness across multiple dimensions.
 
-    def __init__(self, base_agent: Optional[BaseAgent] = None):
+    Test cases run concurrently, capped at max_concurrency runs in flight
+    across every evaluation sharing this evaluator. Results are memoised by
+    (prompt content hash, test case id), so unchanged prompts such as
+    elites are never re-run, and concurrent requests for the same pair
+    share one run. With an EvolutionStore, results are also read from and
+    written to disk, so they are shared across runs and restarts.
+    """
+
+    def __init__(
+        self,
+        base_agent: Optional[BaseAgent] = None,
+        max_concurrency: int = 10,
+        store: Optional[EvolutionStore] = None
+    ):
         self.base_agent = base_agent or BaseAgent(role="evaluator", model="claude-3-5-sonnet-20241022")
+        self.max_concurrency = max_concurrency
+        self.store = store
+
+        self.memo: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.memo_hits = 0
+        self.store_hits = 0
+        self.test_runs = 0
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def evaluate_population(
+        self,
+        population: List[PromptVariation],
+        test_cases: List[TestCase]
+    ) -> List[float]:
+        """Evaluate every variation concurrently; returns fitness scores in population order."""
+        evaluations = await asyncio.gather(*(
+            self.evaluate(variation, test_cases) for variation in population
+        ))
+        return [fitness for fitness, _ in evaluations]
 
     async def evaluate(
         self,
@@ -355,10 +400,9 @@ class FitnessEvaluator:
         }
 
         # Run test cases
-        results = []
-        for test_case in test_cases:
-            result = await self._run_test_case(variation, test_case)
-            results.append(result)
+        results = list(await asyncio.gather(*(
+            self._run_memoised(variation, test_case) for test_case in test_cases
+        )))
 
         # Calculate dimension scores
         dimension_scores[FitnessDimension.ACCURACY] = self._calculate_accuracy(results)
@@ -388,6 +432,73 @@ class FitnessEvaluator:
 
         return overall_fitness, dimension_scores
 
+    async def _run_memoised(
+        self,
+        variation: PromptVariation,
+        test_case: TestCase
+    ) -> Dict[str, Any]:
+        """Run a test case unless this content already has a result for it."""
+        key = (self._content_hash(variation.content), self._test_case_id(test_case))
+
+        if key in self.memo:
+            self.memo_hits += 1
+            return dict(self.memo[key])
+
+        if self.store is not None:
+            stored = self.store.get_evaluation(*key)
+            if stored is not None:
+                self.store_hits += 1
+                stored["test_case"] = test_case
+                self.memo[key] = stored
+                return dict(stored)
+
+        run = self._in_flight.get(key)
+        if run is None:
+            run = asyncio.ensure_future(self._run_limited(key, variation, test_case))
+            self._in_flight[key] = run
+            run.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.memo_hits += 1
+
+        return dict(await asyncio.shield(run))
+
+    async def _run_limited(
+        self,
+        key: Tuple[str, str],
+        variation: PromptVariation,
+        test_case: TestCase
+    ) -> Dict[str, Any]:
+        """Run a test case under the evaluator-wide concurrency limit and memoise it."""
+        async with self._limiter():
+            self.test_runs += 1
+            result = await self._run_test_case(variation, test_case)
+        self.memo[key] = result
+        if self.store is not None:
+            self.store.put_evaluation(*key, {k: v for k, v in result.items() if k != "test_case"})
+        return result
+
+    def _limiter(self) -> asyncio.Semaphore:
+        """Concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return content_hash(content)
+
+    @staticmethod
+    def _test_case_id(test_case: TestCase) -> str:
+        """Stable id for a test case's inputs, expectation and edge-case flag."""
+        payload = json.dumps(
+            [test_case.input_data, test_case.expected_output, test_case.edge_case],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
     async def _run_test_case(
         self,
         variation: PromptVariation,
@@ -506,7 +617,16 @@ class FitnessEvaluator:
 
 
 class GeneticSelector:
-    """Applies genetic algorithms for prompt evolution."""
+    """
+    Applies genetic algorithms for prompt evolution.
+
+    Prompt similarity is word-set Jaccard. Each variation's words are
+    tokenised once and the whole population's pairwise similarities come
+    from one binary-matrix product (bitset popcounts without NumPy). With
+    sharing_radius set, elites and breeding parents are ranked by shared
+    fitness, so near-duplicate prompts split their fitness and distinct
+    niches survive.
+    """
 
     def __init__(
         self,
@@ -514,13 +634,17 @@ class GeneticSelector:
         elite_ratio: float = 0.3,
         breeding_ratio: float = 0.4,
         mutation_rate: float = 0.2,
-        innovation_ratio: float = 0.1
+        innovation_ratio: float = 0.1,
+        sharing_radius: Optional[float] = None,
+        sharing_alpha: float = 1.0
     ):
         self.population_size = population_size
         self.elite_ratio = elite_ratio
         self.breeding_ratio = breeding_ratio
         self.mutation_rate = mutation_rate
         self.innovation_ratio = innovation_ratio
+        self.sharing_radius = sharing_radius
+        self.sharing_alpha = sharing_alpha
         self.mutator = PromptMutator()
 
     async def evolve_generation(
@@ -530,12 +654,17 @@ class GeneticSelector:
     ) -> List[PromptVariation]:
         """Evolve to next generation using genetic algorithm."""
 
-        # Sort by fitness
-        sorted_population = sorted(
-            current_generation,
-            key=lambda x: x.fitness_score,
-            reverse=True
-        )
+        # Sort by fitness (shared fitness when niching is enabled)
+        if self.sharing_radius is not None:
+            shared = self.shared_fitness(current_generation)
+            order = sorted(range(len(current_generation)), key=lambda i: shared[i], reverse=True)
+            sorted_population = [current_generation[i] for i in order]
+        else:
+            sorted_population = sorted(
+                current_generation,
+                key=lambda x: x.fitness_score,
+                reverse=True
+            )
 
         next_generation = []
 
@@ -570,7 +699,7 @@ class GeneticSelector:
         innovation_count = int(self.population_size * self.innovation_ratio)
 
         # Use best performer as base for innovations
-        best_performer = sorted_population[0]
+        best_performer = max(sorted_population, key=lambda x: x.fitness_score)
         innovations = await self.mutator.generate_variations(
             best_performer.content,
             innovation_count,
@@ -648,32 +777,93 @@ class GeneticSelector:
         return variation
 
     def calculate_diversity(self, population: List[PromptVariation]) -> float:
-        """Calculate genetic diversity of population."""
-        if len(population) < 2:
+        """Calculate genetic diversity of population (1 - mean pairwise similarity)."""
+        n = len(population)
+        if n < 2:
             return 0.0
 
-        # Calculate pairwise similarity
-        similarities = []
-        for i in range(len(population)):
-            for j in range(i + 1, len(population)):
-                sim = self._calculate_similarity(
-                    population[i].content,
-                    population[j].content
-                )
-                similarities.append(sim)
-
-        if similarities:
-            # Diversity is inverse of average similarity
-            avg_similarity = statistics.mean(similarities)
-            return 1 - avg_similarity
-
-        return 0.5
+        similarity = self.similarity_matrix(population)
+        if NUMPY_AVAILABLE:
+            total = float(np.triu(similarity, k=1).sum())
+        else:
+            total = sum(similarity[i][j] for i in range(n) for j in range(i + 1, n))
+
+        # Diversity is inverse of average similarity
+        return 1 - total / (n * (n - 1) / 2)
+
+    def shared_fitness(self, population: List[PromptVariation]) -> List[float]:
+        """
+        Fitness divided by niche count (fitness sharing).
+
+        Niche count is the sum of 1 - (d / sharing_radius) ** sharing_alpha
+        over variations at distance d = 1 - similarity below sharing_radius,
+        including the variation itself.
+        """
+        radius = self.sharing_radius
+        fitness = [variation.fitness_score for variation in population]
+        if not radius or len(population) < 2:
+            return fitness
+
+        similarity = self.similarity_matrix(population)
+        if NUMPY_AVAILABLE:
+            distance = 1 - similarity
+            np.fill_diagonal(distance, 0.0)
+            sharing = np.where(distance < radius, 1 - (distance / radius) ** self.sharing_alpha, 0.0)
+            return (np.array(fitness) / sharing.sum(axis=1)).tolist()
+
+        shared = []
+        for i, row in enumerate(similarity):
+            distances = [0.0 if i == j else 1 - sim for j, sim in enumerate(row)]
+            niche = sum(
+                1 - (d / radius) ** self.sharing_alpha
+                for d in distances if d < radius
+            )
+            shared.append(fitness[i] / niche)
+        return shared
+
+    def similarity_matrix(self, population: List[PromptVariation]):
+        """
+        Pairwise word-set Jaccard similarity for a population.
+
+        Returns:
+            n x n NumPy array, or list of lists without NumPy
+        """
+        token_sets = [self._tokens(variation.content) for variation in population]
+        vocabulary: Dict[str, int] = {}
+        for tokens in token_sets:
+            for token in tokens:
+                vocabulary.setdefault(token, len(vocabulary))
+        sizes = [len(tokens) for tokens in token_sets]
+        n = len(population)
+
+        if NUMPY_AVAILABLE:
+            membership = np.zeros((n, len(vocabulary)))
+            for row, tokens in enumerate(token_sets):
+                membership[row, [vocabulary[token] for token in tokens]] = 1.0
+            intersection = membership @ membership.T
+            size = np.array(sizes, dtype=float)
+            union = size[:, None] + size[None, :] - intersection
+            similarity = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+            empty = size == 0
+            similarity[empty, :] = 0.0
+            similarity[:, empty] = 0.0
+            return similarity
+
+        bitsets = [sum(1 << vocabulary[token] for token in tokens) for tokens in token_sets]
+        similarity = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i, n):
+                if not sizes[i] or not sizes[j]:
+                    continue
+                intersection = (bitsets[i] & bitsets[j]).bit_count()
+                similarity[i][j] = similarity[j][i] = intersection / (sizes[i] + sizes[j] - intersection)
+        return similarity
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts."""
         # Simple word overlap similarity
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        words1 = self._tokens(text1)
+        words2 = self._tokens(text2)
 
         if not words1 or not words2:
             return 0.0
@@ -683,22 +873,36 @@ class GeneticSelector:
 
         return len(intersection) / len(union) if union else 0.0
 
+    @staticmethod
+    def _tokens(text: str) -> set:
+        return set(text.lower().split())
+
 
 class PromptEvolutionEngine:
-    """Main engine for evolving prompts over generations."""
+    """
+    Main engine for evolving prompts over generations.
+
+    With an EvolutionStore, every evaluated generation is checkpointed
+    under run_id and resume(run_id) continues an interrupted run; test
+    results are shared through the store, so rerunning known prompts is
+    free.
+    """
 
     def __init__(
         self,
         population_size: int = 50,
         max_generations: int = 100,
-        target_fitness: float = 0.95
+        target_fitness: float = 0.95,
+        store: Optional[EvolutionStore] = None
     ):
         self.population_size = population_size
         self.max_generations = max_generations
         self.target_fitness = target_fitness
+        self.store = store
+        self.run_id: Optional[str] = None
 
         self.mutator = PromptMutator()
-        self.evaluator = FitnessEvaluator()
+        self.evaluator = FitnessEvaluator(store=store)
         self.selector = GeneticSelector(population_size=population_size)
 
         self.generations: List[Generation] = []
@@ -709,16 +913,108 @@ class PromptEvolutionEngine:
         self,
         base_prompt: str,
         test_cases: List[TestCase],
-        max_generations: Optional[int] = None
+        max_generations: Optional[int] = None,
+        run_id: Optional[str] = None
     ) -> PromptVariation:
         """Evolve a prompt over multiple generations."""
         max_gens = max_generations or self.max_generations
 
+        if self.store is not None:
+            self.run_id = run_id or f"run_{uuid.uuid4().hex[:12]}"
+            self.store.create_run(
+                self.run_id,
+                base_prompt,
+                {
+                    "population_size": self.population_size,
+                    "max_generations": max_gens,
+                    "target_fitness": self.target_fitness
+                },
+                [asdict(test_case) for test_case in test_cases]
+            )
+
         # Initialize first generation
         print(f"🧬 Initializing population of {self.population_size} prompts...")
         current_population = await self._initialize_population(base_prompt)
 
-        for generation_num in range(max_gens):
+        return await self._run_generations(current_population, test_cases, 0, max_gens)
+
+    async def resume(
+        self,
+        run_id: str,
+        test_cases: Optional[List[TestCase]] = None,
+        max_generations: Optional[int] = None
+    ) -> PromptVariation:
+        """
+        Continue a checkpointed run after its last saved generation.
+
+        Args:
+            run_id: Run to resume (see run_id after evolve())
+            test_cases: Test cases to use; defaults to the run's stored ones
+            max_generations: Overrides the run's generation limit
+
+        Returns:
+            Best prompt of the run
+
+        Raises:
+            ValueError: If the engine has no store or the run is unknown
+        """
+        if self.store is None:
+            raise ValueError("resume() requires an EvolutionStore")
+        run = self.store.load_run(run_id)
+        if run is None:
+            raise ValueError(f"Unknown evolution run: {run_id}")
+
+        config = run["config"]
+        self.run_id = run_id
+        self.population_size = self.selector.population_size = config["population_size"]
+        self.target_fitness = config["target_fitness"]
+        max_gens = max_generations or config["max_generations"]
+        if test_cases is None:
+            test_cases = [TestCase(**case) for case in run["test_cases"]]
+
+        self.generations = []
+        self.best_prompt = None
+        for checkpoint in run["generations"]:
+            population = [self._variation_from_record(record) for record in checkpoint["population"]]
+            summary = checkpoint["summary"]
+            self.generations.append(Generation(
+                number=checkpoint["number"],
+                population=population,
+                best_fitness=summary["best_fitness"],
+                average_fitness=summary["average_fitness"],
+                diversity_score=summary["diversity_score"]
+            ))
+            best = max(population, key=lambda x: x.fitness_score)
+            if self.best_prompt is None or best.fitness_score > self.best_prompt.fitness_score:
+                self.best_prompt = best
+
+        if not self.generations:
+            print(f"🧬 Resuming {run_id} from scratch...")
+            current_population = await self._initialize_population(run["base_prompt"])
+            return await self._run_generations(current_population, test_cases, 0, max_gens)
+
+        last = self.generations[-1]
+        print(f"🧬 Resuming {run_id} after generation {last.number + 1}")
+
+        # Restore test results from the store (no new test runs)
+        await self._evaluate_population(last.population, test_cases)
+
+        if last.best_fitness >= self.target_fitness or last.number + 1 >= max_gens:
+            self.store.finish_run(run_id)
+            return self.best_prompt
+
+        current_population = await self.selector.evolve_generation(last.population, last.number + 1)
+        return await self._run_generations(current_population, test_cases, last.number + 1, max_gens)
+
+    async def _run_generations(
+        self,
+        current_population: List[PromptVariation],
+        test_cases: List[TestCase],
+        start: int,
+        max_gens: int
+    ) -> PromptVariation:
+        """Evaluate, checkpoint and evolve generations start..max_gens - 1."""
+        for generation_num in range(start, max_gens):
             print(f"\n📊 Generation {generation_num + 1}/{max_gens}")
 
             # Evaluate fitness
@@ -738,6 +1034,7 @@ class PromptEvolutionEngine:
                 diversity_score=diversity
             )
             self.generations.append(generation)
+            self._checkpoint(generation)
 
             # Update best
             if self.best_prompt is None or best.fitness_score > self.best_prompt.fitness_score:
@@ -759,8 +1056,57 @@ class PromptEvolutionEngine:
                 generation_num + 1
             )
 
+        if self.store is not None:
+            self.store.finish_run(self.run_id)
+
         return self.best_prompt
 
+    def _checkpoint(self, generation: Generation):
+        """Save an evaluated generation to the store, if any."""
+        if self.store is None:
+            return
+        self.store.save_generation(
+            self.run_id,
+            generation.number,
+            [self._variation_record(variation) for variation in generation.population],
+            {
+                "best_fitness": generation.best_fitness,
+                "average_fitness": generation.average_fitness,
+                "diversity_score": generation.diversity_score
+            }
+        )
+
+    @staticmethod
+    def _variation_record(variation: PromptVariation) -> Dict[str, Any]:
+        """Checkpoint form of a variation (test results live in the store's evaluations)."""
+        return {
+            "id": variation.id,
+            "content": variation.content,
+            "mutation_type": variation.mutation_type.value,
+            "parent_ids": variation.parent_ids,
+            "generation": variation.generation,
+            "fitness_score": variation.fitness_score,
+            "dimension_scores": {dim.value: score for dim, score in variation.dimension_scores.items()},
+            "created_at": variation.created_at.isoformat(),
+            "token_count": variation.token_count
+        }
+
+    @staticmethod
+    def _variation_from_record(record: Dict[str, Any]) -> PromptVariation:
+        return PromptVariation(
+            id=record["id"],
+            content=record["content"],
+            mutation_type=MutationType(record["mutation_type"]),
+            parent_ids=record["parent_ids"],
+            generation=record["generation"],
+            fitness_score=record["fitness_score"],
+            dimension_scores={
+                FitnessDimension(dim): score for dim, score in record["dimension_scores"].items()
+            },
+            created_at=datetime.fromisoformat(record["created_at"]),
+            token_count=record["token_count"]
+        )
+
     async def _initialize_population(self, base_prompt: str) -> List[PromptVariation]:
         """Initialize the first generation."""
         population = []
@@ -790,10 +1136,8 @@ class PromptEvolutionEngine:
         population: List[PromptVariation],
         test_cases: List[TestCase]
     ):
-        """Evaluate fitness of entire population."""
-        for variation in population:
-            if variation.fitness_score == 0:  # Not yet evaluated
-                await self.evaluator.evaluate(variation, test_cases)
+        """Evaluate fitness of entire population (memoised runs make re-scoring elites free)."""
+        await self.evaluator.evaluate_population(population, test_cases)
 
     def get_evolution_report(self) -> Dict[str, Any]:
         """Generate comprehensive evolution report."""
@@ -14,6 +14,11 @@ Architecture:
 5. Repeat until PASS or max iterations
 6. Return final result with validation history
 
+Speculative mode (candidates_per_iteration > 1) generates and validates
+several candidates concurrently each iteration and keeps the best; the first
+candidate that converges cancels the rest. With plateau_patience set, the
+loop also stops early once scores stop improving.
+
 Usage:
     from refinement_loop import RefinementLoop
 
@@ -23,11 +28,18 @@ Usage:
         validator_func=validate_code,
         initial_input={"task": "Create REST API"}
     )
+
+    # 3 concurrent candidates per round, stop after 2 rounds without +1 point
+    loop = RefinementLoop(max_iterations=5, candidates_per_iteration=3, plateau_patience=2)
+
+    # Syntax errors fail locally in milliseconds instead of costing a model call
+    loop = RefinementLoop(pre_validator=PreValidator())
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Callable, Optional, List, Awaitable
+from typing import Dict, Any, Callable, Optional, List, Awaitable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -41,6 +53,12 @@ try:
 except ImportError:
     ResilientBaseAgent = None
 
+# Fast local checks run before LLM validation
+try:
+    from validation.prevalidation import PreValidator
+except ImportError:
+    PreValidator = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +77,8 @@ class RefinementIteration:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     execution_time_ms: int = 0
     cost_usd: float = 0.0
+    # Speculative mode: scores of every validated candidate (kept one included)
+    candidate_scores: List[float] = field(default_factory=list)
 
     @property
     def passed(self) -> bool:
@@ -81,6 +101,7 @@ class RefinementIteration:
             "timestamp": self.timestamp,
             "execution_time_ms": self.execution_time_ms,
             "cost_usd": self.cost_usd,
+            "candidate_scores": self.candidate_scores,
             "passed": self.passed,
             "status": self.status
         }
@@ -102,6 +123,7 @@ class RefinementResult:
     total_execution_time_ms: int
     total_cost_usd: float
     error: Optional[str] = None
+    stopped_early: bool = False  # True if the loop stopped on a score plateau
 
     @property
     def passed_validation(self) -> bool:
@@ -122,6 +144,7 @@ class RefinementResult:
             "iterations": [it.to_dict() for it in self.iterations],
             "total_iterations": self.total_iterations,
             "converged": self.converged,
+            "stopped_early": self.stopped_early,
             "passed_validation": self.passed_validation,
             "improvement_history": self.improvement_history,
             "total_execution_time_ms": self.total_execution_time_ms,
@@ -136,7 +159,7 @@ class RefinementResult:
             "=" * 60,
             f"{status_emoji} REFINEMENT RESULT",
             "=" * 60,
-            f"Status: {'CONVERGED' if self.converged else 'MAX ITERATIONS REACHED'}",
+            f"Status: {'CONVERGED' if self.converged else 'SCORE PLATEAU' if self.stopped_early else 'MAX ITERATIONS REACHED'}",
             f"Final Validation: {'PASSED' if self.passed_validation else 'FAILED'}",
             f"Total Iterations: {self.total_iterations}",
             f"Total Time: {self.total_execution_time_ms}ms",
@@ -149,6 +172,8 @@ class RefinementResult:
 
         if self.converged:
             output.append("✅ Quality threshold met")
+        elif self.stopped_early:
+            output.append("⚠️  Stopped early: scores plateaued without convergence")
         else:
             output.append("⚠️  Max iterations reached without convergence")
 
@@ -168,6 +193,10 @@ class RefinementLoop:
         min_score_threshold: Minimum average score to pass (default: 80)
         allow_partial: Accept WARNING status if critical issues fixed (default: False)
         save_history: Save all iterations to disk (default: False)
+        candidates_per_iteration: Candidates generated concurrently per iteration (default: 1)
+        plateau_patience: Stop after this many iterations without improvement (default: None)
+        min_improvement: Score gain that counts as improvement (default: 1.0)
+        pre_validator: Local checks run before validator_func (default: None)
     """
 
     def __init__(
@@ -177,7 +206,11 @@ class RefinementLoop:
         allow_partial: bool = False,
         save_history: bool = False,
         history_dir: Optional[Path] = None,
-        agent: Optional['ResilientBaseAgent'] = None
+        agent: Optional['ResilientBaseAgent'] = None,
+        candidates_per_iteration: int = 1,
+        plateau_patience: Optional[int] = None,
+        min_improvement: float = 1.0,
+        pre_validator: Optional['PreValidator'] = None
     ):
         """
         Initialize refinement loop.
@@ -189,10 +222,25 @@ class RefinementLoop:
             save_history: Save iteration history to disk
             history_dir: Directory for history files
             agent: Optional ResilientBaseAgent for structured feedback extraction (C5)
+            candidates_per_iteration: Candidates generated and validated concurrently
+                per iteration; the best is kept (1 = classic sequential loop)
+            plateau_patience: Stop early when the best score of the last N
+                iterations is less than min_improvement above the earlier best
+                (None = never stop early)
+            min_improvement: Minimum score gain that counts as progress
+            pre_validator: Optional validation.prevalidation.PreValidator; when
+                its checks find blocking errors, its synthetic FAIL report is
+                used and validator_func is not called
         """
         if not 1 <= max_iterations <= 10:
             raise ValueError(f"max_iterations must be 1-10, got {max_iterations}")
 
+        if not 1 <= candidates_per_iteration <= 10:
+            raise ValueError(f"candidates_per_iteration must be 1-10, got {candidates_per_iteration}")
+
+        if plateau_patience is not None and plateau_patience < 1:
+            raise ValueError(f"plateau_patience must be >= 1, got {plateau_patience}")
+
         if not 0 <= min_score_threshold <= 100:
             raise ValueError(f"min_score_threshold must be 0-100, got {min_score_threshold}")
 
@@ -202,6 +250,10 @@ class RefinementLoop:
         self.save_history = save_history
         self.history_dir = history_dir or Path.home() / ".claude/logs/refinement"
         self.agent = agent  # C5: Optional agent for structured feedback extraction
+        self.candidates_per_iteration = candidates_per_iteration
+        self.plateau_patience = plateau_patience
+        self.min_improvement = min_improvement
+        self.pre_validator = pre_validator
         self._last_structured_feedback: Optional[Dict[str, Any]] = None  # C5: Cache for structured feedback
 
         if save_history:
@@ -212,6 +264,7 @@ class RefinementLoop:
         logger.info(
             f"Initialized RefinementLoop (max_iter={max_iterations}, "
             f"min_score={min_score_threshold}, "
+            f"candidates={candidates_per_iteration}, "
             f"structured_feedback={'enabled' if agent else 'disabled'})"
         )
 
@@ -245,7 +298,9 @@ class RefinementLoop:
             metadata={
                 "max_iterations": self.max_iterations,
                 "min_score_threshold": self.min_score_threshold,
-                "allow_partial": self.allow_partial
+                "allow_partial": self.allow_partial,
+                "candidates_per_iteration": self.candidates_per_iteration,
+                "plateau_patience": self.plateau_patience
             }
         )
 
@@ -271,15 +326,23 @@ class RefinementLoop:
                     metadata={"iteration": iteration_num}
                 )
 
-                # STEP 1: Generate artifact
-                artifact = await generator_func(current_input)
-                if not artifact:
-                    raise ValueError(f"Generator returned empty artifact at iteration {iteration_num}")
+                # STEP 1-2: Generate and validate artifact (best of N in speculative mode)
+                if self.candidates_per_iteration > 1:
+                    artifact, validation_report, candidate_reports = await self._speculate(
+                        generator_func, validator_func, current_input,
+                        validation_context or {}, iteration_num
+                    )
+                else:
+                    artifact = await generator_func(current_input)
+                    if not artifact:
+                        raise ValueError(f"Generator returned empty artifact at iteration {iteration_num}")
 
-                logger.info(f"Generated artifact ({len(artifact)} chars)")
+                    logger.info(f"Generated artifact ({len(artifact)} chars)")
 
-                # STEP 2: Validate artifact
-                validation_report = await validator_func(artifact, validation_context or {})
+                    validation_report = await self._validate(
+                        validator_func, artifact, validation_context or {}
+                    )
+                    candidate_reports = [validation_report]
 
                 logger.info(
                     f"Validation complete: {validation_report.overall_status}, "
@@ -298,7 +361,7 @@ class RefinementLoop:
                 )
 
                 iter_time_ms = int((time.time() - iter_start) * 1000)
-                iter_cost = validation_report.total_cost_usd
+                iter_cost = sum(report.total_cost_usd for report in candidate_reports)
                 total_cost += iter_cost
 
                 # Record iteration
@@ -309,7 +372,8 @@ class RefinementLoop:
                     feedback=feedback,
                     regeneration_prompt=regen_prompt,
                     execution_time_ms=iter_time_ms,
-                    cost_usd=iter_cost
+                    cost_usd=iter_cost,
+                    candidate_scores=[report.average_score for report in candidate_reports]
                 )
                 iterations.append(iteration)
 
@@ -325,7 +389,8 @@ class RefinementLoop:
                         "critical_count": validation_report.critical_count,
                         "high_count": validation_report.high_count,
                         "execution_time_ms": iter_time_ms,
-                        "cost_usd": iter_cost
+                        "cost_usd": iter_cost,
+                        "candidates": len(candidate_reports)
                     }
                 )
 
@@ -364,7 +429,47 @@ class RefinementLoop:
 
                     return result
 
-                # STEP 6: Prepare next iteration input
+                # STEP 6: Stop early if scores have plateaued
+                if iteration_num < self.max_iterations and self._has_plateaued(iterations):
+                    logger.warning(f"⚠️  Scores plateaued at iteration {iteration_num}, stopping early")
+
+                    total_time_ms = int((time.time() - start_time) * 1000)
+
+                    result = RefinementResult(
+                        success=False,
+                        final_artifact=artifact,
+                        final_validation=validation_report,
+                        iterations=iterations,
+                        total_iterations=iteration_num,
+                        converged=False,
+                        total_execution_time_ms=total_time_ms,
+                        total_cost_usd=total_cost,
+                        error=(
+                            f"Score plateaued: no gain of {self.min_improvement} points "
+                            f"in {self.plateau_patience} iterations"
+                        ),
+                        stopped_early=True
+                    )
+
+                    self.emitter.emit(
+                        event_type="refinement.loop.plateau",
+                        component="refinement_loop",
+                        severity="WARNING",
+                        message=f"Refinement stopped early after {iteration_num} iterations (score plateau)",
+                        metadata={
+                            "iterations": iteration_num,
+                            "improvement_history": result.improvement_history,
+                            "total_cost_usd": total_cost,
+                            "total_time_ms": total_time_ms
+                        }
+                    )
+
+                    if self.save_history:
+                        self._save_history(result)
+
+                    return result
+
+                # STEP 7: Prepare next iteration input
                 current_input = {
                     **initial_input,
                     "previous_attempt": artifact,
@@ -434,6 +539,114 @@ class RefinementLoop:
 
             return result
 
+    async def _validate(
+        self,
+        validator_func: Callable[[str, Dict[str, Any]], Awaitable[ValidationReport]],
+        artifact: str,
+        validation_context: Dict[str, Any]
+    ) -> ValidationReport:
+        """Run local pre-validation, then validator_func unless it short-circuited."""
+        if self.pre_validator:
+            report = self.pre_validator.run(artifact, validation_context)
+            if report is not None:
+                logger.info(f"Pre-validation failed locally, skipping LLM validation: {report.summary}")
+                return report
+        return await validator_func(artifact, validation_context)
+
+    async def _speculate(
+        self,
+        generator_func: Callable[[Dict[str, Any]], Awaitable[str]],
+        validator_func: Callable[[str, Dict[str, Any]], Awaitable[ValidationReport]],
+        current_input: Dict[str, Any],
+        validation_context: Dict[str, Any],
+        iteration_num: int
+    ) -> Tuple[str, ValidationReport, List[ValidationReport]]:
+        """
+        Generate and validate candidates concurrently; keep the best.
+
+        Each candidate runs generate → validate as its own task and receives
+        ``candidate_index``/``candidate_count`` in its input so generators can
+        vary their sampling. The first candidate that passes _has_converged
+        wins immediately and the remaining tasks are cancelled. Failed
+        candidates are skipped unless every candidate fails.
+
+        Returns:
+            (artifact, report) of the best candidate, and the reports of all
+            candidates that finished validation
+        """
+        count = self.candidates_per_iteration
+
+        async def run_candidate(index: int) -> Tuple[str, ValidationReport]:
+            artifact = await generator_func({
+                **current_input,
+                "candidate_index": index,
+                "candidate_count": count
+            })
+            if not artifact:
+                raise ValueError(
+                    f"Generator returned empty artifact at iteration {iteration_num} "
+                    f"(candidate {index + 1}/{count})"
+                )
+            return artifact, await self._validate(validator_func, artifact, validation_context)
+
+        pending = {asyncio.ensure_future(run_candidate(i)) for i in range(count)}
+        finished: List[Tuple[str, ValidationReport]] = []
+        errors: List[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        logger.warning(f"Candidate failed at iteration {iteration_num}: {task.exception()}")
+                        errors.append(task.exception())
+                        continue
+                    finished.append(task.result())
+                if any(self._has_converged(report) for _, report in finished):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not finished:
+            raise errors[0]
+
+        best_artifact, best_report = max(finished, key=lambda c: self._candidate_rank(c[1]))
+        logger.info(
+            f"Kept best of {len(finished)}/{count} candidates "
+            f"(scores: {', '.join(f'{r.average_score:.1f}' for _, r in finished)})"
+        )
+        return best_artifact, best_report, [report for _, report in finished]
+
+    def _candidate_rank(self, report: ValidationReport) -> Tuple[bool, int, float, int]:
+        """Sort key for candidates: converged, fewest critical, highest score, fewest high."""
+        return (
+            self._has_converged(report),
+            -report.critical_count,
+            report.average_score,
+            -report.high_count
+        )
+
+    def _has_plateaued(self, iterations: List[RefinementIteration]) -> bool:
+        """
+        Check whether scores have stopped improving.
+
+        Uses the same per-iteration scores as RefinementResult.improvement_history:
+        the loop has plateaued when the best of the last plateau_patience
+        scores is less than min_improvement above the best score before them.
+        """
+        if self.plateau_patience is None:
+            return False
+
+        history = [it.validation_report.average_score for it in iterations]
+        if len(history) <= self.plateau_patience:
+            return False
+
+        before = max(history[:-self.plateau_patience])
+        recent = max(history[-self.plateau_patience:])
+        return recent - before < self.min_improvement
+
     def _build_feedback_extraction_prompt(
         self,
         report: ValidationReport,
@@ -14,6 +14,7 @@ Security Focus:
 
 import os
 import time
+import random
 import logging
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, Tuple
@@ -84,7 +85,13 @@ class CircuitBreakerMetrics:
     last_success_time: Optional[datetime] = None
     time_in_open_state: float = 0.0
 
-    def record_call(self, success: bool, state: CircuitState):
+    # Exponentially weighted moving averages (used by AdaptiveModelRouter)
+    ewma_alpha: float = 0.2
+    ewma_latency: Optional[float] = None  # Seconds, None until first call
+    ewma_error_rate: float = 0.0          # 0.0 (healthy) - 1.0 (always failing)
+    ewma_cost: Optional[float] = None     # USD per call, None until reported
+
+    def record_call(self, success: bool, state: CircuitState, latency: Optional[float] = None):
         """Record a call result."""
         self.total_calls += 1
 
@@ -96,6 +103,21 @@ class CircuitBreakerMetrics:
             self.last_failure_time = datetime.now()
             self.failure_times.append(datetime.now())
 
+        # Update moving averages
+        self.ewma_error_rate = self._ewma(self.ewma_error_rate, 0.0 if success else 1.0)
+        if latency is not None:
+            self.ewma_latency = self._ewma(self.ewma_latency, latency)
+
+    def record_cost(self, cost: float):
+        """Record the cost of a completed call."""
+        self.ewma_cost = self._ewma(self.ewma_cost, cost)
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        """Fold a sample into a moving average (first sample seeds it)."""
+        if current is None:
+            return sample
+        return self.ewma_alpha * sample + (1 - self.ewma_alpha) * current
+
     def record_state_change(self, from_state: CircuitState, to_state: CircuitState, reason: str):
         """Record state transition."""
         self.state_changes.append({
@@ -133,6 +155,9 @@ class CircuitBreakerMetrics:
             'state_changes': len(self.state_changes),
             'recovery_attempts': self.recovery_attempts,
             'time_in_open_state': round(self.time_in_open_state, 2),
+            'ewma_latency': round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            'ewma_error_rate': round(self.ewma_error_rate, 3),
+            'ewma_cost': round(self.ewma_cost, 6) if self.ewma_cost is not None else None,
             'last_failure': self.last_failure_time.isoformat() if self.last_failure_time else None,
             'last_success': self.last_success_time.isoformat() if self.last_success_time else None
         }
@@ -228,15 +253,18 @@ class EnhancedCircuitBreaker:
             self.half_open_calls += 1
 
         # Execute function
+        start_time = time.time()
         try:
             result = func(*args, **kwargs)
             self._on_success()
-            self.metrics.record_call(success=True, state=self.state)
+            self.metrics.record_call(success=True, state=self.state,
+                                     latency=time.time() - start_time)
             return result
 
         except self.expected_exception as e:
             self._on_failure()
-            self.metrics.record_call(success=False, state=self.state)
+            self.metrics.record_call(success=False, state=self.state,
+                                     latency=time.time() - start_time)
             raise
 
     def _should_attempt_reset(self) -> bool:
@@ -367,6 +395,167 @@ class EnhancedCircuitBreaker:
         return status
 
 
+class AdaptiveModelRouter:
+    """
+    Latency/cost-aware model router driven by live circuit breaker metrics.
+
+    Models are grouped into quality tiers. The router first picks the tier that
+    best serves the configured objective, then load-balances across the
+    equivalent models in that tier with power-of-two-choices: two candidates
+    are sampled and the healthier one (lower EWMA latency, inflated by EWMA
+    error rate) wins. Traffic therefore drifts away from degraded models well
+    before their circuit breakers trip.
+
+    Objectives:
+    - 'latency': tier containing the fastest healthy model
+    - 'cost': tier containing the cheapest healthy model
+    - 'quality': highest available tier
+    """
+
+    OBJECTIVES = ('latency', 'cost', 'quality')
+
+    # Relative quality tiers (higher is better); unknown models default to 1
+    QUALITY_TIERS: Dict[str, int] = {
+        Models.OPUS_4: 3,
+        Models.OPUS: 3,
+        Models.SONNET: 2,
+        Models.GEMINI_EXP: 2,
+        Models.GEMINI_PRO: 2,
+        Models.GROK_3: 2,
+        'gpt-4o': 2,
+        'gpt-4-turbo': 2,
+        Models.GROK_2: 1,
+        Models.GEMINI_FLASH: 1,
+    }
+
+    # Static cost priors until live costs arrive, in the same unit as
+    # ewma_cost (USD per call): list prices for a typical call of 2k input
+    # and 1k output tokens. Unknown models get the highest prior.
+    COST_PRIORS: Dict[str, float] = {
+        Models.OPUS_4: 0.105,
+        Models.OPUS: 0.105,
+        Models.SONNET: 0.021,
+        Models.GEMINI_FLASH: 0.0005,
+        Models.GEMINI_PRO: 0.0075,
+        Models.GEMINI_EXP: 0.009,
+        Models.GROK_2: 0.014,
+        Models.GROK_3: 0.021,
+        'gpt-4o': 0.015,
+        'gpt-4-turbo': 0.05,
+    }
+
+    def __init__(self,
+                 objective: str = 'latency',
+                 quality_floor: int = 0,
+                 error_penalty: float = 4.0,
+                 default_latency: float = 1.0,
+                 quality_tiers: Optional[Dict[str, int]] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize adaptive router.
+
+        Args:
+            objective: 'latency', 'cost' or 'quality'
+            quality_floor: Minimum quality tier a model must have to be eligible
+            error_penalty: Multiplier applied to EWMA error rate when scoring health
+            default_latency: Assumed latency (seconds) for models with no samples yet
+            quality_tiers: Optional overrides for QUALITY_TIERS
+            rng: Optional random generator (for deterministic tests)
+        """
+        if objective not in self.OBJECTIVES:
+            raise ValueError(f"Unknown routing objective: {objective} (expected one of {self.OBJECTIVES})")
+
+        self.objective = objective
+        self.quality_floor = quality_floor
+        self.error_penalty = error_penalty
+        self.default_latency = default_latency
+        self.quality_tiers = {**self.QUALITY_TIERS, **(quality_tiers or {})}
+        self.rng = rng or random.Random()
+
+        self.selection_counts: Dict[str, int] = defaultdict(int)
+
+    def get_quality(self, model: str) -> int:
+        """Get quality tier for a model."""
+        return self.quality_tiers.get(model, 1)
+
+    def health_score(self, breaker: EnhancedCircuitBreaker) -> float:
+        """Score a model's health (lower is better)."""
+        metrics = breaker.metrics
+        latency = metrics.ewma_latency if metrics.ewma_latency is not None else self.default_latency
+        score = latency * (1.0 + self.error_penalty * metrics.ewma_error_rate)
+
+        # Models still proving recovery are only used when nothing else is left
+        if breaker.get_state() == CircuitState.HALF_OPEN:
+            score *= 10.0
+
+        return score
+
+    def cost_score(self, model: str, breaker: EnhancedCircuitBreaker) -> float:
+        """Score a model's expected cost per call in USD (lower is better)."""
+        if breaker.metrics.ewma_cost is not None:
+            return breaker.metrics.ewma_cost
+        return self.COST_PRIORS.get(model, max(self.COST_PRIORS.values()))
+
+    def select(self, candidates: Dict[str, EnhancedCircuitBreaker]) -> str:
+        """
+        Select a model from candidate breakers.
+
+        Args:
+            candidates: Mapping of model name to its circuit breaker
+
+        Returns:
+            Selected model name
+
+        Raises:
+            Exception: No eligible models
+        """
+        eligible = {
+            model: breaker for model, breaker in candidates.items()
+            if breaker.get_state() != CircuitState.OPEN
+            and self.get_quality(model) >= self.quality_floor
+        }
+
+        if not eligible:
+            raise Exception(
+                f"No eligible models (quality_floor={self.quality_floor}, "
+                f"candidates={list(candidates)})"
+            )
+
+        # Choose the tier that best serves the objective
+        if self.objective == 'quality':
+            target_tier = max(self.get_quality(m) for m in eligible)
+        elif self.objective == 'cost':
+            cheapest = min(eligible, key=lambda m: (self.cost_score(m, eligible[m]),
+                                                    self.health_score(eligible[m])))
+            target_tier = self.get_quality(cheapest)
+        else:
+            fastest = min(eligible, key=lambda m: self.health_score(eligible[m]))
+            target_tier = self.get_quality(fastest)
+
+        # Preserve candidate order so ties resolve towards the preferred chain
+        tier_models = [m for m in eligible if self.get_quality(m) == target_tier]
+
+        # Power-of-two-choices across equivalent models
+        if len(tier_models) == 1:
+            choice = tier_models[0]
+        else:
+            first, second = self.rng.sample(tier_models, 2)
+            if tier_models.index(second) < tier_models.index(first):
+                first, second = second, first
+            choice = min((first, second), key=lambda m: self.health_score(eligible[m]))
+
+        self.selection_counts[choice] += 1
+        return choice
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get router metrics."""
+        return {
+            'objective': self.objective,
+            'quality_floor': self.quality_floor,
+            'selection_counts': dict(self.selection_counts)
+        }
+
+
 class ModelFallbackChain:
     """
     Dynamic model fallback system for resilience.
@@ -378,20 +567,25 @@ class ModelFallbackChain:
     - Per-model circuit breakers
     - Cost tracking across providers
     - Performance metrics
+    - Optional adaptive routing (AdaptiveModelRouter) instead of fixed order
     """
 
     def __init__(self,
                  primary_model: str = Models.SONNET,
-                 enable_cross_provider: bool = True):
+                 enable_cross_provider: bool = True,
+                 router: Optional[AdaptiveModelRouter] = None):
         """
         Initialize fallback chain.
 
         Args:
             primary_model: Preferred model to use
             enable_cross_provider: Allow fallback to other providers
+            router: Optional adaptive router; when set, models are chosen from
+                live latency/error/cost metrics instead of fixed chain order
         """
         self.primary_model = primary_model
         self.enable_cross_provider = enable_cross_provider
+        self.router = router
 
         # Primary fallback chain (Claude models - authentication required)
         self.anthropic_chain = [Models.OPUS_4, Models.SONNET, Models.OPUS]
@@ -417,7 +611,8 @@ class ModelFallbackChain:
 
         logger.info(
             f"ModelFallbackChain initialized: primary={primary_model}, "
-            f"cross_provider={enable_cross_provider}"
+            f"cross_provider={enable_cross_provider}, "
+            f"routing={router.objective if router else 'fixed'}"
         )
 
     def _initialize_circuit_breakers(self):
@@ -432,18 +627,41 @@ class ModelFallbackChain:
                 success_threshold=2
             )
 
-    def get_available_model(self) -> Tuple[str, str]:
+    def get_available_model(self, exclude: Optional[List[str]] = None) -> Tuple[str, str]:
         """
         Get the next available model to use.
 
+        Args:
+            exclude: Models to skip (e.g. already attempted in this call)
+
         Returns:
             Tuple of (model_name, provider)
 
         Raises:
             Exception: No available models
         """
+        exclude = exclude or []
+
+        if self.router:
+            chain = self.anthropic_chain + (self.cross_provider_chain if self.enable_cross_provider else [])
+            candidates = {
+                model: self.circuit_breakers[model]
+                for model in chain
+                if model not in exclude
+            }
+            try:
+                model = self.router.select(candidates)
+            except Exception as e:
+                raise Exception(
+                    "No available models - all circuit breakers are OPEN. "
+                    f"Service temporarily unavailable. ({e})"
+                )
+            return (model, self._get_provider(model))
+
         # Try Anthropic chain first (authentication required)
         for model in self.anthropic_chain:
+            if model in exclude:
+                continue
             breaker = self.circuit_breakers[model]
             if breaker.get_state() != CircuitState.OPEN:
                 return (model, 'anthropic')
@@ -451,27 +669,33 @@ class ModelFallbackChain:
         # Try cross-provider fallbacks if enabled
         if self.enable_cross_provider:
             for model in self.cross_provider_chain:
+                if model in exclude:
+                    continue
                 breaker = self.circuit_breakers[model]
                 if breaker.get_state() != CircuitState.OPEN:
-                    # Determine provider from model name
-                    if 'grok' in model.lower():
-                        provider = 'xai'
-                    elif 'gemini' in model.lower():
-                        provider = 'gemini'
-                    elif 'gpt' in model.lower():
-                        provider = 'openai'
-                    else:
-                        provider = 'openai'  # default
-                    return (model, provider)
+                    return (model, self._get_provider(model))
 
         raise Exception(
             "No available models - all circuit breakers are OPEN. "
             "Service temporarily unavailable."
         )
 
+    def _get_provider(self, model: str) -> str:
+        """Determine provider from model name."""
+        if 'claude' in model.lower():
+            return 'anthropic'
+        elif 'grok' in model.lower():
+            return 'xai'
+        elif 'gemini' in model.lower():
+            return 'gemini'
+        elif 'gpt' in model.lower():
+            return 'openai'
+        else:
+            return 'openai'  # default
+
     def call_with_fallback(self,
                           func: Callable,
-                          model: str,
+                          model: Optional[str],
                           *args,
                           **kwargs) -> Dict[str, Any]:
         """
@@ -479,7 +703,9 @@ class ModelFallbackChain:
 
         Args:
             func: Function to call (must accept model parameter)
-            model: Preferred model
+            model: Preferred model, tried first unless its breaker is OPEN.
+                With a router, pass None to let the router pick the first
+                model too; fallbacks are always router-chosen.
             *args: Function arguments
             **kwargs: Function keyword arguments
 
@@ -489,9 +715,30 @@ class ModelFallbackChain:
         attempted_models = []
         last_error = None
 
-        # Start with requested model
-        current_model = model
-        provider = 'anthropic'
+        # Start with requested model (or the router's pick when adaptive)
+        if self.router:
+            requested = self.circuit_breakers.get(model)
+            if requested is not None and requested.get_state() != CircuitState.OPEN:
+                current_model, provider = model, self._get_provider(model)
+            else:
+                try:
+                    current_model, provider = self.get_available_model()
+                except Exception as e:
+                    if model is None:
+                        return {
+                            'result': None,
+                            'model_used': None,
+                            'provider': None,
+                            'attempted_models': [],
+                            'fallback_occurred': False,
+                            'success': False,
+                            'error': str(e)
+                        }
+                    current_model, provider = model, self._get_provider(model)
+            model = model or current_model
+        else:
+            current_model = model
+            provider = 'anthropic'
 
         while True:
             attempted_models.append(current_model)
@@ -502,6 +749,8 @@ class ModelFallbackChain:
                 result = breaker.call(func, current_model, *args, **kwargs)
 
                 self.successful_calls[current_model] += 1
+                if isinstance(result, dict) and 'cost' in result:
+                    breaker.metrics.record_cost(result['cost'])
 
                 return {
                     'result': result,
@@ -522,9 +771,11 @@ class ModelFallbackChain:
                 last_error = e
                 self.fallback_counts[current_model] += 1
 
-            # Try next model in chain
+            # Try next model in chain (the router never re-picks a failed model)
             try:
-                current_model, provider = self.get_available_model()
+                current_model, provider = self.get_available_model(
+                    exclude=attempted_models if self.router else None
+                )
 
                 if current_model in attempted_models:
                     # Already tried this model, all models exhausted
@@ -554,6 +805,7 @@ class ModelFallbackChain:
             'cross_provider_enabled': self.enable_cross_provider,
             'fallback_counts': dict(self.fallback_counts),
             'successful_calls': dict(self.successful_calls),
+            'routing': self.router.get_metrics() if self.router else {'objective': 'fixed'},
             'circuit_breakers': {
                 model: breaker.get_status()
                 for model, breaker in self.circuit_breakers.items()
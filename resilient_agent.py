@@ -12,9 +12,9 @@ import os
 import time
 import json
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterator
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 
 # Initialize logger BEFORE imports that use it
 logging.basicConfig(level=logging.INFO)
@@ -53,11 +53,14 @@ except ImportError:
 # xAI support via OpenAI SDK (OpenAI-compatible API)
 XAI_AVAILABLE = OPENAI_AVAILABLE  # xAI uses OpenAI SDK with custom base_url
 
-from resilience import EnhancedCircuitBreaker, ModelFallbackChain, SecurityValidator
+from resilience import EnhancedCircuitBreaker, ModelFallbackChain, AdaptiveModelRouter, SecurityValidator
 from agent_system import CostTracker, ExponentialBackoff, ModelPricing
 from core.constants import Models, Limits
 from api_config import APIConfig
 from output_styles_manager import OutputStylesManager, OutputStyleValidationError
+from utils.single_flight import SingleFlight, get_default_single_flight, request_key
+from utils.response_cache import ResponseCache
+from utils.prompt_cache import system_blocks, user_content, cache_token_usage
 
 logging.basicConfig(
     level=logging.INFO,
@@ -96,6 +99,16 @@ class CallResult:
     # Output style information
     output_style: Optional[str] = None
 
+    # True when this result was shared from another caller's identical request
+    coalesced: bool = False
+
+    # True when this result was served from the response cache
+    cached: bool = False
+
+    # Provider-side prompt caching (input tokens read from / written to the cache)
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -115,9 +128,19 @@ class CallResult:
             'injection_detected': self.injection_detected,
             'detected_patterns': self.detected_patterns,
             'input_sanitized': self.input_sanitized,
-            'output_style': self.output_style
+            'output_style': self.output_style,
+            'coalesced': self.coalesced,
+            'cached': self.cached,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_write_tokens': self.cache_write_tokens
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CallResult':
+        """Rebuild from to_dict() output (unknown keys are ignored)."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
 
 class ResilientBaseAgent:
     """
@@ -150,7 +173,13 @@ class ResilientBaseAgent:
                  cost_tracker: Optional[CostTracker] = None,
                  system_prompt: Optional[str] = None,
                  output_style: Optional[str] = None,
-                 allowed_scopes: Optional[List[str]] = None):
+                 allowed_scopes: Optional[List[str]] = None,
+                 routing_objective: Optional[str] = None,
+                 coalesce_requests: bool = False,
+                 single_flight: Optional[SingleFlight] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 cache_namespace: Optional[str] = None,
+                 prompt_caching: bool = False):
         """
         Initialize resilient agent.
 
@@ -166,6 +195,14 @@ class ResilientBaseAgent:
             system_prompt: Optional custom system prompt (overrides output_style)
             output_style: Optional output style name (e.g., 'code', 'detailed', 'critic')
             allowed_scopes: List of allowed action scopes (for zero-trust)
+            routing_objective: Optional adaptive routing objective for fallback
+                ('latency', 'cost' or 'quality'); None keeps fixed chain order
+            coalesce_requests: Share one upstream call among identical in-flight requests
+            single_flight: Optional coalescing group (defaults to the process-wide group)
+            response_cache: Optional persistent response cache (opt-in)
+            cache_namespace: Cache namespace (defaults to role)
+            prompt_caching: Mark the system prompt and stable prompt prefixes
+                for provider-side prompt caching (Anthropic models)
         """
         self.role = role
         self.model = model
@@ -174,6 +211,7 @@ class ResilientBaseAgent:
         self.max_retries = max_retries
         self.enable_fallback = enable_fallback
         self.enable_security = enable_security
+        self.prompt_caching = prompt_caching
         self.system_prompt = system_prompt
         self.output_style = output_style
         self.allowed_scopes = allowed_scopes or ['*']
@@ -191,7 +229,8 @@ class ResilientBaseAgent:
         # Note: ModelFallbackChain will use APIConfig internally for provider availability
         self.fallback_chain = ModelFallbackChain(
             primary_model=model,
-            enable_cross_provider=enable_fallback
+            enable_cross_provider=enable_fallback,
+            router=AdaptiveModelRouter(objective=routing_objective) if routing_objective else None
         ) if enable_fallback else None
 
         self.backoff = ExponentialBackoff(
@@ -208,6 +247,13 @@ class ResilientBaseAgent:
         # Security validator
         self.security = SecurityValidator()
 
+        # Request coalescing (single-flight)
+        self.single_flight = (single_flight or get_default_single_flight()) if coalesce_requests else None
+
+        # Persistent response cache
+        self.response_cache = response_cache
+        self.cache_namespace = cache_namespace or role
+
         # Call history
         self.call_history: List[CallResult] = []
 
@@ -318,15 +364,18 @@ class ResilientBaseAgent:
              prompt: str,
              context: Optional[Dict[str, Any]] = None,
              validate_scope: Optional[str] = None,
-             strict_sanitize: bool = False) -> CallResult:
+             strict_sanitize: bool = False,
+             cache_prefix: Optional[str] = None) -> CallResult:
         """
         Make resilient API call with security validation.
 
         Args:
-            prompt: User prompt
+            prompt: User prompt (sent after cache_prefix)
             context: Additional context
             validate_scope: Optional action scope to validate
             strict_sanitize: Use strict input sanitization
+            cache_prefix: Static leading part of the prompt, identical across
+                calls; marked for prompt caching when enabled
 
         Returns:
             CallResult with output and metadata
@@ -348,30 +397,126 @@ class ResilientBaseAgent:
         detected_patterns = []
 
         if self.enable_security:
-            injection_detected, detected_patterns = self.security.detect_injection(prompt)
+            injection_detected, detected_patterns = self.security.detect_injection(
+                (cache_prefix or "") + prompt
+            )
 
             if injection_detected:
                 logger.warning(f"Potential injection detected: {detected_patterns}")
                 # Continue but log the attempt
 
-            # Sanitize input
+            # Sanitize input (prefix separately so it stays byte-identical across calls)
             prompt = self.security.sanitize_input(prompt, strict=strict_sanitize)
+            if cache_prefix:
+                cache_prefix = self.security.sanitize_input(cache_prefix, strict=strict_sanitize)
 
         # Build system prompt
         system = self._build_system_prompt(context)
 
+        key = None
+        if self.single_flight or self.response_cache:
+            key = request_key(
+                model=self.model, system=system, prompt=(cache_prefix or "") + prompt,
+                temperature=self.temperature, max_tokens=self.max_tokens,
+                fallback=self.enable_fallback
+            )
+
+        # Serve repeated requests from the response cache
+        if self.response_cache:
+            cached = self.response_cache.get(self.cache_namespace, key)
+            if cached is not None:
+                logger.info(f"Response cache hit: {self.agent_id}")
+                return replace(
+                    CallResult.from_dict(cached),
+                    cached=True, cost=0.0, latency=time.time() - start_time
+                )
+
+        # Coalesce identical in-flight requests into one upstream call
+        if self.single_flight:
+            result, shared = self.single_flight.do(
+                key, lambda: self._dispatch_call(
+                    prompt, system, start_time, injection_detected, detected_patterns, cache_prefix
+                )
+            )
+            if shared:
+                logger.info(f"Coalesced identical in-flight request: {self.agent_id}")
+                return replace(result, coalesced=True, latency=time.time() - start_time)
+        else:
+            result = self._dispatch_call(
+                prompt, system, start_time, injection_detected, detected_patterns, cache_prefix
+            )
+
+        if self.response_cache and result.success:
+            self.response_cache.set(self.cache_namespace, key, result.to_dict())
+
+        return result
+
+    def stream_text(self,
+                    prompt: str,
+                    context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Stream response text incrementally.
+
+        Uses the Anthropic client's ``messages.stream`` for the primary model
+        so UIs can render tokens as they arrive. If streaming is unavailable
+        or fails before the first token, falls back to a regular call() and
+        yields its full output once.
+
+        Args:
+            prompt: User prompt
+            context: Additional context
+
+        Yields:
+            Text chunks
+        """
+        stream_fn = getattr(getattr(self.anthropic_client, "messages", None), "stream", None)
+        if self.enable_security:
+            prompt = self.security.sanitize_input(prompt)
+
+        if stream_fn and self._get_provider(self.model) == 'anthropic':
+            emitted = False
+            try:
+                with stream_fn(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_blocks(self._build_system_prompt(context), cache=self.prompt_caching),
+                    messages=[{"role": "user", "content": prompt}]
+                ) as stream:
+                    for text in stream.text_stream:
+                        emitted = True
+                        yield text
+                return
+            except Exception as e:
+                if emitted:
+                    raise
+                logger.warning(f"Streaming failed, falling back to call(): {e}")
+
+        result = self.call(prompt, context=context)
+        if not result.success:
+            raise RuntimeError(result.error or "Call failed")
+        yield result.output
+
+    def _dispatch_call(self,
+                       prompt: str,
+                       system: str,
+                       start_time: float,
+                       injection_detected: bool,
+                       detected_patterns: List[str],
+                       cache_prefix: Optional[str] = None) -> CallResult:
+        """Route the call through the fallback chain or a single provider."""
         # Try with fallback if enabled
         if self.enable_fallback and self.fallback_chain:
             return self._call_with_fallback(
                 prompt, system, start_time,
-                injection_detected, detected_patterns
+                injection_detected, detected_patterns, cache_prefix
             )
         else:
             # Determine provider from model
             provider = self._get_provider(self.model)
             return self._call_single_provider(
                 prompt, system, self.model, provider, start_time,
-                injection_detected, detected_patterns
+                injection_detected, detected_patterns, cache_prefix
             )
 
     def generate_text(
@@ -514,18 +659,20 @@ class ResilientBaseAgent:
                            system: str,
                            start_time: float,
                            injection_detected: bool,
-                           detected_patterns: List[str]) -> CallResult:
+                           detected_patterns: List[str],
+                           cache_prefix: Optional[str] = None) -> CallResult:
         """Call with automatic fallback across providers."""
 
         def make_call(model: str) -> Dict[str, Any]:
             """Wrapper function for fallback chain."""
             provider = self._get_provider(model)
-            return self._execute_call(model, provider, prompt, system)
+            return self._execute_call(model, provider, prompt, system, cache_prefix)
 
         # Use fallback chain
+        # With adaptive routing the router picks the model, not self.model
         fallback_result = self.fallback_chain.call_with_fallback(
             make_call,
-            self.model
+            None if self.fallback_chain.router else self.model
         )
 
         if not fallback_result['success']:
@@ -553,6 +700,8 @@ class ResilientBaseAgent:
             tokens_in=api_result['tokens_in'],
             tokens_out=api_result['tokens_out'],
             total_tokens=api_result['total_tokens'],
+            cache_read_tokens=api_result.get('cache_read_tokens', 0),
+            cache_write_tokens=api_result.get('cache_write_tokens', 0),
             cost=api_result['cost'],
             latency=time.time() - start_time,
             injection_detected=injection_detected,
@@ -573,14 +722,15 @@ class ResilientBaseAgent:
                              provider: str,
                              start_time: float,
                              injection_detected: bool,
-                             detected_patterns: List[str]) -> CallResult:
+                             detected_patterns: List[str],
+                             cache_prefix: Optional[str] = None) -> CallResult:
         """Call single provider with retries."""
 
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                api_result = self._execute_call(model, provider, prompt, system)
+                api_result = self._execute_call(model, provider, prompt, system, cache_prefix)
 
                 result = CallResult(
                     success=True,
@@ -590,6 +740,8 @@ class ResilientBaseAgent:
                     tokens_in=api_result['tokens_in'],
                     tokens_out=api_result['tokens_out'],
                     total_tokens=api_result['total_tokens'],
+                    cache_read_tokens=api_result.get('cache_read_tokens', 0),
+                    cache_write_tokens=api_result.get('cache_write_tokens', 0),
                     cost=api_result['cost'],
                     latency=time.time() - start_time,
                     attempt=attempt + 1,
@@ -626,12 +778,16 @@ class ResilientBaseAgent:
                      model: str,
                      provider: str,
                      prompt: str,
-                     system: str) -> Dict[str, Any]:
+                     system: str,
+                     cache_prefix: Optional[str] = None) -> Dict[str, Any]:
         """Execute API call to specific provider."""
 
         if provider == 'anthropic':
-            return self._call_anthropic(model, prompt, system)
-        elif provider == 'openai':
+            return self._call_anthropic(model, prompt, system, cache_prefix)
+
+        # Other providers take the prompt as one string
+        prompt = (cache_prefix or "") + prompt
+        if provider == 'openai':
             return self._call_openai(model, prompt, system)
         elif provider == 'gemini':
             return self._call_gemini(model, prompt, system)
@@ -640,8 +796,9 @@ class ResilientBaseAgent:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-    def _call_anthropic(self, model: str, prompt: str, system: str) -> Dict[str, Any]:
-        """Call Anthropic API."""
+    def _call_anthropic(self, model: str, prompt: str, system: str,
+                        cache_prefix: Optional[str] = None) -> Dict[str, Any]:
+        """Call Anthropic API, marking stable prefixes for prompt caching when enabled."""
         if not self.anthropic_client:
             raise Exception("Anthropic client not available")
 
@@ -649,14 +806,20 @@ class ResilientBaseAgent:
             model=model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
-            system=system,
-            messages=[{"role": "user", "content": prompt}]
+            system=system_blocks(system, cache=self.prompt_caching),
+            messages=[{
+                "role": "user",
+                "content": user_content(prompt, cache_prefix, cache=self.prompt_caching)
+            }]
         )
 
+        cache_read, cache_write = cache_token_usage(response.usage)
         cost = ModelPricing.calculate_cost(
             model,
             response.usage.input_tokens,
-            response.usage.output_tokens
+            response.usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write
         )
 
         # Extract text from content (handle both dict and object formats)
@@ -668,6 +831,8 @@ class ResilientBaseAgent:
             'tokens_in': response.usage.input_tokens,
             'tokens_out': response.usage.output_tokens,
             'total_tokens': response.usage.input_tokens + response.usage.output_tokens,
+            'cache_read_tokens': cache_read,
+            'cache_write_tokens': cache_write,
             'cost': cost
         }
 
@@ -872,6 +1037,19 @@ class ResilientBaseAgent:
         if self.enable_fallback and self.fallback_chain:
             metrics['fallback_chain'] = self.fallback_chain.get_metrics()
 
+        if self.single_flight:
+            metrics['coalescing'] = self.single_flight.get_stats()
+
+        if self.response_cache:
+            metrics['response_cache'] = self.response_cache.get_stats()
+
+        if self.prompt_caching:
+            metrics['prompt_cache'] = {
+                'cache_read_tokens': sum(r.cache_read_tokens for r in self.call_history),
+                'cache_write_tokens': sum(r.cache_write_tokens for r in self.call_history),
+                'uncached_input_tokens': sum(r.tokens_in for r in self.call_history)
+            }
+
         return metrics
 
     def get_recent_calls(self, n: int = 10) -> List[Dict[str, Any]]:
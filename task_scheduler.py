@@ -0,0 +1,208 @@
+"""
+Task Scheduler - Bounded, Resource-Aware DAG Execution
+
+Runs dependent tasks concurrently for cognitive_processing.ReasoningLayer
+so a milestone takes its critical-path time instead of the sum of its
+task times:
+
+    - A task starts as soon as its dependencies have succeeded, a
+      concurrency slot is free, and the resources it demands are free.
+    - Ready tasks are admitted longest-remaining-path first; one that does
+      not fit yet does not block smaller ready tasks behind it.
+    - Results are yielded as tasks finish, so callers can react to partial
+      progress.
+    - Tasks whose dependencies failed, that demand more of a resource than
+      exists, or that wait on a cycle fail without running.
+
+Tasks are plain dicts with an "id", optional "dependencies" (task ids;
+ids outside the batch are ignored) and optional "time" (estimate used for
+prioritisation).
+
+This module only depends on the standard library.
+
+Usage:
+    scheduler = TaskScheduler(max_concurrency=3, capacity={"gpu": 1})
+    async for result in scheduler.run(tasks, execute, demand=lambda t: t.get("resources", {})):
+        ...
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ResourcePool:
+    """
+    Counted resources held by running tasks.
+
+    Resources not listed in the capacity are unlimited.
+    """
+
+    def __init__(self, capacity: Optional[Dict[str, float]] = None):
+        self.capacity = dict(capacity or {})
+        self.in_use: Dict[str, float] = defaultdict(float)
+
+    def shortfall(self, demand: Dict[str, float]) -> List[str]:
+        """Resources the demand exceeds even when nothing else is running."""
+        return [name for name, amount in demand.items()
+                if name in self.capacity and amount > self.capacity[name]]
+
+    def available(self, demand: Dict[str, float]) -> bool:
+        return all(
+            self.in_use[name] + amount <= self.capacity[name]
+            for name, amount in demand.items() if name in self.capacity
+        )
+
+    def acquire(self, demand: Dict[str, float]):
+        for name, amount in demand.items():
+            self.in_use[name] += amount
+
+    def release(self, demand: Dict[str, float]):
+        for name, amount in demand.items():
+            self.in_use[name] -= amount
+
+
+class TaskScheduler:
+    """
+    Concurrent DAG scheduler with a concurrency bound and resource admission.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = 3,
+                 capacity: Optional[Dict[str, float]] = None):
+        """
+        Initialize task scheduler.
+
+        Args:
+            max_concurrency: Maximum tasks running at once
+            capacity: Amount of each constrained resource (others are unlimited)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.capacity = capacity
+        self.peak_concurrency = 0
+
+    async def run(self,
+                  tasks: List[Dict[str, Any]],
+                  execute: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                  demand: Callable[[Dict[str, Any]], Dict[str, float]] = lambda task: {}
+                  ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute tasks, yielding each result as it finishes.
+
+        Args:
+            tasks: Task dicts
+            execute: Coroutine function returning a result dict with "success"
+            demand: Resources a task holds while running
+
+        Yields:
+            Result dicts in completion order; tasks that could not run (or
+            raised) yield {"task_id", "success": False, "time": 0, "error"}
+        """
+        by_id = {task["id"]: task for task in tasks}
+        waiting_on: Dict[str, Set[str]] = {
+            task_id: {dep for dep in task.get("dependencies", []) if dep in by_id}
+            for task_id, task in by_id.items()
+        }
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for task_id, deps in waiting_on.items():
+            for dep in deps:
+                dependents[dep].append(task_id)
+        priority = self._remaining_path(by_id, dependents)
+
+        pool = ResourcePool(self.capacity)
+        ready = [task_id for task_id, deps in waiting_on.items() if not deps]
+        running: Dict[asyncio.Task, str] = {}
+        held: Dict[asyncio.Task, Dict[str, float]] = {}
+        finished: Set[str] = set()
+        failed: Set[str] = set()
+        outcomes: List[Dict[str, Any]] = []
+
+        def settle(task_id: str, result: Dict[str, Any]):
+            finished.add(task_id)
+            if not result.get("success"):
+                failed.add(task_id)
+            outcomes.append(result)
+            for child in dependents[task_id]:
+                waiting_on[child].discard(task_id)
+                if not waiting_on[child] and child not in finished:
+                    blocked = sorted(dep for dep in by_id[child].get("dependencies", []) if dep in failed)
+                    if blocked:
+                        settle(child, self._not_run(child, f"Dependency failed: {', '.join(blocked)}"))
+                    else:
+                        ready.append(child)
+
+        try:
+            while len(finished) < len(by_id):
+                # Admit ready tasks, critical path first, while slots and resources allow
+                ready.sort(key=lambda task_id: -priority[task_id])
+                for task_id in list(ready):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    task_demand = demand(by_id[task_id])
+                    missing = pool.shortfall(task_demand)
+                    if missing:
+                        ready.remove(task_id)
+                        settle(task_id, self._not_run(task_id, f"Insufficient resources: {', '.join(missing)}"))
+                    elif pool.available(task_demand):
+                        ready.remove(task_id)
+                        pool.acquire(task_demand)
+                        job = asyncio.create_task(execute(by_id[task_id]))
+                        running[job] = task_id
+                        held[job] = task_demand
+                self.peak_concurrency = max(self.peak_concurrency, len(running))
+
+                while outcomes:
+                    yield outcomes.pop(0)
+
+                if not running:
+                    if ready:
+                        continue  # admit them on the next pass
+                    # Everything left waits on a cycle
+                    for task_id in sorted(set(by_id) - finished):
+                        if task_id not in finished:  # may have been settled as a dependent
+                            settle(task_id, self._not_run(task_id, "Dependency cycle"))
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for job in done:
+                    task_id = running.pop(job)
+                    pool.release(held.pop(job))
+                    try:
+                        result = job.result()
+                    except Exception as e:
+                        logger.error(f"Task {task_id} failed: {e}")
+                        result = self._not_run(task_id, str(e))
+                    settle(task_id, result)
+
+            while outcomes:
+                yield outcomes.pop(0)
+        finally:
+            for job in running:
+                job.cancel()
+
+    @staticmethod
+    def _remaining_path(by_id: Dict[str, Dict[str, Any]],
+                        dependents: Dict[str, List[str]]) -> Dict[str, float]:
+        """Estimated time from each task's start to the end of its longest dependent chain."""
+        memo: Dict[str, float] = {}
+        visiting: Set[str] = set()
+
+        def path(task_id: str) -> float:
+            if task_id in memo:
+                return memo[task_id]
+            if task_id in visiting:
+                return 0.0  # cycle
+            visiting.add(task_id)
+            tail = max((path(child) for child in dependents[task_id]), default=0.0)
+            visiting.discard(task_id)
+            memo[task_id] = by_id[task_id].get("time", 0) + tail
+            return memo[task_id]
+
+        return {task_id: path(task_id) for task_id in by_id}
+
+    @staticmethod
+    def _not_run(task_id: str, error: str) -> Dict[str, Any]:
+        return {"task_id": task_id, "success": False, "time": 0, "error": error}
@@ -0,0 +1,169 @@
+"""
+Unit Tests for Incremental Streaming in the Anthropic Adapter
+
+Tests mcp_bridge.anthropic_adapter stream translation (CLI stream-json →
+Anthropic SDK events), incremental delivery and early-close behaviour,
+using a fake bridge in place of the Claude Code CLI.
+"""
+
+import asyncio
+import threading
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from mcp_bridge.anthropic_adapter import MessageStream, Messages, _StreamTranslator
+
+
+def partial(event):
+    return {"type": "stream_event", "event": event}
+
+
+PARTIAL_EVENTS = [
+    {"type": "system", "subtype": "init"},
+    partial({"type": "message_start", "message": {"usage": {"input_tokens": 7, "output_tokens": 0}}}),
+    partial({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+    partial({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}}),
+    partial({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "lo"}}),
+    partial({"type": "content_block_stop", "index": 0}),
+    partial({"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 2}}),
+    partial({"type": "message_stop"}),
+    {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hello"}]}},
+    {"type": "result", "result": "Hello", "usage": {"output_tokens": 2}},
+]
+
+
+class FakeBridge:
+    """Bridge whose stream_model yields canned CLI events."""
+
+    def __init__(self, events):
+        self.events = events
+        self.yielded = 0
+        self.closed = threading.Event()
+
+    async def stream_model(self, **kwargs):
+        try:
+            for event in self.events:
+                self.yielded += 1
+                yield event
+        finally:
+            self.closed.set()
+
+
+def make_stream(bridge, **kwargs):
+    return MessageStream(bridge, "sonnet", [{"role": "user", "content": "hi"}],
+                         1024, None, 0.0, **kwargs)
+
+
+class TestStreamTranslator:
+    """Test CLI → SDK event translation."""
+
+    def test_partial_messages_pass_through(self):
+        """Test stream_event payloads are unwrapped and duplicates dropped."""
+        translator = _StreamTranslator("sonnet")
+        events = [e for chunk in PARTIAL_EVENTS for e in translator.feed(chunk)]
+
+        assert [e["type"] for e in events] == [
+            "message_start", "content_block_start", "content_block_delta",
+            "content_block_delta", "content_block_stop", "message_delta", "message_stop"
+        ]
+
+    def test_whole_messages_are_synthesised(self):
+        """Test assistant/result lines become a full SDK event sequence."""
+        translator = _StreamTranslator("sonnet")
+        chunks = [
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hi"}]}},
+            {"type": "result", "result": "Hi", "usage": {"output_tokens": 1}},
+        ]
+        events = [e for chunk in chunks for e in translator.feed(chunk)]
+
+        assert [e["type"] for e in events] == [
+            "message_start", "content_block_start", "content_block_delta",
+            "content_block_stop", "message_delta", "message_stop"
+        ]
+        assert events[2]["delta"] == {"type": "text_delta", "text": "Hi"}
+        assert events[4]["usage"]["output_tokens"] == 1
+
+    def test_plain_text_lines_become_text_deltas(self):
+        """Test non-JSON CLI output is surfaced as text deltas."""
+        translator = _StreamTranslator("sonnet")
+        events = translator.feed({"content": "plain", "type": "content_block_delta"})
+
+        assert events[0]["type"] == "message_start"
+        assert events[2]["delta"]["text"] == "plain"
+
+
+class TestMessageStream:
+    """Test the synchronous SDK-style stream."""
+
+    def test_text_stream_and_final_message(self):
+        """Test text deltas and the assembled final message."""
+        with make_stream(FakeBridge(PARTIAL_EVENTS)) as stream:
+            assert list(stream.text_stream) == ["Hel", "lo"]
+            message = stream.get_final_message()
+
+        assert message.content[0]["text"] == "Hello"
+        assert message.usage.input_tokens == 7
+        assert message.usage.output_tokens == 2
+
+    def test_events_support_attribute_access(self):
+        """Test events behave like SDK objects as well as dicts."""
+        stream = make_stream(FakeBridge(PARTIAL_EVENTS))
+        deltas = [e for e in stream if e.type == "content_block_delta"]
+
+        assert deltas[0].delta.text == "Hel"
+
+    def test_first_event_arrives_before_generation_finishes(self):
+        """Test events are delivered incrementally, not after completion."""
+        gate = threading.Event()
+
+        # Hold back everything after the first event until we've seen it
+        class Gated(FakeBridge):
+            async def stream_model(self, **kwargs):
+                yield PARTIAL_EVENTS[1]
+                while not gate.is_set():
+                    await asyncio.sleep(0.01)
+                yield PARTIAL_EVENTS[2]
+
+        stream = make_stream(Gated([]))
+        iterator = iter(stream)
+
+        assert next(iterator)["type"] == "message_start"
+        gate.set()
+        assert next(iterator)["type"] == "content_block_start"
+
+    def test_bounded_buffer_applies_backpressure(self):
+        """Test the producer stalls once the buffer is full."""
+        events = [partial({"type": "content_block_delta", "index": 0,
+                           "delta": {"type": "text_delta", "text": str(i)}})
+                  for i in range(50)]
+        bridge = FakeBridge(events)
+        stream = make_stream(bridge, max_buffered_events=4)
+
+        asyncio.run(asyncio.sleep(0.2))
+        assert bridge.yielded <= 6
+
+        stream.close()
+        assert bridge.closed.wait(2.0)
+
+    def test_errors_propagate_to_consumer(self):
+        """Test a CLI failure surfaces on iteration."""
+        class Failing(FakeBridge):
+            async def stream_model(self, **kwargs):
+                yield PARTIAL_EVENTS[1]
+                raise RuntimeError("Claude Code CLI error: boom")
+
+        stream = make_stream(Failing([]))
+        with pytest.raises(RuntimeError, match="boom"):
+            list(stream)
+
+    def test_messages_stream_entry_point(self):
+        """Test Messages.stream and create(stream=True) return MessageStreams."""
+        messages = Messages.__new__(Messages)
+        messages.bridge = FakeBridge(PARTIAL_EVENTS)
+
+        with messages.stream(model="sonnet", messages=[{"role": "user", "content": "hi"}]) as stream:
+            assert "".join(stream.text_stream) == "Hello"
@@ -0,0 +1,172 @@
+"""
+Unit Tests for Cluster Worker Processes
+
+Tests ProcessNodeWorker: packages run in a separate process, handler errors
+propagate, heartbeats report misses and recovery, callbacks run on the
+event loop, cancelled packages are dropped, and worker death fails
+in-flight packages.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+import time
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from cluster_worker import (
+    ProcessNodeWorker,
+    WorkerDiedError,
+    execute_work_package,
+    package_payload,
+)
+
+
+def pid_handler(payload):
+    """Report the worker's process id."""
+    return {"result": {"pid": os.getpid(), "deps": payload[5]}, "confidence": 1.0}
+
+
+def failing_handler(payload):
+    raise ValueError(f"bad package {payload[0]}")
+
+
+def slow_handler(payload):
+    time.sleep(5)
+    return {"result": None, "confidence": 0.0}
+
+
+def logging_handler(payload):
+    """Append the package id to inputs["log"], then sleep for its runtime."""
+    with open(payload[3]["log"], "a") as f:
+        f.write(payload[0] + "\n")
+    time.sleep(payload[4]["runtime_seconds"])
+    return {"result": payload[0], "confidence": 1.0}
+
+
+def payload(package_id="WP_1", package_type="compute", deps=None, inputs=None, runtime=0):
+    package = SimpleNamespace(id=package_id, name=package_id, type=package_type,
+                              inputs=inputs or {}, compute_estimate={"runtime_seconds": runtime})
+    return package_payload(package, deps or {})
+
+
+@pytest.fixture
+def start_worker():
+    workers = []
+
+    def factory(handler, **kwargs):
+        worker = ProcessNodeWorker("node_test", handler=handler, **kwargs)
+        worker.start()
+        workers.append(worker)
+        return worker
+
+    yield factory
+    for worker in workers:
+        worker.stop(timeout=2)
+
+
+class TestExecution:
+    """Test package execution in the worker process."""
+
+    def test_package_runs_in_worker_process(self, start_worker):
+        """Test the handler runs out of process and receives dependency data."""
+        worker = start_worker(pid_handler)
+
+        output = asyncio.run(worker.submit(payload(deps={"WP_0": {"x": 1}})))
+
+        assert output["result"]["pid"] == worker.process.pid != os.getpid()
+        assert output["result"]["deps"] == {"WP_0": {"x": 1}}
+
+    def test_handler_errors_propagate(self, start_worker):
+        """Test handler exceptions surface as RuntimeError with the message."""
+        worker = start_worker(failing_handler)
+
+        with pytest.raises(RuntimeError, match="bad package WP_1"):
+            asyncio.run(worker.submit(payload()))
+        assert worker.alive
+
+    def test_cancelled_queued_package_never_runs(self, start_worker, tmp_path):
+        """Test cancelling a submission drops it before the worker starts it."""
+        log = tmp_path / "ran.log"
+        worker = start_worker(logging_handler, max_parallel=1)
+
+        async def cancel_second():
+            first = asyncio.ensure_future(worker.submit(payload("WP_1", inputs={"log": str(log)}, runtime=0.5)))
+            second = asyncio.ensure_future(worker.submit(payload("WP_2", inputs={"log": str(log)})))
+            await asyncio.sleep(0.2)
+            second.cancel()
+            await first
+            # A later package proves the worker has moved past WP_2's slot
+            await worker.submit(payload("WP_3", inputs={"log": str(log)}))
+
+        asyncio.run(cancel_second())
+
+        assert log.read_text().split() == ["WP_1", "WP_3"]
+
+    def test_default_computation(self):
+        """Test the default handler keeps the cluster's result shape."""
+        output = execute_work_package(payload(package_type="analysis"))
+
+        assert output["result"]["analysis"] == "Analysis of WP_1"
+        assert 0.85 <= output["confidence"] <= 1.0
+
+
+class TestHealth:
+    """Test heartbeats and death detection."""
+
+    def test_death_fails_in_flight_packages(self, start_worker):
+        """Test a killed worker fails pending submissions and reports death."""
+        died = []
+        worker = start_worker(slow_handler, on_death=lambda: died.append(True))
+
+        async def submit_then_kill():
+            pending = asyncio.ensure_future(worker.submit(payload()))
+            await asyncio.sleep(0.2)
+            worker.process.kill()
+            return await pending
+
+        with pytest.raises(WorkerDiedError):
+            asyncio.run(submit_then_kill())
+        assert died == [True]
+        assert not worker.alive
+
+    def test_missed_heartbeats_and_recovery(self, start_worker):
+        """Test a paused worker reports a miss, then recovery after it resumes."""
+        beats = []
+        worker = start_worker(pid_handler, heartbeat_interval=0.05, heartbeat_timeout=0.3,
+                              on_heartbeat=beats.append)
+        asyncio.run(worker.submit(payload()))  # wait until the worker is up
+
+        os.kill(worker.process.pid, signal.SIGSTOP)
+        time.sleep(0.5)
+        os.kill(worker.process.pid, signal.SIGCONT)
+        time.sleep(0.3)
+
+        assert beats[0] is False
+        assert beats[-1] is True
+        assert worker.alive
+
+    def test_callbacks_run_on_event_loop_thread(self, start_worker):
+        """Test heartbeat and death callbacks are marshalled onto the submitting loop."""
+        threads = []
+        worker = start_worker(pid_handler, heartbeat_interval=0.05, heartbeat_timeout=0.2,
+                              on_heartbeat=lambda ok: threads.append(threading.current_thread()),
+                              on_death=lambda: threads.append(threading.current_thread()))
+
+        async def pause_then_kill():
+            await worker.submit(payload())
+            os.kill(worker.process.pid, signal.SIGSTOP)
+            await asyncio.sleep(0.5)
+            worker.process.kill()
+            await asyncio.sleep(0.5)
+
+        asyncio.run(pause_then_kill())
+
+        assert len(threads) >= 2
+        assert set(threads) == {threading.main_thread()}
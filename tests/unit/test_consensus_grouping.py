@@ -0,0 +1,178 @@
+"""
+Unit Tests for ConsensusBuilder Result Grouping
+
+Tests TF-IDF similarity between node results, union-find grouping above the
+similarity threshold, deterministic group order, and the pure-Python
+fallback used when NumPy is not installed.
+"""
+
+import random
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import distributed_clusters
+from distributed_clusters import ConsensusBuilder, NodeResult, QuorumTracker
+
+
+def node_result(node_id, result):
+    return NodeResult(
+        work_package_id="WP_1", node_id=node_id, status="success", result=result,
+        confidence=0.9, metrics={}, validation={}, metadata={}
+    )
+
+
+def answer(findings, summary="Revenue grew in the third quarter"):
+    return {"summary": summary, "findings": findings}
+
+
+def fleet(count=120, seed=7):
+    """Three clusters of near-identical answers plus one outlier, shuffled."""
+    rng = random.Random(seed)
+    templates = [
+        answer(["latency regression in checkout service", "cache misses doubled"]),
+        answer(["database connection pool exhausted", "retry storm"], "Outage caused by database"),
+        {"error": "timeout contacting upstream payment gateway after three retries",
+         "code": "UPSTREAM_TIMEOUT", "retryable": True},
+    ]
+    results = []
+    for i in range(count):
+        template = templates[i % 3]
+        if i % 10 == 9:  # minor wording change that should still group
+            template = dict(template, note=f"run {i}")
+        results.append(node_result(f"node_{i:03d}", template))
+    results.append(node_result("odd_1", "completely unrelated text output"))
+    rng.shuffle(results)
+    return results
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def builder(request, monkeypatch):
+    if request.param and not distributed_clusters.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(distributed_clusters, "NUMPY_AVAILABLE", request.param)
+    return ConsensusBuilder()
+
+
+def members(groups):
+    return [[r.node_id for r in group] for group in groups]
+
+
+class TestSimilarity:
+    """Test pairwise result similarity."""
+
+    def test_identical_results_are_fully_similar(self, builder):
+        """Test equal results score 1.0 regardless of key order."""
+        assert builder._calculate_similarity({"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}) == 1.0
+
+    def test_keys_qualify_values(self, builder):
+        """Test the same value under different keys is not a match."""
+        assert builder._calculate_similarity({"answer": "42"}, {"score": "42"}) < 0.5
+
+    def test_similarity_is_symmetric(self, builder):
+        """Test swapping arguments gives the same score."""
+        a = answer(["cache misses doubled"])
+        b = answer(["cache hits doubled"])
+
+        assert builder._calculate_similarity(a, b) == pytest.approx(builder._calculate_similarity(b, a))
+
+
+class TestGrouping:
+    """Test union-find grouping."""
+
+    def test_similar_results_group_transitively(self, builder):
+        """Test results chained by similarity end up in one group."""
+        base = "the quick brown fox jumps over the lazy dog near the river bank today"
+        results = [
+            node_result("a", base),
+            node_result("b", base + " again"),
+            node_result("c", base + " again twice"),
+            node_result("d", "nothing in common"),
+        ]
+
+        assert members(builder._group_similar_results(results)) == [["a", "b", "c"], ["d"]]
+
+    def test_groups_sorted_by_size_then_first_member(self, builder):
+        """Test larger groups come first and ties keep input order."""
+        results = [
+            node_result("x", "alpha"),
+            node_result("y", "beta"),
+            node_result("z", "beta"),
+            node_result("w", "gamma"),
+        ]
+
+        assert members(builder._group_similar_results(results)) == [["y", "z"], ["x"], ["w"]]
+
+    def test_grouping_does_not_depend_on_input_order(self, builder):
+        """Test shuffled inputs produce the same partition."""
+        results = fleet()
+        shuffled = list(results)
+        random.Random(1).shuffle(shuffled)
+
+        def partition(groups):
+            return sorted(sorted(group) for group in members(groups))
+
+        assert partition(builder._group_similar_results(results)) == \
+            partition(builder._group_similar_results(shuffled))
+
+    def test_large_fleet_groups_quickly(self, builder):
+        """Test 120 node results group into their clusters in milliseconds."""
+        results = fleet()
+
+        start = time.perf_counter()
+        groups = builder._group_similar_results(results)
+        elapsed = time.perf_counter() - start
+
+        assert [len(group) for group in groups] == [40, 40, 40, 1]
+        assert elapsed < 0.5
+
+
+class TestQuorum:
+    """Test the early-quorum decision."""
+
+    def test_leader_decided_when_outstanding_votes_cannot_catch_up(self, builder):
+        """Test the leader must beat the runner-up plus every outstanding vote."""
+        results = [node_result(f"n{i}", "yes") for i in range(3)] + [node_result("n3", "no")]
+        reliability = {f"n{i}": 1.0 for i in range(4)}  # votes: yes 2.7, no 0.9
+
+        assert builder.quorum_reached(results, 0.3, reliability)
+        assert not builder.quorum_reached(results, 2.0, reliability)
+
+    def test_outstanding_votes_that_could_change_the_band_wait(self, builder):
+        """Test 3 agreeing of 5 waits: the leader is safe but strong vs weak is not."""
+        results = [node_result(f"n{i}", "yes") for i in range(3)]
+        reliability = {f"n{i}": 1.0 for i in range(3)}  # yes 2.7; worst share 2.7 / 4.5 = 0.6
+
+        assert not builder.quorum_reached(results, 1.8, reliability)
+        assert builder.quorum_reached(results, 0.9, reliability)  # worst share 0.75
+
+    def test_decided_none_band_stops(self, builder):
+        """Test a split that cannot reach a majority is decided as no consensus."""
+        results = [node_result("a1", "a"), node_result("a2", "a"), node_result("b", "b"),
+                   node_result("c", "c"), node_result("d", "d")]
+        reliability = {r.node_id: 1.0 for r in results}  # a 1.8 of 4.5; best share 2.1 / 4.8
+
+        assert builder.quorum_reached(results, 0.3, reliability)
+
+    def test_tracker_folds_results_incrementally(self, builder):
+        """Test the tracker matches full regrouping at every step and only folds new results."""
+        results = fleet(count=60)
+        reliability = {r.node_id: 1.0 for r in results}
+        tracker = QuorumTracker(builder)
+
+        for received in range(1, len(results) + 1):
+            outstanding = 0.9 * (len(results) - received)
+            assert tracker.reached(results[:received], outstanding, reliability) == \
+                builder.quorum_reached(results[:received], outstanding, reliability)
+            assert tracker.folded == received
+
+        assert tracker.follows(results)
+        assert not tracker.follows(results[:1])
+
+    def test_no_results_is_never_decided(self, builder):
+        """Test an empty result set waits for votes."""
+        assert not builder.quorum_reached([], 0.0, {})
@@ -0,0 +1,185 @@
+"""
+Unit Tests for Concurrent Critic Execution
+
+Tests CriticOrchestrator.review_code / areview_code / stream_report with
+stub critic agents: overlap, concurrency cap, per-critic timeouts and
+span-contiguous event emission.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from critic_orchestrator import CriticOrchestrator
+
+
+class StubCostTracker:
+    total_cost = 0.01
+
+
+class StubCritic:
+    """Critic agent that sleeps and returns a fixed score."""
+
+    def __init__(self, delay, score, tracker):
+        self.delay = delay
+        self.score = score
+        self.tracker = tracker
+        self.cost_tracker = StubCostTracker()
+
+    def execute(self, task, context):
+        self.tracker.enter()
+        try:
+            time.sleep(self.delay)
+        finally:
+            self.tracker.exit()
+        return json.dumps({
+            "overall_score": self.score,
+            "grade": "GOOD",
+            "findings": [],
+            "statistics": {"total_findings": 1, "low": 1}
+        })
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def exit(self):
+        with self.lock:
+            self.active -= 1
+
+
+class RecordingEmitter:
+    """Records (span, component) for each emitted event."""
+
+    def __init__(self):
+        self.events = []
+        self.span = None
+
+    def start_span(self, name):
+        self.span = name
+
+    def end_span(self):
+        self.span = None
+
+    def emit(self, event_type, component, message, severity, **kwargs):
+        self.events.append((self.span, component))
+
+
+def make_orchestrator(delays, **kwargs):
+    orchestrator = CriticOrchestrator.__new__(CriticOrchestrator)
+    orchestrator.api_key = None
+    orchestrator.max_concurrency = kwargs.get("max_concurrency", 5)
+    orchestrator.critic_timeout = kwargs.get("critic_timeout")
+    orchestrator.emitter = RecordingEmitter()
+    orchestrator.review_cache = None
+    orchestrator.tracker = ConcurrencyTracker()
+    orchestrator._critic_agents = {
+        critic_id: StubCritic(delay, 80, orchestrator.tracker)
+        for critic_id, delay in delays.items()
+    }
+    return orchestrator
+
+
+ALL_CRITICS = list(CriticOrchestrator.CRITICS.keys())
+
+
+class TestConcurrentReview:
+    """Test the thread-pool review path."""
+
+    def test_critics_overlap(self):
+        """Test wall time is close to the slowest critic, not the sum."""
+        orchestrator = make_orchestrator({c: 0.2 for c in ALL_CRITICS})
+
+        start = time.time()
+        results = orchestrator.review_code("x = 1")
+        elapsed = time.time() - start
+
+        assert list(results) == ALL_CRITICS
+        assert all(r.success for r in results.values())
+        assert elapsed < 0.6
+        assert orchestrator.tracker.peak == len(ALL_CRITICS)
+
+    def test_concurrency_cap(self):
+        """Test max_concurrency bounds running critics."""
+        orchestrator = make_orchestrator({c: 0.05 for c in ALL_CRITICS}, max_concurrency=2)
+
+        orchestrator.review_code("x = 1")
+
+        assert orchestrator.tracker.peak == 2
+
+    def test_per_critic_timeout(self):
+        """Test a slow critic yields an error result without blocking the rest."""
+        delays = {c: 0.01 for c in ALL_CRITICS}
+        delays["security-critic"] = 2.0
+        orchestrator = make_orchestrator(delays, critic_timeout=0.2)
+
+        start = time.time()
+        results = orchestrator.review_code("x = 1")
+
+        assert time.time() - start < 1.0
+        assert not results["security-critic"].success
+        assert "timed out" in results["security-critic"].error
+        assert all(r.success for c, r in results.items() if c != "security-critic")
+
+    def test_events_are_contiguous_per_span(self):
+        """Test each critic's events share one span and are not interleaved."""
+        orchestrator = make_orchestrator({c: 0.05 for c in ALL_CRITICS})
+
+        orchestrator.review_code("x = 1")
+
+        spans = [span for span, _ in orchestrator.emitter.events if span is not None]
+        # Collapse consecutive duplicates: each critic's span appears exactly once
+        runs = [s for i, s in enumerate(spans) if i == 0 or spans[i - 1] != s]
+        assert sorted(runs) == sorted(ALL_CRITICS)
+        assert all(span == component for span, component in orchestrator.emitter.events if span)
+
+    def test_stream_report_grows_with_results(self):
+        """Test aggregated reports are produced as critics finish."""
+        delays = {c: 0.05 * i for i, c in enumerate(ALL_CRITICS)}
+        orchestrator = make_orchestrator(delays)
+
+        reports = list(orchestrator.stream_report("x = 1"))
+
+        assert [r.success_count for r in reports] == [1, 2, 3, 4, 5]
+        assert reports[0].critics_run == [ALL_CRITICS[0]]
+        assert reports[-1].total_findings == 5
+
+
+class TestAsyncReview:
+    """Test the asyncio review path."""
+
+    def test_areview_code_runs_concurrently(self):
+        """Test areview_code overlaps critics and honours timeouts."""
+        delays = {c: 0.2 for c in ALL_CRITICS}
+        delays["documentation-critic"] = 2.0
+        orchestrator = make_orchestrator(delays, critic_timeout=0.5)
+
+        start = time.time()
+        results = asyncio.run(orchestrator.areview_code("x = 1"))
+
+        assert time.time() - start < 1.2
+        assert list(results) == ALL_CRITICS
+        assert not results["documentation-critic"].success
+        assert sum(r.success for r in results.values()) == 4
+
+    def test_invalid_critic_rejected(self):
+        """Test unknown critic IDs raise before any work starts."""
+        orchestrator = make_orchestrator({})
+
+        with pytest.raises(ValueError):
+            asyncio.run(orchestrator.areview_code("x = 1", critics=["nope"]))
@@ -0,0 +1,328 @@
+"""
+Unit Tests for DistributedCluster DAG Scheduling
+
+Tests that work packages start as soon as their own dependencies finish,
+failed packages are retried on backup nodes, node load is respected, idle
+nodes steal queued work, early quorum cancels stragglers, and process-backed
+nodes fail over and scale.
+"""
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from distributed_clusters import DistributedCluster, WorkPackage, NodeResult
+
+
+def package(package_id, seconds=0.0, dependencies=(), node="node_000", backups=(), priority=5):
+    """Work package that the real ClusterNode executes in `seconds`."""
+    return WorkPackage(
+        id=package_id,
+        name=package_id,
+        type="compute",
+        dependencies=list(dependencies),
+        inputs={},
+        expected_output={},
+        compute_estimate={"runtime_seconds": seconds * 10},  # node sleeps 0.1 * runtime
+        assigned_node=node,
+        backup_nodes=list(backups),
+        priority=priority,
+        timeout_seconds=30
+    )
+
+
+def failing(node):
+    """Make node fail every package it runs."""
+    async def execute_package(package, dependencies_data):
+        return NodeResult(
+            work_package_id=package.id, node_id=node.node_id, status="failed",
+            result=None, confidence=0.0, metrics={}, validation={}, metadata={},
+            errors=["node down"]
+        )
+    node.execute_package = execute_package
+
+
+@pytest.fixture
+def cluster():
+    return DistributedCluster(num_nodes=3)
+
+
+def finish_order(results):
+    return [r.work_package_id for r in results]
+
+
+class TestStreamingSchedule:
+    """Test dependency-driven dispatch."""
+
+    def test_package_starts_when_its_own_dependency_finishes(self, cluster):
+        """Test C runs after B without waiting for unrelated slow A."""
+        packages = {
+            "A": package("A", 0.3, node="node_000"),
+            "B": package("B", 0.05, node="node_001"),
+            "C": package("C", 0.05, dependencies=["B"], node="node_002"),
+        }
+
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        assert finish_order(results) == ["B", "C", "A"]
+
+    def test_dependency_data_is_passed_through(self, cluster):
+        """Test dependents receive their dependency's output."""
+        received = {}
+
+        def record(original):
+            async def execute_package(package, dependencies_data):
+                received[package.id] = dependencies_data
+                return await original(package, dependencies_data)
+            return execute_package
+
+        for node in cluster.nodes.values():
+            node.execute_package = record(node.execute_package)
+        packages = {
+            "A": package("A", node="node_000"),
+            "B": package("B", dependencies=["A", "missing"], node="node_001"),
+        }
+
+        asyncio.run(cluster._execute_dag(packages))
+
+        assert list(received["B"]) == ["A"]
+
+    def test_cycles_still_run(self, cluster):
+        """Test packages stuck on a dependency cycle run once nothing else can."""
+        packages = {
+            "A": package("A", dependencies=["B"]),
+            "B": package("B", dependencies=["A"], node="node_001"),
+        }
+
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        assert sorted(finish_order(results)) == ["A", "B"]
+
+
+class TestRetries:
+    """Test failover to backup nodes."""
+
+    def test_failed_package_retries_on_backup_without_stalling(self, cluster):
+        """Test a failed package moves to its backup while others keep running."""
+        failing(cluster.nodes["node_000"])
+        packages = {
+            "A": package("A", 0.05, node="node_000", backups=["node_001"]),
+            "B": package("B", 0.2, node="node_002"),
+        }
+
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        by_id = {r.work_package_id: r for r in results}
+        assert by_id["A"].status == "success"
+        assert by_id["A"].node_id == "node_001"
+        assert packages["A"].retry_count == 1
+        assert finish_order(results) == ["A", "B"]
+
+    def test_exhausted_nodes_report_failure_and_release_dependents(self, cluster):
+        """Test the last failure is returned and dependents still run."""
+        failing(cluster.nodes["node_000"])
+        packages = {
+            "A": package("A", node="node_000"),
+            "B": package("B", dependencies=["A"], node="node_001"),
+        }
+
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        assert [(r.work_package_id, r.status) for r in results] == [("A", "failed"), ("B", "success")]
+
+
+class TestNodeLoad:
+    """Test dispatch respects ClusterNode.get_load()."""
+
+    def test_saturated_node_queues_packages(self, cluster):
+        """Test a node with max_parallel=1 never runs two packages at once."""
+        node = cluster.nodes["node_000"]
+        node.capabilities.max_parallel = 1
+        for other in ("node_001", "node_002"):
+            cluster.nodes[other].capabilities.status = "offline"  # nobody to steal
+        packages = {pid: package(pid, 0.05) for pid in ("A", "B", "C")}
+
+        start = time.time()
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        assert len(results) == 3
+        assert time.time() - start >= 0.15
+
+    def test_busy_assigned_node_overflows_to_idle_backup(self, cluster):
+        """Test packages move to a backup node when the assigned one is full."""
+        cluster.nodes["node_000"].capabilities.max_parallel = 1
+        packages = {
+            "A": package("A", 0.1, backups=["node_001"], priority=9),
+            "B": package("B", 0.1, backups=["node_001"], priority=1),
+        }
+
+        results = asyncio.run(cluster._execute_dag(packages))
+
+        assert {r.work_package_id: r.node_id for r in results} == {"A": "node_000", "B": "node_001"}
+
+
+class TestWorkStealing:
+    """Test idle nodes steal from busy nodes' deques."""
+
+    def test_skewed_assignment_uses_every_node(self, cluster):
+        """Test packages all assigned to one node spread across the cluster."""
+        for node in cluster.nodes.values():
+            node.capabilities.max_parallel = 1
+        packages = {f"P{i}": package(f"P{i}", 0.1) for i in range(6)}  # all on node_000
+
+        start = time.time()
+        results = asyncio.run(cluster._execute_dag(packages))
+        elapsed = time.time() - start
+
+        assert len(results) == 6
+        assert {r.node_id for r in results} == {"node_000", "node_001", "node_002"}
+        assert elapsed < 0.4  # 6 x 0.1s on one node; ~0.2s across three
+        assert cluster.steals == 4
+
+    def test_thief_prefers_its_specialization(self, cluster):
+        """Test a thief takes the package matching its specialization over the tail."""
+        thief, owner = cluster.nodes["node_001"], cluster.nodes["node_000"]
+        thief.capabilities.specializations = ["generation"]
+        owner.capabilities.specializations = ["analysis"]
+        packages = {
+            "gen": package("gen"),
+            "plain": package("plain"),
+        }
+        packages["gen"].type = "generation"
+        queues = {"node_000": deque(["gen", "plain"])}
+
+        stolen = cluster._next_package(thief, queues, defaultdict(set), packages)
+
+        assert stolen == "gen"
+        assert list(queues["node_000"]) == ["plain"]
+
+    def test_owner_specialized_work_is_left_when_possible(self, cluster):
+        """Test thieves leave packages that match their owner's specialization."""
+        thief, owner = cluster.nodes["node_001"], cluster.nodes["node_000"]
+        thief.capabilities.specializations = []
+        owner.capabilities.specializations = ["analysis"]
+        packages = {"mine": package("mine"), "spare": package("spare")}
+        packages["mine"].type = "analysis"
+        queues = {"node_000": deque(["spare", "mine"])}
+
+        assert cluster._next_package(thief, queues, defaultdict(set), packages) == "spare"
+
+
+class TestEarlyQuorum:
+    """Test stopping once the leading result group is decided."""
+
+    def agreeing(self, durations, name="same answer"):
+        """One package per node; equal names give equal results."""
+        packages = {}
+        for i, seconds in enumerate(durations):
+            package_id = f"P{i}"
+            packages[package_id] = package(package_id, seconds, node=f"node_{i:03d}")
+            packages[package_id].name = name
+        return packages
+
+    def test_stragglers_cancelled_once_outcome_is_decided(self):
+        """Test seven agreeing results out of nine decide strong consensus without the slow two."""
+        cluster = DistributedCluster(num_nodes=9, early_quorum=True)
+        packages = self.agreeing([0.05] * 7 + [2.0, 2.0])
+
+        start = time.time()
+        results = asyncio.run(cluster._execute_dag(packages, stop_when=cluster._quorum_reached))
+
+        assert time.time() - start < 1.0
+        assert sorted(finish_order(results)) == [f"P{i}" for i in range(7)]
+        assert [packages[pid].status for pid in ("P7", "P8")] == ["cancelled", "cancelled"]
+        assert all(not node.active_packages for node in cluster.nodes.values())
+
+    def test_outstanding_votes_that_could_weaken_consensus_are_awaited(self, monkeypatch):
+        """Test 3 agreeing of 5 does not stop: two dissenting results make it weak, not strong."""
+        cluster = DistributedCluster(num_nodes=5, early_quorum=True)
+        plan = self.agreeing([0.05, 0.05, 0.05, 0.3, 0.3])
+        plan["P3"].name = "second answer"
+        plan["P4"].name = "third answer"
+
+        async def split_task(task_description, available_nodes):
+            return {
+                "work_packages": [asdict(wp) for wp in plan.values()],
+                "total_work_packages": len(plan),
+                "estimated_parallel_speedup": 5.0,
+            }
+        monkeypatch.setattr(cluster.task_splitter, "split_task", split_task)
+
+        result = asyncio.run(cluster.execute_distributed_task("mostly agree"))
+
+        assert result["distribution"]["cancelled"] == 0
+        assert result["consensus"]["consensus_type"] == "weak"
+        assert result["consensus"]["consensus_level"] < 0.67
+
+    def test_disagreement_waits_for_every_result(self):
+        """Test split results keep running until all packages report."""
+        cluster = DistributedCluster(num_nodes=4, early_quorum=True)
+        packages = self.agreeing([0.05, 0.05, 0.1, 0.1])
+        packages["P1"].name = packages["P3"].name = "other answer"
+
+        results = asyncio.run(cluster._execute_dag(packages, stop_when=cluster._quorum_reached))
+
+        assert len(results) == 4
+        assert not any(wp.status == "cancelled" for wp in packages.values())
+
+    def test_task_reports_cancelled_packages(self, monkeypatch):
+        """Test execute_distributed_task stops early and reports cancellations."""
+        cluster = DistributedCluster(num_nodes=9, early_quorum=True)
+        plan = self.agreeing([0.05] * 7 + [2.0, 2.0])
+
+        async def split_task(task_description, available_nodes):
+            return {
+                "work_packages": [asdict(wp) for wp in plan.values()],
+                "total_work_packages": len(plan),
+                "estimated_parallel_speedup": 5.0,
+            }
+        monkeypatch.setattr(cluster.task_splitter, "split_task", split_task)
+
+        result = asyncio.run(cluster.execute_distributed_task("agree"))
+
+        assert result["distribution"]["cancelled"] == 2
+        assert result["consensus"]["metadata"]["agreeing_nodes"] == 7
+        assert result["consensus"]["consensus_type"] == "strong"
+        assert result["performance"]["total_duration_seconds"] < 1.0
+
+
+class TestProcessBackend:
+    """Test nodes backed by worker processes."""
+
+    def test_dead_worker_fails_over_to_backup(self):
+        """Test a killed node goes offline and its package runs on a backup."""
+        cluster = DistributedCluster(num_nodes=2, backend="process")
+        try:
+            dead = cluster.nodes["node_000"]
+            dead.worker.process.kill()
+            dead.worker._reader.join(5)  # death detected
+            packages = {"A": package("A", node="node_000", backups=["node_001"])}
+
+            results = asyncio.run(cluster._execute_dag(packages))
+
+            assert [(r.node_id, r.status) for r in results] == [("node_001", "success")]
+            assert dead.capabilities.status == "offline"
+            assert dead.capabilities.reliability_score < 0.95
+        finally:
+            cluster.shutdown()
+
+    def test_scale_cluster_adds_and_removes_processes(self):
+        """Test scaling starts and stops worker processes."""
+        cluster = DistributedCluster(num_nodes=1, backend="process")
+        try:
+            asyncio.run(cluster.scale_cluster(2))
+            added = cluster.nodes["node_001"]
+            assert added.worker.alive
+
+            asyncio.run(cluster.scale_cluster(1))
+            assert "node_001" not in cluster.nodes
+            assert not added.worker.process.is_alive()
+        finally:
+            cluster.shutdown()
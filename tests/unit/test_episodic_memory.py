@@ -0,0 +1,190 @@
+"""
+Unit Tests for the Episodic Memory Store
+
+Tests TF-IDF tag scoring over all episodes, top-k pruning, the
+append-only log (lazy reload, eviction, compaction, crash recovery) and
+that recording stays fast as the log grows.
+"""
+
+import json
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from episodic_memory import EpisodeStore, TagIndex
+
+
+def record(episode_id, tags, **extra):
+    return {"id": episode_id, "tags": list(tags), **extra}
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "episodes.jsonl"
+
+
+class CountingDict(dict):
+    """Dict that counts item lookups (episodes scored by a search)."""
+
+    lookups = 0
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+def brute_force(index, query, limit, min_score=0.0):
+    """Score every episode directly from the definition."""
+    weights = {tag: index.idf(tag) for tag in set(query)}
+    total = sum(weights.values())
+    scored = [
+        (sum(w for t, w in weights.items() if t in tags) / total, index.sequence[episode_id], episode_id)
+        for episode_id, tags in index.tags.items()
+    ]
+    return [(episode_id, score) for score, _, episode_id in sorted(scored, reverse=True)
+            if score > min_score][:limit]
+
+
+class TestTagIndex:
+    """Test IDF-weighted scoring."""
+
+    def test_rare_shared_tags_outrank_common_ones(self):
+        """Test an episode sharing a rare tag beats one sharing a common tag."""
+        index = TagIndex()
+        for i in range(10):
+            index.add(f"common{i}", ["python"])
+        index.add("rare", ["kubernetes"])
+
+        results = index.search(["python", "kubernetes"], limit=2)
+
+        assert results[0][0] == "rare"
+        assert results[0][1] > results[1][1]
+
+    def test_pruned_search_matches_brute_force(self):
+        """Test MaxScore pruning returns exactly the exhaustive top k."""
+        index = TagIndex()
+        for i in range(500):
+            index.add(f"e{i}", ["goal", f"g{i % 50}", f"a{i % 7}", "task" if i % 3 else "bug"])
+
+        for query in (["goal", "g7", "a3"], ["task", "bug"], ["g1", "g2", "goal", "a1", "zzz"]):
+            for min_score in (0.0, 0.3):
+                expected = brute_force(index, query, 5, min_score)
+                actual = index.search(query, 5, min_score)
+                assert [eid for eid, _ in actual] == [eid for eid, _ in expected]
+                assert [s for _, s in actual] == pytest.approx([s for _, s in expected])
+
+    def test_ties_prefer_newer_episodes(self):
+        """Test equal scores return the most recently added first."""
+        index = TagIndex()
+        for episode_id in ("old", "mid", "new"):
+            index.add(episode_id, ["deploy"])
+
+        assert [eid for eid, _ in index.search(["deploy"], limit=2)] == ["new", "mid"]
+
+    def test_exclude_and_min_score(self):
+        """Test excluded ids and scores at or below min_score are skipped."""
+        index = TagIndex()
+        index.add("a", ["x", "y"])
+        index.add("b", ["x"])
+
+        assert [eid for eid, _ in index.search(["x", "y"], 5, exclude=["a"])] == ["b"]
+        assert [eid for eid, _ in index.search(["x", "y"], 5, min_score=0.5)] == ["a"]
+
+    def test_repeated_task_stops_after_k_exact_matches(self):
+        """Test a query matching thousands of identical episodes scores only k of them."""
+        index = TagIndex()
+        for i in range(5000):
+            index.add(f"e{i}", ["nightly", "backup", "database"])
+        index.tags = CountingDict(index.tags)
+
+        results = index.search(["nightly", "backup", "database"], limit=3)
+
+        assert [eid for eid, _ in results] == ["e4999", "e4998", "e4997"]
+        assert index.tags.lookups == 3
+
+
+class TestEpisodeStore:
+    """Test the append-only log."""
+
+    def test_search_covers_all_episodes_and_reloads_lazily(self, log_path):
+        """Test an old episode is found after 100 newer ones, also after reopening."""
+        store = EpisodeStore(log_path)
+        store.append(record("first", ["migration", "postgres"], note="kept"))
+        for i in range(100):
+            store.append(record(f"e{i}", ["routine", "check"]))
+        store.flush()
+
+        reopened = EpisodeStore(log_path)
+        assert not reopened._loaded
+        (found, score), = reopened.search(["postgres"], limit=1)
+
+        assert found["note"] == "kept"
+        assert score == pytest.approx(1.0)
+        assert len(reopened) == 101
+
+    def test_appends_never_rewrite_the_log(self, log_path):
+        """Test recording appends one line and leaves earlier bytes untouched."""
+        store = EpisodeStore(log_path)
+        store.append(record("a", ["x"]))
+        store.flush()
+        before = log_path.read_bytes()
+
+        store.append(record("b", ["y"]))
+        store.flush()
+
+        assert log_path.read_bytes().startswith(before)
+        assert len(log_path.read_bytes().splitlines()) == 2
+
+    def test_eviction_tombstones_and_compaction(self, log_path):
+        """Test evicted episodes disappear and compaction drops dead lines."""
+        store = EpisodeStore(log_path, max_episodes=10, compact_min=6, compact_ratio=0.5)
+        for i in range(13):
+            store.append(record(f"e{i}", ["t"]))
+        store.flush()
+
+        assert store.ids() == [f"e{i}" for i in range(3, 13)]
+        assert store.compactions == 1
+        lines = [json.loads(line) for line in log_path.read_bytes().splitlines()]
+        assert not any(line.get("deleted") for line in lines[:8])
+
+        reopened = EpisodeStore(log_path)
+        assert reopened.ids() == store.ids()
+        assert reopened.get("e3")["id"] == "e3"
+        assert reopened.get("e0") is None
+
+    def test_torn_final_line_is_truncated(self, log_path):
+        """Test a partial record from a crash is dropped and appends continue cleanly."""
+        store = EpisodeStore(log_path)
+        store.append(record("a", ["x"]))
+        store.close()
+        with open(log_path, "ab") as f:
+            f.write(b'{"id": "b", "ta')
+
+        reopened = EpisodeStore(log_path)
+        reopened.append(record("c", ["x"]))
+        reopened.close()
+
+        assert EpisodeStore(log_path).ids() == ["a", "c"]
+
+    def test_recording_stays_fast_as_the_log_grows(self, log_path):
+        """Test the last 1000 of 20k similarity-checked appends are as fast as the first."""
+        store = EpisodeStore(log_path)
+
+        def record_batch(start):
+            begin = time.perf_counter()
+            for i in range(start, start + 1000):
+                tags = ["goal", "task", f"topic{i % 400}", f"step{i % 37}"]
+                store.search_ids(tags, limit=3, min_score=0.3)
+                store.append(record(f"e{i}", tags))
+            return time.perf_counter() - begin
+
+        first = record_batch(0)
+        for start in range(1000, 19000, 1000):
+            record_batch(start)
+        last = record_batch(19000)
+
+        assert last < max(first * 5, 0.5)
@@ -0,0 +1,133 @@
+"""
+Unit Tests for EvolutionStore and Resumable Prompt Evolution
+
+Tests checkpoint storage, evaluation sharing across evaluators and runs,
+and resuming an interrupted PromptEvolutionEngine run.
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evolution_store import EvolutionStore, content_hash
+from prompt_evolution import FitnessEvaluator, MutationType, PromptEvolutionEngine, PromptVariation
+from prompt_evolution import TestCase as PromptTestCase
+
+
+BASE = "Analyze the provided text and identify key themes."
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EvolutionStore(str(tmp_path / "evolution.db"))
+    yield store
+    store.close()
+
+
+def cases():
+    return [
+        PromptTestCase({"input": "q1"}, "a1"),
+        PromptTestCase({"input": "edge"}, "a2", edge_case=True),
+    ]
+
+
+def engine(store, generations=2):
+    return PromptEvolutionEngine(population_size=4, max_generations=generations,
+                                 target_fitness=2.0, store=store)  # target never reached
+
+
+class TestStore:
+    """Test checkpoint and evaluation storage."""
+
+    def test_generation_round_trip_stores_content_once(self, store):
+        """Test populations reload with content and share prompt rows."""
+        store.create_run("r1", BASE, {"population_size": 2}, [])
+        population = [{"id": "a", "content": BASE}, {"id": "b", "content": BASE}]
+        store.save_generation("r1", 0, population, {"best_fitness": 0.5})
+
+        run = store.load_run("r1")
+
+        assert [r["content"] for r in run["generations"][0]["population"]] == [BASE, BASE]
+        assert run["generations"][0]["population"][0]["content_hash"] == content_hash(BASE)
+        assert store.get_stats()["prompts"] == 1
+
+    def test_unknown_run(self, store):
+        """Test load_run returns None for an unknown id."""
+        assert store.load_run("missing") is None
+
+
+class TestSharedEvaluations:
+    """Test evaluations are shared through the store."""
+
+    def test_second_evaluator_reuses_stored_results(self, store):
+        """Test a fresh evaluator (e.g. after restart) runs nothing for a known prompt."""
+        prompt = PromptVariation(id="p", content=BASE, mutation_type=MutationType.REPHRASE, token_count=8)
+        first = FitnessEvaluator(store=store)
+        fitness, _ = asyncio.run(first.evaluate(prompt, cases()))
+
+        second = FitnessEvaluator(store=store)
+        again, _ = asyncio.run(second.evaluate(prompt, cases()))
+
+        assert again == fitness
+        assert (first.test_runs, second.test_runs) == (2, 0)
+        assert second.store_hits == 2
+        assert prompt.test_results[1]["test_case"].edge_case
+
+
+class TestResume:
+    """Test checkpointed, resumable runs."""
+
+    def test_generations_are_checkpointed(self, store):
+        """Test every evaluated generation is saved and the run completes."""
+        first = engine(store)
+        asyncio.run(first.evolve(BASE, cases()))
+
+        run = store.load_run(first.run_id)
+
+        assert run["status"] == "completed"
+        assert [g["number"] for g in run["generations"]] == [0, 1]
+        assert len(run["generations"][1]["population"]) == 4
+
+    def test_resume_continues_an_interrupted_run(self, store, monkeypatch):
+        """Test a crashed run resumes after its last checkpoint without re-running known prompts."""
+        crashed = engine(store, generations=3)
+
+        async def crash(population, generation_number):
+            raise RuntimeError("process killed")
+        monkeypatch.setattr(crashed.selector, "evolve_generation", crash)
+        with pytest.raises(RuntimeError):
+            asyncio.run(crashed.evolve(BASE, cases()))
+        checkpoint = crashed.generations[0]
+
+        resumed = engine(store)
+        best = asyncio.run(resumed.resume(crashed.run_id))
+
+        run = store.load_run(crashed.run_id)
+        assert run["status"] == "completed"
+        assert [g.number for g in resumed.generations] == [0, 1, 2]
+        assert [p.content for p in resumed.generations[0].population] == \
+            [p.content for p in checkpoint.population]
+        assert resumed.generations[0].best_fitness == checkpoint.best_fitness
+        assert best.fitness_score >= checkpoint.best_fitness
+        # Restoring generation 0 used stored results only
+        assert resumed.evaluator.store_hits >= len({p.content for p in checkpoint.population}) * 2
+
+    def test_resume_of_finished_run_runs_nothing(self, store):
+        """Test resuming a completed run returns its best prompt from the store."""
+        first = engine(store)
+        best = asyncio.run(first.evolve(BASE, cases()))
+
+        again = engine(store)
+        resumed_best = asyncio.run(again.resume(first.run_id))
+
+        assert resumed_best.content == best.content
+        assert again.evaluator.test_runs == 0
+
+    def test_resume_requires_known_run(self, store):
+        """Test unknown runs raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown evolution run"):
+            asyncio.run(engine(store).resume("missing"))
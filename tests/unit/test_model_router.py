@@ -0,0 +1,225 @@
+"""
+Unit Tests for Adaptive Model Routing
+
+Tests resilience.AdaptiveModelRouter and its integration with
+ModelFallbackChain (EWMA metrics, objectives, power-of-two-choices).
+"""
+
+import random
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from resilience import (
+    AdaptiveModelRouter,
+    CircuitState,
+    EnhancedCircuitBreaker,
+    ModelFallbackChain,
+)
+from core.constants import Models
+
+
+def make_breaker(latency=None, error_rate=0.0, cost=None):
+    """Create a breaker with pre-seeded EWMA metrics."""
+    breaker = EnhancedCircuitBreaker()
+    breaker.metrics.ewma_latency = latency
+    breaker.metrics.ewma_error_rate = error_rate
+    breaker.metrics.ewma_cost = cost
+    return breaker
+
+
+class TestCircuitBreakerEWMA:
+    """Test EWMA tracking in circuit breaker metrics."""
+
+    def test_latency_recorded_on_call(self):
+        """Test that breaker.call records latency and error rate."""
+        breaker = EnhancedCircuitBreaker()
+        breaker.call(lambda: "ok")
+
+        assert breaker.metrics.ewma_latency is not None
+        assert breaker.metrics.ewma_error_rate == 0.0
+
+    def test_error_rate_rises_on_failures(self):
+        """Test that failures push EWMA error rate up."""
+        breaker = EnhancedCircuitBreaker(failure_threshold=10)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                breaker.call(fail)
+
+        assert breaker.metrics.ewma_error_rate > 0.4
+        assert breaker.get_state() == CircuitState.CLOSED
+
+    def test_cost_seeds_then_smooths(self):
+        """Test that the first cost sample seeds the average."""
+        breaker = EnhancedCircuitBreaker()
+        breaker.metrics.record_cost(1.0)
+        assert breaker.metrics.ewma_cost == 1.0
+
+        breaker.metrics.record_cost(0.0)
+        assert breaker.metrics.ewma_cost == pytest.approx(0.8)
+
+
+class TestAdaptiveModelRouter:
+    """Test router objectives and load balancing."""
+
+    def test_invalid_objective(self):
+        """Test that unknown objectives are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveModelRouter(objective="vibes")
+
+    def test_quality_objective_picks_highest_tier(self):
+        """Test quality objective prefers the top tier."""
+        router = AdaptiveModelRouter(objective="quality", rng=random.Random(0))
+        candidates = {
+            Models.OPUS_4: make_breaker(latency=5.0),
+            Models.SONNET: make_breaker(latency=1.0),
+        }
+
+        assert router.select(candidates) == Models.OPUS_4
+
+    def test_latency_objective_picks_fastest_tier(self):
+        """Test latency objective moves to the fastest tier."""
+        router = AdaptiveModelRouter(objective="latency", rng=random.Random(0))
+        candidates = {
+            Models.OPUS_4: make_breaker(latency=5.0),
+            Models.SONNET: make_breaker(latency=1.0),
+        }
+
+        assert router.select(candidates) == Models.SONNET
+
+    def test_cost_objective_picks_cheapest(self):
+        """Test cost objective uses observed cost."""
+        router = AdaptiveModelRouter(objective="cost", rng=random.Random(0))
+        candidates = {
+            Models.GEMINI_PRO: make_breaker(latency=1.0, cost=0.01),
+            Models.GEMINI_FLASH: make_breaker(latency=1.0, cost=0.001),
+        }
+
+        assert router.select(candidates) == Models.GEMINI_FLASH
+
+    def test_cost_priors_cover_claude_models(self):
+        """Test unmeasured Claude models are not treated as free."""
+        router = AdaptiveModelRouter(objective="cost", rng=random.Random(0))
+        candidates = {
+            Models.OPUS_4: make_breaker(latency=1.0),
+            Models.SONNET: make_breaker(latency=1.0),
+            Models.OPUS: make_breaker(latency=1.0),
+        }
+
+        assert router.select(candidates) == Models.SONNET
+        assert router.cost_score("unknown-model", make_breaker()) == max(router.COST_PRIORS.values())
+
+    def test_measured_cost_comparable_to_priors(self):
+        """Test per-call measurements compete fairly with per-call priors."""
+        router = AdaptiveModelRouter(objective="cost", rng=random.Random(0))
+        candidates = {
+            Models.SONNET: make_breaker(latency=1.0, cost=0.02),
+            Models.OPUS_4: make_breaker(latency=1.0),
+        }
+
+        assert router.select(candidates) == Models.SONNET
+
+    def test_quality_floor_excludes_low_tiers(self):
+        """Test quality floor filters out weaker models."""
+        router = AdaptiveModelRouter(objective="latency", quality_floor=2)
+        candidates = {
+            Models.GEMINI_FLASH: make_breaker(latency=0.1),
+            Models.SONNET: make_breaker(latency=2.0),
+        }
+
+        assert router.select(candidates) == Models.SONNET
+
+    def test_open_breakers_are_skipped(self):
+        """Test OPEN models are never selected."""
+        router = AdaptiveModelRouter(objective="latency")
+        fast = make_breaker(latency=0.1)
+        fast.force_open("test")
+        candidates = {Models.SONNET: fast, Models.GEMINI_PRO: make_breaker(latency=3.0)}
+
+        assert router.select(candidates) == Models.GEMINI_PRO
+
+        fallback = make_breaker()
+        fallback.force_open("test")
+        with pytest.raises(Exception):
+            router.select({Models.SONNET: fallback})
+
+    def test_degraded_model_loses_traffic(self):
+        """Test P2C shifts traffic away from a model with rising errors."""
+        router = AdaptiveModelRouter(objective="latency", rng=random.Random(42))
+        candidates = {
+            Models.SONNET: make_breaker(latency=1.0, error_rate=0.5),
+            Models.GEMINI_PRO: make_breaker(latency=1.0),
+            Models.GROK_3: make_breaker(latency=1.0),
+        }
+
+        picks = [router.select(candidates) for _ in range(200)]
+
+        assert picks.count(Models.SONNET) == 0
+        assert picks.count(Models.GEMINI_PRO) > 0
+        assert picks.count(Models.GROK_3) > 0
+
+
+class TestFallbackChainRouting:
+    """Test ModelFallbackChain with and without a router."""
+
+    def test_fixed_order_by_default(self):
+        """Test default behaviour still returns first non-OPEN model."""
+        chain = ModelFallbackChain(enable_cross_provider=False)
+
+        assert chain.get_available_model() == (Models.OPUS_4, 'anthropic')
+
+    def test_router_used_when_configured(self):
+        """Test router-driven selection and metrics."""
+        router = AdaptiveModelRouter(objective="latency", rng=random.Random(0))
+        chain = ModelFallbackChain(enable_cross_provider=False, router=router)
+        chain.circuit_breakers[Models.OPUS_4].metrics.ewma_latency = 9.0
+        chain.circuit_breakers[Models.OPUS].metrics.ewma_latency = 9.0
+        chain.circuit_breakers[Models.SONNET].metrics.ewma_latency = 0.5
+
+        model, provider = chain.get_available_model()
+
+        assert model == Models.SONNET
+        assert provider == 'anthropic'
+        assert chain.get_metrics()['routing']['objective'] == 'latency'
+
+    def test_router_fallback_skips_attempted(self):
+        """Test that a failed model is not re-picked within one call."""
+        router = AdaptiveModelRouter(objective="quality", rng=random.Random(0))
+        chain = ModelFallbackChain(enable_cross_provider=False, router=router)
+        calls = []
+
+        def flaky(model):
+            calls.append(model)
+            if len(calls) == 1:
+                raise RuntimeError("first model down")
+            return {'output': 'ok', 'cost': 0.0}
+
+        result = chain.call_with_fallback(flaky, Models.SONNET)
+
+        assert result['success'] is True
+        assert len(set(calls)) == 2
+
+    def test_router_honours_requested_model(self):
+        """Test an explicit model is tried first and None defers to the router."""
+        router = AdaptiveModelRouter(objective="quality", rng=random.Random(0))
+        chain = ModelFallbackChain(enable_cross_provider=False, router=router)
+        calls = []
+
+        def record(model):
+            calls.append(model)
+            return {'output': 'ok', 'cost': 0.0}
+
+        requested = chain.call_with_fallback(record, Models.SONNET)
+        routed = chain.call_with_fallback(record, None)
+
+        assert requested['model_used'] == Models.SONNET
+        assert requested['fallback_occurred'] is False
+        assert routed['model_used'] in (Models.OPUS_4, Models.OPUS)
+        assert routed['fallback_occurred'] is False
@@ -0,0 +1,112 @@
+"""
+Unit Tests for Local Pre-Validation
+
+Tests validation.prevalidation checks and the RefinementLoop short-circuit
+that skips LLM validation when local checks find blocking errors.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from validation.prevalidation import (
+    PreValidator,
+    RegexCheck,
+    python_syntax_check,
+    PRE_VALIDATOR_NAME,
+)
+from validation_types import ValidationReport, ValidationResult
+from refinement_loop import RefinementLoop
+
+
+PY = {"language": "python", "file_path": "app.py"}
+
+
+class TestChecks:
+    """Test individual checks."""
+
+    def test_syntax_error_is_critical_with_line(self):
+        """Test ast.parse failures become CRITICAL findings with a location."""
+        findings = python_syntax_check("x = 1\ndef f(:\n    pass\n", PY)
+
+        assert len(findings) == 1
+        assert findings[0].severity == "CRITICAL"
+        assert findings[0].location == "app.py:2"
+        assert findings[0].subcategory == "syntax_error"
+
+    def test_compile_catches_what_parse_allows(self):
+        """Test compiler-only errors (return outside function) are caught."""
+        findings = python_syntax_check("return 1\n", PY)
+
+        assert findings and findings[0].subcategory == "compile_error"
+
+    def test_non_python_is_skipped(self):
+        """Test markdown artifacts are not parsed as Python."""
+        assert python_syntax_check("# Report\n\ndef f(:", {"file_path": "report.md"}) == []
+
+    def test_regex_rules(self):
+        """Test conflict markers are flagged on the right line."""
+        findings = RegexCheck()("a = 1\n<<<<<<< HEAD\nb = 2\n", {"file_path": "m.py"})
+
+        assert [f.location for f in findings] == ["m.py:2"]
+
+
+class TestPreValidator:
+    """Test short-circuit reports."""
+
+    def test_blocking_findings_produce_fail_report(self):
+        """Test a synthetic zero-score FAIL report for blocking findings."""
+        pre = PreValidator()
+
+        report = pre.run("def f(:\n", PY)
+
+        assert report.overall_status == "FAIL"
+        assert report.average_score == 0
+        assert report.results[PRE_VALIDATOR_NAME].model_used == "local"
+        assert report.critical_count == 1
+        assert report.metadata["pre_validation"] is True
+
+    def test_clean_code_passes_through(self):
+        """Test valid code returns None so LLM validation runs."""
+        pre = PreValidator(checks=[python_syntax_check, RegexCheck()])
+
+        assert pre.run("def f():\n    return 1\n", PY) is None
+        assert pre.get_stats()["short_circuits"] == 0
+
+    def test_non_blocking_findings_do_not_short_circuit(self):
+        """Test only blocking severities skip validation."""
+        pre = PreValidator(checks=[RegexCheck([(r"TODO", "LOW", "Leftover TODO")])])
+
+        assert pre.run("x = 1  # TODO\n", PY) is None
+
+
+class TestRefinementIntegration:
+    """Test RefinementLoop uses the pre-validator."""
+
+    def test_llm_validator_skipped_on_syntax_error(self):
+        """Test broken iterations never reach validator_func."""
+        artifacts = iter(["def f(:\n", "def f():\n    return 1\n"])
+        validated = []
+
+        async def generate(data):
+            return next(artifacts)
+
+        async def validate(artifact, context):
+            validated.append(artifact)
+            return ValidationReport(
+                overall_status="PASS",
+                results={"code-validator": ValidationResult(
+                    validator_name="code-validator", status="PASS", score=95, cost_usd=0.02
+                )}
+            )
+
+        loop = RefinementLoop(max_iterations=2, pre_validator=PreValidator())
+        result = asyncio.run(loop.refine(generate, validate, {"task": "t"}, PY))
+
+        assert result.converged
+        assert validated == ["def f():\n    return 1\n"]
+        assert result.iterations[0].cost_usd == 0.0
+        assert "[CRITICAL] app.py:1" in result.iterations[0].feedback[0]
@@ -0,0 +1,201 @@
+"""
+Unit Tests for Progressive Enhancement Tier Racing
+
+Tests ProgressiveEnhancementOrchestrator racing mode (staggered concurrent
+tiers, first result meeting the target wins, spend cap), the learned
+per-task-type tier success rates that decide whether to race, and tiers
+skipped by a TierPredictor.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import progressive_enhancement_orchestrator as peo
+from progressive_enhancement_orchestrator import ProgressiveEnhancementOrchestrator
+from workflow_metrics import WorkflowMetricsTracker
+from tier_predictor import TierPredictor
+
+
+class StubValidator:
+    def __init__(self, project_root=None):
+        pass
+
+
+class ScriptedOrchestrator(ProgressiveEnhancementOrchestrator):
+    """Tier calls replaced by scripted (seconds, quality, cost) outcomes."""
+
+    def __init__(self, script, **kwargs):
+        super().__init__(**kwargs)
+        self.script = script
+        self.started = []
+        self.cancelled = []
+
+    async def _execute_with_tier(self, task, context, tier):
+        seconds, quality, cost = self.script[tier.name]
+        self.started.append(tier.name)
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            self.cancelled.append(tier.name)
+            raise
+        return {
+            "model": tier.model,
+            "output": f"{tier.name} output",
+            "quality": quality,
+            "cost": cost,
+            "tokens": 100,
+            "duration_ms": seconds * 1000,
+            "success": True
+        }
+
+
+@pytest.fixture
+def make(tmp_path, monkeypatch):
+    monkeypatch.setattr(peo, "ValidationOrchestrator", StubValidator)
+
+    def factory(script, **kwargs):
+        kwargs.setdefault("metrics_tracker", WorkflowMetricsTracker(str(tmp_path)))
+        return ScriptedOrchestrator(script, quality_target=80, **kwargs)
+
+    return factory
+
+
+SLOW_CHEAP = {
+    "Haiku": (5.0, 0, 0.01),      # never meets the target
+    "Sonnet": (5.0, 90, 0.05),
+    "Opus": (0.05, 95, 0.20),
+    "GPT-4": (5.0, 97, 0.40),
+}
+
+
+class TestRacing:
+    """Test staggered concurrent tiers."""
+
+    def test_first_result_meeting_target_wins_and_cancels_rest(self, make):
+        """Test later tiers start after the delay and the winner cancels the others."""
+        orchestrator = make(SLOW_CHEAP, racing=True, race_delay=0.05)
+
+        start = time.time()
+        result = asyncio.run(orchestrator.execute_workflow("write code"))
+
+        assert time.time() - start < 1
+        assert result.success
+        assert result.overall_quality_score == 95
+        race = result.context["workflow_metadata"]["race"]
+        assert race["winner"] == "Opus"
+        assert sorted(orchestrator.cancelled) == ["GPT-4", "Haiku", "Sonnet"]
+        assert sorted(race["cancelled_tiers"]) == ["GPT-4", "Haiku", "Sonnet"]
+        assert result.context["workflow_metadata"]["final_tier"] == "Opus"
+        cancelled_estimate = sum(
+            orchestrator._estimate_tier_cost(tier, "write code", {})
+            for tier in orchestrator.MODEL_TIERS if tier.name in race["cancelled_tiers"]
+        )
+        assert result.total_cost_usd == pytest.approx(0.20 + cancelled_estimate)
+
+    def test_cancelled_tier_spend_is_charged(self, make):
+        """Test an abandoned in-flight tier's worst-case cost is in the workflow total."""
+        script = {"Haiku": (5.0, 0, 0.01), "Sonnet": (0.05, 90, 0.05),
+                  "Opus": (5.0, 95, 0.2), "GPT-4": (5.0, 97, 0.4)}
+        orchestrator = make(script, racing=True, race_delay=0.01, max_escalations=1)
+
+        result = asyncio.run(orchestrator.execute_workflow("write code"))
+
+        haiku = orchestrator.MODEL_TIERS[0]
+        estimate = orchestrator._estimate_tier_cost(haiku, "write code", {})
+        race = result.context["workflow_metadata"]["race"]
+        assert race["cancelled_tiers"] == ["Haiku"]
+        assert estimate > 0
+        assert result.total_cost_usd == pytest.approx(0.05 + estimate)
+        assert race["spent_usd"] == pytest.approx(0.05 + estimate)
+
+    def test_failed_tier_escalates_without_waiting(self, make):
+        """Test the next tier starts at once when nothing is left running."""
+        script = {"Haiku": (0.01, 40, 0.01), "Sonnet": (0.01, 90, 0.05),
+                  "Opus": (0.01, 95, 0.2), "GPT-4": (0.01, 97, 0.4)}
+        orchestrator = make(script, racing=True, race_delay=30)
+
+        start = time.time()
+        result = asyncio.run(orchestrator.execute_workflow("write code"))
+
+        assert time.time() - start < 1
+        assert orchestrator.started == ["Haiku", "Sonnet"]
+        assert result.context["workflow_metadata"]["race"]["winner"] == "Sonnet"
+
+    def test_spend_cap_stops_new_tiers(self, make):
+        """Test tiers whose worst-case cost would exceed the cap are not started."""
+        orchestrator = make(SLOW_CHEAP, racing=True, race_delay=0.01, spend_cap_usd=0.1)
+        orchestrator.script = {**SLOW_CHEAP, "Haiku": (0.05, 0, 0.01), "Sonnet": (0.05, 70, 0.05)}
+
+        result = asyncio.run(orchestrator.execute_workflow("write code"))
+
+        assert orchestrator.started == ["Haiku", "Sonnet"]
+        assert result.context["workflow_metadata"]["spend_capped"]
+        assert not result.success
+
+    def test_racing_off_stays_sequential(self, make):
+        """Test the default mode never overlaps tiers."""
+        script = {"Haiku": (0.01, 40, 0.01), "Sonnet": (0.01, 90, 0.05),
+                  "Opus": (0.01, 95, 0.2), "GPT-4": (0.01, 97, 0.4)}
+        orchestrator = make(script)
+
+        result = asyncio.run(orchestrator.execute_workflow("write code"))
+
+        assert orchestrator.started == ["Haiku", "Sonnet"]
+        assert result.context["workflow_metadata"]["race"] is None
+
+
+class TestLearnedRates:
+    """Test per-task-type tier success rates drive the race plan."""
+
+    def record(self, orchestrator, task_type, qualities):
+        for quality in qualities:
+            orchestrator.script = {**SLOW_CHEAP, "Haiku": (0.0, quality, 0.01)}
+            asyncio.run(orchestrator.execute_workflow("task", {"task_type": task_type}))
+
+    def test_rates_are_learned_per_task_type(self, make):
+        """Test recorded attempts give smoothed success rates by task type."""
+        orchestrator = make(SLOW_CHEAP, max_escalations=0)
+        self.record(orchestrator, "routine", [90, 90, 90, 10])
+
+        rates = orchestrator.tier_success_rates("routine")
+
+        assert rates["Haiku"]["attempts"] == 4
+        assert rates["Haiku"]["rate"] == pytest.approx(4 / 6)
+        assert orchestrator.tier_success_rates("complex") == {}
+
+    def test_plan_skips_racing_when_cheap_tier_usually_wins(self, make):
+        """Test the delay shrinks as the cheap tier's success rate falls."""
+        orchestrator = make(SLOW_CHEAP, max_escalations=0, race_delay=10)
+        tiers = orchestrator.MODEL_TIERS
+        self.record(orchestrator, "routine", [90] * 8)
+        self.record(orchestrator, "analysis", [10] * 8)
+
+        assert orchestrator._plan_race("routine", tiers) is None
+        assert orchestrator._plan_race("analysis", tiers) == pytest.approx(10 * 1 / 10)
+        assert orchestrator._plan_race("complex", tiers) == 0.0
+        assert orchestrator._plan_race("unseen", tiers) == 10
+
+
+class TestTierPrediction:
+    """Test the workflow starts at the predicted tier."""
+
+    def test_predicted_failing_tier_is_skipped(self, make):
+        """Test tiers predicted to miss the target are never called."""
+        task = "Design a distributed microservice architecture with kubernetes deployment"
+        predictor = TierPredictor(["Haiku", "Sonnet", "Opus", "GPT-4"])
+        predictor.fit([(task, {}, "Haiku", False)] * 6)
+        script = {"Haiku": (0.01, 90, 0.01), "Sonnet": (0.01, 90, 0.05),
+                  "Opus": (0.01, 95, 0.2), "GPT-4": (0.01, 97, 0.4)}
+        orchestrator = make(script, tier_predictor=predictor)
+
+        result = asyncio.run(orchestrator.execute_workflow(task))
+
+        assert orchestrator.started == ["Sonnet"]
+        assert result.context["workflow_metadata"]["predicted_skips"] == ["Haiku"]
+        assert predictor.get_stats()["examples"]["Sonnet"] == 1
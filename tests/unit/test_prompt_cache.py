@@ -0,0 +1,170 @@
+"""
+Unit Tests for Prompt-Prefix Caching
+
+Tests utils.prompt_cache payload builders and the LocalPromptCache stand-in,
+plus cache token accounting through BaseAgent and ResilientBaseAgent.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.prompt_cache import (
+    CACHE_CONTROL,
+    LocalPromptCache,
+    cache_token_usage,
+    flatten_content,
+    system_blocks,
+    user_content,
+)
+from agent_system import BaseAgent, ModelPricing
+from resilient_agent import ResilientBaseAgent, CallResult
+from mcp_bridge.anthropic_adapter import _flatten_request
+
+
+INSTRUCTIONS = "Check naming, security and error handling. " * 200  # ~8.8k chars
+DEFINITION = "You are a security critic. Report findings as JSON. " * 150
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPayloadBuilders:
+    """Test content block construction."""
+
+    def test_long_prefix_is_marked(self):
+        """Test the prefix becomes a cache_control block followed by the prompt."""
+        content = user_content("def f(): pass", cache_prefix=INSTRUCTIONS)
+
+        assert content[0] == {"type": "text", "text": INSTRUCTIONS, "cache_control": CACHE_CONTROL}
+        assert content[1] == {"type": "text", "text": "def f(): pass"}
+        assert flatten_content(content) == INSTRUCTIONS + "def f(): pass"
+
+    def test_short_or_disabled_stays_plain(self):
+        """Test short prefixes and disabled caching keep the string payload."""
+        assert user_content("code", cache_prefix="Review:\n") == "Review:\ncode"
+        assert user_content("code", cache_prefix=INSTRUCTIONS, cache=False) == INSTRUCTIONS + "code"
+        assert system_blocks("You are a critic.") == "You are a critic."
+        assert isinstance(system_blocks(DEFINITION), list)
+
+    def test_usage_reading_tolerates_missing_fields(self):
+        """Test clients without cache counters report zeros."""
+        class Usage:
+            input_tokens = 10
+            output_tokens = 5
+
+        assert cache_token_usage(Usage()) == (0, 0)
+        assert cache_token_usage({"cache_read_input_tokens": 7, "cache_creation_input_tokens": None}) == (7, 0)
+
+    def test_bridge_adapter_flattens_blocks(self):
+        """Test the CLI bridge adapter receives plain strings."""
+        messages, system = _flatten_request(
+            [{"role": "user", "content": user_content("code", cache_prefix=INSTRUCTIONS)}],
+            system_blocks(DEFINITION)
+        )
+
+        assert messages == [{"role": "user", "content": INSTRUCTIONS + "code"}]
+        assert system == DEFINITION
+
+
+class TestLocalPromptCache:
+    """Test the local stand-in's cache accounting."""
+
+    def request(self, prompt):
+        return {
+            "model": "m",
+            "system": system_blocks(DEFINITION),
+            "messages": [{"role": "user", "content": user_content(prompt, cache_prefix=INSTRUCTIONS)}],
+        }
+
+    def test_write_then_read(self):
+        """Test the first request writes the prefix and the next reads it."""
+        client = LocalPromptCache()
+
+        first = client.messages.create(**self.request("a = 1")).usage
+        second = client.messages.create(**self.request("b = 2")).usage
+
+        assert first.cache_read_input_tokens == 0
+        assert first.cache_creation_input_tokens > 2000
+        assert second.cache_read_input_tokens == first.cache_creation_input_tokens
+        assert second.cache_creation_input_tokens == 0
+        assert second.input_tokens == first.input_tokens
+
+    def test_longest_cached_prefix_wins(self):
+        """Test a new user prefix after a cached system prompt only writes the difference."""
+        client = LocalPromptCache()
+        client.messages.create(system=system_blocks(DEFINITION), messages=[{"role": "user", "content": "x"}])
+
+        usage = client.messages.create(**self.request("a = 1")).usage
+
+        assert usage.cache_read_input_tokens == len(DEFINITION) // 4
+        assert usage.cache_creation_input_tokens == len(INSTRUCTIONS) // 4
+
+    def test_entries_expire(self):
+        """Test prefixes are rewritten after the TTL lapses."""
+        clock = FakeClock()
+        client = LocalPromptCache(ttl=300, clock=clock)
+        client.messages.create(**self.request("a = 1"))
+
+        clock.now = 301
+        usage = client.messages.create(**self.request("a = 1")).usage
+
+        assert usage.cache_read_input_tokens == 0
+        assert usage.cache_creation_input_tokens > 0
+
+
+class TestAgentIntegration:
+    """Test agents mark prefixes and report cache tokens."""
+
+    def test_resilient_agent_tracks_cache_tokens(self):
+        """Test CallResult carries cache read/write counts."""
+        agent = ResilientBaseAgent(role="validator", enable_fallback=False, max_retries=1, prompt_caching=True)
+        agent.anthropic_client = LocalPromptCache()
+
+        first = agent.call("x = 1", cache_prefix=INSTRUCTIONS)
+        second = agent.call("y = 2", cache_prefix=INSTRUCTIONS)
+
+        assert first.success and second.success
+        assert first.cache_write_tokens > 0
+        assert second.cache_read_tokens == first.cache_write_tokens
+        assert second.tokens_in < 10
+        sent = agent.anthropic_client.requests[-1]["messages"][0]["content"]
+        assert "cache_control" in sent[0]
+        assert CallResult.from_dict(second.to_dict()).cache_read_tokens == second.cache_read_tokens
+        assert agent.get_metrics()["prompt_cache"]["cache_read_tokens"] == second.cache_read_tokens
+
+    def test_caching_off_sends_plain_prompt(self):
+        """Test the default payload is unchanged when caching is disabled."""
+        agent = ResilientBaseAgent(role="validator", enable_fallback=False, max_retries=1,
+                                   enable_security=False)
+        agent.anthropic_client = LocalPromptCache()
+
+        agent.call("x = 1", cache_prefix=INSTRUCTIONS)
+
+        assert agent.anthropic_client.requests[0]["messages"][0]["content"] == INSTRUCTIONS + "x = 1"
+
+    def test_base_agent_caches_system_prompt(self):
+        """Test BaseAgent marks a long static system prompt."""
+        agent = BaseAgent(role="critic", system_prompt=DEFINITION, max_retries=1, prompt_caching=True)
+        agent.client = LocalPromptCache()
+
+        agent.call("review a")
+        result = agent.call("review b")
+
+        assert result["cache_read_tokens"] == len(DEFINITION) // 4
+        assert result["cache_write_tokens"] == 0
+
+    def test_cache_pricing(self):
+        """Test cache reads are billed at a tenth and writes at 1.25x the input rate."""
+        base = ModelPricing.calculate_cost("gpt-4", 1_000_000, 0)
+
+        assert ModelPricing.calculate_cost("gpt-4", 0, 0, cache_read_tokens=1_000_000) == pytest.approx(base * 0.1)
+        assert ModelPricing.calculate_cost("gpt-4", 0, 0, cache_write_tokens=1_000_000) == pytest.approx(base * 1.25)
@@ -0,0 +1,233 @@
+"""
+Unit Tests for Prompt Evolution Fitness Evaluation
+
+Tests that FitnessEvaluator runs test cases concurrently under a global
+limit, memoises results by prompt content and test case, and shares
+in-flight runs between identical prompts; and that GeneticSelector's
+matrix similarity, diversity and fitness sharing match the pairwise
+definitions with and without NumPy.
+"""
+
+import asyncio
+import random
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import prompt_evolution
+from prompt_evolution import FitnessEvaluator, GeneticSelector, MutationType, PromptVariation
+from prompt_evolution import TestCase as PromptTestCase
+
+
+class SlowEvaluator(FitnessEvaluator):
+    """Evaluator whose test runs take `delay` seconds and record concurrency."""
+
+    def __init__(self, delay=0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.runs = []
+
+    async def _run_test_case(self, variation, test_case):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.runs.append((variation.content, test_case.input_data["input"]))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {
+            "success": True,
+            "latency_ms": 100,
+            "tokens_used": 10,
+            "confidence": len(variation.content) / 100,
+            "test_case": test_case
+        }
+
+
+def variation(content, variation_id=None):
+    return PromptVariation(id=variation_id or content, content=content,
+                           mutation_type=MutationType.REPHRASE, token_count=len(content.split()))
+
+
+def cases(count):
+    return [PromptTestCase({"input": f"case {i}"}, f"expected {i}") for i in range(count)]
+
+
+class TestConcurrency:
+    """Test concurrent evaluation under the global limit."""
+
+    def test_population_runs_concurrently_within_limit(self):
+        """Test 5 variations x 4 cases run 8 at a time, not serially."""
+        evaluator = SlowEvaluator(max_concurrency=8)
+        population = [variation(f"prompt {i}") for i in range(5)]
+
+        start = time.perf_counter()
+        scores = asyncio.run(evaluator.evaluate_population(population, cases(4)))
+        elapsed = time.perf_counter() - start
+
+        assert len(scores) == 5
+        assert evaluator.peak == 8
+        assert evaluator.test_runs == 20
+        assert elapsed < 0.5  # serial: 20 x 0.05s = 1.0s
+
+    def test_results_keep_test_case_order(self):
+        """Test test_results line up with test_cases despite concurrent runs."""
+        evaluator = SlowEvaluator(max_concurrency=3)
+        prompt = variation("ordered prompt")
+
+        asyncio.run(evaluator.evaluate(prompt, cases(5)))
+
+        assert [r["test_case"].input_data["input"] for r in prompt.test_results] == \
+            [f"case {i}" for i in range(5)]
+
+
+class TestMemoisation:
+    """Test the (content hash, test case id) memo table."""
+
+    def test_re_evaluated_elite_is_not_re_run(self):
+        """Test an elite carried into the next generation reuses its results."""
+        evaluator = SlowEvaluator()
+        elite = variation("elite prompt")
+        test_cases = cases(3)
+
+        async def two_generations():
+            first = await evaluator.evaluate(elite, test_cases)
+            second = await evaluator.evaluate(elite, test_cases)
+            return first, second
+
+        first, second = asyncio.run(two_generations())
+
+        assert first == second
+        assert evaluator.test_runs == 3
+        assert evaluator.memo_hits == 3
+
+    def test_identical_content_in_flight_shares_runs(self):
+        """Test two variations with the same content run each case once."""
+        evaluator = SlowEvaluator()
+        population = [variation("same prompt", "a"), variation("same prompt", "b")]
+
+        asyncio.run(evaluator.evaluate_population(population, cases(2)))
+
+        assert sorted(evaluator.runs) == [("same prompt", "case 0"), ("same prompt", "case 1")]
+        assert population[0].fitness_score == population[1].fitness_score
+
+    def test_equal_test_cases_share_an_id(self):
+        """Test test case ids depend on content, not object identity."""
+        a = PromptTestCase({"input": "x", "n": [1, 2]}, "y", edge_case=True)
+        b = PromptTestCase({"n": [1, 2], "input": "x"}, "y", edge_case=True)
+        c = PromptTestCase({"input": "x", "n": [1, 2]}, "y", edge_case=False)
+
+        assert FitnessEvaluator._test_case_id(a) == FitnessEvaluator._test_case_id(b)
+        assert FitnessEvaluator._test_case_id(a) != FitnessEvaluator._test_case_id(c)
+
+    def test_failed_runs_are_not_memoised(self):
+        """Test a run that raises is retried on the next evaluation."""
+        evaluator = SlowEvaluator(delay=0)
+        original = evaluator._run_test_case
+        calls = []
+
+        async def flaky(variation, test_case):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("rate limited")
+            return await original(variation, test_case)
+        evaluator._run_test_case = flaky
+        prompt = variation("flaky prompt")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(evaluator.evaluate(prompt, cases(1)))
+        asyncio.run(evaluator.evaluate(prompt, cases(1)))
+
+        assert len(calls) == 2
+        assert len(evaluator.memo) == 1
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def selector(request, monkeypatch):
+    if request.param and not prompt_evolution.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(prompt_evolution, "NUMPY_AVAILABLE", request.param)
+    return GeneticSelector(population_size=6, sharing_radius=0.5)
+
+
+def scored(content, fitness):
+    prompt = variation(content)
+    prompt.fitness_score = fitness
+    return prompt
+
+
+class TestPopulationSimilarity:
+    """Test matrix similarity, diversity and fitness sharing."""
+
+    def test_matrix_matches_pairwise_jaccard(self, selector):
+        """Test every matrix entry equals the pairwise word-set Jaccard."""
+        texts = ["Analyze the text", "analyze THE data", "", "summarize the text briefly"]
+        population = [variation(text, str(i)) for i, text in enumerate(texts)]
+
+        matrix = selector.similarity_matrix(population)
+
+        for i, a in enumerate(texts):
+            for j, b in enumerate(texts):
+                expected = selector._calculate_similarity(a, b)
+                assert float(matrix[i][j]) == pytest.approx(expected)
+
+    def test_diversity_is_one_minus_mean_similarity(self, selector):
+        """Test diversity keeps its pairwise definition."""
+        rng = random.Random(3)
+        words = [f"w{i}" for i in range(30)]
+        population = [variation(" ".join(rng.sample(words, 8)), str(i)) for i in range(12)]
+        pairs = [(a, b) for i, a in enumerate(population) for b in population[i + 1:]]
+        expected = 1 - sum(selector._calculate_similarity(a.content, b.content) for a, b in pairs) / len(pairs)
+
+        assert selector.calculate_diversity(population) == pytest.approx(expected)
+
+    def test_large_population_is_fast(self, selector):
+        """Test diversity over 300 prompts takes well under a second."""
+        rng = random.Random(5)
+        words = [f"w{i}" for i in range(200)]
+        population = [variation(" ".join(rng.sample(words, 40)), str(i)) for i in range(300)]
+
+        start = time.perf_counter()
+        selector.calculate_diversity(population)
+
+        assert time.perf_counter() - start < 1.0
+
+    def test_near_duplicates_share_fitness(self, selector):
+        """Test clones split their fitness while a distinct prompt keeps its own."""
+        population = [
+            scored("list the key themes in the text", 0.9),
+            scored("list the key themes in the text", 0.9),
+            scored("write a haiku about autumn leaves", 0.8),
+        ]
+
+        shared = selector.shared_fitness(population)
+
+        assert shared[0] == pytest.approx(0.45)
+        assert shared[2] == pytest.approx(0.8)
+
+    def test_sharing_keeps_distinct_elites(self, selector):
+        """Test niching promotes a distinct prompt over a clone into the elite."""
+        selector.elite_ratio = 0.34  # two elites out of six
+        selector.breeding_ratio = 0.0
+        selector.innovation_ratio = 0.0
+        population = [
+            scored("list the key themes in the text", 0.9),
+            scored("list the key themes in the text", 0.9),
+            scored("write a haiku about autumn leaves", 0.8),
+            scored("translate this into french", 0.1),
+            scored("count the vowels in each word", 0.1),
+            scored("explain quantum tunnelling simply", 0.1),
+        ]
+
+        next_generation = asyncio.run(selector.evolve_generation(population, 1))
+
+        assert [p.content for p in next_generation[:2]] == [
+            "write a haiku about autumn leaves",
+            "list the key themes in the text",
+        ]
@@ -0,0 +1,142 @@
+"""
+Unit Tests for Speculative Refinement
+
+Tests RefinementLoop best-of-N candidate generation (concurrent generate and
+validate, cancel on convergence) and early stopping on score plateaus.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from refinement_loop import RefinementLoop
+from validation_types import ValidationReport, ValidationResult
+
+
+def report(score):
+    """Report with one validator; PASS at 80+."""
+    status = "PASS" if score >= 80 else "FAIL"
+    return ValidationReport(
+        overall_status=status,
+        results={"code-validator": ValidationResult(
+            validator_name="code-validator", status=status, score=score, cost_usd=0.01
+        )}
+    )
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestSpeculativeCandidates:
+    """Test concurrent best-of-N generation."""
+
+    def test_candidates_run_concurrently_and_best_is_kept(self):
+        """Test N candidates overlap in time and the highest score wins."""
+        scores = {0: 40, 1: 70, 2: 55}
+
+        async def generate(data):
+            await asyncio.sleep(0.05)
+            return f"candidate-{data['candidate_index']}"
+
+        async def validate(artifact, context):
+            await asyncio.sleep(0.05)
+            return report(scores[int(artifact.rsplit("-", 1)[1])])
+
+        loop = RefinementLoop(max_iterations=1, candidates_per_iteration=3)
+        start = time.time()
+        result = run(loop.refine(generate, validate, {"task": "t"}))
+
+        assert time.time() - start < 0.25  # 3 x (0.05 + 0.05) sequentially
+        assert result.final_artifact == "candidate-1"
+        assert sorted(result.iterations[0].candidate_scores) == [40, 55, 70]
+        assert result.total_cost_usd == pytest.approx(0.03)
+
+    def test_first_converged_candidate_cancels_the_rest(self):
+        """Test a passing candidate ends the round without waiting for slow ones."""
+        cancelled = []
+
+        async def generate(data):
+            if data["candidate_index"] == 0:
+                return "fast"
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(data["candidate_index"])
+                raise
+            return "slow"
+
+        async def validate(artifact, context):
+            return report(95)
+
+        loop = RefinementLoop(max_iterations=3, candidates_per_iteration=3)
+        start = time.time()
+        result = run(loop.refine(generate, validate, {"task": "t"}))
+
+        assert time.time() - start < 1
+        assert result.converged
+        assert result.final_artifact == "fast"
+        assert sorted(cancelled) == [1, 2]
+
+    def test_failed_candidates_are_skipped(self):
+        """Test one failing candidate does not fail the iteration."""
+        async def generate(data):
+            if data["candidate_index"] == 0:
+                raise RuntimeError("model error")
+            return "ok" if data["candidate_index"] == 1 else ""
+
+        async def validate(artifact, context):
+            return report(90)
+
+        result = run(RefinementLoop(max_iterations=1, candidates_per_iteration=3).refine(
+            generate, validate, {"task": "t"}
+        ))
+
+        assert result.converged
+        assert result.iterations[0].candidate_scores == [90]
+
+
+class TestPlateauStop:
+    """Test early stop when scores stop improving."""
+
+    def test_stops_when_scores_plateau(self):
+        """Test the loop ends once the last N scores add no improvement."""
+        scores = iter([50, 60, 60.5, 60, 70, 90])
+
+        async def generate(data):
+            return "code"
+
+        async def validate(artifact, context):
+            return report(next(scores))
+
+        result = run(RefinementLoop(max_iterations=6, plateau_patience=2).refine(
+            generate, validate, {"task": "t"}
+        ))
+
+        assert result.stopped_early
+        assert not result.converged
+        assert result.improvement_history == [50, 60, 60.5, 60]
+        assert result.total_iterations == 4
+
+    def test_improving_scores_keep_going(self):
+        """Test steady progress runs until convergence."""
+        scores = iter([50, 60, 70, 85])
+
+        async def generate(data):
+            return "code"
+
+        async def validate(artifact, context):
+            return report(next(scores))
+
+        result = run(RefinementLoop(max_iterations=5, plateau_patience=1).refine(
+            generate, validate, {"task": "t"}
+        ))
+
+        assert result.converged
+        assert not result.stopped_early
+        assert result.total_iterations == 4
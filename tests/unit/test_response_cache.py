@@ -0,0 +1,216 @@
+"""
+Unit Tests for the Persistent LLM Response Cache
+
+Tests utils.response_cache.ResponseCache: memory/disk hits, persistence
+across instances, TTL expiry, size-based eviction and namespaces; and
+how ClaudeCodeBridge and BaseAgent store and return cached responses.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.response_cache import ResponseCache
+from mcp_bridge.claude_code_bridge import ClaudeCodeBridge
+from agent_system import BaseAgent
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary cache database path."""
+    return str(tmp_path / "cache.db")
+
+
+class TestResponseCacheBasics:
+    """Test get/set and hit accounting."""
+
+    def test_miss_then_memory_hit(self, db_path):
+        """Test first lookup misses and second hits memory."""
+        cache = ResponseCache(db_path=db_path)
+        key = cache.make_key(model="m", prompt="p", temperature=0.0)
+
+        assert cache.get("validator", key) is None
+        cache.set("validator", key, {"output": "ok", "success": True})
+
+        assert cache.get("validator", key) == {"output": "ok", "success": True}
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["namespaces"]["validator"] == {"hits": 1, "misses": 1}
+
+    def test_persists_across_instances(self, db_path):
+        """Test a new cache instance reads entries from disk."""
+        ResponseCache(db_path=db_path).set("critic", "k", {"output": "saved"})
+
+        cache = ResponseCache(db_path=db_path)
+
+        assert cache.get("critic", "k") == {"output": "saved"}
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_namespaces_are_isolated(self, db_path):
+        """Test per-agent namespaces and invalidation."""
+        cache = ResponseCache(db_path=db_path)
+        cache.set("a", "k", 1)
+        cache.set("b", "k", 2)
+
+        cache.invalidate("a")
+
+        assert cache.get("a", "k") is None
+        assert cache.get("b", "k") == 2
+
+
+class TestResponseCacheLimits:
+    """Test TTL and size-based eviction."""
+
+    def test_ttl_expiry(self, db_path):
+        """Test expired entries are treated as misses."""
+        cache = ResponseCache(db_path=db_path, ttl_seconds=0.05)
+        cache.set("ns", "k", "value")
+        time.sleep(0.1)
+
+        assert cache.get("ns", "k") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_size_eviction_drops_least_recently_used(self, db_path):
+        """Test eviction keeps total size under the cap."""
+        cache = ResponseCache(db_path=db_path, max_bytes=300, memory_entries=1)
+        payload = "x" * 100
+
+        cache.set("ns", "old", payload)
+        time.sleep(0.01)
+        cache.set("ns", "mid", payload)
+        time.sleep(0.01)
+        cache.set("ns", "new", payload)
+
+        stats = cache.get_stats()
+        assert stats["evictions"] >= 1
+        assert stats["total_bytes"] <= 300
+        assert cache.get("ns", "old") is None
+        assert cache.get("ns", "new") == payload
+
+    def test_memory_hits_protect_entries_from_eviction(self, db_path):
+        """Test an entry read only from memory is not evicted as least recently used."""
+        cache = ResponseCache(db_path=db_path, max_bytes=300, memory_entries=10)
+        payload = "x" * 100
+
+        cache.set("ns", "hot", payload)
+        time.sleep(0.01)
+        cache.set("ns", "cold", payload)
+        time.sleep(0.01)
+        assert cache.get("ns", "hot") == payload  # memory hit
+        cache.set("ns", "new", payload)
+
+        assert cache.get_stats()["evictions"] >= 1
+        assert cache.get("ns", "cold") is None
+        assert cache.get("ns", "hot") == payload
+
+    def test_memory_hit_access_times_reach_disk(self, db_path):
+        """Test buffered memory-hit access times are written in batches and on close."""
+        cache = ResponseCache(db_path=db_path, touch_batch=2)
+        cache.set("ns", "a", 1)
+        cache.set("ns", "b", 2)
+        written = dict(cache.conn.execute("SELECT key, accessed_at FROM responses").fetchall())
+        time.sleep(0.01)
+
+        cache.get("ns", "a")
+        assert cache.conn.execute("SELECT accessed_at FROM responses WHERE key = 'a'").fetchone()[0] == written["a"]
+        cache.get("ns", "b")
+        touched = dict(cache.conn.execute("SELECT key, accessed_at FROM responses").fetchall())
+        assert touched["a"] > written["a"] and touched["b"] > written["b"]
+
+    def test_memory_lru_capacity(self, db_path):
+        """Test memory front is bounded but disk still serves entries."""
+        cache = ResponseCache(db_path=db_path, memory_entries=2)
+        for i in range(5):
+            cache.set("ns", f"k{i}", i)
+
+        assert cache.get_stats()["memory_entries"] == 2
+        assert cache.get("ns", "k0") == 0
+        assert cache.get_stats()["disk_hits"] == 1
+
+
+class FakeBridge(ClaudeCodeBridge):
+    """Bridge without a CLI whose calls return canned responses."""
+
+    def __init__(self, cache, responses):
+        self.response_cache = cache
+        self.single_flight = None
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def _call_cli(self, model, messages, system, max_tokens, temperature):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestBridgeCaching:
+    """Test ClaudeCodeBridge's use of the response cache."""
+
+    def call(self, bridge):
+        return asyncio.run(bridge.call_model("claude-3-5-sonnet-20241022", [{"role": "user", "content": "hi"}]))
+
+    def test_cached_responses_are_copies(self, db_path):
+        """Test mutating a returned response does not change the cached one."""
+        bridge = FakeBridge(ResponseCache(db_path=db_path), [{"result": "ok", "usage": {"input_tokens": 1}}])
+
+        first = self.call(bridge)
+        first["usage"]["input_tokens"] = 99
+        second = self.call(bridge)
+        second["result"] = "mutated"
+
+        assert self.call(bridge) == {"result": "ok", "usage": {"input_tokens": 1}}
+        assert bridge.calls == 1
+
+    def test_error_responses_are_not_cached(self, db_path):
+        """Test an is_error result is returned but retried on the next call."""
+        bridge = FakeBridge(ResponseCache(db_path=db_path),
+                            [{"result": "auth failed", "is_error": True}, {"result": "ok"}])
+
+        assert self.call(bridge)["is_error"] is True
+        assert self.call(bridge) == {"result": "ok"}
+        assert bridge.calls == 2
+
+
+class FakeAgent(BaseAgent):
+    """BaseAgent whose API call returns a fresh nested response."""
+
+    def __init__(self, response_cache):
+        # Skip client setup: only the caching path in call() is exercised
+        self.client = object()
+        self.system_prompt = None
+        self.role = "tester"
+        self.model = "m"
+        self.temperature = 0.0
+        self.max_tokens = 10
+        self.single_flight = None
+        self.response_cache = response_cache
+        self.cache_namespace = "agent"
+        self.agent_id = "agent_1"
+        self.api_calls = 0
+
+    def _call_with_retries(self, prompt, system, temperature, max_tokens, cache_prefix=None):
+        self.api_calls += 1
+        return {"output": "ok", "success": True, "cost": 0.01, "usage": {"input_tokens": 3}}
+
+
+class TestAgentCaching:
+    """Test BaseAgent.call() with a response cache."""
+
+    def test_cached_responses_are_copies(self, db_path):
+        """Test mutating a returned response never changes later cache hits."""
+        agent = FakeAgent(ResponseCache(db_path=db_path))
+
+        first = agent.call("hello")
+        first["usage"]["input_tokens"] = 999
+        second = agent.call("hello")
+        second["usage"]["input_tokens"] = 555
+        third = agent.call("hello")
+
+        assert agent.api_calls == 1
+        assert third["cached"]
+        assert third["usage"] == {"input_tokens": 3}
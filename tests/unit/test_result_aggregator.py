@@ -0,0 +1,199 @@
+"""
+Unit Tests for Validation Result Aggregator
+
+Tests ResultAggregator directory runs: streaming walk with glob exclusion,
+bounded concurrent validation, fail-fast and progress reporting, and that
+a shared ValidationOrchestrator keeps per-call settings apart across threads.
+"""
+
+import threading
+import time
+import pytest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from validation import ValidationOrchestrator, ValidationResult, ValidationFinding
+from validation.result_aggregator import ResultAggregator, compile_exclude_patterns, iter_files
+from validation.interfaces import EXCLUDE_PATTERNS
+
+
+class FakeOrchestrator:
+    """Orchestrator stub that validates every file as code."""
+
+    default_level = "standard"
+    emitter = None
+
+    def __init__(self, delay=0.0, critical_files=()):
+        self.delay = delay
+        self.critical_files = set(critical_files)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.validated = []
+
+    def _detect_validators_for_file(self, file_path):
+        return ["code-validator"]
+
+    def _detect_language(self, file_path):
+        return "python"
+
+    def validate_code(self, code, context, level):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.validated.append(Path(context["file_path"]).name)
+
+        findings = []
+        if Path(context["file_path"]).name in self.critical_files:
+            findings.append(ValidationFinding(
+                id="SEC-001", severity="CRITICAL", category="security",
+                subcategory="injection", location=context["file_path"],
+                issue="bad", recommendation="fix"
+            ))
+        return ValidationResult(
+            validator_name="code-validator",
+            status="FAIL" if findings else "PASS",
+            score=50 if findings else 100,
+            findings=findings,
+            target=context["file_path"]
+        )
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small source tree with excluded directories and files."""
+    for name in ["a.py", "b.py", "c.py", "d.py", "e.py", "f.py"]:
+        (tmp_path / name).write_text("x = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "g.py").write_text("y = 2\n")
+    (tmp_path / "pkg" / "g.pyc").write_bytes(b"\0")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text("[core]\n")
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / "ci.py").write_text("z = 3\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "lib.js").write_text("var a;\n")
+    return tmp_path
+
+
+class TestFileWalker:
+    """Test streaming walk and exclusion."""
+
+    def test_excludes_by_component_glob(self, tree):
+        """Test excluded dirs are pruned and globs match names exactly."""
+        names = [p.relative_to(tree).as_posix()
+                 for p in iter_files(tree, True, compile_exclude_patterns(EXCLUDE_PATTERNS))]
+
+        assert "pkg/g.py" in names
+        assert ".github/ci.py" in names  # ".git" must not match ".github"
+        assert "pkg/g.pyc" not in names
+        assert not any(n.startswith((".git/", "node_modules/")) for n in names)
+
+    def test_non_recursive(self, tree):
+        """Test recursive=False lists only the top level."""
+        names = [p.name for p in iter_files(tree, False, compile_exclude_patterns(EXCLUDE_PATTERNS))]
+
+        assert "g.py" not in names
+        assert "a.py" in names
+
+
+class TestConcurrentDirectoryValidation:
+    """Test bounded concurrency, ordering, fail-fast and progress."""
+
+    def test_concurrency_bounded_and_order_stable(self, tree):
+        """Test at most max_workers files run at once and results keep walk order."""
+        orchestrator = FakeOrchestrator(delay=0.05)
+        aggregator = ResultAggregator(orchestrator, max_workers=3)
+
+        start = time.time()
+        results = aggregator._validate_directory(tree, "standard", recursive=True)
+        elapsed = time.time() - start
+
+        assert orchestrator.peak == 3
+        assert elapsed < 0.05 * 8
+        expected = [p for p in iter_files(tree, True, aggregator.exclude)]
+        assert [r.target for r in results] == [str(p) for p in expected]
+
+    def test_fail_fast_stops_scheduling(self, tree):
+        """Test no new files start after a CRITICAL finding."""
+        orchestrator = FakeOrchestrator(critical_files={"a.py"})
+        aggregator = ResultAggregator(orchestrator, max_workers=1)
+
+        results = aggregator._validate_directory(tree, "standard", recursive=True, fail_fast=True)
+
+        assert orchestrator.validated == ["a.py"]
+        assert results[0].status == "FAIL"
+
+    def test_progress_callback(self, tree):
+        """Test progress is reported once per file."""
+        calls = []
+        aggregator = ResultAggregator(FakeOrchestrator(), max_workers=2)
+
+        aggregator.run_all_validators(
+            str(tree), progress_callback=lambda done, seen, path: calls.append((done, seen))
+        )
+
+        assert [done for done, _ in calls] == list(range(1, 9))
+        assert all(done <= seen for done, seen in calls)
+
+
+class SlowAgentOrchestrator(ValidationOrchestrator):
+    """Real generate_text over a call() that reports the settings it ran with."""
+
+    def __init__(self):
+        # Skip ResilientBaseAgent/session setup: only generate_text and stats are exercised
+        self.model = "shared-model"
+        self.temperature = 0.2
+        self.max_tokens = 1000
+        self.enable_fallback = True
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def call(self, prompt, cache_prefix=None):
+        before = (self.model, self.temperature, self.max_tokens, self.enable_fallback)
+        time.sleep(0.01)  # let other threads enter generate_text
+        after = (self.model, self.temperature, self.max_tokens, self.enable_fallback)
+        return SimpleNamespace(output=repr((before, after)))
+
+
+class TestSharedOrchestrator:
+    """Test one orchestrator serving concurrent directory workers."""
+
+    def test_concurrent_generate_text_keeps_settings_per_call(self):
+        """Test each thread's call sees only its own model, temperature and max_tokens."""
+        orchestrator = SlowAgentOrchestrator()
+
+        def generate(i):
+            return orchestrator.generate_text("p", model=f"model-{i}", temperature=i / 10, max_tokens=i)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outputs = list(pool.map(generate, range(16)))
+
+        for i, output in enumerate(outputs):
+            expected = (f"model-{i}", i / 10, i, False)
+            assert eval(output) == (expected, expected)
+        assert (orchestrator.model, orchestrator.temperature,
+                orchestrator.max_tokens, orchestrator.enable_fallback) == ("shared-model", 0.2, 1000, True)
+
+    def test_stats_updates_are_not_lost(self):
+        """Test concurrent stats updates all land."""
+        orchestrator = SlowAgentOrchestrator()
+
+        def record(_):
+            for _ in range(1000):
+                orchestrator._record_stats(total_validations=1, total_cost=0.001)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(record, range(8)))
+
+        stats = orchestrator.get_execution_stats()
+        assert stats["total_validations"] == 8000
+        assert stats["total_cost_usd"] == pytest.approx(8.0)
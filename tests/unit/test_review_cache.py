@@ -0,0 +1,247 @@
+"""
+Unit Tests for the Incremental Code Review Cache
+
+Tests utils.review_cache: AST-normalised unit splitting, reuse of findings
+for unchanged units with rebased line numbers, and CriticOrchestrator
+incremental reviews.
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.response_cache import ResponseCache
+from utils.review_cache import ReviewCache, split_code_units, shift_finding
+from critic_orchestrator import CriticOrchestrator
+
+
+CODE_V1 = '''import os
+
+
+def load(path):
+    return open(path).read()
+
+
+class Store:
+    def get(self, key):
+        return os.environ[key]
+'''
+
+# Same as V1 with a new helper inserted above Store, plus a trailing comment
+CODE_V2 = '''import os
+
+
+def load(path):
+    return open(path).read()  # read the file
+
+
+def save(path, data):
+    open(path, "w").write(data)
+
+
+class Store:
+    def get(self, key):
+        return os.environ[key]
+'''
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReviewCache(ResponseCache(db_path=str(tmp_path / "cache.db")))
+
+
+# Module-level statements separated by a function
+CODE_SPLIT_MODULE = '''import os
+
+
+def helper():
+    x = 1
+    y = 2
+    z = 3
+    return x + y + z
+
+
+x = eval(input())
+'''
+
+
+class TestSplitCodeUnits:
+    """Test unit splitting and hashing."""
+
+    def test_units_cover_top_level_definitions(self):
+        """Test functions, classes and module statements become units."""
+        units = split_code_units(CODE_V1)
+
+        assert [u.name for u in units] == ["<module>", "load", "Store"]
+        assert units[1].start_line == 4
+        assert units[2].source.startswith("class Store")
+
+    def test_hash_ignores_comments_and_position(self):
+        """Test comment edits and moved code keep the same digest."""
+        v1 = {u.name: u for u in split_code_units(CODE_V1)}
+        v2 = {u.name: u for u in split_code_units(CODE_V2)}
+
+        assert v1["load"].digest == v2["load"].digest
+        assert v1["Store"].digest == v2["Store"].digest
+        assert v2["Store"].start_line != v1["Store"].start_line
+
+    def test_line_layout_changes_digest(self):
+        """Test inserting lines inside a unit invalidates it (cached lines would drift)."""
+        v1 = split_code_units(CODE_V1)[1]
+        v2 = split_code_units(CODE_V1.replace("def load(path):\n", "def load(path):\n    # note\n"))[1]
+
+        assert v1.name == v2.name == "load"
+        assert v1.digest != v2.digest
+
+    def test_unparsable_code_is_one_unit(self):
+        """Test non-Python code falls back to a single text unit."""
+        units = split_code_units("function f() { return 1; }")
+
+        assert len(units) == 1
+        assert units[0].kind == "text"
+
+    def test_module_unit_maps_non_adjacent_statements(self):
+        """Test the module unit counts and maps only its own lines."""
+        module = {u.name: u for u in split_code_units(CODE_SPLIT_MODULE)}["<module>"]
+
+        assert module.source == "import os\nx = eval(input())"
+        assert module.line_count == 2
+        assert [module.original_line(i) for i in (1, 2)] == [1, 11]
+
+    def test_shift_finding_string_and_dict_locations(self):
+        """Test line numbers are rebased in both location formats."""
+        assert shift_finding({"location": "app.py:3-5"}, 10)["location"] == "app.py:13-15"
+        assert shift_finding({"location": {"line": 2}}, -1)["location"] == {"line": 1}
+
+    def test_shift_finding_leaves_column_alone(self):
+        """Test only the line of a file:line:col location is shifted."""
+        assert shift_finding({"location": "app.py:42:5"}, 10)["location"] == "app.py:52:5"
+
+
+class TestReviewCache:
+    """Test plan/record/merge."""
+
+    def test_only_changed_units_are_planned(self, cache):
+        """Test a second version re-reviews only the new unit."""
+        first = cache.plan(CODE_V1, "security-critic")
+        cache.record(first, [], 90, "GOOD")
+
+        second = cache.plan(CODE_V2, "security-critic")
+
+        assert [u.name for u in second.changed] == ["save"]
+        assert second.snippet.startswith("def save")
+        assert cache.get_stats()["units_reused"] == 3
+
+    def test_reused_findings_follow_moved_code(self, cache):
+        """Test cached findings are rebased to the unit's new position."""
+        first = cache.plan(CODE_V1, "security-critic")
+        store_line = split_code_units(CODE_V1)[2].start_line
+        # Finding on the Store.get body, in snippet coordinates
+        snippet_line = first.snippet.splitlines().index("        return os.environ[key]") + 1
+        cache.record(first, [{"title": "env", "location": {"line": snippet_line}}], 70, "FAIR")
+
+        second = cache.plan(CODE_V2, "security-critic")
+        cache.record(second, [], 100, "EXCELLENT")
+        merged = cache.merge(second)
+
+        new_store_line = {u.name: u for u in second.units}["Store"].start_line
+        assert merged.findings == [
+            {"title": "env", "location": {"line": new_store_line + 2}}
+        ]
+        assert new_store_line > store_line
+        assert "FAIR" in merged.labels
+
+    def test_first_review_sends_file_in_original_order(self, cache):
+        """Test a plan where every unit changed sends the code as written."""
+        plan = cache.plan(CODE_SPLIT_MODULE, "security-critic")
+
+        assert plan.snippet == CODE_SPLIT_MODULE
+
+    def test_module_findings_keep_original_lines(self, cache):
+        """Test a finding on a late module statement is reported on its own line."""
+        first = cache.plan(CODE_SPLIT_MODULE, "security-critic")
+        cache.record(first, [{"title": "eval", "location": {"line": 11}}], 40, "POOR")
+        assert cache.merge(first).findings == [{"title": "eval", "location": {"line": 11}}]
+
+        # Editing the helper re-reviews it alone; the cached module finding stays put
+        edited = CODE_SPLIT_MODULE.replace("z = 3", "z = 4")
+        second = cache.plan(edited, "security-critic")
+        cache.record(second, [], 100, "EXCELLENT")
+
+        assert [u.name for u in second.changed] == ["helper"]
+        assert cache.merge(second).findings == [{"title": "eval", "location": {"line": 11}}]
+
+    def test_reviewers_are_isolated(self, cache):
+        """Test one reviewer's cache does not satisfy another."""
+        cache.record(cache.plan(CODE_V1, "security-critic"), [], 90)
+
+        assert len(cache.plan(CODE_V1, "performance-critic").changed) == 3
+
+
+class StubCostTracker:
+    total_cost = 0.0
+
+
+class RecordingCritic:
+    """Critic that records prompts and flags every 'open(' line."""
+
+    def __init__(self):
+        self.prompts = []
+        self.cost_tracker = StubCostTracker()
+
+    def execute(self, task, context):
+        self.prompts.append(task)
+        code = task.split("```\n", 1)[1].split("\n```", 1)[0]
+        findings = [
+            {"severity": "HIGH", "title": "unsafe open", "location": {"line": i + 1}}
+            for i, line in enumerate(code.splitlines()) if "open(" in line
+        ]
+        return json.dumps({"overall_score": 80, "grade": "GOOD", "findings": findings})
+
+
+class TestIncrementalCriticReview:
+    """Test CriticOrchestrator with a review cache."""
+
+    def make_orchestrator(self, cache):
+        orchestrator = CriticOrchestrator.__new__(CriticOrchestrator)
+        orchestrator.max_concurrency = 1
+        orchestrator.critic_timeout = None
+        orchestrator.review_cache = cache
+        orchestrator.emitter = None
+        orchestrator._critic_agents = {"security-critic": RecordingCritic()}
+        return orchestrator
+
+    def test_second_review_sends_only_changed_units(self, cache):
+        """Test unchanged units are not re-sent and findings are merged."""
+        orchestrator = self.make_orchestrator(cache)
+        critic = orchestrator._critic_agents["security-critic"]
+
+        orchestrator.review_code(CODE_V1, critics=["security-critic"])
+        result = orchestrator.review_code(CODE_V2, critics=["security-critic"])["security-critic"]
+
+        assert "def save" in critic.prompts[1]
+        assert "def load" not in critic.prompts[1]
+
+        open_lines = sorted(
+            i + 1 for i, line in enumerate(CODE_V2.splitlines()) if "open(" in line
+        )
+        assert sorted(f["location"]["line"] for f in result.findings) == open_lines
+        assert result.statistics["high"] == 2
+        assert result.metrics["incremental"]["units_reused"] == 3
+
+    def test_unchanged_code_makes_no_call(self, cache):
+        """Test an identical re-review is served entirely from the cache."""
+        orchestrator = self.make_orchestrator(cache)
+        critic = orchestrator._critic_agents["security-critic"]
+
+        first = orchestrator.review_code(CODE_V1, critics=["security-critic"])["security-critic"]
+        again = orchestrator.review_code(CODE_V1, critics=["security-critic"])["security-critic"]
+
+        assert len(critic.prompts) == 1
+        assert again.findings == first.findings
+        assert again.overall_score == 80
+        assert again.grade == "GOOD"
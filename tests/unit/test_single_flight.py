@@ -0,0 +1,197 @@
+"""
+Unit Tests for Request Coalescing
+
+Tests utils.single_flight.SingleFlight for the sync (threaded) and async
+paths, error propagation and hit counters.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.single_flight import (
+    SingleFlight,
+    request_key,
+    get_default_single_flight,
+    reset_default_single_flight,
+)
+
+
+class TestRequestKey:
+    """Test request key construction."""
+
+    def test_key_is_order_independent(self):
+        """Test that field order does not change the key."""
+        assert request_key(model="m", prompt="p") == request_key(prompt="p", model="m")
+
+    def test_key_changes_with_fields(self):
+        """Test that different requests get different keys."""
+        assert request_key(model="m", temperature=0.0) != request_key(model="m", temperature=0.7)
+
+
+class TestSyncSingleFlight:
+    """Test threaded coalescing."""
+
+    def test_concurrent_identical_calls_share_one_upstream(self):
+        """Test that concurrent identical calls only run fn once."""
+        group = SingleFlight()
+        upstream = []
+        release = threading.Event()
+
+        def fn():
+            upstream.append(1)
+            release.wait(timeout=5)
+            return "answer"
+
+        results = []
+
+        def worker():
+            results.append(group.do("k", fn))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+
+        # Wait until every follower has joined the in-flight call
+        deadline = time.time() + 5
+        while group.coalesced_calls < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(upstream) == 1
+        assert [r for r, _ in results] == ["answer"] * 5
+        assert sum(1 for _, shared in results if shared) == 4
+        assert group.get_stats()["upstream_calls"] == 1
+        assert group.get_stats()["coalesced_calls"] == 4
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test that completed calls are released (not a cache)."""
+        group = SingleFlight()
+        calls = []
+
+        group.do("k", lambda: calls.append(1))
+        group.do("k", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert group.in_flight() == 0
+
+    def test_errors_propagate(self):
+        """Test that the leader's exception is raised."""
+        group = SingleFlight()
+
+        def fail():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            group.do("k", fail)
+        assert group.in_flight() == 0
+
+
+class TestAsyncSingleFlight:
+    """Test asyncio coalescing."""
+
+    def test_concurrent_identical_coroutines_share_one_upstream(self):
+        """Test that concurrent identical awaits run fn once."""
+        group = SingleFlight()
+        upstream = []
+
+        async def fn():
+            upstream.append(1)
+            await asyncio.sleep(0.05)
+            return {"result": "ok"}
+
+        async def main():
+            return await asyncio.gather(*(group.ado("k", fn) for _ in range(4)))
+
+        results = asyncio.run(main())
+
+        assert len(upstream) == 1
+        assert all(r == {"result": "ok"} for r, _ in results)
+        assert sum(1 for _, shared in results if shared) == 3
+
+    def test_async_errors_propagate_to_waiters(self):
+        """Test that waiters receive the leader's exception."""
+        group = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("bad")
+
+        async def main():
+            return await asyncio.gather(
+                *(group.ado("k", fn) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert group.in_flight() == 0
+
+    def test_cancelled_leader_hands_over_to_a_waiter(self):
+        """Test cancelling the leader re-runs the call for waiters instead of cancelling them."""
+        group = SingleFlight()
+        upstream = []
+
+        async def fn():
+            upstream.append(1)
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        async def main():
+            leader = asyncio.create_task(group.ado("k", fn))
+            await asyncio.sleep(0)
+            waiters = [asyncio.create_task(group.ado("k", fn)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*waiters)
+            return leader, results
+
+        leader, results = asyncio.run(main())
+
+        assert leader.cancelled()
+        assert [r for r, _ in results] == ["ok"] * 3
+        assert sorted(shared for _, shared in results) == [False, True, True]
+        assert len(upstream) == 2
+        assert group.get_stats()["upstream_calls"] == 2
+        assert group.get_stats()["coalesced_calls"] == 2
+        assert group.in_flight() == 0
+
+
+class TestDefaultGroup:
+    """Test process-wide default group."""
+
+    def test_default_group_is_singleton(self):
+        """Test default group is shared and resettable."""
+        reset_default_single_flight()
+        first = get_default_single_flight()
+
+        assert get_default_single_flight() is first
+
+        reset_default_single_flight()
+        assert get_default_single_flight() is not first
+
+    def test_concurrent_first_use_creates_one_group(self):
+        """Test threads racing on first use all get the same group."""
+        reset_default_single_flight()
+        barrier = threading.Barrier(8)
+        groups = []
+
+        def fetch():
+            barrier.wait()
+            groups.append(get_default_single_flight())
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(g) for g in groups}) == 1
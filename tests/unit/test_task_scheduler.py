@@ -0,0 +1,183 @@
+"""
+Unit Tests for the Resource-Aware Task Scheduler
+
+Tests that dependent tasks run concurrently in critical-path time within
+the concurrency bound and resource capacity, that results stream back as
+tasks finish, and that failed, infeasible and cyclic tasks are reported
+without running.
+"""
+
+import asyncio
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from task_scheduler import ResourcePool, TaskScheduler
+
+
+UNIT = 0.02  # seconds per unit of task "time"
+
+
+def task(task_id, time=1, dependencies=(), **extra):
+    return {"id": task_id, "time": time, "dependencies": list(dependencies), **extra}
+
+
+class Recorder:
+    """execute() that sleeps for the task's time and records concurrency."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.started = []
+
+    async def __call__(self, task):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.append(task["id"])
+        try:
+            await asyncio.sleep(task["time"] * UNIT)
+        finally:
+            self.active -= 1
+        if task["id"] in self.fail:
+            raise RuntimeError("boom")
+        return {"task_id": task["id"], "success": True, "time": task["time"]}
+
+
+def run(scheduler, tasks, execute, **kwargs):
+    async def collect():
+        return [result async for result in scheduler.run(tasks, execute, **kwargs)]
+    start = time.perf_counter()
+    results = asyncio.run(collect())
+    return results, time.perf_counter() - start
+
+
+def demand(task):
+    return task.get("resources", {})
+
+
+class TestScheduling:
+    """Test dependency order, concurrency and critical-path time."""
+
+    def test_diamond_runs_in_critical_path_time(self):
+        """Test parallel branches overlap: 1 + 5 + 1 units, not 1 + 5 + 5 + 1."""
+        tasks = [task("a"), task("b", 5, ["a"]), task("c", 5, ["a"]), task("d", 1, ["b", "c"])]
+        execute = Recorder()
+
+        results, elapsed = run(TaskScheduler(max_concurrency=3), tasks, execute)
+
+        assert [r["task_id"] for r in results][0] == "a"
+        assert [r["task_id"] for r in results][-1] == "d"
+        assert execute.peak == 2
+        assert elapsed < 10 * UNIT
+
+    def test_concurrency_bound(self):
+        """Test no more than max_concurrency tasks run at once."""
+        execute = Recorder()
+        scheduler = TaskScheduler(max_concurrency=2)
+
+        results, _ = run(scheduler, [task(str(i)) for i in range(6)], execute)
+
+        assert len(results) == 6
+        assert execute.peak == scheduler.peak_concurrency == 2
+
+    def test_longest_path_admitted_first(self):
+        """Test the head of the longest chain starts before a short independent task."""
+        tasks = [task("short", 1), task("head", 1), task("tail", 5, ["head"])]
+        execute = Recorder()
+
+        run(TaskScheduler(max_concurrency=1), tasks, execute)
+
+        assert execute.started[0] == "head"
+
+    def test_results_stream_before_completion(self):
+        """Test a quick task's result arrives while a slow one is still running."""
+        execute = Recorder()
+
+        async def first_result():
+            stream = TaskScheduler().run([task("quick", 1), task("slow", 20)], execute)
+            result = await stream.__anext__()
+            still_running = execute.active
+            await stream.aclose()
+            return result, still_running
+
+        result, still_running = asyncio.run(first_result())
+
+        assert result["task_id"] == "quick"
+        assert still_running == 1
+
+
+class TestResources:
+    """Test resource-aware admission."""
+
+    def test_shared_resource_serialises_tasks(self):
+        """Test tasks needing the same single agent never overlap, others still do."""
+        tasks = [task("a", resources={"gpu": 1}), task("b", resources={"gpu": 1}), task("c")]
+        execute = Recorder()
+
+        run(TaskScheduler(max_concurrency=3, capacity={"gpu": 1}), tasks, execute, demand=demand)
+
+        assert execute.peak == 2
+
+    def test_small_task_backfills_past_a_blocked_one(self):
+        """Test a ready task that fits starts while a larger one waits for capacity."""
+        tasks = [task("hog", 2, resources={"mem": 3}), task("big", 5, resources={"mem": 2}),
+                 task("small", 1, resources={"mem": 1})]
+        execute = Recorder()
+
+        run(TaskScheduler(capacity={"mem": 4}), tasks, execute, demand=demand)
+
+        assert execute.started[:2] == ["big", "small"]
+
+    def test_infeasible_demand_fails_without_running(self):
+        """Test a task needing more than exists fails and its dependents are skipped."""
+        tasks = [task("a", resources={"gpu": 2}), task("b", 1, ["a"]), task("c")]
+        execute = Recorder()
+
+        results, _ = run(TaskScheduler(capacity={"gpu": 1}), tasks, execute, demand=demand)
+        by_id = {r["task_id"]: r for r in results}
+
+        assert execute.started == ["c"]
+        assert by_id["a"]["error"] == "Insufficient resources: gpu"
+        assert by_id["b"]["error"] == "Dependency failed: a"
+
+    def test_pool_ignores_unlisted_resources(self):
+        """Test resources without a capacity are unlimited."""
+        pool = ResourcePool({"gpu": 1})
+        pool.acquire({"gpu": 1, "cpu": 100})
+
+        assert pool.available({"cpu": 1000})
+        assert not pool.available({"gpu": 1})
+        assert pool.shortfall({"gpu": 2, "cpu": 1000}) == ["gpu"]
+
+
+class TestFailures:
+    """Test failures, cycles and unknown dependencies."""
+
+    def test_exception_fails_task_and_skips_dependents(self):
+        """Test a raising task is reported and its dependents never start."""
+        tasks = [task("a"), task("b", 1, ["a"]), task("c", 1, ["b"]), task("d")]
+        execute = Recorder(fail={"a"})
+
+        results, _ = run(TaskScheduler(), tasks, execute)
+        by_id = {r["task_id"]: r for r in results}
+
+        assert sorted(execute.started) == ["a", "d"]
+        assert by_id["a"] == {"task_id": "a", "success": False, "time": 0, "error": "boom"}
+        assert by_id["c"]["error"] == "Dependency failed: b"
+        assert by_id["d"]["success"]
+
+    def test_cycles_fail_and_unknown_dependencies_are_ignored(self):
+        """Test cyclic tasks fail without running and outside ids do not block."""
+        tasks = [task("x", 1, ["y"]), task("y", 1, ["x"]), task("z", 1, ["elsewhere"])]
+        execute = Recorder()
+
+        results, _ = run(TaskScheduler(), tasks, execute)
+        by_id = {r["task_id"]: r for r in results}
+
+        assert execute.started == ["z"]
+        assert len(results) == 3
+        assert not by_id["x"]["success"] and not by_id["y"]["success"]
@@ -0,0 +1,117 @@
+"""
+Unit Tests for TierPredictor
+
+Tests task features, per-tier logistic regression, tier-skip
+recommendations and training from recorded workflow history.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tier_predictor import TierPredictor
+from workflow_metrics import WorkflowMetrics
+
+
+TIERS = ["Haiku", "Sonnet", "Opus"]
+
+HARD = "Design a distributed microservice architecture with kubernetes deployment"
+EASY = "Write a simple python function to reverse a string"
+
+
+def history(repeats=6):
+    """Haiku passes easy tasks and fails hard ones; Sonnet passes both."""
+    examples = []
+    for _ in range(repeats):
+        examples += [
+            (EASY, {}, "Haiku", True),
+            (HARD, {}, "Haiku", False),
+            (EASY, {}, "Sonnet", True),
+            (HARD, {}, "Sonnet", True),
+        ]
+    return examples
+
+
+class TestFeatures:
+    """Test feature extraction."""
+
+    def test_task_analyzer_features(self):
+        """Test domains, capabilities and complexity become features."""
+        features = TierPredictor(TIERS).features(HARD, {"language": "Go"})
+
+        assert "domain:architecture" in features
+        assert "cap:kubernetes" in features
+        assert any(f.startswith("complexity:") for f in features)
+        assert "language:go" in features
+
+
+class TestPrediction:
+    """Test learned pass probabilities and skip recommendations."""
+
+    def test_hard_tasks_skip_the_cheap_tier(self):
+        """Test the predictor starts hard tasks at the tier that passes."""
+        predictor = TierPredictor(TIERS)
+        predictor.fit(history())
+
+        assert predictor.predict_proba(HARD)["Haiku"] < 0.3
+        assert predictor.predict_proba(EASY)["Haiku"] > 0.7
+        assert predictor.recommend_start(HARD, {}, TIERS) == "Sonnet"
+        assert predictor.recommend_start(EASY, {}, TIERS) == "Haiku"
+
+    def test_untrained_tiers_are_not_skipped(self):
+        """Test tiers below min_samples report None and are tried."""
+        predictor = TierPredictor(TIERS, min_samples=5)
+        predictor.fit(history(repeats=2))
+
+        assert predictor.predict_proba(HARD)["Haiku"] is None
+        assert predictor.recommend_start(HARD, {}, TIERS) == "Haiku"
+
+    def test_last_candidate_is_never_skipped(self):
+        """Test a failing prediction for every tier still returns the last one."""
+        predictor = TierPredictor(TIERS)
+        predictor.fit([(HARD, {}, tier, False) for tier in TIERS for _ in range(6)])
+
+        assert predictor.recommend_start(HARD, {}, TIERS) == "Opus"
+
+    def test_added_examples_refit_lazily(self):
+        """Test add_example updates predictions on the next call."""
+        predictor = TierPredictor(TIERS, min_samples=1)
+        predictor.add_example(HARD, {}, "Haiku", False)
+
+        assert predictor.predict_proba(HARD)["Haiku"] < 0.5
+
+
+class TestHistory:
+    """Test training from recorded history."""
+
+    def test_fit_history_reads_workflows_and_learning_db(self):
+        """Test progressive workflow attempts and tagged executions become examples."""
+        workflow = WorkflowMetrics(
+            workflow_id="wf_1", task=HARD, timestamp="2024-01-01T00:00:00",
+            success=True, overall_quality_score=90, total_execution_time_ms=1.0,
+            total_cost_usd=0.1, total_tokens=10, total_iterations=2,
+            context={"workflow_metadata": {
+                "workflow_type": "progressive_enhancement",
+                "quality_target": 85,
+                "attempts": [
+                    {"tier": "Haiku", "quality": 60},
+                    {"tier": "Sonnet", "quality": 90},
+                    {"tier": "Opus", "quality": 0, "cancelled": True},
+                ]
+            }}
+        )
+        tracker = SimpleNamespace(workflows=[workflow])
+        learning_db = SimpleNamespace(get_executions=lambda: [
+            SimpleNamespace(task_description=EASY, task_complexity="simple",
+                            outputs={"model_tier": "Haiku"}, success=True),
+            SimpleNamespace(task_description=EASY, task_complexity="simple",
+                            outputs={}, success=True),
+        ])
+
+        predictor = TierPredictor(TIERS)
+
+        assert predictor.fit_history(tracker, learning_db) == 3
+        assert predictor.get_stats()["examples"] == {"Haiku": 2, "Sonnet": 1, "Opus": 0}
@@ -0,0 +1,220 @@
+"""
+Unit Tests for the Claude Code CLI Worker Pool
+
+Tests mcp_bridge.worker_pool.ClaudeWorkerPool against a fake `claude`
+executable that speaks the stream-json session protocol.
+"""
+
+import asyncio
+import os
+import stat
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from mcp_bridge.worker_pool import ClaudeWorkerPool
+
+
+FAKE_CLI = '''#!{python}
+import json, os, sys
+
+args = sys.argv[1:]
+model = args[args.index("--model") + 1]
+system = args[args.index("--system-prompt") + 1] if "--system-prompt" in args else ""
+print(json.dumps({{"type": "system", "subtype": "init", "pid": os.getpid()}}), flush=True)
+
+turn = 0
+for line in sys.stdin:
+    message = json.loads(line)
+    text = message["message"]["content"][0]["text"]
+    turn += 1
+    if text == "crash":
+        sys.stderr.write("simulated crash\\n")
+        sys.exit(3)
+    if text == "unauthorized":
+        print(json.dumps({{"type": "result", "subtype": "success", "is_error": True,
+                          "result": "Invalid API key - please run /login"}}), flush=True)
+        continue
+    print(json.dumps({{"type": "assistant", "message": {{"content": [{{"type": "text", "text": text}}]}}}}), flush=True)
+    print(json.dumps({{
+        "type": "result",
+        "result": f"{{model}}|{{system}}|{{text}}|pid={{os.getpid()}}|turn={{turn}}",
+        "usage": {{"input_tokens": len(text), "output_tokens": 1}}
+    }}), flush=True)
+'''
+
+
+@pytest.fixture
+def fake_claude(tmp_path):
+    """Write an executable fake Claude CLI."""
+    path = tmp_path / "claude"
+    path.write_text(FAKE_CLI.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def make_pool(fake_claude, **kwargs):
+    return ClaudeWorkerPool(fake_claude, env=dict(os.environ), **kwargs)
+
+
+def wait_for_idle(pool, count, timeout=5.0):
+    """Wait for background pre-spawning to finish."""
+    deadline = time.time() + timeout
+    while pool.get_stats()["idle_workers"] < count and time.time() < deadline:
+        time.sleep(0.02)
+
+
+class TestWorkerPool:
+    """Test pooled request handling."""
+
+    def test_request_returns_result_message(self, fake_claude):
+        """Test a request round-trips through a worker."""
+        pool = make_pool(fake_claude, warm_workers=0)
+        try:
+            result = pool.request("sonnet", "be brief", "hello")
+
+            assert result["type"] == "result"
+            assert result["result"].startswith("sonnet|be brief|hello|")
+            assert result["usage"]["input_tokens"] == 5
+        finally:
+            pool.shutdown()
+
+    def test_second_request_uses_warm_worker(self, fake_claude):
+        """Test spares are pre-spawned and reused."""
+        pool = make_pool(fake_claude, warm_workers=1)
+        try:
+            pool.request("sonnet", None, "one")
+            wait_for_idle(pool, 1)
+            pool.request("sonnet", None, "two")
+
+            stats = pool.get_stats()
+            assert stats["cold_starts"] == 1
+            assert stats["warm_hits"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_isolated_by_default(self, fake_claude):
+        """Test each request gets a fresh session (turn 1) by default."""
+        pool = make_pool(fake_claude, warm_workers=0)
+        try:
+            first = pool.request("sonnet", None, "a")
+            second = pool.request("sonnet", None, "b")
+
+            assert "turn=1" in first["result"]
+            assert "turn=1" in second["result"]
+            assert pool.get_stats()["recycled"] == 2
+        finally:
+            pool.shutdown()
+
+    def test_recycle_after_n_calls(self, fake_claude):
+        """Test a session worker is reused until max_calls_per_worker."""
+        pool = make_pool(fake_claude, warm_workers=0, max_calls_per_worker=2)
+        try:
+            first = pool.request("sonnet", None, "a")
+            second = pool.request("sonnet", None, "b")
+            third = pool.request("sonnet", None, "c")
+
+            pid = lambda r: r["result"].split("pid=")[1].split("|")[0]
+            assert pid(first) == pid(second)
+            assert "turn=2" in second["result"]
+            assert pid(third) != pid(first)
+        finally:
+            pool.shutdown()
+
+    def test_worker_crash_raises_and_is_discarded(self, fake_claude):
+        """Test a crashed worker surfaces stderr and is not reused."""
+        pool = make_pool(fake_claude, warm_workers=0, max_calls_per_worker=5)
+        try:
+            with pytest.raises(RuntimeError, match="simulated crash"):
+                pool.request("sonnet", None, "crash")
+
+            assert pool.get_stats()["failures"] == 1
+            assert pool.request("sonnet", None, "ok")["result"].startswith("sonnet||ok")
+        finally:
+            pool.shutdown()
+
+    def test_error_result_raises(self, fake_claude):
+        """Test an is_error result (e.g. auth failure) raises instead of returning text."""
+        pool = make_pool(fake_claude, warm_workers=0)
+        try:
+            with pytest.raises(RuntimeError, match="Invalid API key"):
+                pool.request("sonnet", None, "unauthorized")
+
+            assert pool.get_stats()["failures"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_async_requests_run_concurrently(self, fake_claude):
+        """Test arequest multiplexes callers over the pool."""
+        pool = make_pool(fake_claude, max_workers=3, warm_workers=0)
+
+        async def main():
+            return await asyncio.gather(
+                *(pool.arequest("opus", None, f"q{i}") for i in range(6))
+            )
+
+        try:
+            results = asyncio.run(main())
+
+            assert sorted(r["result"].split("|")[2] for r in results) == [f"q{i}" for i in range(6)]
+            assert pool.get_stats()["requests"] == 6
+        finally:
+            pool.shutdown()
+
+    def test_health_check_prunes_dead_workers(self, fake_claude):
+        """Test dead idle workers are dropped."""
+        pool = make_pool(fake_claude, warm_workers=1)
+        try:
+            pool.request("sonnet", None, "warm up")
+            wait_for_idle(pool, 1)
+            for workers in pool._idle.values():
+                for worker in workers:
+                    worker.process.kill()
+                    worker.process.wait()
+
+            stats = pool.health_check()
+
+            assert stats["idle_workers"] == 0
+            assert stats["dead_workers"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_idle_workers_reaped_on_request_path(self, fake_claude):
+        """Test a request for one key reaps another key's long-idle spare."""
+        pool = make_pool(fake_claude, warm_workers=1, idle_timeout=0.2)
+        try:
+            pool.request("sonnet", None, "warm up")
+            wait_for_idle(pool, 1)
+            spare = pool._idle[("sonnet", None)][0]
+            time.sleep(0.3)
+
+            pool.request("opus", None, "other key")
+
+            assert ("sonnet", None) not in {k for k, ws in pool._idle.items() if ws}
+            spare.process.wait(timeout=5)
+        finally:
+            pool.shutdown()
+
+    def test_evicted_worker_closed_outside_lock(self, fake_claude):
+        """Test parking past the idle bound closes the evicted worker without the pool lock."""
+        pool = make_pool(fake_claude, max_workers=1, warm_workers=0, max_calls_per_worker=2)
+        try:
+            pool.request("sonnet", None, "a")
+            pool.request("opus", None, "b")  # second idle worker exceeds max_workers
+            evicted = []
+            for worker in [w for ws in pool._idle.values() for w in ws]:
+                original = worker.close
+                def close(original=original):
+                    evicted.append(pool._lock.locked())
+                    original()
+                worker.close = close
+
+            pool.request("haiku", None, "c")
+
+            assert evicted == [False]
+        finally:
+            pool.shutdown()
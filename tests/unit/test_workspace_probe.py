@@ -0,0 +1,159 @@
+"""
+Unit Tests for the Incremental Workspace Probe
+
+Tests the TTL/fingerprint cache, that snapshots only re-read changed files
+and only re-run git when the tree or git metadata moved, and that results
+match a full rescan.
+"""
+
+import os
+import shutil
+import subprocess
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from workspace_probe import TTLCache, WorkspaceProbe
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def touch(path, content):
+    """Write a file and move its mtime forward so the change is visible."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    mtime = max(previous + 10**9, path.stat().st_mtime_ns)
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    touch(tmp_path / "app.py", "x = 1  # TODO: tidy\n")
+    touch(tmp_path / "pkg" / "util.py", "def f():\n    pass  # FIXME later\n")
+    touch(tmp_path / "README.md", "TODO: not python\n")
+    return tmp_path
+
+
+def probe(root):
+    return WorkspaceProbe(root, ttl=0)
+
+
+class TestTTLCache:
+    """Test expiry by age and by fingerprint."""
+
+    def test_expires_after_ttl_and_on_fingerprint_change(self):
+        """Test entries are served until the TTL passes or the fingerprint differs."""
+        clock = FakeClock()
+        cache = TTLCache(5.0, clock=clock)
+        cache.put("k", "v", fingerprint=(1, 2))
+
+        assert cache.get("k", fingerprint=(1, 2)) == "v"
+        assert cache.get("k", fingerprint=(1, 3)) is None
+        clock.now = 5.0
+        assert cache.get("k", fingerprint=(1, 2)) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+class TestIncrementalScan:
+    """Test only changed files are re-read."""
+
+    def test_todos_match_grep_format(self, workspace):
+        """Test TODO/FIXME lines come back as ./path:line for .py files only."""
+        data = probe(workspace).snapshot()
+
+        assert data["todo_comments"].splitlines() == [
+            "./app.py:x = 1  # TODO: tidy",
+            "./pkg/util.py:    pass  # FIXME later",
+        ]
+
+    def test_unchanged_tree_reads_nothing(self, workspace):
+        """Test a second snapshot re-reads no files and keeps the tree version."""
+        scanner = probe(workspace)
+        scanner.snapshot()
+        version, reads = scanner.tree_version, scanner.files_read
+
+        scanner.snapshot()
+
+        assert (scanner.tree_version, scanner.files_read) == (version, reads)
+
+    def test_edits_additions_and_deletions_are_picked_up(self, workspace):
+        """Test only the edited and new files are read and deleted files drop out."""
+        scanner = probe(workspace)
+        scanner.snapshot()
+        reads = scanner.files_read
+
+        touch(workspace / "app.py", "x = 2\n")
+        touch(workspace / "pkg" / "new.py", "# TODO: new\n")
+        (workspace / "pkg" / "util.py").unlink()
+        data = scanner.snapshot()
+
+        assert scanner.files_read == reads + 2
+        assert data["todo_comments"] == "./pkg/new.py:# TODO: new\n"
+        assert data == probe(workspace).snapshot()
+
+    def test_skip_dirs_and_limit(self, workspace):
+        """Test skipped directories are not walked and output is truncated."""
+        touch(workspace / "node_modules" / "dep.py", "# TODO: vendored\n")
+        scanner = WorkspaceProbe(workspace, ttl=0, todo_limit=20)
+
+        todos = scanner.snapshot()["todo_comments"]
+
+        assert todos == "./app.py:x = 1  # TO"
+        assert not any("node_modules" in path for path in scanner._files)
+
+    def test_snapshot_reused_within_ttl(self, workspace):
+        """Test a snapshot inside the TTL does not touch the filesystem."""
+        scanner = WorkspaceProbe(workspace, ttl=60)
+        first = scanner.snapshot()
+        touch(workspace / "app.py", "# TODO: changed\n")
+
+        assert scanner.snapshot() is first
+        scanner.invalidate()
+        assert "changed" in scanner.snapshot()["todo_comments"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitCaching:
+    """Test git only runs when the tree or git metadata changed."""
+
+    @pytest.fixture
+    def repo(self, workspace):
+        def git(*args):
+            subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                           cwd=workspace, check=True, capture_output=True)
+        git("init", "-q")
+        git("add", "-A")
+        git("commit", "-q", "-m", "initial")
+        return workspace, git
+
+    def test_git_reruns_only_on_change(self, repo):
+        """Test idle snapshots run no git, an edit reruns status and a commit reruns log."""
+        workspace, git = repo
+        scanner = probe(workspace)
+        first = scanner.snapshot()
+        assert first["git_status"] == ""
+        assert "initial" in first["recent_commits"]
+
+        runs = scanner.git_runs
+        scanner.snapshot()
+        assert scanner.git_runs == runs
+
+        touch(workspace / "app.py", "x = 3\n")
+        edited = scanner.snapshot()
+        assert edited["git_status"].strip() == "M app.py"
+        assert scanner.git_runs == runs + 1
+
+        git("commit", "-q", "-am", "second")
+        committed = scanner.snapshot()
+        assert committed["git_status"] == ""
+        assert committed["recent_commits"].splitlines()[0].endswith("second")
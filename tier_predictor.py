@@ -0,0 +1,273 @@
+"""
+Tier Predictor - Learned Tier Skipping for Progressive Enhancement
+
+Predicts which model tier will meet the quality target for a task, so the
+progressive workflow can start there instead of paying latency and tokens
+for tiers that historically fail on similar tasks.
+
+Model:
+- Features: TaskAnalyzer domains, detected capabilities and complexity,
+  plus language / task_type hints from the context
+- One logistic regression per tier (sparse binary features, L2-regularised,
+  batch gradient descent; no numpy required)
+- A tier is skipped only when it has enough history and its predicted pass
+  probability is below skip_below; the last candidate tier is never skipped
+
+Training data:
+- WorkflowMetricsTracker: attempts recorded by progressive workflows
+  (pass = attempt quality >= that workflow's quality target)
+- LearningDatabase: executions whose outputs["model_tier"] names a tier
+  (pass = execution.success)
+
+Usage:
+    predictor = TierPredictor([tier.name for tier in MODEL_TIERS])
+    predictor.fit_history(metrics_tracker, learning_db)
+
+    start = predictor.recommend_start(task, context, ["Haiku", "Sonnet", "Opus"])
+"""
+
+import math
+import re
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    from .dynamic_spawner import TaskAnalyzer
+except ImportError:
+    try:
+        from dynamic_spawner import TaskAnalyzer
+    except ImportError:
+        TaskAnalyzer = None
+
+logger = logging.getLogger(__name__)
+
+# (task, context, tier name, passed)
+TierExample = Tuple[str, Dict[str, Any], str, bool]
+
+
+class TierPredictor:
+    """
+    Per-tier logistic regression over task features.
+
+    Attributes:
+        tier_names: Tiers the predictor knows about (cheapest first)
+        min_samples: Examples a tier needs before its prediction is trusted
+        skip_below: Pass probability below which a trained tier is skipped
+    """
+
+    def __init__(self,
+                 tier_names: Sequence[str],
+                 min_samples: int = 5,
+                 skip_below: float = 0.3,
+                 learning_rate: float = 0.5,
+                 epochs: int = 200,
+                 l2: float = 0.01):
+        """
+        Initialize tier predictor.
+
+        Args:
+            tier_names: Tier names, cheapest first
+            min_samples: Minimum examples per tier before predicting
+            skip_below: Skip a tier when its pass probability is below this
+            learning_rate: Gradient descent step size
+            epochs: Gradient descent passes per fit
+            l2: L2 regularisation strength
+        """
+        if not 0.0 <= skip_below <= 1.0:
+            raise ValueError(f"skip_below must be in [0, 1], got {skip_below}")
+
+        self.tier_names = list(tier_names)
+        self.min_samples = min_samples
+        self.skip_below = skip_below
+        self.learning_rate = learning_rate
+        self.epochs = epochs
+        self.l2 = l2
+
+        self.analyzer = TaskAnalyzer() if TaskAnalyzer is not None else None
+
+        self._examples: Dict[str, List[Tuple[Set[str], bool]]] = {name: [] for name in self.tier_names}
+        self._weights: Dict[str, Dict[str, float]] = {}
+        self._bias: Dict[str, float] = {}
+        self._dirty = False
+
+    # ---------------------------------------------------------------- features
+
+    def features(self, task: str, context: Optional[Dict[str, Any]] = None) -> Set[str]:
+        """
+        Binary features for a task.
+
+        Uses TaskAnalyzer domain, capability and complexity detection when
+        available, falling back to the task's longer words otherwise.
+        """
+        context = context or {}
+        task_lower = task.lower()
+        features: Set[str] = set()
+
+        if self.analyzer is not None:
+            domains = self.analyzer._detect_domains(task_lower)
+            capabilities = self.analyzer._detect_capabilities(task_lower, domains)
+            complexity = self.analyzer._assess_complexity(task_lower, domains, capabilities)
+            features.update(f"domain:{domain.value}" for domain in domains)
+            features.update(f"cap:{capability}" for capability in capabilities)
+            features.add(f"complexity:{complexity.value}")
+        else:
+            features.update(f"word:{word}" for word in re.findall(r"[a-z]{4,}", task_lower))
+
+        for key in ("language", "task_type", "complexity"):
+            if context.get(key):
+                features.add(f"{key}:{str(context[key]).lower()}")
+
+        return features
+
+    # ---------------------------------------------------------------- training
+
+    def add_example(self, task: str, context: Optional[Dict[str, Any]], tier: str, passed: bool) -> None:
+        """Record one tier outcome; the model refits lazily on next prediction."""
+        if tier not in self._examples:
+            return
+        self._examples[tier].append((self.features(task, context), bool(passed)))
+        self._dirty = True
+
+    def fit(self, examples: Iterable[TierExample]) -> int:
+        """
+        Add examples and refit.
+
+        Returns:
+            Number of examples added
+        """
+        count = 0
+        for task, context, tier, passed in examples:
+            if tier in self._examples:
+                self.add_example(task, context, tier, passed)
+                count += 1
+        self._refit()
+        return count
+
+    def fit_history(self, metrics_tracker=None, learning_db=None) -> int:
+        """
+        Train on recorded history.
+
+        Args:
+            metrics_tracker: WorkflowMetricsTracker with progressive workflows
+            learning_db: LearningDatabase whose executions carry
+                outputs["model_tier"]
+
+        Returns:
+            Number of examples added
+        """
+        examples: List[TierExample] = []
+
+        if metrics_tracker is not None:
+            for workflow in metrics_tracker.workflows:
+                context = dict(workflow.context or {})
+                metadata = context.pop("workflow_metadata", None) or {}
+                if metadata.get("workflow_type") != "progressive_enhancement":
+                    continue
+                target = metadata.get("quality_target", 0)
+                for attempt in metadata.get("attempts", []):
+                    if attempt.get("cancelled"):
+                        continue
+                    examples.append((workflow.task, context, attempt["tier"],
+                                     attempt.get("quality", 0) >= target))
+
+        if learning_db is not None:
+            for execution in learning_db.get_executions():
+                tier = (execution.outputs or {}).get("model_tier")
+                if tier:
+                    context = {"complexity": execution.task_complexity}
+                    examples.append((execution.task_description, context, tier, bool(execution.success)))
+
+        count = self.fit(examples)
+        logger.info(f"TierPredictor trained on {count} tier outcomes")
+        return count
+
+    def _refit(self) -> None:
+        for tier, examples in self._examples.items():
+            if examples:
+                self._weights[tier], self._bias[tier] = self._train(examples)
+        self._dirty = False
+
+    def _train(self, examples: List[Tuple[Set[str], bool]]) -> Tuple[Dict[str, float], float]:
+        """Batch gradient descent on the logistic loss."""
+        weights: Dict[str, float] = {}
+        bias = 0.0
+        n = len(examples)
+
+        for _ in range(self.epochs):
+            grad: Dict[str, float] = {}
+            grad_bias = 0.0
+            for features, passed in examples:
+                error = self._sigmoid(bias + sum(weights.get(f, 0.0) for f in features)) - passed
+                grad_bias += error
+                for f in features:
+                    grad[f] = grad.get(f, 0.0) + error
+
+            bias -= self.learning_rate * grad_bias / n
+            for f, g in grad.items():
+                w = weights.get(f, 0.0)
+                weights[f] = w - self.learning_rate * (g / n + self.l2 * w)
+
+        return weights, bias
+
+    @staticmethod
+    def _sigmoid(z: float) -> float:
+        if z < -30:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-z))
+
+    # -------------------------------------------------------------- prediction
+
+    def predict_proba(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Optional[float]]:
+        """
+        Pass probability per tier.
+
+        Returns:
+            Dict of tier name -> probability, or None for tiers with fewer
+            than min_samples examples
+        """
+        if self._dirty:
+            self._refit()
+
+        features = self.features(task, context)
+        probabilities: Dict[str, Optional[float]] = {}
+        for tier in self.tier_names:
+            if len(self._examples[tier]) < self.min_samples:
+                probabilities[tier] = None
+                continue
+            weights = self._weights[tier]
+            probabilities[tier] = self._sigmoid(self._bias[tier] + sum(weights.get(f, 0.0) for f in features))
+        return probabilities
+
+    def recommend_start(self,
+                        task: str,
+                        context: Optional[Dict[str, Any]],
+                        candidates: Sequence[str]) -> str:
+        """
+        First candidate tier not predicted to fail.
+
+        Walks candidates cheapest-first and skips a tier only when it is
+        trained and its pass probability is below skip_below. The last
+        candidate is never skipped.
+
+        Args:
+            task: Task description
+            context: Task context
+            candidates: Eligible tier names, cheapest first
+
+        Returns:
+            Name of the tier to start with
+        """
+        probabilities = self.predict_proba(task, context)
+        for tier in candidates[:-1]:
+            probability = probabilities.get(tier)
+            if probability is None or probability >= self.skip_below:
+                return tier
+        return candidates[-1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Example counts per tier."""
+        return {
+            "examples": {tier: len(examples) for tier, examples in self._examples.items()},
+            "task_analyzer": self.analyzer is not None,
+            "skip_below": self.skip_below
+        }
@@ -5,6 +5,10 @@ This package provides shared utilities used across all orchestrators.
 
 Modules:
     model_selector - Centralized model selection and cost estimation
+    single_flight - Coalescing of identical in-flight LLM requests
+    response_cache - Persistent content-addressed LLM response cache
+    review_cache - Incremental, diff-aware per-unit code review cache
+    prompt_cache - Provider-side prompt-prefix caching helpers
 
 Usage:
     from utils import ModelSelector
@@ -16,10 +20,21 @@ Usage:
 """
 
 from utils.model_selector import ModelSelector
+from utils.single_flight import SingleFlight, get_default_single_flight, request_key
+from utils.response_cache import ResponseCache
+from utils.review_cache import ReviewCache, split_code_units
+from utils.prompt_cache import LocalPromptCache
 
 __version__ = "1.0.0"
 
 __all__ = [
     "ModelSelector",
+    "SingleFlight",
+    "get_default_single_flight",
+    "request_key",
+    "ResponseCache",
+    "ReviewCache",
+    "split_code_units",
+    "LocalPromptCache",
     "__version__"
 ]
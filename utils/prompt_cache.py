@@ -0,0 +1,242 @@
+"""
+Provider-Side Prompt-Prefix Caching Helpers
+
+Validator and critic prompts open with thousands of tokens of static
+instructions that are resent verbatim on every call. Anthropic's prompt
+caching lets a request mark the end of a stable prefix with
+``cache_control``; later requests sharing that exact prefix are billed at a
+fraction of the input price and skip re-processing it.
+
+Architecture:
+    - system_blocks() / user_content(): build Messages API payloads with the
+      stable prefix marked, or the plain string when caching doesn't apply
+    - flatten_content(): collapse content blocks back to text for backends
+      that only take strings (the Claude Code CLI bridge)
+    - cache_token_usage(): read cache-read / cache-write token counts from a
+      response's usage, tolerating clients that don't report them
+    - LocalPromptCache: in-process stand-in for a client with prompt caching,
+      for tests and offline runs
+
+Usage:
+    from utils.prompt_cache import user_content, cache_token_usage
+
+    response = client.messages.create(
+        model=model,
+        system=system_blocks(system),
+        messages=[{"role": "user", "content": user_content(prompt, cache_prefix=instructions)}]
+    )
+    cache_read, cache_write = cache_token_usage(response.usage)
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Marker that ends a cacheable prefix (5-minute ephemeral cache)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Providers ignore prefixes below ~1024 tokens; don't mark shorter ones
+# (~4 characters per token) so short prompts keep the plain string payload
+MIN_CACHEABLE_CHARS = 4096
+
+# Ephemeral cache lifetime
+CACHE_TTL_SECONDS = 300
+
+Content = Union[str, List[Dict[str, Any]]]
+
+
+def is_cacheable(text: Optional[str], min_chars: int = MIN_CACHEABLE_CHARS) -> bool:
+    """Whether text is long enough to be worth marking for caching."""
+    return bool(text) and len(text) >= min_chars
+
+
+def system_blocks(system: str, cache: bool = True, min_chars: int = MIN_CACHEABLE_CHARS) -> Content:
+    """
+    Build the ``system`` parameter, marking it cacheable when long enough.
+
+    Args:
+        system: System prompt
+        cache: Whether prompt caching is enabled
+        min_chars: Minimum length worth caching
+
+    Returns:
+        Plain string, or a single text block carrying cache_control
+    """
+    if not cache or not is_cacheable(system, min_chars):
+        return system
+    return [{"type": "text", "text": system, "cache_control": dict(CACHE_CONTROL)}]
+
+
+def user_content(prompt: str,
+                 cache_prefix: Optional[str] = None,
+                 cache: bool = True,
+                 min_chars: int = MIN_CACHEABLE_CHARS) -> Content:
+    """
+    Build user message content with an optional stable prefix marked cacheable.
+
+    The request text is always ``cache_prefix + prompt``; only the payload
+    shape differs.
+
+    Args:
+        prompt: Variable part of the prompt
+        cache_prefix: Static leading part shared across calls
+        cache: Whether prompt caching is enabled
+        min_chars: Minimum prefix length worth caching
+
+    Returns:
+        Plain string, or [prefix block with cache_control, prompt block]
+    """
+    if not cache_prefix:
+        return prompt
+    if not cache or not is_cacheable(cache_prefix, min_chars):
+        return cache_prefix + prompt
+
+    blocks = [{"type": "text", "text": cache_prefix, "cache_control": dict(CACHE_CONTROL)}]
+    if prompt:
+        blocks.append({"type": "text", "text": prompt})
+    return blocks
+
+
+def flatten_content(content: Optional[Content]) -> str:
+    """Join the text of content blocks (strings pass through unchanged)."""
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(getattr(block, "text", ""))
+        for block in content
+    )
+
+
+def cache_token_usage(usage: Any) -> Tuple[int, int]:
+    """
+    Read prompt-cache token counts from a response usage object or dict.
+
+    Returns:
+        (cache_read_tokens, cache_write_tokens), zeros when not reported
+    """
+    def read(name: str) -> int:
+        value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+        return int(value or 0)
+
+    return read("cache_read_input_tokens"), read("cache_creation_input_tokens")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4) if text else 0
+
+
+@dataclass
+class LocalUsage:
+    """Usage reported by LocalPromptCache (Anthropic field names)."""
+    input_tokens: int
+    output_tokens: int
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+
+@dataclass
+class LocalTextBlock:
+    """Text content block."""
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class LocalMessage:
+    """Message returned by LocalPromptCache."""
+    content: List[LocalTextBlock]
+    model: str
+    usage: LocalUsage
+    role: str = "assistant"
+    stop_reason: str = "end_turn"
+
+
+class LocalPromptCache:
+    """
+    In-process stand-in for an Anthropic client with prompt caching.
+
+    Usable anywhere an ``anthropic_client`` / ``client`` is expected
+    (``client.messages.create(...)``). Mirrors the provider's accounting:
+    the request is read as system blocks followed by message blocks; every
+    block carrying cache_control ends a prefix. The longest previously seen,
+    unexpired prefix is a cache read, any longer marked prefix is a cache
+    write, and ``input_tokens`` counts only the uncached remainder.
+
+    Responses come from ``responder(request_kwargs)`` (default: "OK").
+    """
+
+    def __init__(self,
+                 responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 ttl: float = CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize local prompt cache.
+
+        Args:
+            responder: Produces the response text for a request's kwargs
+            ttl: Prefix lifetime in seconds, refreshed on each read
+            clock: Time source (injectable for tests)
+        """
+        self.responder = responder or (lambda request: "OK")
+        self.ttl = ttl
+        self.clock = clock
+        self.messages = self  # client.messages.create(...)
+        self.requests: List[Dict[str, Any]] = []
+
+        self._prefixes: Dict[str, float] = {}  # prefix digest -> expiry
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _blocks(request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        blocks = []
+        for content in [request.get("system")] + [m.get("content") for m in request.get("messages", [])]:
+            if content is None:
+                continue
+            if isinstance(content, str):
+                blocks.append({"type": "text", "text": content})
+            else:
+                blocks.extend(content)
+        return blocks
+
+    def create(self, **request) -> LocalMessage:
+        """Answer a Messages API request, accounting for cached prefixes."""
+        self.requests.append(request)
+        blocks = self._blocks(request)
+
+        now = self.clock()
+        digest = hashlib.sha256()
+        consumed = 0
+        cache_read = 0
+        cache_write = 0
+        with self._lock:
+            for block in blocks:
+                text = block.get("text", "")
+                digest.update(text.encode("utf-8"))
+                consumed += estimate_tokens(text)
+                if "cache_control" not in block:
+                    continue
+                key = digest.hexdigest()
+                if self._prefixes.get(key, 0) > now:
+                    cache_read = consumed
+                    cache_write = 0
+                else:
+                    cache_write = consumed - cache_read
+                self._prefixes[key] = now + self.ttl
+
+        total = sum(estimate_tokens(b.get("text", "")) for b in blocks)
+        output = self.responder(request)
+        return LocalMessage(
+            content=[LocalTextBlock(text=output)],
+            model=request.get("model", ""),
+            usage=LocalUsage(
+                input_tokens=total - cache_read - cache_write,
+                output_tokens=estimate_tokens(output),
+                cache_read_input_tokens=cache_read,
+                cache_creation_input_tokens=cache_write
+            )
+        )
@@ -0,0 +1,306 @@
+"""
+Persistent Content-Addressed LLM Response Cache
+
+Caches LLM responses on disk so repeated deterministic calls (temperature 0
+validators, routers, critics) cost nothing on the next run - e.g. CI
+re-validating unchanged code.
+
+Architecture:
+    - Key: SHA-256 of the normalised request (utils.single_flight.request_key)
+    - Memory LRU (OrderedDict) in front of a SQLite table
+    - Per-agent namespaces so agents can be invalidated independently
+    - TTL expiry on read, size-based LRU eviction on write (memory hits
+      refresh the SQLite access time in batches)
+    - Hit/miss/eviction counters (overall and per namespace)
+
+Usage:
+    from utils.response_cache import ResponseCache
+
+    cache = ResponseCache()  # ~/.claude/cache/llm_responses.db
+    agent = ResilientBaseAgent(role="validator", temperature=0.0, response_cache=cache)
+
+    cache.get_stats()
+    cache.invalidate("validator")
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from utils.single_flight import request_key
+
+
+class ResponseCache:
+    """
+    Two-level (memory LRU + SQLite) response cache.
+
+    Values must be JSON-serialisable (agents store their result dicts).
+    Caching is opt-in: only agents constructed with a cache use it.
+    """
+
+    DEFAULT_DB_PATH = Path.home() / ".claude" / "cache" / "llm_responses.db"
+
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 memory_entries: int = 512,
+                 touch_batch: int = 64):
+        """
+        Initialize response cache.
+
+        Args:
+            db_path: SQLite file path (":memory:" for a process-local cache)
+            ttl_seconds: Entry lifetime; None disables expiry
+            max_bytes: Maximum total size of stored values before LRU eviction
+            memory_entries: Capacity of the in-memory LRU front
+            touch_batch: Memory hits buffered before their access times are
+                written to SQLite (always flushed before eviction)
+        """
+        self.db_path = str(db_path or self.DEFAULT_DB_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.touch_batch = touch_batch
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+        self._touched: Dict[Tuple[str, str], float] = {}  # memory hits not yet written to disk
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_tables()
+        self._total_bytes = self._load_total_bytes()
+
+        # Metrics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.namespace_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    def _create_tables(self):
+        """Create cache table."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+        )
+        self.conn.commit()
+
+    def _load_total_bytes(self) -> int:
+        """Sum of stored value sizes."""
+        row = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    @staticmethod
+    def make_key(**fields: Any) -> str:
+        """Build a content-addressed key for a request (see request_key)."""
+        return request_key(**fields)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, mem_key: Tuple[str, str], value: Any, created_at: float):
+        """Insert into the memory LRU, evicting the least recently used entry."""
+        self._memory[mem_key] = (value, created_at)
+        self._memory.move_to_end(mem_key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            namespace: Cache namespace (usually the agent role)
+            key: Request key
+
+        Returns:
+            Cached value, or None on miss/expiry
+        """
+        now = time.time()
+        mem_key = (namespace, key)
+
+        with self._lock:
+            entry = self._memory.get(mem_key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(mem_key)
+                    self._touched[mem_key] = now
+                    if len(self._touched) >= self.touch_batch:
+                        self._flush_touches()
+                        self.conn.commit()
+                    self.memory_hits += 1
+                    self.namespace_stats[namespace]["hits"] += 1
+                    return value
+                del self._memory[mem_key]
+
+            row = self.conn.execute(
+                "SELECT value, created_at FROM responses WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                self.namespace_stats[namespace]["misses"] += 1
+                return None
+
+            raw, created_at = row
+            if self._expired(created_at, now):
+                self._delete(namespace, key)
+                self.conn.commit()
+                self.expirations += 1
+                self.misses += 1
+                self.namespace_stats[namespace]["misses"] += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key)
+            )
+            self.conn.commit()
+
+            value = json.loads(raw)
+            self._remember(mem_key, value, created_at)
+            self.disk_hits += 1
+            self.namespace_stats[namespace]["hits"] += 1
+            return value
+
+    def set(self, namespace: str, key: str, value: Any):
+        """
+        Store a response.
+
+        Args:
+            namespace: Cache namespace (usually the agent role)
+            key: Request key
+            value: JSON-serialisable response
+        """
+        raw = json.dumps(value, default=str)
+        size = len(raw.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            self._delete(namespace, key)
+            self.conn.execute(
+                "INSERT INTO responses (namespace, key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, raw, size, now, now)
+            )
+            self._total_bytes += size
+            self.writes += 1
+            self._remember((namespace, key), value, now)
+            self._evict_if_needed()
+            self.conn.commit()
+
+    def _delete(self, namespace: str, key: str):
+        """Delete a single entry (caller holds the lock and commits)."""
+        row = self.conn.execute(
+            "SELECT size FROM responses WHERE namespace = ? AND key = ?",
+            (namespace, key)
+        ).fetchone()
+        if row is not None:
+            self.conn.execute(
+                "DELETE FROM responses WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            )
+            self._total_bytes -= row[0]
+        self._memory.pop((namespace, key), None)
+
+    def _flush_touches(self):
+        """Write buffered memory-hit access times to SQLite (caller holds the lock and commits)."""
+        if not self._touched:
+            return
+        self.conn.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE namespace = ? AND key = ?",
+            [(accessed_at, namespace, key) for (namespace, key), accessed_at in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _evict_if_needed(self):
+        """Evict least recently accessed entries until under 90% of max_bytes."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        self._flush_touches()
+
+        target = int(self.max_bytes * 0.9)
+        rows = self.conn.execute(
+            "SELECT namespace, key, size FROM responses ORDER BY accessed_at ASC"
+        )
+        victims = []
+        for namespace, key, size in rows:
+            if self._total_bytes <= target:
+                break
+            victims.append((namespace, key))
+            self._total_bytes -= size
+
+        self.conn.executemany(
+            "DELETE FROM responses WHERE namespace = ? AND key = ?", victims
+        )
+        for victim in victims:
+            self._memory.pop(victim, None)
+        self.evictions += len(victims)
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """
+        Drop cached entries.
+
+        Args:
+            namespace: Namespace to clear; None clears everything
+        """
+        with self._lock:
+            if namespace is None:
+                self.conn.execute("DELETE FROM responses")
+                self._memory.clear()
+            else:
+                self.conn.execute("DELETE FROM responses WHERE namespace = ?", (namespace,))
+                for mem_key in [k for k in self._memory if k[0] == namespace]:
+                    del self._memory[mem_key]
+            self.conn.commit()
+            self._total_bytes = self._load_total_bytes()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "entries": entries,
+                "memory_entries": len(self._memory),
+                "total_bytes": self._total_bytes,
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "namespaces": {ns: dict(stats) for ns, stats in self.namespace_stats.items()},
+            }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._flush_touches()
+            self.conn.commit()
+            self.conn.close()
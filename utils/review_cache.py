@@ -0,0 +1,438 @@
+"""
+Incremental, Diff-Aware Code Review Cache
+
+Re-reviewing a whole file after a one-line edit wastes tokens and latency.
+This cache splits code into top-level units (functions, classes and the
+remaining module-level statements), keys each unit by a hash of its
+normalised AST, and remembers the findings each reviewer produced for it.
+On the next run only changed units are sent for review; findings for
+unchanged units are reused and merged back with their line numbers rebased.
+
+Architecture:
+    - split_code_units(): ast-based split; moving a unit or editing comments
+      and whitespace within its lines doesn't change its hash. Non-Python (or
+      unparsable) code is a single text-hashed unit
+    - ReviewCache.plan(): which units are cached vs changed for a reviewer,
+      plus a compact snippet containing only the changed units (the file
+      itself, in original order, when every unit changed)
+    - ReviewCache.record(): attribute fresh findings to units by line number
+      and store them unit-relative
+    - ReviewCache.merge(): all findings in original line numbers (through
+      each unit's line map, since the module unit is not contiguous), with
+      a line-weighted score
+    - Storage: utils.response_cache.ResponseCache (SQLite + memory LRU)
+
+Usage:
+    from utils.review_cache import ReviewCache
+
+    cache = ReviewCache()
+    orchestrator = CriticOrchestrator(review_cache=cache)
+    results = orchestrator.review_code(code, file_path="app/users.py")
+    cache.get_stats()  # units_reused, units_reviewed, lines_skipped
+"""
+
+import ast
+import hashlib
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.response_cache import ResponseCache
+from utils.single_flight import request_key
+
+# Keys in dict-style finding locations that hold line numbers
+LINE_KEYS = ("line", "line_number", "start_line", "end_line", "line_start", "line_end")
+
+# "file.py:42", "file.py:42-45", "line 42", "lines 42-45", "L42"
+_LINE_PATTERN = re.compile(r"(:|\blines?\s*|\bL)(\d+)(?:(\s*-\s*)(\d+))?", re.IGNORECASE)
+
+
+@dataclass
+class CodeUnit:
+    """A top-level unit of code that is reviewed and cached independently."""
+    name: str
+    kind: str  # function, class, module, text
+    start_line: int  # 1-based, inclusive
+    end_line: int  # 1-based, inclusive
+    source: str
+    digest: str
+    # Original line number of each source line (empty: start_line..end_line)
+    lines: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.lines:
+            self.lines = list(range(self.start_line, self.end_line + 1))
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def original_line(self, relative: int) -> int:
+        """Map a 1-based line of unit.source to its line in the original code."""
+        if 1 <= relative <= len(self.lines):
+            return self.lines[relative - 1]
+        if relative < 1:
+            return self.lines[0] + relative - 1
+        return self.lines[-1] + relative - len(self.lines)
+
+
+@dataclass
+class ReviewPlan:
+    """Which units of a snippet need review, and the snippet to send."""
+    reviewer: str
+    units: List[CodeUnit]
+    changed: List[CodeUnit]
+    entries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    snippet: str = ""
+    # (unit, 1-based line within unit.source) for each snippet line; None for
+    # separators and for comments/blank lines between units
+    snippet_lines: List[Optional[Tuple[CodeUnit, int]]] = field(default_factory=list)
+
+    @property
+    def reused(self) -> List[CodeUnit]:
+        return [u for u in self.units if u not in self.changed]
+
+
+@dataclass
+class MergedReview:
+    """Findings for the whole snippet, combining cached and fresh units."""
+    findings: List[Dict[str, Any]]
+    score: float
+    labels: List[str]  # per-unit grade/status labels
+    stats: Dict[str, int]
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _node_digest(nodes: List[ast.AST], relative: Callable[[int], int]) -> str:
+    """
+    Hash AST structure plus line layout within the unit's source.
+
+    Moving a unit keeps its digest; reformatting that changes line numbers
+    inside it (so cached finding lines would be wrong) does not.
+
+    Args:
+        nodes: The unit's top-level nodes
+        relative: Maps an original line number to its line within the unit
+    """
+    parts = []
+    for node in nodes:
+        parts.append(ast.dump(node, include_attributes=False))
+        parts.append(",".join(
+            str(relative(child.lineno)) for child in ast.walk(node) if hasattr(child, "lineno")
+        ))
+    return _digest("\n".join(parts))
+
+
+def split_code_units(code: str) -> List[CodeUnit]:
+    """
+    Split code into top-level units keyed by normalised AST hash.
+
+    Functions and classes become their own units (decorators included); all
+    other top-level statements form one "<module>" unit whose source joins
+    them in order (unit.lines maps it back, as the statements need not be
+    adjacent). Code that does not parse as Python is a single unit hashed on
+    whitespace-normalised text.
+
+    Args:
+        code: Source code
+
+    Returns:
+        Units in source order
+    """
+    lines = code.splitlines()
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        normalised = "\n".join(line.rstrip() for line in lines).strip()
+        return [CodeUnit("<file>", "text", 1, max(1, len(lines)), code, _digest(normalised))]
+
+    units = []
+    module_nodes = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            end = node.end_lineno or node.lineno
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            units.append(CodeUnit(
+                name=node.name,
+                kind=kind,
+                start_line=start,
+                end_line=end,
+                source="\n".join(lines[start - 1:end]),
+                digest=_node_digest([node], lambda lineno, start=start: lineno - start)
+            ))
+        else:
+            module_nodes.append(node)
+
+    if module_nodes:
+        module_lines = []
+        for node in module_nodes:
+            first = node.lineno
+            if module_lines and first <= module_lines[-1]:
+                first = module_lines[-1] + 1  # statements sharing a line ("a = 1; b = 2")
+            module_lines.extend(range(first, (node.end_lineno or node.lineno) + 1))
+        position = {lineno: index for index, lineno in enumerate(module_lines)}
+        units.append(CodeUnit(
+            name="<module>",
+            kind="module",
+            start_line=module_lines[0],
+            end_line=module_lines[-1],
+            source="\n".join(lines[lineno - 1] for lineno in module_lines),
+            digest=_node_digest(module_nodes, lambda lineno: position.get(lineno, -1)),
+            lines=module_lines
+        ))
+
+    return sorted(units, key=lambda u: u.start_line)
+
+
+def finding_line(finding: Dict[str, Any]) -> Optional[int]:
+    """Extract the first line number referenced by a finding's location."""
+    location = finding.get("location")
+    if isinstance(location, dict):
+        for key in LINE_KEYS:
+            value = location.get(key)
+            if isinstance(value, int):
+                return value
+            if isinstance(value, str) and value.isdigit():
+                return int(value)
+        return None
+    if isinstance(location, str):
+        match = _LINE_PATTERN.search(location)
+        if match:
+            return int(match.group(2))
+    if isinstance(finding.get("line"), int):
+        return finding["line"]
+    return None
+
+
+def map_finding(finding: Dict[str, Any], mapping: Callable[[int], int]) -> Dict[str, Any]:
+    """Return a copy of finding with its location line (or line range) passed through mapping."""
+    mapped = dict(finding)
+    location = finding.get("location")
+    if isinstance(location, dict):
+        location = dict(location)
+        for key in LINE_KEYS:
+            if isinstance(location.get(key), int):
+                location[key] = mapping(location[key])
+        mapped["location"] = location
+    elif isinstance(location, str):
+        def repl(match):
+            text = f"{match.group(1)}{mapping(int(match.group(2)))}"
+            if match.group(4):
+                text += f"{match.group(3)}{mapping(int(match.group(4)))}"
+            return text
+        # Only the first match is the line ("file.py:42:5" keeps column 5)
+        mapped["location"] = _LINE_PATTERN.sub(repl, location, count=1)
+    if isinstance(finding.get("line"), int):
+        mapped["line"] = mapping(finding["line"])
+    return mapped
+
+
+def shift_finding(finding: Dict[str, Any], delta: int) -> Dict[str, Any]:
+    """Return a copy of finding with its location line (or line range) shifted by delta."""
+    if delta == 0:
+        return dict(finding)
+    return map_finding(finding, lambda line: line + delta)
+
+
+def severity_stats(findings: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Count findings by severity (critic statistics format)."""
+    stats = {"total_findings": len(findings), "critical": 0, "high": 0, "medium": 0, "low": 0}
+    for finding in findings:
+        severity = str(finding.get("severity", "")).lower()
+        if severity in stats:
+            stats[severity] += 1
+    return stats
+
+
+class ReviewCache:
+    """
+    Per-unit review findings cache.
+
+    Entries are keyed by (reviewer, unit digest), so a reviewer that changes
+    its prompt or level should use a distinct reviewer name.
+    """
+
+    def __init__(self,
+                 response_cache: Optional[ResponseCache] = None,
+                 namespace: str = "code_review_units"):
+        """
+        Initialize review cache.
+
+        Args:
+            response_cache: Backing store (defaults to a ResponseCache at the
+                default on-disk location)
+            namespace: ResponseCache namespace for review entries
+        """
+        self.store = response_cache or ResponseCache()
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self.units_reused = 0
+        self.units_reviewed = 0
+        self.lines_skipped = 0
+        self.lines_reviewed = 0
+
+    def _key(self, reviewer: str, digest: str) -> str:
+        return request_key(reviewer=reviewer, unit=digest)
+
+    def plan(self, code: str, reviewer: str) -> ReviewPlan:
+        """
+        Work out which units need review.
+
+        Args:
+            code: Full source code
+            reviewer: Reviewer identity (critic ID, validator name + level)
+
+        Returns:
+            ReviewPlan; plan.snippet holds only the changed units
+        """
+        units = split_code_units(code)
+        plan = ReviewPlan(reviewer=reviewer, units=units, changed=[])
+
+        for unit in units:
+            entry = self.store.get(self.namespace, self._key(reviewer, unit.digest))
+            if entry is None:
+                plan.changed.append(unit)
+            else:
+                plan.entries[unit.digest] = entry
+
+        if len(plan.changed) == len(units):
+            # Nothing reusable: review the file as written
+            owner = {
+                lineno: (unit, relative)
+                for unit in units
+                for relative, lineno in enumerate(unit.lines, start=1)
+            }
+            plan.snippet = code
+            plan.snippet_lines = [owner.get(lineno) for lineno in range(1, len(code.splitlines()) + 1)]
+        else:
+            parts = []
+            for unit in plan.changed:
+                if parts:
+                    plan.snippet_lines.append(None)  # blank separator
+                parts.append(unit.source)
+                plan.snippet_lines.extend(
+                    (unit, relative) for relative in range(1, unit.source.count("\n") + 2)
+                )
+            plan.snippet = "\n\n".join(parts)
+
+        with self._lock:
+            reused = plan.reused
+            self.units_reused += len(reused)
+            self.lines_skipped += sum(u.line_count for u in reused)
+
+        return plan
+
+    def _unit_for_snippet_line(self, plan: ReviewPlan, line: int) -> Optional[Tuple[CodeUnit, int]]:
+        """
+        Unit and unit-relative line for a snippet line.
+
+        Lines between units belong to the nearest unit line above them (or
+        below, before the first unit).
+        """
+        mapped = plan.snippet_lines
+        if not mapped or line < 1:
+            return None
+        index = min(line, len(mapped)) - 1
+        for probe in range(index, -1, -1):
+            if mapped[probe] is not None:
+                unit, relative = mapped[probe]
+                return unit, relative + (line - 1 - probe)
+        for probe in range(index + 1, len(mapped)):
+            if mapped[probe] is not None:
+                unit, relative = mapped[probe]
+                return unit, relative - (probe - (line - 1))
+        return None
+
+    def record(self,
+               plan: ReviewPlan,
+               findings: List[Dict[str, Any]],
+               score: float,
+               label: Optional[str] = None):
+        """
+        Attribute fresh findings (in snippet line numbers) to changed units and store them.
+
+        Findings without a usable line number are attributed to the unit whose
+        name they mention, else to the first changed unit.
+
+        Args:
+            plan: Plan whose snippet was reviewed
+            findings: Findings from reviewing plan.snippet
+            score: Score the reviewer gave the snippet
+            label: Optional grade/status the reviewer gave the snippet
+        """
+        if not plan.changed:
+            return
+
+        per_unit: Dict[str, List[Dict[str, Any]]] = {u.digest: [] for u in plan.changed}
+        for finding in findings:
+            line = finding_line(finding)
+            located = self._unit_for_snippet_line(plan, line) if line is not None else None
+            if located is not None:
+                unit, relative = located
+                per_unit[unit.digest].append(shift_finding(finding, relative - line))
+                continue
+
+            text = str(finding)
+            unit = next((u for u in plan.changed if u.name in text), plan.changed[0])
+            per_unit[unit.digest].append(dict(finding))
+
+        for unit in plan.changed:
+            entry = {"findings": per_unit[unit.digest], "score": score, "label": label}
+            self.store.set(self.namespace, self._key(plan.reviewer, unit.digest), entry)
+            plan.entries[unit.digest] = entry
+
+        with self._lock:
+            self.units_reviewed += len(plan.changed)
+            self.lines_reviewed += sum(u.line_count for u in plan.changed)
+
+    def merge(self, plan: ReviewPlan) -> MergedReview:
+        """
+        Combine cached and freshly recorded entries for every unit.
+
+        Returns:
+            MergedReview with findings in original line numbers (source order)
+            and a score weighted by unit line count
+        """
+        findings: List[Dict[str, Any]] = []
+        labels: List[str] = []
+        weighted = 0.0
+        weight = 0
+        for unit in plan.units:
+            entry = plan.entries.get(unit.digest)
+            if entry is None:
+                continue
+            findings.extend(map_finding(f, unit.original_line) for f in entry["findings"])
+            if entry.get("label"):
+                labels.append(entry["label"])
+            weighted += entry["score"] * unit.line_count
+            weight += unit.line_count
+
+        return MergedReview(
+            findings=findings,
+            score=weighted / weight if weight else 0.0,
+            labels=labels,
+            stats={
+                "units_total": len(plan.units),
+                "units_reused": len(plan.reused),
+                "units_reviewed": len(plan.changed),
+                "lines_skipped": sum(u.line_count for u in plan.reused)
+            }
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get unit reuse metrics."""
+        with self._lock:
+            total = self.units_reused + self.units_reviewed
+            return {
+                "units_reused": self.units_reused,
+                "units_reviewed": self.units_reviewed,
+                "lines_skipped": self.lines_skipped,
+                "lines_reviewed": self.lines_reviewed,
+                "reuse_rate": round(self.units_reused / total, 4) if total else 0.0
+            }
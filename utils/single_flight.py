@@ -0,0 +1,235 @@
+"""
+Request Coalescing (Single-Flight) for LLM Calls
+
+When several agents (or a retry storm) issue an identical request at the same
+time, only the first caller performs the upstream call. Every other caller with
+the same key waits for that call and receives the same result (or exception).
+Once the call completes the key is released, so this is NOT a cache - later
+identical requests go upstream again.
+
+Architecture:
+    - Sync path: threads wait on a threading.Event per in-flight key
+    - Async path: coroutines await a shared asyncio.Future per in-flight key;
+      if the leading coroutine is cancelled, its waiters retry and one of
+      them becomes the new leader
+    - Keys are SHA-256 hashes of the normalised request (see request_key)
+
+Usage:
+    from utils.single_flight import get_default_single_flight, request_key
+
+    group = get_default_single_flight()
+    key = request_key(model=model, system=system, prompt=prompt, temperature=0.0)
+
+    result, shared = group.do(key, lambda: client.messages.create(...))
+    result, shared = await group.ado(key, lambda: bridge.call_model(...))
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def request_key(**fields: Any) -> str:
+    """
+    Build a stable key for an LLM request.
+
+    Args:
+        **fields: Request fields (model, system, prompt, temperature, ...)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the fields
+
+    Examples:
+        >>> request_key(model="m", prompt="p") == request_key(prompt="p", model="m")
+        True
+    """
+    canonical = json.dumps(fields, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Resolves an async call's future when its leader was cancelled; waiters retry
+_LEADER_CANCELLED = object()
+
+
+class _Call:
+    """An in-flight synchronous call shared by one or more waiters."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate identical in-flight calls.
+
+    Both ``do`` (threads) and ``ado`` (asyncio) return ``(result, shared)``
+    where ``shared`` is True when the caller piggy-backed on another caller's
+    upstream call.
+    """
+
+    def __init__(self):
+        """Initialize an empty single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+
+        # Counters
+        self.upstream_calls = 0   # Calls that actually went upstream
+        self.coalesced_calls = 0  # Calls served by another caller's request
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Execute ``fn`` once per in-flight ``key`` (thread-safe).
+
+        Args:
+            key: Request key (see request_key)
+            fn: Zero-argument callable performing the upstream call
+
+        Returns:
+            Tuple of (result, shared)
+
+        Raises:
+            Exception: Whatever ``fn`` raised (re-raised in every waiter)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced_calls += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.upstream_calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``fn()`` once per in-flight ``key`` within the running event loop.
+
+        Args:
+            key: Request key (see request_key)
+            fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            Tuple of (result, shared)
+
+        Raises:
+            Exception: Whatever ``fn()`` raised (re-raised in every waiter)
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        while True:
+            with self._lock:
+                future = self._async_calls.get(loop_key)
+                if future is not None:
+                    self.coalesced_calls += 1
+                    leader = False
+                else:
+                    future = loop.create_future()
+                    self._async_calls[loop_key] = future
+                    self.upstream_calls += 1
+                    leader = True
+
+            if leader:
+                break
+
+            # shield() so a cancelled waiter does not cancel the leader's call
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result, True
+
+            # The leader was cancelled, not us: retry (the first retrier leads)
+            with self._lock:
+                self.coalesced_calls -= 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            with self._lock:
+                self._async_calls.pop(loop_key, None)
+            if not future.done():
+                future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved so lone leaders don't log "exception never retrieved"
+                future.exception()
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                if self._async_calls.get(loop_key) is future:
+                    del self._async_calls[loop_key]
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters."""
+        total = self.upstream_calls + self.coalesced_calls
+        return {
+            "upstream_calls": self.upstream_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "in_flight": self.in_flight(),
+            "coalesce_rate": round(self.coalesced_calls / total, 4) if total else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters (in-flight calls are unaffected)."""
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+
+
+# Singleton instance shared by all agents in the process
+_default_single_flight: Optional[SingleFlight] = None
+_default_lock = threading.Lock()
+
+
+def get_default_single_flight() -> SingleFlight:
+    """Get global default SingleFlight group."""
+    global _default_single_flight
+    if _default_single_flight is None:
+        with _default_lock:
+            if _default_single_flight is None:
+                _default_single_flight = SingleFlight()
+    return _default_single_flight
+
+
+def reset_default_single_flight() -> None:
+    """Reset global default SingleFlight group (useful for testing)."""
+    global _default_single_flight
+    with _default_lock:
+        _default_single_flight = None
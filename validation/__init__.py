@@ -11,6 +11,7 @@ Architecture:
     ├── core.py              - Core validation engine
     ├── critic_integration.py - Critic-based deep analysis
     ├── result_aggregator.py  - Result aggregation and reporting
+    ├── prevalidation.py      - Fast local checks before LLM validators
     └── __init__.py          - Public API (this file)
 
 Public API:
@@ -18,7 +19,7 @@ Public API:
     from validation import ValidationOrchestrator
 
     # Helper classes
-    from validation import CriticIntegration, ResultAggregator
+    from validation import CriticIntegration, ResultAggregator, PreValidator
 
     # Types
     from validation import (
@@ -61,6 +62,7 @@ from validation.core import ValidationOrchestrator
 # Integration modules
 from validation.critic_integration import CriticIntegration
 from validation.result_aggregator import ResultAggregator
+from validation.prevalidation import PreValidator
 
 # Types and interfaces
 from validation.interfaces import (
@@ -74,6 +76,7 @@ from validation.interfaces import (
     DEFAULT_VALIDATION_LEVEL,
     DEFAULT_TIMEOUT_SECONDS,
     DEFAULT_MAX_TOKENS,
+    DEFAULT_BATCH_TOKEN_BUDGET,
     DOC_PATTERNS,
     TEST_PATTERNS,
     CODE_EXTENSIONS,
@@ -108,6 +111,7 @@ __all__ = [
     "ValidationOrchestrator",
     "CriticIntegration",
     "ResultAggregator",
+    "PreValidator",
 
     # Types
     "ValidationFinding",
@@ -124,6 +128,7 @@ __all__ = [
     "DEFAULT_VALIDATION_LEVEL",
     "DEFAULT_TIMEOUT_SECONDS",
     "DEFAULT_MAX_TOKENS",
+    "DEFAULT_BATCH_TOKEN_BUDGET",
 
     # Protocols
     "ValidationEngineProtocol",
@@ -24,11 +24,13 @@ Usage:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Literal, Any
+from typing import List, Dict, Optional, Literal, Any, Tuple
 import json
 import re
+import string
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 # Phase B infrastructure
 from resilient_agent import ResilientBaseAgent
@@ -36,6 +38,7 @@ from session_management import EnhancedSessionManager
 
 # Centralized utilities
 from utils import ModelSelector
+from utils.review_cache import ReviewCache
 
 # Validation types and interfaces
 from validation.interfaces import (
@@ -48,6 +51,11 @@ from validation.interfaces import (
     DEFAULT_TIMEOUT_SECONDS,
     DEFAULT_MAX_TOKENS,
     DEFAULT_VALIDATION_LEVEL,
+    DEFAULT_BATCH_TOKEN_BUDGET,
+    BATCH_FILE_START,
+    BATCH_FILE_END,
+    BATCH_PROMPT_SUFFIX,
+    PROMPT_CACHE_STABLE_VARIABLES,
     INLINE_PROMPTS,
     DOC_PATTERNS,
     TEST_PATTERNS,
@@ -64,6 +72,37 @@ except ImportError:
     EventSeverity = None
 
 
+class _CallSettings(threading.local):
+    """Model settings generate_text is using on the current thread (None outside a call)."""
+    active: Optional[Dict[str, Any]] = None
+
+
+def _per_call_setting(name: str) -> property:
+    """
+    Agent attribute that generate_text can override for its own thread.
+
+    Reads and writes inside a generate_text call see that call's value;
+    everywhere else they see the shared value, so concurrent calls for
+    different models never observe each other's settings.
+    """
+    shared = f"_shared_{name}"
+
+    def get(self):
+        active = self._call_settings.active
+        if active is not None and name in active:
+            return active[name]
+        return getattr(self, shared)
+
+    def set(self, value):
+        active = self._call_settings.active
+        if active is not None:
+            active[name] = value
+        else:
+            setattr(self, shared, value)
+
+    return property(get, set)
+
+
 class ValidationOrchestrator(ResilientBaseAgent):
     """
     Orchestrates validation across code, documentation, and tests.
@@ -91,12 +130,23 @@ class ValidationOrchestrator(ResilientBaseAgent):
         )
     """
 
+    # Overridden per thread by generate_text (see _per_call_setting)
+    model = _per_call_setting("model")
+    temperature = _per_call_setting("temperature")
+    max_tokens = _per_call_setting("max_tokens")
+    enable_fallback = _per_call_setting("enable_fallback")
+
+    @property
+    def _call_settings(self) -> _CallSettings:
+        return self.__dict__.setdefault("_call_settings_local", _CallSettings())
+
     def __init__(
         self,
         project_root: str,
         validators: Optional[List[str]] = None,
         session_manager: Optional[EnhancedSessionManager] = None,
-        default_level: ValidationLevel = DEFAULT_VALIDATION_LEVEL
+        default_level: ValidationLevel = DEFAULT_VALIDATION_LEVEL,
+        review_cache: Optional[ReviewCache] = None
     ):
         """
         Initialize ValidationOrchestrator with Phase B integration.
@@ -108,6 +158,8 @@ class ValidationOrchestrator(ResilientBaseAgent):
             session_manager: Optional EnhancedSessionManager instance
                            If not provided, creates a new one
             default_level: Default validation level for all validators
+            review_cache: Optional per-unit review cache; when set, validate_code
+                only sends changed functions/classes and reuses cached findings
 
         Raises:
             FileNotFoundError: If validator .md files don't exist
@@ -118,7 +170,8 @@ class ValidationOrchestrator(ResilientBaseAgent):
             role="validation_orchestrator",
             model="claude-sonnet-4-5-20250929",  # Default to Sonnet 4.5
             temperature=0.2,  # Balanced for validation analysis
-            enable_fallback=True  # Enable multi-provider fallback
+            enable_fallback=True,  # Enable multi-provider fallback
+            prompt_caching=True  # Validator instructions are resent verbatim
         )
 
         # Project configuration
@@ -143,14 +196,24 @@ class ValidationOrchestrator(ResilientBaseAgent):
         # Cache for loaded validator prompts
         self._validator_cache: Dict[str, str] = {}
 
+        # Cache for extracted prompt templates
+        self._template_cache: Dict[str, str] = {}
+
+        # Incremental (diff-aware) code review cache
+        self.review_cache = review_cache
+
         # Centralized model selection (Phase 2D)
         self.model_selector = ModelSelector()
 
-        # Execution tracking
+        # Execution tracking (updated from ResultAggregator worker threads)
+        self._stats_lock = threading.Lock()
         self._execution_stats = {
             "total_validations": 0,
             "total_cost": 0.0,
-            "total_time": 0.0
+            "total_time": 0.0,
+            "batched_calls": 0,
+            "batched_files": 0,
+            "batch_fallbacks": 0
         }
 
         # Initialize observability
@@ -185,20 +248,23 @@ class ValidationOrchestrator(ResilientBaseAgent):
         prompt: str,
         model: str,
         temperature: float = 0.2,
-        max_tokens: int = DEFAULT_MAX_TOKENS
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        cache_prefix: Optional[str] = None
     ) -> str:
         """
         Generate text using the ResilientBaseAgent.call() method.
 
         This is a convenience wrapper around the Phase B call() method.
-        Temporarily changes the model/temperature/max_tokens for this call only.
+        The model/temperature/max_tokens apply to this call only, and only on
+        the calling thread, so concurrent calls may use different models.
         Disables fallback to ensure we use the exact model requested.
 
         Args:
-            prompt: User prompt
+            prompt: User prompt (sent after cache_prefix)
             model: Model to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_prefix: Static instruction prefix, marked for prompt caching
 
         Returns:
             Generated text response
@@ -206,22 +272,21 @@ class ValidationOrchestrator(ResilientBaseAgent):
         Raises:
             ValueError: If call fails or returns no output
         """
-        # Save current settings
-        original_model = self.model
-        original_temperature = self.temperature
-        original_max_tokens = self.max_tokens
-        original_fallback = self.enable_fallback
+        settings = self._call_settings
+        outer = settings.active
 
         try:
-            # Temporarily set new model/temperature/max_tokens
-            self.model = model
-            self.temperature = temperature
-            self.max_tokens = max_tokens
-            # Disable fallback - we want to use the exact model specified
-            self.enable_fallback = False
+            # Settings for this thread's call; fallback disabled - we want
+            # to use the exact model specified
+            settings.active = {
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "enable_fallback": False
+            }
 
             # Call ResilientBaseAgent.call() which uses self.model, self.temperature, etc.
-            result = self.call(prompt=prompt)
+            result = self.call(prompt=prompt, cache_prefix=cache_prefix)
 
             # Extract text from CallResult
             if isinstance(result, dict):
@@ -249,11 +314,7 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 return result_str
 
         finally:
-            # Always restore original settings
-            self.model = original_model
-            self.temperature = original_temperature
-            self.max_tokens = original_max_tokens
-            self.enable_fallback = original_fallback
+            settings.active = outer
 
     # ========================================================================
     # HELPER METHODS
@@ -389,8 +450,29 @@ class ValidationOrchestrator(ResilientBaseAgent):
         Returns:
             Fully formatted prompt ready to send to LLM
         """
-        # Prepare formatting variables with comprehensive defaults
-        format_vars = {
+        format_vars = self._format_vars(validator_name, target_content, context, level)
+
+        # Format the prompt
+        try:
+            formatted_prompt = prompt_template.format(**format_vars)
+        except KeyError as e:
+            raise ValueError(
+                f"Missing required template variable: {e}\n"
+                f"Available variables: {list(format_vars.keys())}\n"
+                f"Template requires: {re.findall(r'\{(\w+)\}', prompt_template)}"
+            )
+
+        return formatted_prompt
+
+    def _format_vars(
+        self,
+        validator_name: str,
+        target_content: str,
+        context: Dict,
+        level: str
+    ) -> Dict[str, Any]:
+        """Prepare template formatting variables with comprehensive defaults."""
+        return {
             "validator_name": validator_name,
             "level": level,
             "target_content": target_content,
@@ -410,17 +492,51 @@ class ValidationOrchestrator(ResilientBaseAgent):
             **context  # Include all context fields
         }
 
-        # Format the prompt
-        try:
-            formatted_prompt = prompt_template.format(**format_vars)
-        except KeyError as e:
-            raise ValueError(
-                f"Missing required template variable: {e}\n"
-                f"Available variables: {list(format_vars.keys())}\n"
-                f"Template requires: {re.findall(r'\{(\w+)\}', prompt_template)}"
-            )
+    def _split_cacheable_prefix(
+        self,
+        prompt_template: str,
+        formatted_prompt: str,
+        validator_name: str,
+        context: Dict,
+        level: str
+    ) -> Tuple[str, str]:
+        """
+        Split a formatted prompt into its stable instruction prefix and the rest.
 
-        return formatted_prompt
+        The prefix is the template up to its first variable outside
+        PROMPT_CACHE_STABLE_VARIABLES, so it is byte-identical for every file
+        validated with the same validator and level.
+
+        Args:
+            prompt_template: Template the prompt was formatted from
+            formatted_prompt: Output of _format_prompt()
+            validator_name: Name of validator
+            context: Context used for formatting
+            level: Validation level
+
+        Returns:
+            (prefix, remainder) with prefix + remainder == formatted_prompt;
+            prefix is empty when the template has no stable lead-in
+        """
+        format_vars = self._format_vars(validator_name, "", context, level)
+        formatter = string.Formatter()
+        parts = []
+        try:
+            for literal, field_name, format_spec, conversion in formatter.parse(prompt_template):
+                parts.append(literal)
+                if field_name is None:
+                    continue
+                if field_name not in PROMPT_CACHE_STABLE_VARIABLES:
+                    break
+                value = formatter.convert_field(format_vars[field_name], conversion)
+                parts.append(formatter.format_field(value, format_spec or ""))
+        except (KeyError, ValueError):
+            return "", formatted_prompt
+
+        prefix = "".join(parts)
+        if not formatted_prompt.startswith(prefix):
+            return "", formatted_prompt
+        return prefix, formatted_prompt[len(prefix):]
 
     def _parse_response(
         self,
@@ -540,6 +656,9 @@ class ValidationOrchestrator(ResilientBaseAgent):
         """
         Get prompt template from .md file or fall back to inline prompt.
 
+        Templates are cached per validator, so the static instruction block
+        is extracted once and reused byte-for-byte across calls.
+
         Args:
             validator_name: Name of validator
 
@@ -549,14 +668,17 @@ class ValidationOrchestrator(ResilientBaseAgent):
         Raises:
             ValueError: If validator not found in either .md or inline
         """
+        if validator_name in self._template_cache:
+            return self._template_cache[validator_name]
+
         try:
             # First try to extract from .md file
             validator_content = self._load_validator(validator_name)
-            return self._extract_system_prompt(validator_content)
+            template = self._extract_system_prompt(validator_content)
         except (ValueError, FileNotFoundError) as e:
             # Fall back to inline prompt
             if validator_name in INLINE_PROMPTS:
-                return INLINE_PROMPTS[validator_name]
+                template = INLINE_PROMPTS[validator_name]
             else:
                 raise ValueError(
                     f"No prompt template found for {validator_name}.\n"
@@ -564,6 +686,10 @@ class ValidationOrchestrator(ResilientBaseAgent):
                     f"Original error: {e}"
                 )
 
+        # Extraction is regex work over a large file; do it once per validator
+        self._template_cache[validator_name] = template
+        return template
+
     # ========================================================================
     # VALIDATION METHODS
     # ========================================================================
@@ -616,6 +742,13 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 }
             )
 
+        # Incremental review: only changed units go to the validator
+        plan = None
+        if self.review_cache:
+            plan = self.review_cache.plan(code, f"code-validator:{level}")
+            if not plan.changed:
+                return self._merge_incremental(plan, None, context)
+
         try:
             # Get prompt template
             prompt_template = self._get_prompt_template("code-validator")
@@ -627,14 +760,18 @@ class ValidationOrchestrator(ResilientBaseAgent):
             formatted_prompt = self._format_prompt(
                 prompt_template=prompt_template,
                 validator_name="code-validator",
-                target_content=code,
+                target_content=plan.snippet if plan else code,
                 context=context,
                 level=level
             )
+            cache_prefix, formatted_prompt = self._split_cacheable_prefix(
+                prompt_template, formatted_prompt, "code-validator", context, level
+            )
 
             # Invoke LLM
             response = self.generate_text(
                 prompt=formatted_prompt,
+                cache_prefix=cache_prefix,
                 model=model,
                 temperature=VALIDATION_TEMPERATURES.get("code-validator", {}).get(level, 0.1),
                 max_tokens=DEFAULT_MAX_TOKENS
@@ -651,10 +788,14 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 model_used=model
             )
 
+            if plan:
+                self.review_cache.record(
+                    plan, [asdict(f) for f in result.findings], result.score, result.status
+                )
+                result = self._merge_incremental(plan, result, context)
+
             # Update stats
-            self._execution_stats["total_validations"] += 1
-            self._execution_stats["total_cost"] += result.cost_usd
-            self._execution_stats["total_time"] += execution_time
+            self._record_stats(total_validations=1, total_cost=result.cost_usd, total_time=execution_time)
 
             # Emit success event
             if self.emitter:
@@ -688,11 +829,200 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 model_used=model if 'model' in locals() else "unknown"
             )
 
-            self._execution_stats["total_validations"] += 1
-            self._execution_stats["total_time"] += execution_time
+            self._record_stats(total_validations=1, total_time=execution_time)
 
             return fail_result
 
+    def _merge_incremental(
+        self,
+        plan,
+        result: Optional[ValidationResult],
+        context: Dict
+    ) -> ValidationResult:
+        """
+        Merge cached and fresh per-unit findings into one ValidationResult.
+
+        Args:
+            plan: ReviewPlan from self.review_cache
+            result: Fresh result for plan.snippet (None if every unit was cached)
+            context: Validation context
+
+        Returns:
+            ValidationResult covering the whole file, in original line numbers
+        """
+        merged = self.review_cache.merge(plan)
+        status_priority = {"FAIL": 0, "WARNING": 1, "PASS": 2}
+        status = min(merged.labels, key=lambda s: status_priority.get(s, 1), default="PASS")
+
+        return ValidationResult(
+            validator_name="code-validator",
+            status=status,
+            score=round(merged.score, 1),
+            findings=[ValidationFinding(**f) for f in merged.findings],
+            execution_time_ms=result.execution_time_ms if result else 0,
+            model_used=result.model_used if result else "review-cache",
+            cost_usd=result.cost_usd if result else 0.0,
+            passed_checks=result.passed_checks if result else [],
+            metrics={**(result.metrics if result else {}), "incremental": merged.stats},
+            target=result.target if result and result.target else context.get('file_path', '')
+        )
+
+    def validate_code_batch(
+        self,
+        files: List[Tuple[str, str]],
+        level: Optional[ValidationLevel] = None,
+        context: Optional[Dict] = None,
+        token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET
+    ) -> List[ValidationResult]:
+        """
+        Validate many small files with as few model calls as possible.
+
+        Files are packed greedily into requests of at most token_budget
+        estimated tokens, each file wrapped in BATCH_FILE_START/END markers,
+        so the validator prompt is sent once per batch instead of once per
+        file. The response is demultiplexed into per-file results; any file
+        whose entry is missing or unparsable (or the whole batch, if the
+        call fails) is re-validated on its own with validate_code. Files
+        larger than the budget always go through validate_code.
+
+        Args:
+            files: (file_path, code) pairs
+            level: Validation level (defaults to self.default_level)
+            context: Context shared by all files (file_path is set per file)
+            token_budget: Max estimated code tokens per batched request
+
+        Returns:
+            One ValidationResult per input file, in input order
+        """
+        level = level or self.default_level
+        context = context or {}
+        results: List[Optional[ValidationResult]] = [None] * len(files)
+
+        # Greedy packing in input order
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, (_, code) in enumerate(files):
+            tokens = self.model_selector.estimate_tokens(code)
+            if tokens > token_budget:
+                batches.append([index])
+                continue
+            if current and current_tokens + tokens > token_budget:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+
+        for batch in batches:
+            packed = {}
+            if len(batch) > 1:
+                packed = self._validate_packed([files[i] for i in batch], level, context)
+
+            for index in batch:
+                file_path, code = files[index]
+                result = packed.get(file_path)
+                if result is None:
+                    if len(batch) > 1:
+                        self._record_stats(batch_fallbacks=1)
+                    file_context = {
+                        "language": self._detect_language(Path(file_path)),
+                        **context,
+                        "file_path": file_path
+                    }
+                    result = self.validate_code(code, file_context, level)
+                results[index] = result
+
+        return results
+
+    def _validate_packed(
+        self,
+        files: List[Tuple[str, str]],
+        level: ValidationLevel,
+        context: Dict
+    ) -> Dict[str, ValidationResult]:
+        """
+        Run one code-validator request over several delimited files.
+
+        Returns:
+            file_path -> ValidationResult for every file that demultiplexed
+            cleanly (missing entries signal a fallback to single-file calls)
+        """
+        start_time = time.time()
+        file_paths = [path for path, _ in files]
+
+        try:
+            prompt_template = self._get_prompt_template("code-validator")
+            model = self._select_model("code-validator", level)
+
+            target_content = "\n\n".join(
+                f"{BATCH_FILE_START.format(file_path=path)}\n{code}\n{BATCH_FILE_END}"
+                for path, code in files
+            )
+            batch_context = {**context, "file_path": f"{len(files)} files (batch)"}
+            formatted_prompt = self._format_prompt(
+                prompt_template=prompt_template,
+                validator_name="code-validator",
+                target_content=target_content,
+                context=batch_context,
+                level=level
+            ) + BATCH_PROMPT_SUFFIX.format(
+                file_count=len(files),
+                file_paths=json.dumps(file_paths)
+            )
+            cache_prefix, formatted_prompt = self._split_cacheable_prefix(
+                prompt_template, formatted_prompt, "code-validator", batch_context, level
+            )
+
+            response = self.generate_text(
+                prompt=formatted_prompt,
+                cache_prefix=cache_prefix,
+                model=model,
+                temperature=VALIDATION_TEMPERATURES.get("code-validator", {}).get(level, 0.1),
+                max_tokens=min(DEFAULT_MAX_TOKENS * len(files), 16000)
+            )
+
+            clean_response = response.strip()
+            if clean_response.startswith("```"):
+                clean_response = re.sub(r'^```(?:json)?\s*\n?', '', clean_response)
+                clean_response = re.sub(r'\n?```\s*$', '', clean_response)
+            entries = json.loads(clean_response)["results"]
+        except Exception as e:
+            print(f"Warning: Batch validation failed, falling back to single-file calls: {e}")
+            return {}
+
+        execution_time = time.time() - start_time
+        batch_cost = self._estimate_cost(model, response)
+        sizes = {path: max(1, len(code)) for path, code in files}
+        total_size = sum(sizes.values())
+
+        results = {}
+        for path in file_paths:
+            entry = entries.get(path) if isinstance(entries, dict) else None
+            if not isinstance(entry, dict):
+                continue
+            try:
+                result = self._parse_response(
+                    response=json.dumps(entry),
+                    validator_name="code-validator",
+                    execution_time=execution_time,
+                    model_used=model
+                )
+            except ValueError:
+                continue
+
+            # Attribute the shared call's cost by file size
+            result.cost_usd = batch_cost * sizes[path] / total_size
+            result.target = result.target or path
+            result.metrics = {**result.metrics, "batch_size": len(files)}
+            results[path] = result
+
+            self._record_stats(total_validations=1, total_cost=result.cost_usd)
+
+        self._record_stats(total_time=execution_time, batched_calls=1, batched_files=len(results))
+        return results
+
     def validate_documentation(
         self,
         documentation: str,
@@ -733,9 +1063,13 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 context=context,
                 level=level
             )
+            cache_prefix, formatted_prompt = self._split_cacheable_prefix(
+                prompt_template, formatted_prompt, "doc-validator", context, level
+            )
 
             response = self.generate_text(
                 prompt=formatted_prompt,
+                cache_prefix=cache_prefix,
                 model=model,
                 temperature=VALIDATION_TEMPERATURES.get("doc-validator", {}).get(level, 0.2),
                 max_tokens=DEFAULT_MAX_TOKENS
@@ -744,9 +1078,7 @@ class ValidationOrchestrator(ResilientBaseAgent):
             execution_time = time.time() - start_time
             result = self._parse_response(response, "doc-validator", execution_time, model)
 
-            self._execution_stats["total_validations"] += 1
-            self._execution_stats["total_cost"] += result.cost_usd
-            self._execution_stats["total_time"] += execution_time
+            self._record_stats(total_validations=1, total_cost=result.cost_usd, total_time=execution_time)
 
             return result
 
@@ -811,9 +1143,13 @@ class ValidationOrchestrator(ResilientBaseAgent):
                 context=context,
                 level=level
             )
+            cache_prefix, formatted_prompt = self._split_cacheable_prefix(
+                prompt_template, formatted_prompt, "test-validator", context, level
+            )
 
             response = self.generate_text(
                 prompt=formatted_prompt,
+                cache_prefix=cache_prefix,
                 model=model,
                 temperature=VALIDATION_TEMPERATURES.get("test-validator", {}).get(level, 0.2),
                 max_tokens=DEFAULT_MAX_TOKENS
@@ -822,9 +1158,7 @@ class ValidationOrchestrator(ResilientBaseAgent):
             execution_time = time.time() - start_time
             result = self._parse_response(response, "test-validator", execution_time, model)
 
-            self._execution_stats["total_validations"] += 1
-            self._execution_stats["total_cost"] += result.cost_usd
-            self._execution_stats["total_time"] += execution_time
+            self._record_stats(total_validations=1, total_cost=result.cost_usd, total_time=execution_time)
 
             return result
 
@@ -903,31 +1237,46 @@ class ValidationOrchestrator(ResilientBaseAgent):
 
         return None
 
+    def _record_stats(self, **deltas) -> None:
+        """Add deltas to execution statistics (safe across worker threads)."""
+        with self._stats_lock:
+            for key, delta in deltas.items():
+                self._execution_stats[key] += delta
+
     def get_execution_stats(self) -> Dict:
         """Get execution statistics."""
-        total = self._execution_stats["total_validations"]
+        with self._stats_lock:
+            stats = dict(self._execution_stats)
+        total = stats["total_validations"]
 
         return {
             "total_validations": total,
-            "total_cost_usd": round(self._execution_stats["total_cost"], 6),
-            "total_time_seconds": round(self._execution_stats["total_time"], 2),
+            "total_cost_usd": round(stats["total_cost"], 6),
+            "total_time_seconds": round(stats["total_time"], 2),
             "average_cost_usd": round(
-                self._execution_stats["total_cost"] / total if total > 0 else 0,
+                stats["total_cost"] / total if total > 0 else 0,
                 6
             ),
             "average_time_seconds": round(
-                self._execution_stats["total_time"] / total if total > 0 else 0,
+                stats["total_time"] / total if total > 0 else 0,
                 2
-            )
+            ),
+            "batched_calls": stats["batched_calls"],
+            "batched_files": stats["batched_files"],
+            "batch_fallbacks": stats["batch_fallbacks"]
         }
 
     def reset_stats(self) -> None:
         """Reset execution statistics to zero."""
-        self._execution_stats = {
-            "total_validations": 0,
-            "total_cost": 0.0,
-            "total_time": 0.0
-        }
+        with self._stats_lock:
+            self._execution_stats = {
+                "total_validations": 0,
+                "total_cost": 0.0,
+                "total_time": 0.0,
+                "batched_calls": 0,
+                "batched_files": 0,
+                "batch_fallbacks": 0
+            }
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -81,6 +81,11 @@ DEFAULT_TIMEOUT_SECONDS = 120
 DEFAULT_MAX_TOKENS = 4000
 DEFAULT_VALIDATION_LEVEL: ValidationLevel = "standard"
 
+# Batch validation: max estimated input tokens of code packed into one request
+DEFAULT_BATCH_TOKEN_BUDGET = 12000
+BATCH_FILE_START = "=== FILE: {file_path} ==="
+BATCH_FILE_END = "=== END FILE ==="
+
 # File patterns for auto-detection
 DOC_PATTERNS = [".md", "readme", "guide", "docs", ".rst", ".txt"]
 TEST_PATTERNS = ["test_", "_test.", ".test.", "spec_", "_spec.", ".spec."]
@@ -176,6 +181,14 @@ class CriticIntegrationProtocol(Protocol):
         ...
 
 
+# Template variables that are identical for every file in a run; prompt text up
+# to the first other variable is a stable prefix eligible for prompt caching
+PROMPT_CACHE_STABLE_VARIABLES = frozenset({
+    "validator_name", "level", "project_name", "project_type", "criticality",
+    "version", "framework", "primary_language", "test_framework"
+})
+
+
 # ============================================================================
 # INLINE PROMPTS (Fallback when .md extraction fails)
 # ============================================================================
@@ -301,6 +314,21 @@ Return JSON with this exact structure:
 }}"""
 }
 
+# Appended to a validator prompt whose {target_content} holds several delimited files
+BATCH_PROMPT_SUFFIX = """
+
+BATCH MODE: The content above contains {file_count} separate files, each delimited by
+"=== FILE: <path> ===" and "=== END FILE ===". Validate each file independently;
+line numbers are relative to the start of each file.
+
+Instead of a single object, return JSON with this exact structure:
+{{
+    "results": {{
+        "<path>": <object with the structure described above, for that file only>
+    }}
+}}
+with exactly one entry for each of these paths: {file_paths}"""
+
 # ============================================================================
 # LANGUAGE DETECTION
 # ============================================================================
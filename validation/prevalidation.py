@@ -0,0 +1,273 @@
+"""
+Validation Pre-Check - Fast Local Checks Before LLM Validators
+
+Runs millisecond-cheap local checks on an artifact before any model is
+called. When a check finds a blocking problem (a syntax error, a leftover
+merge-conflict marker) there is no point paying for LLM validation: the
+PreValidator returns a synthetic FAIL ValidationReport instead, and the
+caller skips the validators.
+
+Architecture:
+    - Checks are callables (artifact, context) -> List[ValidationFinding]
+    - python_syntax_check: ast.parse + compile (Python artifacts only)
+    - pyflakes_check: in-process pyflakes, when installed (optional)
+    - RegexCheck: configurable (pattern, severity, message) rules
+    - PreValidator: runs checks in order, short-circuits on blocking findings
+
+Usage:
+    from validation.prevalidation import PreValidator
+
+    pre_validator = PreValidator()
+    loop = RefinementLoop(pre_validator=pre_validator)
+
+    report = pre_validator.run(code, {"language": "python"})
+    if report is not None:
+        ...  # blocking findings; LLM validation skipped
+"""
+
+import ast
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from validation.interfaces import (
+    ValidationResult,
+    ValidationReport,
+    ValidationFinding,
+    LANGUAGE_EXTENSION_MAP
+)
+
+try:
+    from pyflakes import api as pyflakes_api
+    from pyflakes import messages as pyflakes_messages
+    PYFLAKES_AVAILABLE = True
+except ImportError:
+    pyflakes_api = None
+    pyflakes_messages = None
+    PYFLAKES_AVAILABLE = False
+
+PRE_VALIDATOR_NAME = "pre-validator"
+
+# Check signature: (artifact, context) -> findings
+PreValidationCheck = Callable[[str, Dict[str, Any]], List[ValidationFinding]]
+
+# Findings at these severities short-circuit LLM validation
+DEFAULT_BLOCKING_SEVERITIES = ("CRITICAL",)
+
+# (pattern, severity, message) rules applied to every artifact
+DEFAULT_REGEX_RULES: List[Tuple[str, str, str]] = [
+    (r"^(<{7}|>{7})( .*)?$", "CRITICAL", "Unresolved merge conflict marker"),
+]
+
+
+def is_python(context: Dict[str, Any]) -> bool:
+    """Whether the validation context describes a Python artifact."""
+    language = str(context.get("language", "")).lower()
+    if language:
+        return language == "python"
+    suffix = Path(str(context.get("file_path", ""))).suffix
+    return LANGUAGE_EXTENSION_MAP.get(suffix) == "python"
+
+
+def _finding(index: int,
+             severity: str,
+             subcategory: str,
+             location: str,
+             issue: str,
+             recommendation: str,
+             code_snippet: Optional[str] = None) -> ValidationFinding:
+    return ValidationFinding(
+        id=f"PRE-{index:03d}",
+        severity=severity,
+        category="syntax" if subcategory in ("syntax_error", "compile_error") else "quality",
+        subcategory=subcategory,
+        location=location,
+        issue=issue,
+        recommendation=recommendation,
+        code_snippet=code_snippet
+    )
+
+
+def python_syntax_check(artifact: str, context: Dict[str, Any]) -> List[ValidationFinding]:
+    """
+    Parse and compile Python artifacts.
+
+    ast.parse catches grammar errors; compile additionally catches errors
+    raised by the compiler (e.g. 'return' outside function, misplaced
+    nonlocal). Non-Python artifacts are skipped.
+    """
+    if not is_python(context):
+        return []
+
+    file_path = str(context.get("file_path", "<artifact>"))
+    subcategory = "syntax_error"
+    try:
+        tree = ast.parse(artifact, filename=file_path)
+        subcategory = "compile_error"
+        compile(tree, file_path, "exec")
+    except SyntaxError as e:
+        return [_finding(
+            1, "CRITICAL", subcategory,
+            f"{file_path}:{e.lineno or 0}",
+            f"{type(e).__name__}: {e.msg}",
+            "Fix the syntax error so the code parses and compiles",
+            code_snippet=(e.text or "").rstrip() or None
+        )]
+    except ValueError as e:  # e.g. null bytes in source
+        return [_finding(1, "CRITICAL", subcategory, file_path, str(e),
+                         "Remove invalid characters from the source")]
+    return []
+
+
+def pyflakes_check(artifact: str, context: Dict[str, Any]) -> List[ValidationFinding]:
+    """
+    Run pyflakes in-process on Python artifacts (no-op if pyflakes is missing).
+
+    Undefined names are HIGH (the code will fail at runtime); everything else
+    pyflakes reports (unused imports/variables, redefinitions) is LOW.
+    """
+    if not PYFLAKES_AVAILABLE or not is_python(context):
+        return []
+
+    file_path = str(context.get("file_path", "<artifact>"))
+    collected = []
+
+    class _Collector:
+        def unexpectedError(self, filename, msg):
+            pass
+
+        def syntaxError(self, filename, msg, lineno, offset, text):
+            pass  # reported by python_syntax_check
+
+        def flake(self, message):
+            collected.append(message)
+
+    pyflakes_api.check(artifact, file_path, _Collector())
+
+    findings = []
+    for index, message in enumerate(collected, 1):
+        undefined = isinstance(message, (pyflakes_messages.UndefinedName,
+                                         pyflakes_messages.UndefinedExport,
+                                         pyflakes_messages.UndefinedLocal))
+        findings.append(_finding(
+            index, "HIGH" if undefined else "LOW",
+            type(message).__name__,
+            f"{file_path}:{message.lineno}",
+            message.message % message.message_args,
+            "Define or import the name" if undefined else "Remove or use the unused binding"
+        ))
+    return findings
+
+
+@dataclass
+class RegexCheck:
+    """Line-based regex rules: (pattern, severity, message)."""
+    rules: Iterable[Tuple[str, str, str]] = tuple(DEFAULT_REGEX_RULES)
+
+    def __post_init__(self):
+        self._compiled: List[Tuple[Pattern, str, str]] = [
+            (re.compile(pattern, re.MULTILINE), severity, message)
+            for pattern, severity, message in self.rules
+        ]
+
+    def __call__(self, artifact: str, context: Dict[str, Any]) -> List[ValidationFinding]:
+        file_path = str(context.get("file_path", "<artifact>"))
+        findings = []
+        for pattern, severity, message in self._compiled:
+            for match in pattern.finditer(artifact):
+                line = artifact.count("\n", 0, match.start()) + 1
+                findings.append(_finding(
+                    len(findings) + 1, severity, "pattern",
+                    f"{file_path}:{line}", message,
+                    f"Remove or fix: {match.group(0).strip()[:80]}",
+                    code_snippet=match.group(0)
+                ))
+        return findings
+
+
+class PreValidator:
+    """
+    Ordered local checks that can stand in for LLM validation.
+
+    Attributes:
+        checks: Checks run in order
+        blocking_severities: Severities that short-circuit validation
+    """
+
+    def __init__(self,
+                 checks: Optional[List[PreValidationCheck]] = None,
+                 blocking_severities: Iterable[str] = DEFAULT_BLOCKING_SEVERITIES):
+        """
+        Initialize pre-validator.
+
+        Args:
+            checks: Checks to run (defaults to syntax, pyflakes and regex checks)
+            blocking_severities: Finding severities that block LLM validation
+        """
+        self.checks = checks if checks is not None else [
+            python_syntax_check,
+            pyflakes_check,
+            RegexCheck()
+        ]
+        self.blocking_severities = set(blocking_severities)
+
+        self.runs = 0
+        self.short_circuits = 0
+
+    def check(self, artifact: str, context: Optional[Dict[str, Any]] = None) -> List[ValidationFinding]:
+        """Run every check and return all findings."""
+        context = context or {}
+        findings: List[ValidationFinding] = []
+        for check in self.checks:
+            findings.extend(check(artifact, context))
+        return findings
+
+    def run(self, artifact: str, context: Optional[Dict[str, Any]] = None) -> Optional[ValidationReport]:
+        """
+        Run checks; return a synthetic FAIL report if any finding is blocking.
+
+        Args:
+            artifact: Artifact about to be validated
+            context: Validation context (language, file_path, ...)
+
+        Returns:
+            ValidationReport (score 0) when validation should be skipped,
+            None when the artifact should go on to the LLM validators
+        """
+        start = time.perf_counter()
+        context = context or {}
+        findings = self.check(artifact, context)
+        self.runs += 1
+
+        blocking = [f for f in findings if f.severity in self.blocking_severities]
+        if not blocking:
+            return None
+
+        self.short_circuits += 1
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        result = ValidationResult(
+            validator_name=PRE_VALIDATOR_NAME,
+            status="FAIL",
+            score=0,
+            findings=findings,
+            execution_time_ms=elapsed_ms,
+            model_used="local",
+            cost_usd=0.0,
+            target=str(context.get("file_path", ""))
+        )
+        return ValidationReport(
+            overall_status="FAIL",
+            results={PRE_VALIDATOR_NAME: result},
+            summary=f"Pre-validation failed: {len(blocking)} blocking finding(s); LLM validation skipped",
+            metadata={"pre_validation": True}
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get run and short-circuit counts."""
+        return {
+            "runs": self.runs,
+            "short_circuits": self.short_circuits,
+            "pyflakes": PYFLAKES_AVAILABLE
+        }
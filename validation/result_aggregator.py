@@ -14,10 +14,21 @@ Usage:
     aggregator = ResultAggregator(orchestrator)
     report = aggregator.run_all_validators("src/", level="standard")
     markdown = aggregator.generate_report(report, format="markdown")
+
+    # CI: 8 files in flight, stop at the first CRITICAL finding
+    aggregator = ResultAggregator(orchestrator, max_workers=8)
+    report = aggregator.run_all_validators(".", fail_fast=True)
+
+    # Many small files: pack them into shared requests
+    aggregator = ResultAggregator(orchestrator, batch_token_budget=DEFAULT_BATCH_TOKEN_BUDGET)
 """
 
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import List, Dict, Optional, Literal
+from typing import Callable, Iterator, List, Dict, Optional, Literal, Pattern, Tuple
+import fnmatch
+import os
+import re
 import time
 
 from validation.interfaces import (
@@ -28,6 +39,60 @@ from validation.interfaces import (
     EXCLUDE_PATTERNS
 )
 
+# Observability
+try:
+    from observability.event_emitter import EventType, EventSeverity
+except ImportError:
+    EventType = None
+    EventSeverity = None
+
+# progress_callback(files_done, files_discovered, file_path)
+ProgressCallback = Callable[[int, int, Path], None]
+
+
+def compile_exclude_patterns(patterns: List[str]) -> Pattern:
+    """
+    Compile exclude patterns into one regex matched against path components.
+
+    Patterns are globs applied to each file or directory name, so ".git"
+    excludes a .git directory (but not .github) and "*.pyc" excludes
+    compiled files.
+
+    Args:
+        patterns: Glob patterns (e.g. EXCLUDE_PATTERNS)
+
+    Returns:
+        Compiled regex; use .match(name)
+    """
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def iter_files(directory: Path, recursive: bool, exclude: Pattern) -> Iterator[Path]:
+    """
+    Stream files under directory, skipping excluded names.
+
+    Excluded directories are pruned, so their contents are never listed.
+
+    Args:
+        directory: Root directory
+        recursive: Descend into subdirectories
+        exclude: Regex from compile_exclude_patterns
+
+    Yields:
+        File paths in a stable (sorted) order
+    """
+    for root, dirnames, filenames in os.walk(directory):
+        if recursive:
+            dirnames[:] = sorted(d for d in dirnames if not exclude.match(d))
+        else:
+            dirnames[:] = []
+        for name in sorted(filenames):
+            if not exclude.match(name):
+                yield Path(root) / name
+
+
+_DEFAULT_EXCLUDE = compile_exclude_patterns(EXCLUDE_PATTERNS)
+
 
 class ResultAggregator:
     """
@@ -37,21 +102,41 @@ class ResultAggregator:
     then aggregates results into comprehensive reports.
     """
 
-    def __init__(self, orchestrator):
+    def __init__(
+        self,
+        orchestrator,
+        max_workers: int = 4,
+        exclude_patterns: Optional[List[str]] = None,
+        batch_token_budget: Optional[int] = None
+    ):
         """
         Initialize ResultAggregator.
 
         Args:
             orchestrator: ValidationOrchestrator instance
+            max_workers: Files validated concurrently in directory runs
+            exclude_patterns: Glob patterns for names to skip (defaults to EXCLUDE_PATTERNS)
+            batch_token_budget: If set, small code files in directory runs are
+                packed into shared code-validator requests of about this many
+                tokens (see ValidationOrchestrator.validate_code_batch)
         """
         self.orchestrator = orchestrator
+        self.max_workers = max(1, max_workers)
+        self.batch_token_budget = batch_token_budget
+        self.exclude = (
+            compile_exclude_patterns(exclude_patterns)
+            if exclude_patterns is not None else _DEFAULT_EXCLUDE
+        )
 
     def run_all_validators(
         self,
         target_path: str,
         level: Optional[ValidationLevel] = None,
         recursive: bool = True,
-        validators: Optional[List[str]] = None
+        validators: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> ValidationReport:
         """
         Run all appropriate validators on a file or directory.
@@ -66,6 +151,9 @@ class ResultAggregator:
             level: Validation level (defaults to orchestrator.default_level)
             recursive: If target is directory, recurse into subdirs
             validators: Override which validators to run
+            max_workers: Override concurrent file validations for directories
+            fail_fast: Stop scheduling files after the first CRITICAL finding
+            progress_callback: Called as (files_done, files_discovered, file_path)
 
         Returns:
             ValidationReport aggregating all validation results
@@ -98,7 +186,10 @@ class ResultAggregator:
                 directory=target,
                 level=level,
                 recursive=recursive,
-                validators=validators
+                validators=validators,
+                max_workers=max_workers,
+                fail_fast=fail_fast,
+                progress_callback=progress_callback
             )
             all_results.extend(results)
 
@@ -209,58 +300,184 @@ class ResultAggregator:
         directory: Path,
         level: str,
         recursive: bool,
-        validators: Optional[List[str]] = None
+        validators: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> List[ValidationResult]:
         """
-        Validate all files in a directory.
+        Validate all files in a directory concurrently.
+
+        Files are streamed from the walker into a thread pool with at most
+        max_workers validations in flight, so wall time scales with the
+        concurrency limit rather than the file count and the walk never has
+        to finish before validation starts.
 
         Args:
             directory: Directory to validate
             level: Validation level
             recursive: Recurse into subdirectories
             validators: Override which validators to run
+            max_workers: Override concurrent file validations
+            fail_fast: Stop scheduling files after the first CRITICAL finding
+            progress_callback: Called as (files_done, files_discovered, file_path)
 
         Returns:
-            List of all ValidationResult objects
+            List of all ValidationResult objects (in file walk order)
         """
-        all_results = []
-
-        # Get all files
-        if recursive:
-            files = directory.rglob("*")
-        else:
-            files = directory.glob("*")
-
-        # Filter to only files (not directories)
-        files = [f for f in files if f.is_file()]
-
-        # Exclude common non-source files
-        filtered_files = []
-        for file_path in files:
-            # Check if any exclude pattern matches
-            skip = False
-            for pattern in EXCLUDE_PATTERNS:
-                if pattern in str(file_path):
-                    skip = True
-                    break
-            if not skip:
-                filtered_files.append(file_path)
-
-        # Validate each file
-        for file_path in filtered_files:
+        workers = max_workers or self.max_workers
+        files = iter_files(directory, recursive, self.exclude)
+        results_by_index: Dict[int, List[ValidationResult]] = {}
+        discovered = 0
+        done_count = 0
+        stop = False
+
+        # Small code-only files are buffered and validated together
+        batch: List[Tuple[int, Path]] = []
+        batch_tokens = 0
+
+        def validate(file_path: Path) -> List[ValidationResult]:
             try:
-                file_results = self._validate_single_file(
+                return self._validate_single_file(
                     file_path=file_path,
                     level=level,
                     validators=validators
                 )
-                all_results.extend(file_results)
             except Exception as e:
                 # Log error but continue with other files
                 print(f"Warning: Failed to validate {file_path}: {e}")
-                continue
+                return []
+
+        def run_job(job: List[Tuple[int, Path]]) -> Dict[int, List[ValidationResult]]:
+            if len(job) == 1:
+                index, file_path = job[0]
+                return {index: validate(file_path)}
+            return self._validate_batch(job, level, validate)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as executor:
+            pending = {}
+            exhausted = False
+            while True:
+                # Keep the pool full without materialising the whole walk
+                while not stop and not exhausted and len(pending) < workers:
+                    file_path = next(files, None)
+                    if file_path is None:
+                        exhausted = True
+                        break
+                    index = discovered
+                    discovered += 1
+
+                    tokens = self._batch_tokens(file_path, validators)
+                    if tokens is None:
+                        pending[executor.submit(run_job, [(index, file_path)])] = [(index, file_path)]
+                        continue
+
+                    batch.append((index, file_path))
+                    batch_tokens += tokens
+                    if batch_tokens >= self.batch_token_budget:
+                        pending[executor.submit(run_job, batch)] = batch
+                        batch, batch_tokens = [], 0
+
+                # Flush a partial batch once nothing else is left to schedule
+                if batch and not stop and (exhausted or not pending):
+                    pending[executor.submit(run_job, batch)] = batch
+                    batch, batch_tokens = [], 0
+
+                if not pending:
+                    break
+
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    job = pending.pop(future)
+                    job_results = future.result()
+                    for index, file_path in job:
+                        file_results = job_results.get(index, [])
+                        results_by_index[index] = file_results
+                        done_count += 1
+                        self._report_progress(done_count, discovered, file_path, progress_callback)
+
+                        if fail_fast and not stop and self._has_critical(file_results):
+                            stop = True
+                            print(f"Fail-fast: critical finding in {file_path}, stopping")
+
+        return [r for index in sorted(results_by_index) for r in results_by_index[index]]
+
+    def _batch_tokens(self, file_path: Path, validators: Optional[List[str]]) -> Optional[int]:
+        """
+        Estimated tokens for a file that can join a batch, else None.
+
+        Only files that get exactly the code-validator and fit well inside the
+        budget are batched; everything else is validated on its own.
+        """
+        if not self.batch_token_budget:
+            return None
+        file_validators = validators if validators is not None else \
+            self.orchestrator._detect_validators_for_file(file_path)
+        if file_validators != ["code-validator"]:
+            return None
+        try:
+            tokens = file_path.stat().st_size // 4  # ~4 chars per token
+        except OSError:
+            return None
+        return tokens if tokens <= self.batch_token_budget // 2 else None
+
+    def _validate_batch(
+        self,
+        job: List[Tuple[int, Path]],
+        level: str,
+        validate: Callable[[Path], List[ValidationResult]]
+    ) -> Dict[int, List[ValidationResult]]:
+        """Validate several small code files through validate_code_batch."""
+        results: Dict[int, List[ValidationResult]] = {}
+        readable = []
+        for index, file_path in job:
+            try:
+                readable.append((index, str(file_path), file_path.read_text(encoding="utf-8")))
+            except Exception:
+                # Unreadable: the single-file path reports it as a FAIL result
+                results[index] = validate(file_path)
+
+        if readable:
+            try:
+                batch_results = self.orchestrator.validate_code_batch(
+                    [(path, content) for _, path, content in readable],
+                    level=level,
+                    token_budget=self.batch_token_budget
+                )
+                for (index, _, _), result in zip(readable, batch_results):
+                    results[index] = [result]
+            except Exception as e:
+                print(f"Warning: Batch validation failed: {e}")
+                for index, path, _ in readable:
+                    results[index] = validate(Path(path))
+
+        return results
+
+    @staticmethod
+    def _has_critical(results: List[ValidationResult]) -> bool:
+        return any(f.severity == "CRITICAL" for r in results for f in r.findings)
 
-        return all_results
+    def _report_progress(
+        self,
+        done: int,
+        discovered: int,
+        file_path: Path,
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        """Invoke the progress callback and emit a progress event."""
+        if progress_callback:
+            progress_callback(done, discovered, file_path)
+
+        emitter = getattr(self.orchestrator, "emitter", None)
+        if emitter and EventType is not None:
+            emitter.emit(
+                event_type=EventType.VALIDATION_PROGRESS,
+                component="result-aggregator",
+                message=f"Validated {done}/{discovered} files",
+                severity=EventSeverity.INFO,
+                workflow="validation",
+                data={"files_done": done, "files_discovered": discovered, "file_path": str(file_path)}
+            )
 
     def generate_report(
         self,
@@ -0,0 +1,278 @@
+"""
+Workspace Probe - Cached, Incremental Project Scans for the Perception Layer
+
+Replaces the per-cycle `git status`, `git log` and `grep -r TODO` calls in
+cognitive_processing.PerceptionLayer with scans that only redo work for
+what changed:
+
+    - A snapshot is reused as-is for `ttl` seconds.
+    - After that the working tree is re-walked, but only directories whose
+      mtime changed are re-listed, and only files whose (mtime, size)
+      changed are re-read for TODO/FIXME comments.
+    - `git status` runs only when a file changed or .git/index or HEAD
+      moved; `git log` only when HEAD or its reflog moved.
+
+Edits inside skipped directories (node_modules, virtualenvs, caches) are
+not noticed until something else changes; everything else is picked up on
+the first snapshot after the TTL expires.
+
+This module only depends on the standard library.
+
+Usage:
+    probe = WorkspaceProbe(Path.cwd(), ttl=5.0)
+    data = probe.snapshot()  # {"git_status": ..., "recent_commits": ..., "todo_comments": ...}
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SKIP_DIRS = frozenset({
+    ".git", "__pycache__", "node_modules", ".venv", "venv",
+    ".mypy_cache", ".pytest_cache", ".tox",
+})
+
+TODO_PATTERN = re.compile(r"TODO|FIXME")
+
+
+class TTLCache:
+    """
+    Small cache whose entries expire after a TTL or when their fingerprint
+    (e.g. a tuple of file mtimes) changes.
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, fingerprint: Any = None) -> Optional[Any]:
+        """Cached value, or None if missing, expired or the fingerprint differs."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, stored_fingerprint, value = entry
+            if self.clock() - stored_at < self.ttl and stored_fingerprint == fingerprint:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any, fingerprint: Any = None):
+        self._entries[key] = (self.clock(), fingerprint, value)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one entry, or all of them."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+class WorkspaceProbe:
+    """
+    Incremental git and TODO scans of one working tree.
+
+    Thread-safe: concurrent snapshots serialise on a lock, so the second
+    caller gets the first one's fresh result.
+    """
+
+    def __init__(self,
+                 root: Path = Path("."),
+                 ttl: float = 5.0,
+                 git_timeout: float = 5,
+                 todo_limit: int = 500,
+                 todo_suffixes: Tuple[str, ...] = (".py",),
+                 skip_dirs: frozenset = DEFAULT_SKIP_DIRS):
+        """
+        Initialize workspace probe.
+
+        Args:
+            root: Working tree to scan
+            ttl: Seconds a snapshot is reused without touching the filesystem
+            git_timeout: Timeout for each git command
+            todo_limit: Characters of TODO/FIXME output kept
+            todo_suffixes: File suffixes searched for TODO/FIXME comments
+            skip_dirs: Directory names not walked
+        """
+        self.root = Path(root).resolve()
+        self.git_dir = self.root / ".git"
+        self.git_timeout = git_timeout
+        self.todo_limit = todo_limit
+        self.todo_suffixes = todo_suffixes
+        self.skip_dirs = skip_dirs
+
+        self.cache = TTLCache(ttl)
+        self._lock = threading.Lock()
+
+        # Incremental tree state
+        self._dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}  # path -> (mtime_ns, subdirs, files)
+        self._files: Dict[str, Tuple[int, int]] = {}                   # path -> (mtime_ns, size)
+        self._todos: Dict[str, List[str]] = {}                          # path -> matching lines
+        self.tree_version = 0
+
+        # Last git results and the state they were computed from
+        self._status: Optional[Tuple[Any, str]] = None
+        self._log: Optional[Tuple[Any, str]] = None
+
+        # Metrics
+        self.git_runs = 0
+        self.files_read = 0
+
+    def snapshot(self) -> Dict[str, str]:
+        """Git status, recent commits and TODO comments for the tree."""
+        with self._lock:
+            cached = self.cache.get("snapshot")
+            if cached is not None:
+                return cached
+
+            self._scan_tree()
+            data = {
+                "git_status": self._git_status(),
+                "recent_commits": self._recent_commits(),
+                "todo_comments": self._todo_comments(),
+            }
+            self.cache.put("snapshot", data)
+            return data
+
+    def invalidate(self):
+        """Force the next snapshot to re-check the tree."""
+        self.cache.invalidate()
+
+    # Tree walk
+
+    def _scan_tree(self):
+        """Re-stat the tree, re-listing changed directories and re-reading changed files."""
+        seen_dirs = set()
+        seen_files = set()
+        changed = False
+
+        pending = [str(self.root)]
+        while pending:
+            directory = pending.pop()
+            seen_dirs.add(directory)
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+            listing = self._dirs.get(directory)
+            if listing is None or listing[0] != mtime:
+                listing = (mtime, *self._list_dir(directory))
+                self._dirs[directory] = listing
+                changed = True
+            _, subdirs, files = listing
+
+            pending.extend(subdirs)
+            for path in files:
+                seen_files.add(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._files.get(path) != signature:
+                    self._files[path] = signature
+                    self._update_todos(path)
+                    changed = True
+
+        for path in set(self._files) - seen_files:
+            del self._files[path]
+            self._todos.pop(path, None)
+            changed = True
+        for directory in set(self._dirs) - seen_dirs:
+            del self._dirs[directory]
+
+        if changed:
+            self.tree_version += 1
+
+    def _list_dir(self, directory: str) -> Tuple[List[str], List[str]]:
+        subdirs, files = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.skip_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+        return subdirs, files
+
+    def _update_todos(self, path: str):
+        if not path.endswith(self.todo_suffixes):
+            return
+        self.files_read += 1
+        relative = "./" + os.path.relpath(path, self.root)
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                matches = [f"{relative}:{line.rstrip()}" for line in f if TODO_PATTERN.search(line)]
+        except OSError:
+            matches = []
+        if matches:
+            self._todos[path] = matches
+        else:
+            self._todos.pop(path, None)
+
+    def _todo_comments(self) -> str:
+        """TODO/FIXME lines in `grep -r` format, truncated to todo_limit characters."""
+        output = []
+        length = 0
+        for path in sorted(self._todos):
+            for line in self._todos[path]:
+                output.append(line + "\n")
+                length += len(line) + 1
+                if length >= self.todo_limit:
+                    return "".join(output)[:self.todo_limit]
+        return "".join(output)
+
+    # Git
+
+    def _git_state(self, *names: str) -> Tuple[Optional[int], ...]:
+        """mtimes of files under .git (None for missing files)."""
+        state = []
+        for name in names:
+            try:
+                state.append(os.stat(self.git_dir / name).st_mtime_ns)
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
+    def _git_status(self) -> str:
+        state = (self.tree_version, self._git_state("index", "HEAD"))
+        if self._status is not None and self._status[0] == state and any(state[1]):
+            return self._status[1]
+        output = self._git("status", "--short")
+        # git status may refresh the index; key the result on the state it left behind
+        self._status = ((self.tree_version, self._git_state("index", "HEAD")), output)
+        return output
+
+    def _recent_commits(self) -> str:
+        state = self._git_state("HEAD", "logs/HEAD", "packed-refs")
+        if self._log is not None and self._log[0] == state and any(state):
+            return self._log[1]
+        output = self._git("log", "--oneline", "-5")
+        self._log = (state, output)
+        return output
+
+    def _git(self, *args: str) -> str:
+        self.git_runs += 1
+        try:
+            return subprocess.run(
+                ["git", *args],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=self.git_timeout
+            ).stdout
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return ""